@@ -7,18 +7,30 @@ import inspect
 import os
 import stat
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 from ..sessions.models import SessionItem
+from .transfer_journal import JOURNAL_SUFFIX, ChunkJournal
+from .transfer_scheduler import TokenBucket
+from .transfer_tuning import TransferAutoTuner, TransferTuning
 
 
-class AcceleratedDownloadUnavailable(Exception):
+class AcceleratedTransferUnavailable(Exception):
     pass
-class AcceleratedDownloadCancelled(Exception):
+class AcceleratedTransferCancelled(Exception):
     pass
-class AcceleratedDownloadError(Exception):
+class AcceleratedTransferError(Exception):
+    pass
+
+
+class AcceleratedDownloadUnavailable(AcceleratedTransferUnavailable):
+    pass
+class AcceleratedDownloadCancelled(AcceleratedTransferCancelled):
+    pass
+class AcceleratedDownloadError(AcceleratedTransferError):
     pass
 
 
@@ -28,6 +40,18 @@ class AcceleratedDownloadConfig:
 
     parallel_requests: int = 6
     chunk_size_bytes: int = 4 * 1024 * 1024
+    # Small files of a directory plan downloaded concurrently next to the
+    # segmented large-file workers. Open remote handles never exceed
+    # ``parallel_requests + parallel_files``.
+    parallel_files: int = 8
+    # Keep ``.part`` files of segmented downloads together with a chunk
+    # journal on failure so the next attempt only fetches missing chunks.
+    resumable: bool = False
+    # Let a TransferAutoTuner adjust in-flight requests (up to
+    # ``max_parallel_requests``) and the chunk size of the next file.
+    # ``parallel_requests`` and ``chunk_size_bytes`` are the starting point.
+    auto_tune: bool = False
+    max_parallel_requests: int = 16
     connect_timeout: int = 30
     strict_host_key_checking: str = "accept-new"
 
@@ -66,6 +90,30 @@ def build_download_chunks(file_size: int, chunk_size_bytes: int) -> list[tuple[i
     ]
 
 
+class _PlanProgress:
+    """Aggregate byte progress of files downloading concurrently."""
+
+    def __init__(self, total_size: int, emit: Callable[[float], None]) -> None:
+        self.total_size = total_size
+        self._emit = emit
+        self._transferred = 0
+
+    def file_callback(self, file_size: int) -> Callable[[float], None]:
+        reported = 0
+
+        def emit_file_progress(file_progress: float) -> None:
+            nonlocal reported
+            clamped = max(0.0, min(100.0, file_progress))
+            current_bytes = int(file_size * clamped / 100.0)
+            if current_bytes <= reported:
+                return
+            self._transferred += current_bytes - reported
+            reported = current_bytes
+            self._emit(min(100.0, self._transferred * 100.0 / self.total_size))
+
+        return emit_file_progress
+
+
 async def _maybe_await(value: Any) -> Any:
     if inspect.isawaitable(value):
         return await value
@@ -81,8 +129,12 @@ async def _close_resource(resource: Any) -> None:
         await _maybe_await(wait_closed())
 
 
-class AsyncSSHSegmentedDownloader:
-    """Download remote files with concurrent SFTP range reads."""
+class AsyncSSHTransferBase:
+    """Connection, cancellation and worker plumbing shared by segmented transfers."""
+
+    unavailable_error: type[Exception] = AcceleratedDownloadUnavailable
+    cancelled_error: type[Exception] = AcceleratedDownloadCancelled
+    transfer_label = "download"
 
     def __init__(
         self,
@@ -92,35 +144,32 @@ class AsyncSSHSegmentedDownloader:
         progress_callback: Optional[Callable[[float], None]] = None,
         cancellation_event: Optional[threading.Event] = None,
         connect_factory: Optional[Callable[..., Any]] = None,
+        bandwidth_limiter: Optional[TokenBucket] = None,
     ) -> None:
         self.session = session
         self.config = config
         self.progress_callback = progress_callback
         self.cancellation_event = cancellation_event
         self._connect_factory = connect_factory
+        self.bandwidth_limiter = bandwidth_limiter
         self._async_exit_handlers: dict[int, Callable[..., Any]] = {}
-
-    def download(self, remote_path: str, local_path: Path, expected_size: int = 0) -> None:
-        """Run the segmented download synchronously."""
-        asyncio.run(self._download_async(remote_path, local_path, expected_size))
-
-    def download_directory(
-        self,
-        remote_path: str,
-        local_path: Path,
-        *,
-        min_segment_size: int,
-    ) -> None:
-        """Run a recursive directory download synchronously."""
-        asyncio.run(
-            self._download_directory_async(remote_path, local_path, min_segment_size)
+        # Bytes left in journaled partial files after a failed transfer.
+        self.resumable_bytes = 0
+        # Telemetry for the transfer history.
+        self.chunk_retries = 0
+        self.rtt_ms: Optional[float] = None
+
+    async def _run_with_sftp(self, operation: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Open one AsyncSSH connection and SFTP session around ``operation``."""
+        return await self._run_with_connection(
+            lambda _connection, sftp: operation(sftp)
         )
 
-    async def _download_async(self, remote_path: str, local_path: Path, expected_size: int) -> None:
+    async def _run_with_connection(
+        self, operation: Callable[[Any, Any], Awaitable[Any]]
+    ) -> Any:
+        """Like :meth:`_run_with_sftp`, also passing the connection for execs."""
         self._validate_session()
-        if not hasattr(os, "pwrite"):
-            raise AcceleratedDownloadUnavailable("os.pwrite is required")
-
         asyncssh = self._import_asyncssh()
         connect_factory = self._connect_factory or asyncssh.connect
         connect_kwargs = self._build_connect_kwargs(asyncssh)
@@ -129,46 +178,31 @@ class AsyncSSHSegmentedDownloader:
         try:
             sftp = await self._open_resource(connection.start_sftp_client())
             try:
-                attrs = await _maybe_await(sftp.stat(remote_path))
-                remote_size = self._get_remote_size(attrs, expected_size)
-                await self._download_with_sftp(sftp, remote_path, local_path, remote_size)
-                self._preserve_mtime(local_path, attrs)
+                await self._measure_round_trip(sftp)
+                return await operation(connection, sftp)
             finally:
                 await self._close_opened_resource(sftp)
         finally:
             await self._close_opened_resource(connection)
 
-    async def _download_directory_async(
-        self, remote_path: str, local_path: Path, min_segment_size: int
-    ) -> None:
-        self._validate_session()
-        if not hasattr(os, "pwrite"):
-            raise AcceleratedDownloadUnavailable("os.pwrite is required")
-
-        asyncssh = self._import_asyncssh()
-        connect_factory = self._connect_factory or asyncssh.connect
-        connect_kwargs = self._build_connect_kwargs(asyncssh)
-
-        connection = await self._open_resource(connect_factory(**connect_kwargs))
+    async def _measure_round_trip(self, sftp: Any) -> None:
+        """Time one small SFTP request as the connection's round-trip time."""
+        started = time.monotonic()
         try:
-            sftp = await self._open_resource(connection.start_sftp_client())
-            try:
-                plan = await self._build_download_plan(sftp, remote_path, local_path)
-                await self._download_plan(sftp, plan, min_segment_size)
-            finally:
-                await self._close_opened_resource(sftp)
-        finally:
-            await self._close_opened_resource(connection)
+            await _maybe_await(sftp.stat("."))
+        except Exception:
+            return
+        self.rtt_ms = (time.monotonic() - started) * 1000.0
 
     def _validate_session(self) -> None:
         if not self.session or not self.session.is_ssh():
-            raise AcceleratedDownloadUnavailable("session is not SSH")
+            raise self.unavailable_error("session is not SSH")
         if not self.session.host:
-            raise AcceleratedDownloadUnavailable("session has no host")
+            raise self.unavailable_error("session has no host")
         if self.session.proxy_jump:
-            raise AcceleratedDownloadUnavailable("ProxyJump is not supported")
+            raise self.unavailable_error("ProxyJump is not supported")
         if self.session.uses_password_auth() and not self.session.auth_value:
-            raise AcceleratedDownloadUnavailable("password auth needs a stored password")
+            raise self.unavailable_error("password auth needs a stored password")
 
     def _import_asyncssh(self) -> Any:
         if self._connect_factory:
@@ -178,7 +212,7 @@ class AsyncSSHSegmentedDownloader:
 
             return asyncssh
         except ImportError as exc:
-            raise AcceleratedDownloadUnavailable("asyncssh is not installed") from exc
+            raise self.unavailable_error("asyncssh is not installed") from exc
 
     def _build_connect_kwargs(self, asyncssh: Any) -> dict[str, Any]:
         kwargs: dict[str, Any] = {
@@ -211,6 +245,129 @@ class AsyncSSHSegmentedDownloader:
             return
         await _close_resource(resource)
 
+    def _is_directory(self, attrs: Any) -> bool:
+        attrs_type = getattr(attrs, "type", None)
+        if attrs_type == 2:
+            return True
+        permissions = getattr(attrs, "permissions", None)
+        return isinstance(permissions, int) and stat.S_ISDIR(permissions)
+
+    def _is_regular_file(self, attrs: Any) -> bool:
+        attrs_type = getattr(attrs, "type", None)
+        if attrs_type == 1:
+            return True
+        permissions = getattr(attrs, "permissions", None)
+        return isinstance(permissions, int) and stat.S_ISREG(permissions)
+
+    def _join_remote_path(self, parent: str, name: str) -> str:
+        if parent == "/":
+            return f"/{name}"
+        return f"{parent.rstrip('/')}/{name}"
+
+    async def _gather_workers(self, coroutines: Iterable[Any]) -> None:
+        """Run worker coroutines together, cancelling the rest on first failure."""
+        tasks = [asyncio.create_task(coroutine) for coroutine in coroutines]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _throttle(self, byte_count: int) -> None:
+        """Wait for the shared bandwidth budget before moving ``byte_count``."""
+        if self.bandwidth_limiter is None:
+            return
+        delay = self.bandwidth_limiter.reserve(byte_count)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _raise_if_cancelled(self) -> None:
+        if self.cancellation_event and self.cancellation_event.is_set():
+            raise self.cancelled_error(f"{self.transfer_label} cancelled")
+
+    def _emit_progress(self, progress: float) -> None:
+        if self.progress_callback:
+            self.progress_callback(progress)
+
+
+class AsyncSSHSegmentedDownloader(AsyncSSHTransferBase):
+    """Download remote files with concurrent SFTP range reads."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Local write accounting: bytes handed to pwrite() and bytes that had
+        # to be copied on the way there (buffer conversions).
+        self.bytes_written = 0
+        self.bytes_copied = 0
+        self.tuner: Optional[TransferAutoTuner] = None
+        if self.config.auto_tune:
+            self.tuner = TransferAutoTuner(
+                TransferTuning(
+                    self.config.parallel_requests, self.config.chunk_size_bytes
+                ),
+                min_requests=1,
+                max_requests=self.config.max_parallel_requests,
+            )
+
+    def _chunk_size(self) -> int:
+        if self.tuner is not None:
+            return self.tuner.chunk_size_bytes
+        return self.config.chunk_size_bytes
+
+    def copied_bytes_per_mb(self) -> float:
+        """Return intermediate bytes copied per MiB written to disk."""
+        if not self.bytes_written:
+            return 0.0
+        return self.bytes_copied * 1024 * 1024 / self.bytes_written
+
+    def download(self, remote_path: str, local_path: Path, expected_size: int = 0) -> None:
+        """Run the segmented download synchronously."""
+        asyncio.run(self._download_async(remote_path, local_path, expected_size))
+
+    def download_directory(
+        self,
+        remote_path: str,
+        local_path: Path,
+        *,
+        min_segment_size: int,
+    ) -> None:
+        """Run a recursive directory download synchronously."""
+        asyncio.run(
+            self._download_directory_async(remote_path, local_path, min_segment_size)
+        )
+
+    async def _download_async(self, remote_path: str, local_path: Path, expected_size: int) -> None:
+        if not hasattr(os, "pwrite"):
+            raise AcceleratedDownloadUnavailable("os.pwrite is required")
+
+        async def download_file(sftp: Any) -> None:
+            attrs = await _maybe_await(sftp.stat(remote_path))
+            remote_size = self._get_remote_size(attrs, expected_size)
+            await self._download_with_sftp(
+                sftp,
+                remote_path,
+                local_path,
+                remote_size,
+                remote_mtime=getattr(attrs, "mtime", None),
+            )
+            self._preserve_mtime(local_path, attrs)
+
+        await self._run_with_sftp(download_file)
+
+    async def _download_directory_async(
+        self, remote_path: str, local_path: Path, min_segment_size: int
+    ) -> None:
+        if not hasattr(os, "pwrite"):
+            raise AcceleratedDownloadUnavailable("os.pwrite is required")
+
+        async def download_tree(sftp: Any) -> None:
+            plan = await self._build_download_plan(sftp, remote_path, local_path)
+            await self._download_plan(sftp, plan, min_segment_size)
+
+        await self._run_with_sftp(download_tree)
+
     def _get_remote_size(self, attrs: Any, expected_size: int) -> int:
         size = getattr(attrs, "size", None)
         if isinstance(size, int) and size >= 0:
@@ -274,66 +431,50 @@ class AsyncSSHSegmentedDownloader:
                 self._preserve_mtime(directory.local_path, directory.attrs)
             return
 
-        completed_bytes = 0
+        progress = _PlanProgress(plan.total_size, self._emit_progress)
+        large_files = [f for f in plan.files if f.size >= min_segment_size]
+        small_queue: asyncio.Queue[RemoteFileEntry] = asyncio.Queue()
         for file_entry in plan.files:
-            self._raise_if_cancelled()
-            progress_callback = self._make_directory_progress_callback(
-                completed_bytes, file_entry.size, plan.total_size
-            )
-            if file_entry.size >= min_segment_size:
+            if file_entry.size < min_segment_size:
+                small_queue.put_nowait(file_entry)
+
+        async def large_file_worker() -> None:
+            for file_entry in large_files:
+                self._raise_if_cancelled()
                 await self._download_with_sftp(
                     sftp,
                     file_entry.remote_path,
                     file_entry.local_path,
                     file_entry.size,
-                    progress_callback,
+                    progress.file_callback(file_entry.size),
+                    remote_mtime=getattr(file_entry.attrs, "mtime", None),
                 )
-            else:
+                self._preserve_mtime(file_entry.local_path, file_entry.attrs)
+
+        async def small_file_worker() -> None:
+            while True:
+                self._raise_if_cancelled()
+                try:
+                    file_entry = small_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 await self._download_small_file_with_sftp(
                     sftp,
                     file_entry.remote_path,
                     file_entry.local_path,
                     file_entry.size,
-                    progress_callback,
+                    progress.file_callback(file_entry.size),
                 )
-            completed_bytes += file_entry.size
-            self._preserve_mtime(file_entry.local_path, file_entry.attrs)
-            self._emit_progress(min(100.0, completed_bytes * 100.0 / plan.total_size))
+                self._preserve_mtime(file_entry.local_path, file_entry.attrs)
+
+        small_worker_count = min(max(1, self.config.parallel_files), small_queue.qsize())
+        workers = [large_file_worker()] if large_files else []
+        workers.extend(small_file_worker() for _ in range(small_worker_count))
+        await self._gather_workers(workers)
 
         for directory in reversed(plan.directories):
             self._preserve_mtime(directory.local_path, directory.attrs)
 
-    def _make_directory_progress_callback(
-        self, completed_bytes: int, file_size: int, total_size: int
-    ) -> Callable[[float], None]:
-        def emit_file_progress(file_progress: float) -> None:
-            clamped = max(0.0, min(100.0, file_progress))
-            current_bytes = int(file_size * clamped / 100.0)
-            self._emit_progress(
-                min(100.0, (completed_bytes + current_bytes) * 100.0 / total_size)
-            )
-
-        return emit_file_progress
-
-    def _is_directory(self, attrs: Any) -> bool:
-        attrs_type = getattr(attrs, "type", None)
-        if attrs_type == 2:
-            return True
-        permissions = getattr(attrs, "permissions", None)
-        return isinstance(permissions, int) and stat.S_ISDIR(permissions)
-
-    def _is_regular_file(self, attrs: Any) -> bool:
-        attrs_type = getattr(attrs, "type", None)
-        if attrs_type == 1:
-            return True
-        permissions = getattr(attrs, "permissions", None)
-        return isinstance(permissions, int) and stat.S_ISREG(permissions)
-
-    def _join_remote_path(self, parent: str, name: str) -> str:
-        if parent == "/":
-            return f"/{name}"
-        return f"{parent.rstrip('/')}/{name}"
-
     async def _download_with_sftp(
         self,
         sftp: Any,
@@ -341,14 +482,21 @@ class AsyncSSHSegmentedDownloader:
         local_path: Path,
         remote_size: int,
         progress_callback: Optional[Callable[[float], None]] = None,
+        remote_mtime: Optional[float] = None,
     ) -> None:
         part_path = local_path.with_name(f"{local_path.name}.part")
-        chunks = build_download_chunks(remote_size, self.config.chunk_size_bytes)
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        fd = os.open(str(part_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        journal = self._open_journal(part_path, remote_path, remote_size, remote_mtime)
+        chunks = build_download_chunks(
+            remote_size, journal.chunk_size if journal else self._chunk_size()
+        )
+        flags = os.O_WRONLY | os.O_CREAT
+        if journal is None or journal.completed_bytes() == 0:
+            flags |= os.O_TRUNC
+        fd = os.open(str(part_path), flags, 0o644)
         completed = False
         try:
-            os.ftruncate(fd, remote_size)
+            self._preallocate_local_file(fd, remote_size)
             if remote_size == 0:
                 (progress_callback or self._emit_progress)(100.0)
             else:
@@ -356,17 +504,45 @@ class AsyncSSHSegmentedDownloader:
                     sftp,
                     remote_path,
                     fd,
-                    chunks,
+                    journal.pending_chunks(chunks) if journal else chunks,
                     remote_size,
                     progress_callback or self._emit_progress,
+                    journal,
                 )
             completed = True
         finally:
             os.close(fd)
-            if not completed:
+            if journal is not None and not completed:
+                journal.flush(force=True)
+                self.resumable_bytes += journal.completed_bytes()
+            elif journal is not None:
+                journal.remove()
+            elif not completed:
                 part_path.unlink(missing_ok=True)
         os.replace(part_path, local_path)
 
+    def _open_journal(
+        self,
+        part_path: Path,
+        remote_path: str,
+        remote_size: int,
+        remote_mtime: Optional[float],
+    ) -> Optional[ChunkJournal]:
+        """Return the resume journal for ``part_path``, reusing a matching one."""
+        if not self.config.resumable or not isinstance(remote_mtime, (int, float)):
+            return None
+        journal_path = part_path.with_name(f"{part_path.name}{JOURNAL_SUFFIX}")
+        identity = dict(source=remote_path, size=remote_size, mtime=remote_mtime)
+        try:
+            part_matches = part_path.stat().st_size == remote_size
+        except OSError:
+            part_matches = False
+        if part_matches:
+            journal = ChunkJournal.load(journal_path, chunk_size=None, **identity)
+            if journal is not None:
+                return journal
+        return ChunkJournal(journal_path, chunk_size=self._chunk_size(), **identity)
+
     async def _download_small_file_with_sftp(
         self,
         sftp: Any,
@@ -378,25 +554,27 @@ class AsyncSSHSegmentedDownloader:
         part_path = local_path.with_name(f"{local_path.name}.part")
         local_path.parent.mkdir(parents=True, exist_ok=True)
         remote_file = await self._open_remote_file(sftp, remote_path)
+        fd = os.open(str(part_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         completed = False
         try:
-            with open(part_path, "wb") as local_file:
-                offset = 0
-                while offset < remote_size:
-                    self._raise_if_cancelled()
-                    length = min(self.config.chunk_size_bytes, remote_size - offset)
-                    data = await self._read_remote_range(remote_file, offset, length)
-                    if len(data) != length:
-                        raise AcceleratedDownloadError(
-                            f"Short read at offset {offset}: expected {length}, got {len(data)}"
-                        )
-                    local_file.write(data)
-                    offset += length
-                    progress_callback(min(100.0, offset * 100.0 / remote_size))
-                if remote_size == 0:
-                    progress_callback(100.0)
+            self._preallocate_local_file(fd, remote_size)
+            offset = 0
+            while offset < remote_size:
+                self._raise_if_cancelled()
+                length = min(self._chunk_size(), remote_size - offset)
+                data = await self._read_remote_range(remote_file, offset, length)
+                if len(data) != length:
+                    raise AcceleratedDownloadError(
+                        f"Short read at offset {offset}: expected {length}, got {len(data)}"
+                    )
+                self._write_local_range(fd, data, offset)
+                offset += length
+                progress_callback(min(100.0, offset * 100.0 / remote_size))
+            if remote_size == 0:
+                progress_callback(100.0)
             completed = True
         finally:
+            os.close(fd)
             await self._close_opened_resource(remote_file)
             if not completed:
                 part_path.unlink(missing_ok=True)
@@ -410,12 +588,15 @@ class AsyncSSHSegmentedDownloader:
         chunks: Iterable[tuple[int, int]],
         remote_size: int,
         progress_callback: Callable[[float], None],
+        journal: Optional[ChunkJournal] = None,
     ) -> None:
         queue: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
         for chunk in chunks:
             queue.put_nowait(chunk)
 
-        transferred = 0
+        transferred = journal.completed_bytes() if journal else 0
+        if transferred:
+            progress_callback(min(100.0, transferred * 100.0 / remote_size))
         progress_lock = asyncio.Lock()
 
         async def record_progress(byte_count: int) -> None:
@@ -424,66 +605,117 @@ class AsyncSSHSegmentedDownloader:
                 transferred += byte_count
                 progress_callback(min(100.0, transferred * 100.0 / remote_size))
 
-        async def worker() -> None:
-            remote_file = await self._open_remote_file(sftp, remote_path)
+        tuner = self.tuner
+        in_flight = 0
+        slot_changed = asyncio.Condition()
+
+        async def acquire_slot() -> None:
+            nonlocal in_flight
+            async with slot_changed:
+                await slot_changed.wait_for(
+                    lambda: in_flight < tuner.parallel_requests
+                )
+                in_flight += 1
+
+        async def release_slot() -> None:
+            nonlocal in_flight
+            async with slot_changed:
+                in_flight -= 1
+                slot_changed.notify_all()
+
+        # Handles are borrowed for one read while holding a slot, so the
+        # number open follows the tuned limit rather than the worker count.
+        idle_files: list[Any] = []
+        open_files = 0
+
+        async def checkout_file() -> Any:
+            nonlocal open_files
+            if idle_files:
+                return idle_files.pop()
+            open_files += 1
             try:
-                while True:
-                    self._raise_if_cancelled()
+                return await self._open_remote_file(sftp, remote_path)
+            except BaseException:
+                open_files -= 1
+                raise
+
+        async def checkin_file(remote_file: Any) -> None:
+            nonlocal open_files
+            if tuner is not None and open_files > tuner.parallel_requests:
+                open_files -= 1
+                await self._close_opened_resource(remote_file)
+            else:
+                idle_files.append(remote_file)
+
+        async def worker() -> None:
+            while True:
+                self._raise_if_cancelled()
+                if tuner is not None:
+                    await acquire_slot()
+                try:
                     try:
                         offset, length = queue.get_nowait()
                     except asyncio.QueueEmpty:
                         return
-                    data = await self._read_remote_range(remote_file, offset, length)
+                    remote_file = await checkout_file()
+                    try:
+                        started = time.monotonic()
+                        data = await self._read_remote_range(
+                            remote_file, offset, length
+                        )
+                    finally:
+                        await checkin_file(remote_file)
                     if len(data) != length:
                         raise AcceleratedDownloadError(
                             f"Short read at offset {offset}: expected {length}, got {len(data)}"
                         )
-                    self._write_local_range(local_fd, data, offset)
-                    await record_progress(length)
-            finally:
-                await self._close_opened_resource(remote_file)
-
-        worker_count = max(1, min(self.config.parallel_requests, queue.qsize()))
-        tasks = [asyncio.create_task(worker()) for _ in range(worker_count)]
+                    if tuner is not None:
+                        tuner.record_chunk(length, time.monotonic() - started)
+                finally:
+                    if tuner is not None:
+                        await release_slot()
+                self._write_local_range(local_fd, data, offset)
+                if journal:
+                    journal.mark_done(offset // journal.chunk_size)
+                await record_progress(length)
+
+        limit = tuner.max_requests if tuner is not None else self.config.parallel_requests
+        worker_count = max(1, min(limit, queue.qsize()))
         try:
-            await asyncio.gather(*tasks)
-        except Exception:
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
-            raise
+            await self._gather_workers(worker() for _ in range(worker_count))
+        finally:
+            for remote_file in idle_files:
+                await self._close_opened_resource(remote_file)
 
     async def _open_remote_file(self, sftp: Any, remote_path: str) -> Any:
         return await self._open_resource(sftp.open(remote_path, "rb"))
 
     async def _read_remote_range(
         self, remote_file: Any, offset: int, length: int
-    ) -> bytes:
+    ) -> memoryview:
+        """Read one range and expose it as a byte view without copying it."""
+        self._raise_if_cancelled()
+        await self._throttle(length)
         self._raise_if_cancelled()
         try:
             data = await _maybe_await(remote_file.read(length, offset))
         except TypeError:
             data = await _maybe_await(remote_file.read(length, offset=offset))
         self._raise_if_cancelled()
-        if isinstance(data, memoryview):
-            return data.tobytes()
-        if isinstance(data, bytearray):
-            return bytes(data)
-        if isinstance(data, bytes):
-            return data
-        raise AcceleratedDownloadError(f"Unexpected SFTP read type: {type(data).__name__}")
-
-    def _raise_if_cancelled(self) -> None:
-        if self.cancellation_event and self.cancellation_event.is_set():
-            raise AcceleratedDownloadCancelled("download cancelled")
-
-    def _emit_progress(self, progress: float) -> None:
-        if self.progress_callback:
-            self.progress_callback(progress)
-
-    def _write_local_range(self, local_fd: int, data: bytes, offset: int) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise AcceleratedDownloadError(
+                f"Unexpected SFTP read type: {type(data).__name__}"
+            )
+        view = memoryview(data)
+        if not view.c_contiguous:
+            # pwrite() needs one contiguous buffer.
+            self.bytes_copied += view.nbytes
+            return memoryview(view.tobytes())
+        return view.cast("B")
+
+    def _write_local_range(self, local_fd: int, data: Any, offset: int) -> None:
         written = 0
-        buffer = memoryview(data)
+        buffer = data if isinstance(data, memoryview) else memoryview(data)
         while written < len(buffer):
             byte_count = os.pwrite(local_fd, buffer[written:], offset + written)
             if byte_count <= 0:
@@ -491,6 +723,19 @@ class AsyncSSHSegmentedDownloader:
                     f"Short local write at offset {offset + written}"
                 )
             written += byte_count
+        self.bytes_written += written
+
+    def _preallocate_local_file(self, local_fd: int, size: int) -> None:
+        """Size the partial file up front so range writes never extend it."""
+        os.ftruncate(local_fd, size)
+        if size <= 0 or not hasattr(os, "posix_fallocate"):
+            return
+        try:
+            os.posix_fallocate(local_fd, 0, size)
+        except OSError:
+            # Not every filesystem supports fallocate; the sparse file from
+            # ftruncate() still works, only without reserved blocks.
+            pass
 
     def _preserve_mtime(self, local_path: Path, attrs: Any) -> None:
         mtime = getattr(attrs, "mtime", None)
@@ -0,0 +1,630 @@
+"""AsyncSSH segmented SFTP uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shlex
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from .accelerated_download import (
+    AcceleratedTransferCancelled,
+    AcceleratedTransferError,
+    AcceleratedTransferUnavailable,
+    AsyncSSHTransferBase,
+    _maybe_await,
+    _PlanProgress,
+    build_download_chunks,
+)
+from .transfer_journal import JOURNAL_SUFFIX, ChunkJournal
+
+
+# Prints the file size, then one digest per ``bs``-byte block, hashing with
+# one dd | <algorithm>sum pair per block.
+_REMOTE_CHECKSUM_SCRIPT = (
+    'f=$1; bs=$2; sum=$3; size=$(wc -c < "$f") || exit 1; echo $size; i=0; '
+    "while [ $((i * bs)) -lt $size ]; do "
+    'dd if="$f" bs="$bs" skip="$i" count=1 2>/dev/null | "$sum" | cut -d" " -f1; '
+    "i=$((i + 1)); done"
+)
+
+
+class AcceleratedUploadUnavailable(AcceleratedTransferUnavailable):
+    pass
+class AcceleratedUploadCancelled(AcceleratedTransferCancelled):
+    pass
+class AcceleratedUploadError(AcceleratedTransferError):
+    pass
+
+
+def remote_checksum_command(
+    remote_path: str, block_size: int, algorithm: str = "md5"
+) -> str:
+    return shlex.join(
+        [
+            "sh",
+            "-c",
+            _REMOTE_CHECKSUM_SCRIPT,
+            "sh",
+            remote_path,
+            str(block_size),
+            f"{algorithm}sum",
+        ]
+    )
+
+
+def parse_remote_checksums(output: str, block_size: int) -> tuple[int, list[str]]:
+    """Return the remote size and per-block digests printed by the script."""
+    lines = output.split()
+    if not lines:
+        raise ValueError("empty checksum output")
+    size = int(lines[0])
+    digests = lines[1:]
+    if len(digests) != -(-size // block_size):
+        raise ValueError(f"expected checksums for {size} bytes, got {len(digests)}")
+    return size, digests
+
+
+def local_block_checksums(
+    local_path: Path, block_size: int, algorithm: str = "md5"
+) -> list[str]:
+    digests = []
+    with open(local_path, "rb") as local_file:
+        while block := local_file.read(block_size):
+            digests.append(
+                hashlib.new(algorithm, block, usedforsecurity=False).hexdigest()
+            )
+    return digests
+
+
+@dataclass(frozen=True)
+class AcceleratedUploadConfig:
+    """Runtime limits for segmented uploads."""
+
+    parallel_requests: int = 6
+    chunk_size_bytes: int = 4 * 1024 * 1024
+    parallel_files: int = 8
+    # Once a file is written, hash it chunk by chunk on the server and
+    # compare with the local chunks; a mismatching chunk is rewritten up to
+    # ``chunk_retries`` times. Servers that cannot hash get a read-back;
+    # files of a single chunk only get their size checked.
+    verify_chunks: bool = True
+    chunk_retries: int = 1
+    # Local directory for chunk journals of remote ``.part`` files. When
+    # set, failed segmented uploads keep their partial file and resume.
+    journal_dir: Optional[Path] = None
+    connect_timeout: int = 30
+    strict_host_key_checking: str = "accept-new"
+
+
+@dataclass(frozen=True)
+class LocalDirectoryEntry:
+    local_path: Path
+    remote_path: str
+    mode: int
+    mtime: float
+
+
+@dataclass(frozen=True)
+class LocalFileEntry:
+    local_path: Path
+    remote_path: str
+    size: int
+    mode: int
+    mtime: float
+
+
+@dataclass(frozen=True)
+class LocalUploadPlan:
+    directories: list[LocalDirectoryEntry]
+    files: list[LocalFileEntry]
+    total_size: int
+
+
+class AsyncSSHSegmentedUploader(AsyncSSHTransferBase):
+    """Upload local files with concurrent SFTP range writes."""
+
+    unavailable_error = AcceleratedUploadUnavailable
+    cancelled_error = AcceleratedUploadCancelled
+    transfer_label = "upload"
+    # Connection of the running transfer, for the verification exec.
+    _exec_connection: Any = None
+
+    def upload(self, local_path: Path, remote_path: str) -> None:
+        """Run the segmented upload synchronously."""
+        asyncio.run(self._upload_async(local_path, remote_path))
+
+    def upload_directory(
+        self,
+        local_path: Path,
+        remote_path: str,
+        *,
+        min_segment_size: int,
+    ) -> None:
+        """Run a recursive directory upload synchronously."""
+        asyncio.run(
+            self._upload_directory_async(local_path, remote_path, min_segment_size)
+        )
+
+    async def _upload_async(self, local_path: Path, remote_path: str) -> None:
+        if not hasattr(os, "pread"):
+            raise AcceleratedUploadUnavailable("os.pread is required")
+        local_stat = os.stat(local_path)
+        if not stat.S_ISREG(local_stat.st_mode):
+            raise AcceleratedUploadUnavailable("local path is not a regular file")
+
+        async def upload_file(connection: Any, sftp: Any) -> None:
+            self._exec_connection = connection
+            await self._upload_with_sftp(
+                sftp,
+                local_path,
+                remote_path,
+                local_stat.st_size,
+                local_mtime=local_stat.st_mtime,
+            )
+            await self._preserve_remote_attrs(
+                sftp, remote_path, local_stat.st_mode, local_stat.st_mtime
+            )
+
+        await self._run_with_connection(upload_file)
+
+    async def _upload_directory_async(
+        self, local_path: Path, remote_path: str, min_segment_size: int
+    ) -> None:
+        if not hasattr(os, "pread"):
+            raise AcceleratedUploadUnavailable("os.pread is required")
+        plan = self._build_upload_plan(local_path, remote_path)
+
+        async def upload_tree(connection: Any, sftp: Any) -> None:
+            self._exec_connection = connection
+            await self._upload_plan(sftp, plan, min_segment_size)
+
+        await self._run_with_connection(upload_tree)
+
+    def _build_upload_plan(self, local_path: Path, remote_path: str) -> LocalUploadPlan:
+        root_stat = os.stat(local_path)
+        if not stat.S_ISDIR(root_stat.st_mode):
+            raise AcceleratedUploadUnavailable("local path is not a directory")
+
+        directories = [
+            LocalDirectoryEntry(
+                local_path, remote_path, root_stat.st_mode, root_stat.st_mtime
+            )
+        ]
+        files: list[LocalFileEntry] = []
+        pending = [(local_path, remote_path)]
+        while pending:
+            current_local, current_remote = pending.pop()
+            with os.scandir(current_local) as entries:
+                for entry in sorted(entries, key=lambda item: item.name):
+                    entry_local = Path(entry.path)
+                    entry_remote = self._join_remote_path(current_remote, entry.name)
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    if stat.S_ISDIR(entry_stat.st_mode):
+                        directories.append(
+                            LocalDirectoryEntry(
+                                entry_local,
+                                entry_remote,
+                                entry_stat.st_mode,
+                                entry_stat.st_mtime,
+                            )
+                        )
+                        pending.append((entry_local, entry_remote))
+                    elif stat.S_ISREG(entry_stat.st_mode):
+                        files.append(
+                            LocalFileEntry(
+                                entry_local,
+                                entry_remote,
+                                entry_stat.st_size,
+                                entry_stat.st_mode,
+                                entry_stat.st_mtime,
+                            )
+                        )
+                    else:
+                        raise AcceleratedUploadUnavailable(
+                            f"unsupported local entry type: {entry_local}"
+                        )
+
+        return LocalUploadPlan(
+            directories=directories,
+            files=files,
+            total_size=sum(file_entry.size for file_entry in files),
+        )
+
+    async def _upload_plan(
+        self, sftp: Any, plan: LocalUploadPlan, min_segment_size: int
+    ) -> None:
+        for directory in plan.directories:
+            self._raise_if_cancelled()
+            await self._make_remote_directory(sftp, directory.remote_path)
+
+        progress = _PlanProgress(max(1, plan.total_size), self._emit_progress)
+        large_files = [f for f in plan.files if f.size >= min_segment_size]
+        small_queue: asyncio.Queue[LocalFileEntry] = asyncio.Queue()
+        for file_entry in plan.files:
+            if file_entry.size < min_segment_size:
+                small_queue.put_nowait(file_entry)
+
+        async def upload_entry(file_entry: LocalFileEntry, segmented: bool) -> None:
+            if segmented:
+                await self._upload_with_sftp(
+                    sftp,
+                    file_entry.local_path,
+                    file_entry.remote_path,
+                    file_entry.size,
+                    progress.file_callback(file_entry.size),
+                    local_mtime=file_entry.mtime,
+                )
+            else:
+                await self._upload_small_file_with_sftp(
+                    sftp,
+                    file_entry.local_path,
+                    file_entry.remote_path,
+                    file_entry.size,
+                    progress.file_callback(file_entry.size),
+                )
+            await self._preserve_remote_attrs(
+                sftp, file_entry.remote_path, file_entry.mode, file_entry.mtime
+            )
+
+        async def large_file_worker() -> None:
+            for file_entry in large_files:
+                self._raise_if_cancelled()
+                await upload_entry(file_entry, True)
+
+        async def small_file_worker() -> None:
+            while True:
+                self._raise_if_cancelled()
+                try:
+                    file_entry = small_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await upload_entry(file_entry, False)
+
+        small_worker_count = min(max(1, self.config.parallel_files), small_queue.qsize())
+        workers = [large_file_worker()] if large_files else []
+        workers.extend(small_file_worker() for _ in range(small_worker_count))
+        await self._gather_workers(workers)
+
+        if plan.total_size == 0:
+            self._emit_progress(100.0)
+        for directory in reversed(plan.directories):
+            await self._preserve_remote_attrs(
+                sftp, directory.remote_path, directory.mode, directory.mtime
+            )
+
+    async def _upload_with_sftp(
+        self,
+        sftp: Any,
+        local_path: Path,
+        remote_path: str,
+        local_size: int,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        local_mtime: Optional[float] = None,
+    ) -> None:
+        part_path = f"{remote_path}.part"
+        chunks = build_download_chunks(local_size, self.config.chunk_size_bytes)
+        journal = await self._open_journal(
+            sftp, local_path, part_path, local_size, local_mtime
+        )
+        fd = os.open(str(local_path), os.O_RDONLY)
+        completed = False
+        try:
+            if journal is None or journal.completed_bytes() == 0:
+                # Create or truncate the remote partial file once; workers
+                # then reopen it for ranged writes.
+                remote_file = await self._open_remote_file(sftp, part_path, "wb")
+                await self._close_opened_resource(remote_file)
+            if local_size == 0:
+                (progress_callback or self._emit_progress)(100.0)
+            else:
+                await self._run_chunk_workers(
+                    sftp,
+                    part_path,
+                    fd,
+                    journal.pending_chunks(chunks) if journal else chunks,
+                    local_size,
+                    progress_callback or self._emit_progress,
+                    journal,
+                )
+                await self._verify_remote_file(
+                    sftp, fd, local_path, part_path, local_size, journal
+                )
+            completed = True
+        finally:
+            os.close(fd)
+            if journal is not None and not completed:
+                journal.flush(force=True)
+                self.resumable_bytes += journal.completed_bytes()
+            elif journal is not None:
+                journal.remove()
+            elif not completed:
+                await self._remove_remote_quietly(sftp, part_path)
+        await self._replace_remote(sftp, part_path, remote_path)
+
+    async def _open_journal(
+        self,
+        sftp: Any,
+        local_path: Path,
+        part_path: str,
+        local_size: int,
+        local_mtime: Optional[float],
+    ) -> Optional[ChunkJournal]:
+        """Return the resume journal for the remote ``part_path``."""
+        if self.config.journal_dir is None or local_mtime is None:
+            return None
+        target = f"{self.session.user or ''}@{self.session.host}:{self.session.port or 22}:{part_path}"
+        journal_name = hashlib.sha256(target.encode("utf-8")).hexdigest()[:32]
+        journal_path = Path(self.config.journal_dir) / f"{journal_name}{JOURNAL_SUFFIX}"
+        identity = dict(
+            source=str(local_path),
+            size=local_size,
+            mtime=local_mtime,
+            chunk_size=self.config.chunk_size_bytes,
+        )
+        journal = ChunkJournal.load(journal_path, **identity)
+        if journal is not None:
+            try:
+                part_attrs = await _maybe_await(sftp.stat(part_path))
+                part_size = getattr(part_attrs, "size", None)
+            except Exception:
+                part_size = None
+            # Ranged writes land out of order, so the remote partial can be
+            # shorter than the source but never longer.
+            if isinstance(part_size, int) and part_size <= local_size:
+                return journal
+        return ChunkJournal(journal_path, **identity)
+
+    async def _upload_small_file_with_sftp(
+        self,
+        sftp: Any,
+        local_path: Path,
+        remote_path: str,
+        local_size: int,
+        progress_callback: Callable[[float], None],
+    ) -> None:
+        part_path = f"{remote_path}.part"
+        fd = os.open(str(local_path), os.O_RDONLY)
+        completed = False
+        try:
+            remote_file = await self._open_remote_file(sftp, part_path, "w+b")
+            try:
+                offset = 0
+                while offset < local_size:
+                    self._raise_if_cancelled()
+                    length = min(self.config.chunk_size_bytes, local_size - offset)
+                    data = self._read_local_range(fd, offset, length)
+                    await self._write_remote_range(remote_file, data, offset)
+                    offset += length
+                    progress_callback(min(100.0, offset * 100.0 / local_size))
+                if local_size == 0:
+                    progress_callback(100.0)
+            finally:
+                await self._close_opened_resource(remote_file)
+            await self._verify_remote_file(
+                sftp, fd, local_path, part_path, local_size
+            )
+            completed = True
+        finally:
+            os.close(fd)
+            if not completed:
+                await self._remove_remote_quietly(sftp, part_path)
+        await self._replace_remote(sftp, part_path, remote_path)
+
+    async def _run_chunk_workers(
+        self,
+        sftp: Any,
+        remote_path: str,
+        local_fd: int,
+        chunks: Iterable[tuple[int, int]],
+        local_size: int,
+        progress_callback: Callable[[float], None],
+        journal: Optional[ChunkJournal] = None,
+    ) -> None:
+        queue: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
+        for chunk in chunks:
+            queue.put_nowait(chunk)
+
+        transferred = journal.completed_bytes() if journal else 0
+        if transferred:
+            progress_callback(min(100.0, transferred * 100.0 / local_size))
+
+        def record_progress(byte_count: int) -> None:
+            nonlocal transferred
+            transferred += byte_count
+            progress_callback(min(100.0, transferred * 100.0 / local_size))
+
+        async def worker() -> None:
+            remote_file = await self._open_remote_file(sftp, remote_path, "r+b")
+            try:
+                while True:
+                    self._raise_if_cancelled()
+                    try:
+                        offset, length = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    data = self._read_local_range(local_fd, offset, length)
+                    await self._write_remote_range(remote_file, data, offset)
+                    if journal:
+                        journal.mark_done(offset // journal.chunk_size)
+                    record_progress(length)
+            finally:
+                await self._close_opened_resource(remote_file)
+
+        worker_count = max(1, min(self.config.parallel_requests, queue.qsize()))
+        await self._gather_workers(worker() for _ in range(worker_count))
+
+    async def _verify_remote_file(
+        self,
+        sftp: Any,
+        local_fd: int,
+        local_path: Path,
+        remote_path: str,
+        local_size: int,
+        journal: Optional[ChunkJournal] = None,
+    ) -> None:
+        """Compare ``remote_path`` chunk by chunk with the local file.
+
+        One exec hashes every chunk on the server, so verifying costs a
+        round trip instead of reading the whole file back. Mismatching
+        chunks are rewritten; any still wrong after ``chunk_retries`` rounds
+        go back to pending in ``journal`` before the upload fails.
+        """
+        if not self.config.verify_chunks or local_size == 0:
+            return
+        chunk_size = self.config.chunk_size_bytes
+        if local_size <= chunk_size:
+            # An exec per small file would open a channel per file in a
+            # directory plan; for one acknowledged write the size will do.
+            attrs = await _maybe_await(sftp.stat(remote_path))
+            remote_size = getattr(attrs, "size", local_size)
+            if remote_size != local_size:
+                raise AcceleratedUploadError(
+                    f"Integrity check failed for {remote_path}: "
+                    f"{remote_size} bytes instead of {local_size}"
+                )
+            return
+        chunks = build_download_chunks(local_size, chunk_size)
+        expected = local_block_checksums(local_path, chunk_size, "sha256")
+        retries = max(0, self.config.chunk_retries)
+        while True:
+            remote = await self._remote_checksums(remote_path, chunk_size)
+            if remote is None:
+                await self._verify_by_reading_back(sftp, local_fd, remote_path, chunks)
+                return
+            remote_size, remote_digests = remote
+            if remote_size > local_size:
+                raise AcceleratedUploadError(
+                    f"remote size {remote_size} exceeds local size {local_size}"
+                )
+            bad = [
+                index
+                for index, digest in enumerate(expected)
+                if index >= len(remote_digests) or remote_digests[index] != digest
+            ]
+            if not bad:
+                return
+            if retries == 0:
+                break
+            retries -= 1
+            self.chunk_retries += len(bad)
+            remote_file = await self._open_remote_file(sftp, remote_path, "r+b")
+            try:
+                for index in bad:
+                    offset, length = chunks[index]
+                    data = self._read_local_range(local_fd, offset, length)
+                    await self._write_remote_range(remote_file, data, offset)
+            finally:
+                await self._close_opened_resource(remote_file)
+        if journal is not None:
+            for index in bad:
+                journal.mark_pending(index)
+        raise AcceleratedUploadError(
+            f"Integrity check failed for {len(bad)} chunks of {remote_path}"
+        )
+
+    async def _remote_checksums(
+        self, remote_path: str, chunk_size: int
+    ) -> Optional[tuple[int, list[str]]]:
+        """Per-chunk SHA-256 of ``remote_path``, or None if the server can't."""
+        connection = self._exec_connection
+        if connection is None:
+            return None
+        try:
+            result = await _maybe_await(
+                connection.run(
+                    remote_checksum_command(remote_path, chunk_size, "sha256"),
+                    check=False,
+                )
+            )
+        except Exception:
+            # No exec channel (e.g. sftp-only accounts or MaxSessions).
+            return None
+        self._raise_if_cancelled()
+        if result.exit_status != 0:
+            return None
+        try:
+            return parse_remote_checksums(str(result.stdout), chunk_size)
+        except ValueError:
+            return None
+
+    async def _verify_by_reading_back(
+        self,
+        sftp: Any,
+        local_fd: int,
+        remote_path: str,
+        chunks: list[tuple[int, int]],
+    ) -> None:
+        remote_file = await self._open_remote_file(sftp, remote_path, "r+b")
+        try:
+            for offset, length in chunks:
+                data = self._read_local_range(local_fd, offset, length)
+                retries = max(0, self.config.chunk_retries)
+                while True:
+                    echo = await _maybe_await(remote_file.read(length, offset))
+                    self._raise_if_cancelled()
+                    if bytes(echo) == data:
+                        break
+                    if retries == 0:
+                        raise AcceleratedUploadError(
+                            f"Integrity check failed at offset {offset}"
+                        )
+                    retries -= 1
+                    self.chunk_retries += 1
+                    await self._write_remote_range(remote_file, data, offset)
+        finally:
+            await self._close_opened_resource(remote_file)
+
+    async def _open_remote_file(self, sftp: Any, remote_path: str, mode: str) -> Any:
+        return await self._open_resource(sftp.open(remote_path, mode))
+
+    async def _write_remote_range(
+        self, remote_file: Any, data: bytes, offset: int
+    ) -> None:
+        self._raise_if_cancelled()
+        await self._throttle(len(data))
+        self._raise_if_cancelled()
+        await _maybe_await(remote_file.write(data, offset))
+        self._raise_if_cancelled()
+
+    def _read_local_range(self, local_fd: int, offset: int, length: int) -> bytes:
+        data = os.pread(local_fd, length, offset)
+        if len(data) != length:
+            raise AcceleratedUploadError(
+                f"Short local read at offset {offset}: expected {length}, got {len(data)}"
+            )
+        return data
+
+    async def _make_remote_directory(self, sftp: Any, remote_path: str) -> None:
+        await _maybe_await(sftp.makedirs(remote_path, exist_ok=True))
+
+    async def _replace_remote(self, sftp: Any, part_path: str, remote_path: str) -> None:
+        posix_rename = getattr(sftp, "posix_rename", None)
+        if posix_rename:
+            try:
+                await _maybe_await(posix_rename(part_path, remote_path))
+                return
+            except Exception:
+                pass
+        await self._remove_remote_quietly(sftp, remote_path)
+        await _maybe_await(sftp.rename(part_path, remote_path))
+
+    async def _remove_remote_quietly(self, sftp: Any, remote_path: str) -> None:
+        try:
+            await _maybe_await(sftp.remove(remote_path))
+        except Exception:
+            pass
+
+    async def _preserve_remote_attrs(
+        self, sftp: Any, remote_path: str, mode: int, mtime: float
+    ) -> None:
+        try:
+            await _maybe_await(sftp.chmod(remote_path, stat.S_IMODE(mode)))
+            await _maybe_await(sftp.utime(remote_path, (mtime, mtime)))
+        except Exception:
+            # Servers may refuse setstat; the data itself is already in place.
+            pass
@@ -0,0 +1,160 @@
+"""Block-level delta uploads for remote files saved repeatedly while edited."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+from pathlib import Path
+from typing import Any
+
+from .accelerated_download import _maybe_await
+from .accelerated_upload import (
+    AcceleratedUploadError,
+    AcceleratedUploadUnavailable,
+    AsyncSSHSegmentedUploader,
+    local_block_checksums,
+    parse_remote_checksums,
+    remote_checksum_command,
+)
+
+# Below this a full upload is a single round trip anyway.
+DELTA_MIN_FILE_SIZE = 256 * 1024
+MIN_BLOCK_SIZE = 64 * 1024
+# The remote side hashes with one dd | md5sum pair per block, so the block
+# count bounds the processes it spawns.
+MAX_REMOTE_BLOCKS = 256
+
+
+class DeltaUploadUnavailable(AcceleratedUploadUnavailable):
+    pass
+
+
+def choose_block_size(file_size: int) -> int:
+    return max(MIN_BLOCK_SIZE, -(-file_size // MAX_REMOTE_BLOCKS))
+
+
+def changed_ranges(
+    local_size: int,
+    local_digests: list[str],
+    remote_digests: list[str],
+    block_size: int,
+) -> list[tuple[int, int]]:
+    """Coalesced ``(offset, length)`` ranges whose blocks differ remotely."""
+    ranges: list[tuple[int, int]] = []
+    for index, digest in enumerate(local_digests):
+        if index < len(remote_digests) and remote_digests[index] == digest:
+            continue
+        offset = index * block_size
+        length = min(block_size, local_size - offset)
+        if ranges and ranges[-1][0] + ranges[-1][1] == offset:
+            ranges[-1] = (ranges[-1][0], ranges[-1][1] + length)
+        else:
+            ranges.append((offset, length))
+    return ranges
+
+
+def split_ranges(
+    ranges: list[tuple[int, int]], max_length: int
+) -> list[tuple[int, int]]:
+    pieces = []
+    for offset, length in ranges:
+        end = offset + length
+        while offset < end:
+            pieces.append((offset, min(max_length, end - offset)))
+            offset += max_length
+    return pieces
+
+
+class AsyncSSHDeltaUploader(AsyncSSHSegmentedUploader):
+    """Rewrite only the blocks of an existing remote file that changed.
+
+    The remote file is hashed per fixed-size block by one exec on the
+    transfer's own connection and compared with the local blocks; the
+    differing ranges are written in place and the file is truncated to the
+    local size. In-place writes leave the file mixed if they fail half-way,
+    so callers must follow a failure with a full upload.
+    """
+
+    transfer_label = "delta upload"
+    unavailable_error = DeltaUploadUnavailable
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.bytes_sent = 0
+        self.bytes_total = 0
+
+    def upload_delta(self, local_path: Path, remote_path: str) -> None:
+        asyncio.run(self._upload_delta_async(local_path, remote_path))
+
+    async def _upload_delta_async(self, local_path: Path, remote_path: str) -> None:
+        if not hasattr(os, "pread"):
+            raise DeltaUploadUnavailable("os.pread is required")
+        local_stat = os.stat(local_path)
+        if not stat.S_ISREG(local_stat.st_mode):
+            raise DeltaUploadUnavailable("local path is not a regular file")
+        local_size = local_stat.st_size
+        block_size = choose_block_size(local_size)
+
+        async def upload(connection: Any, sftp: Any) -> None:
+            self._exec_connection = connection
+            result = await _maybe_await(
+                connection.run(
+                    remote_checksum_command(remote_path, block_size), check=False
+                )
+            )
+            if result.exit_status != 0:
+                raise DeltaUploadUnavailable(
+                    f"remote checksum failed with status {result.exit_status}"
+                )
+            try:
+                remote_size, remote_digests = parse_remote_checksums(
+                    str(result.stdout), block_size
+                )
+            except ValueError as exc:
+                raise DeltaUploadUnavailable(
+                    f"unusable remote checksums: {exc}"
+                ) from exc
+
+            ranges = changed_ranges(
+                local_size,
+                local_block_checksums(local_path, block_size),
+                remote_digests,
+                block_size,
+            )
+            self.bytes_total = local_size
+            self.bytes_sent = sum(length for _offset, length in ranges)
+            self._raise_if_cancelled()
+            # From here on the remote file is being rewritten; stopping
+            # half-way would leave it mixed, and the rest is small.
+            self.cancellation_event = None
+            fd = os.open(str(local_path), os.O_RDONLY)
+            try:
+                if ranges:
+                    await self._run_chunk_workers(
+                        sftp,
+                        remote_path,
+                        fd,
+                        split_ranges(ranges, self.config.chunk_size_bytes),
+                        self.bytes_sent,
+                        self._emit_progress,
+                    )
+                if remote_size > local_size:
+                    await _maybe_await(sftp.truncate(remote_path, local_size))
+                await self._verify_remote_file(
+                    sftp, fd, local_path, remote_path, local_size
+                )
+            finally:
+                os.close(fd)
+            attrs = await _maybe_await(sftp.stat(remote_path))
+            if getattr(attrs, "size", local_size) != local_size:
+                raise AcceleratedUploadError(
+                    f"remote size {attrs.size} does not match local size {local_size}"
+                )
+            self._emit_progress(100.0)
+            await self._preserve_remote_attrs(
+                sftp, remote_path, local_stat.st_mode, local_stat.st_mtime
+            )
+
+        await self._run_with_connection(upload)
+
@@ -0,0 +1,147 @@
+# ashyterm/filemanager/directory_watcher.py
+"""Live updates for local directory views.
+
+A :class:`DirectoryWatcher` wraps a ``Gio.FileMonitor`` on the directory
+being shown and reports the names of changed entries in batches, so a
+burst of events (a build, an archive being unpacked) turns into one
+update instead of hundreds.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Dict, Iterable, Optional
+
+from gi.repository import Gio, GLib
+
+from ..utils.logger import get_logger
+from .models import FileItem
+
+# Events arriving within this window are applied together.
+CHANGE_BATCH_DELAY_MS = 150
+
+_RELEVANT_EVENTS = {
+    Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+    Gio.FileMonitorEvent.ATTRIBUTE_CHANGED,
+    Gio.FileMonitorEvent.CREATED,
+    Gio.FileMonitorEvent.DELETED,
+    Gio.FileMonitorEvent.MOVED_IN,
+    Gio.FileMonitorEvent.MOVED_OUT,
+    Gio.FileMonitorEvent.RENAMED,
+}
+
+
+class DirectoryWatcher:
+    """Watches one local directory at a time and batches entry changes.
+
+    ``on_changes(directory, names)`` runs on the main loop at most once
+    per :data:`CHANGE_BATCH_DELAY_MS` with every entry name touched since
+    the previous call.
+    """
+
+    def __init__(
+        self,
+        on_changes: Callable[[str, set[str]], None],
+        batch_delay_ms: int = CHANGE_BATCH_DELAY_MS,
+    ) -> None:
+        self.logger = get_logger("ashyterm.filemanager.directory_watcher")
+        self._on_changes = on_changes
+        self._batch_delay_ms = batch_delay_ms
+        self._monitor = None
+        self._handler_id = 0
+        self._directory: Optional[str] = None
+        self._pending: set[str] = set()
+        self._flush_source_id = 0
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    def watch(self, directory: str) -> None:
+        if directory == self._directory and self._monitor is not None:
+            return
+        self.stop()
+        try:
+            monitor = Gio.File.new_for_path(directory).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            self.logger.debug(f"Cannot watch {directory}: {e.message}")
+            return
+        self._monitor = monitor
+        self._directory = directory
+        self._handler_id = monitor.connect("changed", self._on_monitor_changed)
+
+    def stop(self) -> None:
+        if self._flush_source_id:
+            GLib.source_remove(self._flush_source_id)
+            self._flush_source_id = 0
+        if self._monitor is not None:
+            if self._handler_id:
+                self._monitor.disconnect(self._handler_id)
+            self._monitor.cancel()
+        self._monitor = None
+        self._handler_id = 0
+        self._directory = None
+        self._pending.clear()
+
+    def _on_monitor_changed(self, _monitor, gio_file, other_file, event_type) -> None:
+        if event_type not in _RELEVANT_EVENTS:
+            return
+        for changed in (gio_file, other_file):
+            name = self._child_name(changed)
+            if name:
+                self._pending.add(name)
+        if self._pending and not self._flush_source_id:
+            self._flush_source_id = GLib.timeout_add(
+                self._batch_delay_ms, self._flush
+            )
+
+    def _child_name(self, gio_file) -> Optional[str]:
+        # Only direct children of the watched directory are listed.
+        if gio_file is None:
+            return None
+        path = gio_file.get_path()
+        if not path or os.path.dirname(path) != os.path.normpath(self._directory):
+            return None
+        return os.path.basename(path)
+
+    def _flush(self) -> bool:
+        self._flush_source_id = 0
+        names, self._pending = self._pending, set()
+        if names and self._directory is not None:
+            self._on_changes(self._directory, names)
+        return GLib.SOURCE_REMOVE
+
+
+def stat_entries(directory: str, names: Iterable[str]) -> Dict[str, Optional[FileItem]]:
+    """Fresh items for ``names``; None marks entries that are gone."""
+    return {name: FileItem.from_local_path(directory, name) for name in names}
+
+
+def apply_entry_changes(store, changes: Dict[str, Optional[FileItem]]) -> None:
+    """Replace, remove or add the changed entries of a ``Gio.ListStore``.
+
+    Untouched items keep their positions, so selection and scroll state
+    survive; the sorter and filter above the store place new items.
+    """
+    positions = {}
+    for position in range(store.get_n_items()):
+        positions[store.get_item(position).name] = position
+
+    removed = []
+    added = []
+    for name, item in changes.items():
+        position = positions.get(name)
+        if item is None:
+            if position is not None:
+                removed.append(position)
+        elif position is None:
+            added.append(item)
+        else:
+            store.splice(position, 1, [item])
+
+    for position in sorted(removed, reverse=True):
+        store.remove(position)
+    if added:
+        store.splice(store.get_n_items(), 0, added)
@@ -0,0 +1,411 @@
+"""In-memory filename index for repeated recursive searches in one session."""
+
+from __future__ import annotations
+
+import fnmatch
+import grp
+import os
+import posixpath
+import pwd
+import stat
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+# Trees larger than this are left to fd/find; the index would cost more
+# memory than the searches it saves.
+MAX_INDEXED_ENTRIES = 300_000
+# Directory paths passed to one remote ``find`` during incremental refresh.
+REMOTE_REFRESH_BATCH_CHARS = 60_000
+_GLOB_CHARS = frozenset("*?[")
+# %M perms, %s size, %T@ mtime, %u owner, %g group, %h parent, %f name, %l target
+_FIND_ENTRY_FORMAT = "%M\\t%s\\t%T@\\t%u\\t%g\\t%h\\t%f\\t%l\\n"
+_FIND_DIRECTORY_FORMAT = "%T@\\t%p\\n"
+
+
+class FilenameIndexTooLarge(Exception):
+    pass
+
+
+class IndexedEntry(NamedTuple):
+    name: str
+    permissions: str
+    size: int
+    mtime: float
+    owner: str
+    group: str
+    link_target: str
+
+
+class _DirectoryNode:
+    """One directory of the index: its mtime and sorted children."""
+
+    __slots__ = ("mtime", "entries", "folded_names", "subdirs")
+
+    def __init__(self, mtime: float, entries: Iterable[IndexedEntry]) -> None:
+        self.mtime = mtime
+        self.entries = tuple(sorted(entries, key=lambda entry: entry.name))
+        self.folded_names = tuple(entry.name.casefold() for entry in self.entries)
+        self.subdirs = tuple(
+            entry.name for entry in self.entries if entry.permissions.startswith("d")
+        )
+
+
+def _build_matcher(term: str) -> Callable[[str], bool]:
+    """Case-insensitive substring match, or a glob when ``term`` has wildcards."""
+    folded = term.casefold()
+    if _GLOB_CHARS.intersection(folded):
+        return lambda name: fnmatch.fnmatchcase(name, folded)
+    return lambda name: folded in name
+
+
+class FilenameIndex:
+    """Filenames below ``root``, keyed by directory path.
+
+    Each directory keeps its children sorted by name, and the ``subdirs``
+    of every node link the directories into a path tree that queries walk
+    from the search base downwards. Refreshes only rescan directories
+    whose mtime changed since they were indexed.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = posixpath.normpath(root)
+        self.ready = False
+        self.too_large = False
+        self.entry_count = 0
+        self._nodes: dict[str, _DirectoryNode] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def covers(self, path: str) -> bool:
+        path = posixpath.normpath(path)
+        return path == self.root or path.startswith(self.root.rstrip("/") + "/")
+
+    def directory_mtime(self, path: str) -> Optional[float]:
+        node = self._nodes.get(path)
+        return node.mtime if node else None
+
+    def subdirectories(self, path: str) -> tuple[str, ...]:
+        node = self._nodes.get(path)
+        return node.subdirs if node else ()
+
+    def discard(self) -> None:
+        """Forget all entries; used when the tree turned out too large."""
+        with self._lock:
+            self._nodes.clear()
+            self.entry_count = 0
+        self.ready = False
+        self.too_large = True
+
+    def set_directory(
+        self, path: str, mtime: float, entries: Iterable[IndexedEntry]
+    ) -> None:
+        node = _DirectoryNode(mtime, entries)
+        with self._lock:
+            previous = self._nodes.get(path)
+            self.entry_count += len(node.entries) - (
+                len(previous.entries) if previous else 0
+            )
+            self._nodes[path] = node
+        if self.entry_count > MAX_INDEXED_ENTRIES:
+            raise FilenameIndexTooLarge(
+                f"More than {MAX_INDEXED_ENTRIES} entries below {self.root}"
+            )
+
+    def retain(self, directories: set[str]) -> None:
+        """Drop directories that no longer exist."""
+        with self._lock:
+            for path in [path for path in self._nodes if path not in directories]:
+                self.entry_count -= len(self._nodes.pop(path).entries)
+
+    def search(
+        self, base_path: str, term: str, show_hidden: bool, limit: int
+    ) -> tuple[list[tuple[str, IndexedEntry]], bool]:
+        """Return ``(relative_path, entry)`` matches below ``base_path``.
+
+        The boolean is True when ``limit`` cut the result list short.
+        """
+        matches = _build_matcher(term)
+        results: list[tuple[str, IndexedEntry]] = []
+        base_path = posixpath.normpath(base_path)
+        with self._lock:
+            pending = [(base_path, "")]
+            while pending:
+                path, relative = pending.pop()
+                node = self._nodes.get(path)
+                if node is None:
+                    continue
+                for entry, folded in zip(node.entries, node.folded_names):
+                    if not show_hidden and entry.name.startswith("."):
+                        continue
+                    if matches(folded):
+                        results.append((f"{relative}{entry.name}", entry))
+                        if len(results) >= limit:
+                            return results, True
+                for name in reversed(node.subdirs):
+                    if show_hidden or not name.startswith("."):
+                        pending.append(
+                            (posixpath.join(path, name), f"{relative}{name}/")
+                        )
+        return results, False
+
+    def try_begin_refresh(self) -> bool:
+        return self._refresh_lock.acquire(blocking=False)
+
+    def end_refresh(self) -> None:
+        self._refresh_lock.release()
+
+
+class _OwnerNames:
+    """Caches uid/gid to name lookups during a local scan."""
+
+    def __init__(self) -> None:
+        self._users: dict[int, str] = {}
+        self._groups: dict[int, str] = {}
+
+    def user(self, uid: int) -> str:
+        if uid not in self._users:
+            try:
+                self._users[uid] = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                self._users[uid] = str(uid)
+        return self._users[uid]
+
+    def group(self, gid: int) -> str:
+        if gid not in self._groups:
+            try:
+                self._groups[gid] = grp.getgrgid(gid).gr_name
+            except KeyError:
+                self._groups[gid] = str(gid)
+        return self._groups[gid]
+
+
+def _scan_local_directory(path: str, owners: _OwnerNames) -> list[IndexedEntry]:
+    entries = []
+    with os.scandir(path) as iterator:
+        for dir_entry in iterator:
+            try:
+                info = dir_entry.stat(follow_symlinks=False)
+                link_target = (
+                    os.readlink(dir_entry.path) if dir_entry.is_symlink() else ""
+                )
+            except OSError:
+                continue
+            entries.append(
+                IndexedEntry(
+                    name=dir_entry.name,
+                    permissions=stat.filemode(info.st_mode),
+                    size=info.st_size,
+                    mtime=info.st_mtime,
+                    owner=owners.user(info.st_uid),
+                    group=owners.group(info.st_gid),
+                    link_target=link_target,
+                )
+            )
+    return entries
+
+
+def refresh_local_index(
+    index: FilenameIndex, is_cancelled: Callable[[], bool] = lambda: False
+) -> int:
+    """Walk the local tree, rescanning only directories whose mtime changed.
+
+    Returns the number of directories that were (re)scanned.
+    """
+    owners = _OwnerNames()
+    seen: set[str] = set()
+    rescanned = 0
+    pending = [index.root]
+    while pending:
+        if is_cancelled():
+            return rescanned
+        path = pending.pop()
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        seen.add(path)
+        if index.directory_mtime(path) != mtime:
+            try:
+                entries = _scan_local_directory(path, owners)
+            except OSError:
+                continue
+            index.set_directory(path, mtime, entries)
+            rescanned += 1
+        pending.extend(
+            posixpath.join(path, name) for name in index.subdirectories(path)
+        )
+    index.retain(seen)
+    index.ready = True
+    return rescanned
+
+
+def _parse_find_entry(line: str) -> Optional[tuple[str, IndexedEntry]]:
+    fields = line.rstrip("\n").split("\t")
+    if len(fields) != 8:
+        return None
+    perms, size, mtime, owner, group, parent, name, link_target = fields
+    try:
+        entry = IndexedEntry(
+            name=name,
+            permissions=perms,
+            size=int(size),
+            mtime=float(mtime),
+            owner=owner,
+            group=group,
+            link_target=link_target,
+        )
+    except ValueError:
+        return None
+    return posixpath.normpath(parent), entry
+
+
+@contextmanager
+def _streamed_lines(operations, command: list[str]) -> Iterator[Iterable[str]]:
+    """Yield the command's stdout; kill it if the reader stops early."""
+    with operations.stream_command_on_session(command) as proc:
+        try:
+            yield proc.stdout
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+
+
+def _read_remote_listings(
+    operations,
+    command: list[str],
+    listings: dict[str, list[IndexedEntry]],
+    is_cancelled: Callable[[], bool],
+    budget: int,
+) -> int:
+    """Collect ``find`` entries by parent; return how many were read.
+
+    Raises :class:`FilenameIndexTooLarge` as soon as more than ``budget``
+    entries arrive, which stops ``find`` instead of buffering the rest.
+    """
+    count = 0
+    with _streamed_lines(operations, command) as lines:
+        for line in lines:
+            if is_cancelled():
+                break
+            parsed = _parse_find_entry(line)
+            if parsed is None:
+                continue
+            count += 1
+            if count > budget:
+                raise FilenameIndexTooLarge(
+                    f"More than {MAX_INDEXED_ENTRIES} entries in the listing"
+                )
+            parent, entry = parsed
+            listings.setdefault(parent, []).append(entry)
+    return count
+
+
+def _own_mtime(
+    listings: dict[str, list[IndexedEntry]], path: str
+) -> Optional[float]:
+    """mtime from the line ``find`` printed for its starting point."""
+    # "/" may come back with an empty %h, which _parse_find_entry makes ".".
+    for parent in {posixpath.dirname(path), "."}:
+        for entry in listings.get(parent, ()):
+            if posixpath.join(parent, entry.name) == path:
+                return entry.mtime
+    return None
+
+
+def refresh_remote_index(
+    index: FilenameIndex,
+    operations,
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> int:
+    """Index a remote tree with streamed ``find -printf`` output.
+
+    The first build is a single ``find`` over the whole tree. Later
+    refreshes list directory mtimes first and only re-list the directories
+    that changed. Returns the number of directories that were (re)scanned.
+    """
+    root = index.root
+    listings: dict[str, list[IndexedEntry]] = {}
+    if not index.ready:
+        _read_remote_listings(
+            operations,
+            ["find", root, "-printf", _FIND_ENTRY_FORMAT],
+            listings,
+            is_cancelled,
+            MAX_INDEXED_ENTRIES,
+        )
+        if is_cancelled():
+            return 0
+        mtimes = {
+            posixpath.join(parent, entry.name): entry.mtime
+            for parent, entries in listings.items()
+            for entry in entries
+            if entry.permissions.startswith("d")
+        }
+        root_mtime = _own_mtime(listings, root)
+        if root_mtime is None:
+            return 0
+        # Same value the incremental "-type d" listing reports for the root.
+        mtimes[root] = root_mtime
+        changed = set(mtimes)
+    else:
+        mtimes = {}
+        with _streamed_lines(
+            operations, ["find", root, "-type", "d", "-printf", _FIND_DIRECTORY_FORMAT]
+        ) as lines:
+            for line in lines:
+                if is_cancelled():
+                    return 0
+                mtime, _sep, path = line.rstrip("\n").partition("\t")
+                try:
+                    mtimes[posixpath.normpath(path)] = float(mtime)
+                except ValueError:
+                    continue
+        changed = {
+            path for path, mtime in mtimes.items() if index.directory_mtime(path) != mtime
+        }
+        batch: list[str] = []
+        batch_chars = 0
+        read = 0
+        for path in sorted(changed):
+            batch.append(path)
+            batch_chars += len(path) + 1
+            if batch_chars >= REMOTE_REFRESH_BATCH_CHARS:
+                read += _read_remote_listings(
+                    operations,
+                    _list_children_command(batch),
+                    listings,
+                    is_cancelled,
+                    MAX_INDEXED_ENTRIES - read,
+                )
+                batch, batch_chars = [], 0
+        if batch:
+            _read_remote_listings(
+                operations,
+                _list_children_command(batch),
+                listings,
+                is_cancelled,
+                MAX_INDEXED_ENTRIES - read,
+            )
+        if is_cancelled():
+            return 0
+
+    for path in changed:
+        if path in mtimes:
+            index.set_directory(path, mtimes[path], listings.get(path, ()))
+    index.retain(set(mtimes))
+    index.ready = True
+    return len(changed)
+
+
+def _list_children_command(directories: list[str]) -> list[str]:
+    return [
+        "find",
+        *directories,
+        "-mindepth",
+        "1",
+        "-maxdepth",
+        "1",
+        "-printf",
+        _FIND_ENTRY_FORMAT,
+    ]
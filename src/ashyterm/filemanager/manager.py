@@ -35,6 +35,11 @@ from .cleanup import (
     cleanup_model_references as _cleanup_model_references_impl,
     nullify_references as _nullify_references_impl,
 )
+from .directory_watcher import (
+    DirectoryWatcher,
+    apply_entry_changes,
+    stat_entries,
+)
 from .fm_column_view import ColumnViewDelegate
 from .fm_context_menu import ContextMenuDelegate
 from .ls_output import (
@@ -89,6 +94,9 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
 
         self.config_dir = get_config_directory()
         self.transfer_manager = TransferManager(str(self.config_dir), self.operations)
+        self.transfer_manager.connect(
+            "transfer-retry-requested", self._on_transfer_retry_requested
+        )
 
         if self.settings_manager.get("use_system_tmp_for_edit", False):
             self.remote_edit_dir = Path(tempfile.gettempdir()) / "ashyterm_remote_edit"
@@ -109,6 +117,8 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
             ""  # Track last successfully listed path for fallback
         )
         self.file_monitors: dict[str, Any] = {}
+        # Live updates for the listed directory of local sessions.
+        self._directory_watcher = DirectoryWatcher(self._on_local_directory_changes)
         self.edited_file_metadata: dict[tuple[str, ...], Any] = {}
         self._is_rebinding = False  # Flag to prevent race conditions during rebind
         self._rsync_status: Dict[str, bool] = {}
@@ -131,6 +141,11 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
         self.recursive_search_enabled = False
         self._showing_recursive_results = False
         self._recursive_search_generation = 0
+        # Search generation whose results currently fill the store.
+        self._recursive_results_generation = -1
+        # Optional per-session filename index answering repeated searches.
+        self._filename_index = None
+        self._filename_index_session: Optional[str] = None
         self._recursive_search_in_progress = False
 
         # Delegates for column view and context menu logic
@@ -218,6 +233,7 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
 
         self.operations = FileOperations(self.session_item)
         self.transfer_manager.file_operations = self.operations
+        self.operations.engine_advisor = self.transfer_manager.preferred_engine
         self._check_remote_rsync_requirement()
 
         self.directory_change_handler_id = self.bound_terminal.connect(
@@ -442,6 +458,7 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
         if self.operations:
             self.operations.shutdown()
 
+        self._directory_watcher.stop()
         self.unbind()
 
     def destroy(self) -> None:
@@ -991,6 +1008,7 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
             if source == "filemanager":
                 self.column_view.grab_focus()
         else:
+            self._directory_watcher.stop()
             if self.bound_terminal:
                 self.bound_terminal.grab_focus()
 
@@ -1042,7 +1060,7 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
                 return
 
             all_items = self._parse_ls_output(output, requested_path)
-            GLib.idle_add(self._set_store_items, all_items, requested_path, source)
+            GLib.idle_add(self._apply_listing, all_items, requested_path, source)
 
         except Exception as e:
             self.logger.error(f"Error in background file listing: {e}")
@@ -1102,6 +1120,16 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
     def _resolve_link_target(self, file_item: FileItem, base_path: str) -> None:
         _ls_resolve_link(file_item, base_path)
 
+    def _apply_listing(self, items, requested_path, source):
+        """Show a finished listing and watch it when it is local."""
+        self._set_store_items(items, requested_path, source)
+        if not self._is_destroyed and requested_path == self.current_path:
+            if self._is_remote_session():
+                self._directory_watcher.stop()
+            else:
+                self._directory_watcher.watch(requested_path)
+        return False
+
     def _set_store_items(self, items, requested_path, source):
         """Set all store items in a single operation for optimal performance.
 
@@ -1128,6 +1156,9 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
         self._last_successful_path = requested_path
 
         self._showing_recursive_results = False
+        if self._recursive_search_in_progress:
+            # The listing replaced the results view; stop streaming into it.
+            self._recursive_search_generation += 1
         self._recursive_search_in_progress = False
         self._confirm_non_cd_pending_command()
         self._restore_search_entry(source)
@@ -1156,16 +1187,44 @@ class FileManager(FileSearchMixin, FileTransferMixin, GObject.Object):
 
         if error_message:
             self.logger.error(f"Error listing files: {error_message}")
+            self._directory_watcher.stop()
 
         if self.store is not None:
             self.store.splice(0, self.store.get_n_items(), file_items)
         self._showing_recursive_results = False
+        if self._recursive_search_in_progress:
+            # The listing replaced the results view; stop streaming into it.
+            self._recursive_search_generation += 1
         self._recursive_search_in_progress = False
 
         self._confirm_non_cd_pending_command()
         self._restore_search_entry(source)
         return False
 
+    def _is_watched_listing(self, directory: str) -> bool:
+        return (
+            not self._is_destroyed
+            and not self._showing_recursive_results
+            and bool(self.current_path)
+            and os.path.normpath(directory) == os.path.normpath(self.current_path)
+        )
+
+    def _on_local_directory_changes(self, directory: str, names: Set[str]) -> None:
+        if self._is_watched_listing(directory):
+            AsyncTaskManager.get().submit_io(
+                self._stat_changed_entries_thread, directory, names
+            )
+
+    def _stat_changed_entries_thread(self, directory: str, names: Set[str]) -> None:
+        changes = stat_entries(directory, names)
+        GLib.idle_add(self._apply_local_directory_changes, directory, changes)
+
+    def _apply_local_directory_changes(self, directory: str, changes) -> bool:
+        """Apply watched changes in place instead of relisting the directory."""
+        if self.store is not None and self._is_watched_listing(directory):
+            apply_entry_changes(self.store, changes)
+        return GLib.SOURCE_REMOVE
+
     def _fallback_to_accessible_path(self, fallback_path: str, source: str):
         """Navigate to an accessible fallback path when permission denied on current path.
 
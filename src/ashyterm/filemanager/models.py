@@ -1,9 +1,13 @@
 # ashyterm/filemanager/models.py
 import gi
-from typing import Any
+from typing import Any, Optional
 
 gi.require_version("Gtk", "4.0")
+import grp
+import os
+import pwd
 import re
+import stat
 from datetime import datetime
 
 from gi.repository import Gio, GLib, GObject
@@ -207,6 +211,45 @@ class FileItem(GObject.GObject):
             # Fallback to Regex for edge cases
             return cls._from_ls_line_regex(line)
 
+    @classmethod
+    def from_local_path(cls, directory: str, name: str) -> Optional["FileItem"]:
+        """Build the item ``ls -la --classify`` would list for a local entry.
+
+        Returns None when the entry no longer exists.
+        """
+        path = os.path.join(directory, name)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None
+        link_target = ""
+        if stat.S_ISLNK(st.st_mode):
+            try:
+                link_target = os.path.join(directory, os.readlink(path))
+            except OSError:
+                link_target = ""
+            # --classify marks link targets that are directories with "/".
+            if link_target and os.path.isdir(path):
+                link_target += "/"
+        try:
+            owner = pwd.getpwuid(st.st_uid).pw_name
+        except KeyError:
+            owner = str(st.st_uid)
+        try:
+            group = grp.getgrgid(st.st_gid).gr_name
+        except KeyError:
+            group = str(st.st_gid)
+        return cls(
+            name=name,
+            perms=stat.filemode(st.st_mode),
+            size=st.st_size,
+            date=datetime.fromtimestamp(int(st.st_mtime)),
+            owner=owner,
+            group=group,
+            is_link=bool(link_target),
+            link_target=link_target,
+        )
+
     @classmethod
     def _from_ls_line_regex(cls, line: str):
         """Fallback regex parser for edge cases."""
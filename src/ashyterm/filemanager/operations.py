@@ -1,15 +1,16 @@
 # ashyterm/filemanager/operations.py
 import ctypes
 import os
-import re
 import signal
 import shlex
 import subprocess
 import tempfile
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from gi.repository import GLib
 
@@ -22,15 +23,52 @@ from .accelerated_download import (
     AcceleratedDownloadUnavailable,
     AsyncSSHSegmentedDownloader,
 )
+from .accelerated_upload import (
+    AcceleratedUploadCancelled,
+    AcceleratedUploadConfig,
+    AcceleratedUploadUnavailable,
+    AsyncSSHSegmentedUploader,
+)
+from .transfer_sizes import (
+    DirectorySizeCache,
+    measure_local_sizes,
+    parse_du_output,
+)
+from .delta_upload import (
+    DELTA_MIN_FILE_SIZE,
+    AsyncSSHDeltaUploader,
+    DeltaUploadUnavailable,
+)
+from .remote_probes import (
+    PROBE_CACHE_TTL,
+    PROBE_COMMAND,
+    PROBE_FREE_SPACE,
+    PROBE_MTIME,
+    ProbeResult,
+    RemoteProbe,
+    build_probe_command,
+    parse_probe_output,
+)
+from .rsync_progress import OUTPUT_TAIL_LINES, RsyncProgressParser
+from .transfer_analytics import (
+    ENGINE_ACCELERATED,
+    ENGINE_DELTA,
+    ENGINE_RSYNC,
+    ENGINE_SFTP,
+    MIN_COMPARABLE_SIZE,
+    TransferTelemetry,
+)
+from .transfer_scheduler import TransferScheduler, host_of
+from .transfer_tuning import TransferTuningStore
 
-# Pre-compiled pattern for rsync progress parsing
-_PROGRESS_PERCENT_PATTERN = re.compile(r"(\d+)%")
 _RSYNC_COMPRESSION_MODES = {"auto", "always", "never"}
 _ACCELERATED_DOWNLOAD_DEFAULT_REQUESTS = 6
 _ACCELERATED_DOWNLOAD_MIN_REQUESTS = 2
 _ACCELERATED_DOWNLOAD_MAX_REQUESTS = 10
 _ACCELERATED_DOWNLOAD_DEFAULT_MIN_SIZE_MB = 64
 _ACCELERATED_DOWNLOAD_CHUNK_SIZE_BYTES = 4 * 1024 * 1024
+# Upper bound for in-flight range requests when auto-tuning is enabled.
+_ACCELERATED_DOWNLOAD_MAX_TUNED_REQUESTS = 16
 _INCOMPRESSIBLE_EXTENSIONS = frozenset(
     {
         ".7z",
@@ -84,7 +122,7 @@ def set_pdeathsig_kill() -> None:
         libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
 
 
-def _drain_stderr_to_list(stderr_stream, output_list: list):
+def _drain_stderr_to_list(stderr_stream, output_list):
     """Drain ``stderr_stream`` in a thread to avoid pipe-buffer deadlock.
 
     Without this, a subprocess that reads stdout in a loop while writing
@@ -112,6 +150,28 @@ def _format_exception_for_log(exc: Exception) -> str:
     return f"{exc_type}: {message}" if message else exc_type
 
 
+@contextmanager
+def _stream_local_command(command: List[str]) -> Iterator[subprocess.Popen]:
+    """Local counterpart of ``stream_remote_command``.
+
+    Leaving the context terminates the process if it is still running and
+    waits for it, so an abandoned stream does not leave it behind.
+    """
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        errors="replace",
+    ) as proc:
+        try:
+            yield proc
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+
+
 class OperationCancelledError(Exception):
     """Custom exception to indicate that an operation was cancelled by the user."""
 
@@ -121,10 +181,9 @@ class FileOperations:
         self.session_item = session_item
         self._spawner = spawner
         self.logger = get_logger("ashyterm.filemanager.operations")
-        self._command_cache: dict[
-            str, dict[str, tuple[bool, float]]
-        ] = {}  # {session_key: {command: (available, timestamp)}}
-        self._cache_ttl = 300  # 5 minutes
+        self._probe_cache: dict[
+            str, dict[RemoteProbe, tuple[ProbeResult, float]]
+        ] = {}  # {session_key: {probe: (result, timestamp)}}
         self._max_cache_sessions = 50  # Max number of sessions in cache
         self._active_processes: dict[str, Any] = {}
         self._lock = threading.Lock()
@@ -132,6 +191,11 @@ class FileOperations:
         # against the same socket. Serialize remote probes/listings while
         # keeping them off the GTK main thread.
         self._remote_command_lock = threading.Lock()
+        self._size_cache = DirectorySizeCache()
+        self._transfer_telemetry: dict[str, TransferTelemetry] = {}
+        # Set by the file manager: (host, direction, default engine) ->
+        # the engine history measured fastest, or None when unknown.
+        self.engine_advisor: Optional[Callable[[str, str, str], Optional[str]]] = None
 
     def shutdown(self) -> None:
         """Terminate all active subprocess groups managed by this instance."""
@@ -162,55 +226,120 @@ class FileOperations:
                     )
             self._active_processes.clear()
 
-    def _get_session_key(self, session: SessionItem) -> str:
+    def _record_transfer_telemetry(
+        self, transfer_id: str, engine: str, transfer: Any = None
+    ) -> None:
+        """Remember which engine ran ``transfer_id`` and what it measured."""
+        telemetry = TransferTelemetry(
+            engine=engine,
+            chunk_retries=getattr(transfer, "chunk_retries", 0),
+            rtt_ms=getattr(transfer, "rtt_ms", None),
+        )
+        with self._lock:
+            self._transfer_telemetry[transfer_id] = telemetry
+
+    def pop_transfer_telemetry(self, transfer_id: str) -> Optional[TransferTelemetry]:
+        with self._lock:
+            return self._transfer_telemetry.pop(transfer_id, None)
+
+    @staticmethod
+    def _get_session_key(session: SessionItem) -> str:
+        """``user@host:port``, the key for every per-endpoint cache."""
         return f"{session.user or ''}@{session.host}:{session.port or 22}"
 
     def _prune_expired_cache(self, now: float) -> None:
         """Remove cache entries past their TTL (per-session + session-level)."""
-        for session_key in list(self._command_cache):
-            entries = self._command_cache[session_key]
-            for cmd in list(entries):
-                _available, cached_at = entries[cmd]
-                if now - cached_at >= self._cache_ttl:
-                    del entries[cmd]
+        for session_key in list(self._probe_cache):
+            entries = self._probe_cache[session_key]
+            for probe in list(entries):
+                _result, cached_at = entries[probe]
+                if now - cached_at >= PROBE_CACHE_TTL.get(probe.kind, 0):
+                    del entries[probe]
             if not entries:
-                del self._command_cache[session_key]
-
-    def _is_command_available(
-        self, session: SessionItem, command: str, use_cache: bool = True
-    ) -> bool:
-        session_key = self._get_session_key(session)
-        now = time.monotonic()
-        if use_cache:
-            self._prune_expired_cache(now)
-            cached = self._command_cache.get(session_key, {}).get(command)
-            if cached is not None:
-                available, cached_at = cached
-                if now - cached_at < self._cache_ttl:
-                    return available
-
-        check_command = ["command", "-v", command]
-        success, _ = self.execute_command_on_session(
-            check_command, session_override=session
-        )
+                del self._probe_cache[session_key]
 
-        if session_key not in self._command_cache:
+    def _store_probe_results(
+        self,
+        session_key: str,
+        results: Dict[RemoteProbe, ProbeResult],
+        now: float,
+    ) -> None:
+        cacheable = {
+            probe: (result, now)
+            for probe, result in results.items()
+            if PROBE_CACHE_TTL.get(probe.kind, 0) > 0
+        }
+        if not cacheable:
+            return
+        if session_key not in self._probe_cache:
             # Evict oldest sessions if cache exceeds size limit. Uses the
             # most-recently-updated timestamp per session so we evict truly
             # idle sessions first.
-            if len(self._command_cache) >= self._max_cache_sessions:
+            if len(self._probe_cache) >= self._max_cache_sessions:
                 oldest_key = min(
-                    self._command_cache,
+                    self._probe_cache,
                     key=lambda k: (
-                        max(ts for _, ts in self._command_cache[k].values())
-                        if self._command_cache[k]
+                        max(ts for _, ts in self._probe_cache[k].values())
+                        if self._probe_cache[k]
                         else 0
                     ),
                 )
-                del self._command_cache[oldest_key]
-            self._command_cache[session_key] = {}
-        self._command_cache[session_key][command] = (success, now)
-        return success
+                del self._probe_cache[oldest_key]
+            self._probe_cache[session_key] = {}
+        self._probe_cache[session_key].update(cacheable)
+
+    def run_probes(
+        self,
+        probes: List[RemoteProbe],
+        session_override: Optional[SessionItem] = None,
+        use_cache: bool = True,
+    ) -> Dict[RemoteProbe, ProbeResult]:
+        """Answer metadata ``probes`` with at most one command on the session.
+
+        Fresh cached results are reused; the rest run together as a single
+        shell script. If the command itself fails, every pending probe is
+        reported as failed and nothing is cached.
+        """
+        session = session_override if session_override else self.session_item
+        if not session:
+            return {probe: ProbeResult(False) for probe in probes}
+
+        session_key = self._get_session_key(session)
+        now = time.monotonic()
+        results: Dict[RemoteProbe, ProbeResult] = {}
+        pending: List[RemoteProbe] = []
+        if use_cache:
+            self._prune_expired_cache(now)
+            cached_entries = self._probe_cache.get(session_key, {})
+        else:
+            cached_entries = {}
+        for probe in dict.fromkeys(probes):
+            cached = cached_entries.get(probe)
+            if cached is not None:
+                results[probe] = cached[0]
+            else:
+                pending.append(probe)
+        if not pending:
+            return results
+
+        success, output = self.execute_command_on_session(
+            build_probe_command(pending), session_override=session
+        )
+        if not success:
+            self.logger.warning(f"Metadata probes failed: {output.strip()}")
+            results.update({probe: ProbeResult(False) for probe in pending})
+            return results
+
+        fresh = parse_probe_output(pending, output)
+        self._store_probe_results(session_key, fresh, now)
+        results.update(fresh)
+        return results
+
+    def _is_command_available(
+        self, session: SessionItem, command: str, use_cache: bool = True
+    ) -> bool:
+        probe = RemoteProbe(PROBE_COMMAND, command)
+        return self.run_probes([probe], session, use_cache=use_cache)[probe].ok
 
     def check_command_available(
         self,
@@ -275,16 +404,36 @@ class FileOperations:
         # This case should not be reached if session is always local or ssh
         return False, _("Unsupported session type for command execution.")
 
+    def stream_command_on_session(
+        self,
+        command: List[str],
+        session_override: Optional[SessionItem] = None,
+    ):
+        """Start ``command`` with stdout piped for line-by-line reading.
+
+        Returns a context manager yielding the running process. Leaving it
+        stops the process (and its SSH channel) if it has not exited yet.
+        """
+        session_to_use = session_override if session_override else self.session_item
+        if not session_to_use:
+            raise ValueError(_("No session context for file operation."))
+        if session_to_use.is_ssh():
+            if self._spawner is None:
+                from ..terminal.spawner import get_spawner
+
+                self._spawner = get_spawner()
+            return self._spawner.stream_remote_command(session_to_use, command)
+        return _stream_local_command(command)
+
     def get_remote_file_timestamp(self, remote_path: str) -> Optional[int]:
         """Gets the modification timestamp of a remote file."""
-        # The command 'stat -c %Y' is standard on GNU systems for getting the epoch timestamp.
-        command = ["stat", "-c", "%Y", remote_path]
-        success, output = self.execute_command_on_session(command)
-        if success and output.strip().isdigit():
-            return int(output.strip())
-        self.logger.warning(
-            f"Failed to get timestamp for {remote_path}. Output: {output}"
-        )
+        probe = RemoteProbe(PROBE_MTIME, remote_path)
+        # A timestamp is usually fetched right before a download, so the
+        # rsync check that download needs rides along in the same exec.
+        result = self.run_probes([probe, RemoteProbe(PROBE_COMMAND, "rsync")])[probe]
+        if result.ok:
+            return result.value
+        self.logger.warning(f"Failed to get timestamp for {remote_path}")
         return None
 
     def get_directory_size(
@@ -321,29 +470,93 @@ class FileOperations:
 
         return 0
 
-    def get_free_space(
+    def get_directory_sizes(
         self,
-        path: str,
+        paths: List[str],
         is_remote: bool = False,
         session_override: Optional[SessionItem] = None,
-    ) -> int:
-        """Free bytes at ``path`` via ``df -B1 --output=avail``; -1 on failure."""
-        try:
-            command = ["df", "-B1", "--output=avail", path]
+        mtimes: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, int]:
+        """Total bytes for each of ``paths`` in one batch; 0 on failure.
+
+        Remote paths share a single ``du -sb`` call, local ones are walked
+        in parallel. Sizes are cached per path and mtime for a short while;
+        remote mtimes come from ``mtimes`` (the listing), local ones from
+        ``os.stat``.
+        """
+        session = session_override or self.session_item
+        scope = self._get_session_key(session) if is_remote and session else "local"
+        sizes: Dict[str, int] = {}
+        pending: List[Tuple[str, Optional[float]]] = []
+        for path in dict.fromkeys(paths):
+            if is_remote:
+                mtime = (mtimes or {}).get(path)
+            else:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    mtime = None
+            cached = self._size_cache.get((scope, path), mtime)
+            if cached is not None:
+                sizes[path] = cached
+            else:
+                pending.append((path, mtime))
+        if not pending:
+            return sizes
 
+        pending_paths = [path for path, _mtime in pending]
+        try:
             if is_remote:
+                # du exits non-zero when any path is unreadable; keep the
+                # sizes it printed for the others.
+                command = [
+                    "sh",
+                    "-c",
+                    'du -sb -- "$@" 2>/dev/null; exit 0',
+                    "sh",
+                    *pending_paths,
+                ]
                 success, output = self.execute_command_on_session(
-                    command, session_override, timeout=10
+                    command, session_override, timeout=60
                 )
+                measured = parse_du_output(output) if success else {}
             else:
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                success = result.returncode == 0
-                output = result.stdout if success else result.stderr
+                measured = measure_local_sizes(pending_paths)
+        except Exception as e:
+            self.logger.warning(f"Failed to get directory sizes: {e}")
+            measured = {}
+
+        for path, mtime in pending:
+            size = measured.get(path, 0)
+            sizes[path] = size
+            if size > 0:
+                self._size_cache.put((scope, path), mtime, size)
+        return sizes
+
+    def get_free_space(
+        self,
+        path: str,
+        is_remote: bool = False,
+        session_override: Optional[SessionItem] = None,
+    ) -> int:
+        """Free bytes at ``path`` via ``df -B1 --output=avail``; -1 on failure."""
+        if is_remote:
+            probe = RemoteProbe(PROBE_FREE_SPACE, path)
+            # Uploads follow a free-space check; warm their rsync check too.
+            result = self.run_probes(
+                [probe, RemoteProbe(PROBE_COMMAND, "rsync")], session_override
+            )[probe]
+            return result.value if result.ok else -1
+
+        try:
+            result = subprocess.run(
+                ["df", "-B1", "--output=avail", path],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            success = result.returncode == 0
+            output = result.stdout if success else result.stderr
 
             if success and output.strip():
                 # Output format: "Avail\n12345678" (header + value)
@@ -438,6 +651,19 @@ class FileOperations:
             options=sftp_options,
         )
 
+    @staticmethod
+    def _get_process_bandwidth_share() -> int:
+        """Bytes per second one rsync/sftp process may use, 0 if uncapped.
+
+        External tools cannot draw from the shared token bucket, so each
+        gets an even share of the cap at the time it starts.
+        """
+        scheduler = TransferScheduler.get()
+        rate = scheduler.bandwidth.rate
+        if rate <= 0:
+            return 0
+        return max(1, rate // max(1, scheduler.active_count))
+
     def _get_rsync_compression_mode(self) -> str:
         try:
             from ..settings.manager import get_settings_manager
@@ -528,24 +754,115 @@ class FileOperations:
             strict_host_key,
         )
 
+    def _get_accelerated_upload_min_size_bytes(self) -> int:
+        min_size_mb = self._get_clamped_int_setting(
+            "file_transfer_accelerated_upload_min_size_mb",
+            _ACCELERATED_DOWNLOAD_DEFAULT_MIN_SIZE_MB,
+            0,
+            4096,
+        )
+        return min_size_mb * 1024 * 1024
+
     def _should_use_accelerated_download(
         self, session: SessionItem, is_directory: bool, file_size: int
     ) -> bool:
-        enabled, parallel_requests, min_size_bytes, _timeout, _strict_host_key = (
+        enabled, _requests, min_size_bytes, _timeout, _strict_host_key = (
             self._get_accelerated_download_settings()
         )
-        if not enabled or parallel_requests < _ACCELERATED_DOWNLOAD_MIN_REQUESTS:
+        if not enabled or file_size < min_size_bytes:
             return False
-        if not session or not session.is_ssh():
+        return self._can_use_accelerated_engine(session, file_size, "download")
+
+    def _should_use_accelerated_upload(
+        self, session: SessionItem, is_directory: bool, file_size: int
+    ) -> bool:
+        if not bool(self._get_setting_value("file_transfer_accelerated_uploads", True)):
+            return False
+        if file_size < self._get_accelerated_upload_min_size_bytes():
             return False
-        if file_size < min_size_bytes:
+        return self._can_use_accelerated_engine(session, file_size, "upload")
+
+    def _should_use_delta_upload(
+        self, session: SessionItem, is_directory: bool, file_size: int
+    ) -> bool:
+        if is_directory or file_size < DELTA_MIN_FILE_SIZE:
+            return False
+        if not bool(self._get_setting_value("file_transfer_delta_save_uploads", True)):
+            return False
+        # No acceleration size threshold and no engine preference: a delta
+        # upload pays off on much smaller files than a parallel one.
+        return self._can_use_accelerated_engine(session, 0, "upload")
+
+    def _can_use_accelerated_engine(
+        self, session: SessionItem, file_size: int, direction: str
+    ) -> bool:
+        """Whether the asyncssh engine can serve ``session`` at all."""
+        _enabled, parallel_requests, _min_size, _timeout, _strict_host_key = (
+            self._get_accelerated_download_settings()
+        )
+        if parallel_requests < _ACCELERATED_DOWNLOAD_MIN_REQUESTS:
+            return False
+        if not session or not session.is_ssh():
             return False
         if session.proxy_jump:
             return False
         if session.uses_password_auth() and not session.auth_value:
             return False
+        if self.engine_advisor and file_size >= MIN_COMPARABLE_SIZE:
+            # Hosts where rsync or SFTP measured clearly faster keep them.
+            preferred = self.engine_advisor(
+                host_of(self._get_session_key(session)),
+                direction,
+                ENGINE_ACCELERATED,
+            )
+            if preferred not in (None, ENGINE_ACCELERATED):
+                self.logger.debug(
+                    f"Transfer history prefers {preferred} for {session.host}"
+                )
+                return False
         return True
 
+    def _get_transfer_tuning_store(self) -> Optional[TransferTuningStore]:
+        """Return the per-host tuning store, or None when auto-tuning is off."""
+        if not bool(self._get_setting_value("file_transfer_auto_tune", True)):
+            return None
+        try:
+            from ..settings.config import get_config_paths
+
+            return TransferTuningStore(
+                get_config_paths().CACHE_DIR / "transfer_tuning.json"
+            )
+        except Exception as exc:
+            self.logger.debug(f"Transfer tuning store unavailable: {exc}")
+            return None
+
+    def _get_transfer_journal_dir(self) -> Optional[Path]:
+        try:
+            from ..settings.config import get_config_paths
+
+            return get_config_paths().CACHE_DIR / "transfer_journals"
+        except Exception as exc:
+            self.logger.debug(f"Transfer journals unavailable: {exc}")
+            return None
+
+    def _fail_resumable_transfer(
+        self, completion_callback, transfer_id: str, path: str, error_detail: str
+    ) -> None:
+        """Report a failed accelerated transfer whose partial data was kept.
+
+        Falling back to rsync here would restart from zero; retrying the
+        transfer instead resumes from the chunk journal.
+        """
+        self.logger.warning(
+            f"Accelerated transfer interrupted for {path}; partial data kept: {error_detail}"
+        )
+        self._schedule_transfer_completion(
+            completion_callback,
+            transfer_id,
+            False,
+            _("Transfer interrupted. Retry to resume from where it stopped."),
+        )
+
     def _start_accelerated_download_with_fallback(
         self,
         transfer_id: str,
@@ -568,9 +885,24 @@ class FileOperations:
                 connect_timeout,
                 strict_host_key,
             ) = self._get_accelerated_download_settings()
+            tuning_store = self._get_transfer_tuning_store()
+            learned = (
+                tuning_store.get(self._get_session_key(session))
+                if tuning_store
+                else None
+            )
             config = AcceleratedDownloadConfig(
-                parallel_requests=parallel_requests,
-                chunk_size_bytes=_ACCELERATED_DOWNLOAD_CHUNK_SIZE_BYTES,
+                parallel_requests=(
+                    learned.parallel_requests if learned else parallel_requests
+                ),
+                chunk_size_bytes=(
+                    learned.chunk_size_bytes
+                    if learned
+                    else _ACCELERATED_DOWNLOAD_CHUNK_SIZE_BYTES
+                ),
+                resumable=True,
+                auto_tune=tuning_store is not None,
+                max_parallel_requests=_ACCELERATED_DOWNLOAD_MAX_TUNED_REQUESTS,
                 connect_timeout=connect_timeout,
                 strict_host_key_checking=strict_host_key,
             )
@@ -579,12 +911,14 @@ class FileOperations:
                 if progress_callback:
                     GLib.idle_add(progress_callback, transfer_id, progress)
 
+            downloader = None
             try:
                 downloader = AsyncSSHSegmentedDownloader(
                     session,
                     config,
                     progress_callback=emit_progress,
                     cancellation_event=cancellation_event,
+                    bandwidth_limiter=TransferScheduler.get().bandwidth,
                 )
                 if is_directory:
                     downloader.download_directory(
@@ -596,6 +930,15 @@ class FileOperations:
                     downloader.download(
                         remote_path, local_path, expected_size=file_size
                     )
+                if getattr(downloader, "bytes_written", 0):
+                    self.logger.debug(
+                        f"Accelerated download of {remote_path} wrote "
+                        f"{downloader.bytes_written} bytes, "
+                        f"{downloader.copied_bytes_per_mb():.0f} bytes copied per MB"
+                    )
+                self._record_transfer_telemetry(
+                    transfer_id, ENGINE_ACCELERATED, downloader
+                )
                 self._schedule_transfer_completion(
                     completion_callback,
                     transfer_id,
@@ -604,6 +947,9 @@ class FileOperations:
                 )
             except AcceleratedDownloadCancelled:
                 self.logger.warning(f"Download cancelled for {remote_path}")
+                self._record_transfer_telemetry(
+                    transfer_id, ENGINE_ACCELERATED, downloader
+                )
                 self._schedule_transfer_completion(
                     completion_callback, transfer_id, False, "Cancelled"
                 )
@@ -624,6 +970,14 @@ class FileOperations:
                 )
             except Exception as exc:
                 error_detail = _format_exception_for_log(exc)
+                if getattr(downloader, "resumable_bytes", 0) > 0:
+                    self._record_transfer_telemetry(
+                        transfer_id, ENGINE_ACCELERATED, downloader
+                    )
+                    self._fail_resumable_transfer(
+                        completion_callback, transfer_id, remote_path, error_detail
+                    )
+                    return
                 self.logger.warning(
                     f"Accelerated download failed for {remote_path}; falling back: {error_detail}"
                 )
@@ -638,9 +992,198 @@ class FileOperations:
                     completion_callback=completion_callback,
                     cancellation_event=cancellation_event,
                 )
+            finally:
+                tuner = getattr(downloader, "tuner", None)
+                if tuning_store and tuner and tuner.adjustments:
+                    tuning_store.save(self._get_session_key(session), tuner.tuning)
+
+        threading.Thread(target=accelerated_thread, daemon=True).start()
+
+    def _start_accelerated_upload_with_fallback(
+        self,
+        transfer_id: str,
+        session: SessionItem,
+        local_path: Path,
+        remote_path: str,
+        is_directory: bool,
+        progress_callback=None,
+        completion_callback=None,
+        cancellation_event: Optional[threading.Event] = None,
+    ) -> None:
+        """Start an AsyncSSH segmented upload and fallback to rsync/SFTP on error."""
+
+        def fallback() -> None:
+            self._transfer_with_progress(
+                transfer_id=transfer_id,
+                session=session,
+                source_path=str(local_path),
+                dest_path=remote_path,
+                is_directory=is_directory,
+                direction="upload",
+                progress_callback=progress_callback,
+                completion_callback=completion_callback,
+                cancellation_event=cancellation_event,
+            )
+
+        def accelerated_thread():
+            (
+                _enabled,
+                parallel_requests,
+                _download_min_size,
+                connect_timeout,
+                strict_host_key,
+            ) = self._get_accelerated_download_settings()
+            min_size_bytes = self._get_accelerated_upload_min_size_bytes()
+            config = AcceleratedUploadConfig(
+                parallel_requests=parallel_requests,
+                chunk_size_bytes=_ACCELERATED_DOWNLOAD_CHUNK_SIZE_BYTES,
+                journal_dir=self._get_transfer_journal_dir(),
+                connect_timeout=connect_timeout,
+                strict_host_key_checking=strict_host_key,
+            )
+
+            def emit_progress(progress: float) -> None:
+                if progress_callback:
+                    GLib.idle_add(progress_callback, transfer_id, progress)
+
+            uploader = None
+            try:
+                uploader = AsyncSSHSegmentedUploader(
+                    session,
+                    config,
+                    progress_callback=emit_progress,
+                    cancellation_event=cancellation_event,
+                    bandwidth_limiter=TransferScheduler.get().bandwidth,
+                )
+                if is_directory:
+                    uploader.upload_directory(
+                        local_path, remote_path, min_segment_size=min_size_bytes
+                    )
+                else:
+                    uploader.upload(local_path, remote_path)
+                self._record_transfer_telemetry(
+                    transfer_id, ENGINE_ACCELERATED, uploader
+                )
+                self._schedule_transfer_completion(
+                    completion_callback,
+                    transfer_id,
+                    True,
+                    _("Upload completed successfully."),
+                )
+            except AcceleratedUploadCancelled:
+                self.logger.warning(f"Upload cancelled for {local_path}")
+                self._record_transfer_telemetry(
+                    transfer_id, ENGINE_ACCELERATED, uploader
+                )
+                self._schedule_transfer_completion(
+                    completion_callback, transfer_id, False, "Cancelled"
+                )
+            except AcceleratedUploadUnavailable as exc:
+                self.logger.info(
+                    f"Accelerated upload unavailable for {local_path}; falling back: {exc}"
+                )
+                fallback()
+            except Exception as exc:
+                error_detail = _format_exception_for_log(exc)
+                if getattr(uploader, "resumable_bytes", 0) > 0:
+                    self._record_transfer_telemetry(
+                        transfer_id, ENGINE_ACCELERATED, uploader
+                    )
+                    self._fail_resumable_transfer(
+                        completion_callback, transfer_id, str(local_path), error_detail
+                    )
+                    return
+                self.logger.warning(
+                    f"Accelerated upload failed for {local_path}; falling back: {error_detail}"
+                )
+                fallback()
 
         threading.Thread(target=accelerated_thread, daemon=True).start()
 
+    def _start_delta_upload_with_fallback(
+        self,
+        transfer_id: str,
+        session: SessionItem,
+        local_path: Path,
+        remote_path: str,
+        file_size: int,
+        progress_callback=None,
+        completion_callback=None,
+        cancellation_event: Optional[threading.Event] = None,
+    ) -> None:
+        """Send only changed blocks of ``local_path``; any failure re-uploads it."""
+
+        def fallback() -> None:
+            self.start_upload_with_progress(
+                transfer_id,
+                session,
+                local_path,
+                remote_path,
+                is_directory=False,
+                file_size=file_size,
+                progress_callback=progress_callback,
+                completion_callback=completion_callback,
+                cancellation_event=cancellation_event,
+            )
+
+        def delta_thread():
+            (
+                _enabled,
+                parallel_requests,
+                _min_size_bytes,
+                connect_timeout,
+                strict_host_key,
+            ) = self._get_accelerated_download_settings()
+            config = AcceleratedUploadConfig(
+                parallel_requests=parallel_requests,
+                chunk_size_bytes=_ACCELERATED_DOWNLOAD_CHUNK_SIZE_BYTES,
+                connect_timeout=connect_timeout,
+                strict_host_key_checking=strict_host_key,
+            )
+
+            def emit_progress(progress: float) -> None:
+                if progress_callback:
+                    GLib.idle_add(progress_callback, transfer_id, progress)
+
+            try:
+                uploader = AsyncSSHDeltaUploader(
+                    session,
+                    config,
+                    progress_callback=emit_progress,
+                    cancellation_event=cancellation_event,
+                    bandwidth_limiter=TransferScheduler.get().bandwidth,
+                )
+                uploader.upload_delta(local_path, remote_path)
+                self.logger.debug(
+                    f"Delta upload of {remote_path} sent {uploader.bytes_sent} "
+                    f"of {uploader.bytes_total} bytes"
+                )
+                self._record_transfer_telemetry(transfer_id, ENGINE_DELTA, uploader)
+                self._schedule_transfer_completion(
+                    completion_callback,
+                    transfer_id,
+                    True,
+                    _("Upload completed successfully."),
+                )
+            except AcceleratedUploadCancelled:
+                self._record_transfer_telemetry(transfer_id, ENGINE_DELTA)
+                self._schedule_transfer_completion(
+                    completion_callback, transfer_id, False, "Cancelled"
+                )
+            except DeltaUploadUnavailable as exc:
+                self.logger.info(
+                    f"Delta upload unavailable for {remote_path}; uploading in full: {exc}"
+                )
+                fallback()
+            except Exception as exc:
+                self.logger.warning(
+                    f"Delta upload failed for {remote_path}; uploading in full: "
+                    f"{_format_exception_for_log(exc)}"
+                )
+                fallback()
+
+        threading.Thread(target=delta_thread, daemon=True).start()
+
     def _remove_sftp_batch_file(self, batch_file_path: Optional[str]) -> None:
         if not batch_file_path:
             return
@@ -697,6 +1240,7 @@ class FileOperations:
         try:
             spawner = self._get_transfer_spawner()
             if self._is_command_available(session, "rsync"):
+                self._record_transfer_telemetry(transfer_id, ENGINE_RSYNC)
                 self._run_rsync_transfer(
                     transfer_id,
                     session,
@@ -711,6 +1255,7 @@ class FileOperations:
                     cancellation_event,
                 )
             else:
+                self._record_transfer_telemetry(transfer_id, ENGINE_SFTP)
                 self._run_sftp_transfer(
                     transfer_id,
                     session,
@@ -766,7 +1311,7 @@ class FileOperations:
             spawner,
         )
         process = self._start_process(transfer_id, command)
-        stderr_lines: list[str] = []
+        stderr_lines: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
         stderr_thread = threading.Thread(
             target=_drain_stderr_to_list,
             args=(process.stderr, stderr_lines),
@@ -808,10 +1353,15 @@ class FileOperations:
         else:
             rsync_source = source_rsync
             rsync_dest = f"{remote_target}:{dest_path}"
-        return [
+        command = [
             "rsync",
             self._get_rsync_archive_flags(source_path, dest_path, is_directory),
-            "--progress",
+            "--info=progress2",
+        ]
+        bandwidth_share = self._get_process_bandwidth_share()
+        if bandwidth_share:
+            command.append(f"--bwlimit={max(1, bandwidth_share // 1024)}")
+        return command + [
             "-e",
             self._build_rsync_ssh_command(spawner, session),
             rsync_source,
@@ -826,16 +1376,20 @@ class FileOperations:
         progress_callback,
         cancellation_event: Optional[threading.Event],
     ) -> str:
-        output: list[str] = []
+        """Stream progress to the UI; return only the tail of the output."""
+
+        def emit(progress: float) -> None:
+            if progress_callback:
+                GLib.idle_add(progress_callback, transfer_id, progress)
+
+        parser = RsyncProgressParser(emit)
         for line in iter(process.stdout.readline, ""):
             if cancellation_event and cancellation_event.is_set():
                 os.killpg(os.getpgid(process.pid), signal.SIGTERM)
                 raise OperationCancelledError(f"{op_label} cancelled by user.")
-            output.append(line)
-            match = _PROGRESS_PERCENT_PATTERN.search(line)
-            if match and progress_callback:
-                GLib.idle_add(progress_callback, transfer_id, float(match.group(1)))
-        return "".join(output)
+            parser.feed(line)
+        parser.flush()
+        return parser.output_tail()
 
     def _run_sftp_transfer(
         self,
@@ -863,6 +1417,10 @@ class FileOperations:
                 "-b",
                 batch_file_path,
             ]
+            bandwidth_share = self._get_process_bandwidth_share()
+            if bandwidth_share:
+                # sftp -l takes Kbit/s.
+                command += ["-l", str(max(1, bandwidth_share * 8 // 1000))]
             process = self._start_process(transfer_id, command)
             stdout, stderr = process.communicate()
             self._complete_process_transfer(
@@ -959,11 +1517,48 @@ class FileOperations:
         local_path: Path,
         remote_path: str,
         is_directory: bool,
+        file_size: int = 0,
         progress_callback: Any = None,
         completion_callback: Any = None,
         cancellation_event: Optional[threading.Event] = None,
+        prefer_delta: bool = False,
     ) -> None:
-        """Start an upload operation with progress tracking."""
+        """Start an upload operation with progress tracking.
+
+        ``prefer_delta`` asks for a block-level delta against the existing
+        remote file, for files saved repeatedly while being edited.
+        """
+        if not file_size and not is_directory:
+            try:
+                file_size = local_path.stat().st_size
+            except OSError:
+                file_size = 0
+        if prefer_delta and self._should_use_delta_upload(
+            session, is_directory, file_size
+        ):
+            self._start_delta_upload_with_fallback(
+                transfer_id=transfer_id,
+                session=session,
+                local_path=local_path,
+                remote_path=remote_path,
+                file_size=file_size,
+                progress_callback=progress_callback,
+                completion_callback=completion_callback,
+                cancellation_event=cancellation_event,
+            )
+            return
+        if self._should_use_accelerated_upload(session, is_directory, file_size):
+            self._start_accelerated_upload_with_fallback(
+                transfer_id=transfer_id,
+                session=session,
+                local_path=local_path,
+                remote_path=remote_path,
+                is_directory=is_directory,
+                progress_callback=progress_callback,
+                completion_callback=completion_callback,
+                cancellation_event=cancellation_event,
+            )
+            return
         self._transfer_with_progress(
             transfer_id=transfer_id,
             session=session,
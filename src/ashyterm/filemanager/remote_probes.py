@@ -0,0 +1,76 @@
+"""Metadata probes answered by one shell script per round trip."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+PROBE_MTIME = "mtime"
+PROBE_COMMAND = "command"
+PROBE_FREE_SPACE = "free_space"
+
+# How long a result may be reused. Modification times back conflict
+# checks and are always fetched fresh.
+PROBE_CACHE_TTL = {
+    PROBE_COMMAND: 300.0,
+    PROBE_FREE_SPACE: 30.0,
+    PROBE_MTIME: 0.0,
+}
+
+# Arguments come in kind/argument pairs; every probe prints one
+# "<status>\t<value>" line, in order. The script itself always exits 0 so
+# a failed exec can be told apart from failed probes.
+_PROBE_SCRIPT = r"""
+while [ $# -ge 2 ]; do
+  kind=$1; arg=$2; shift 2
+  case $kind in
+    mtime) out=$(stat -c %Y -- "$arg" 2>/dev/null) ;;
+    command) out=$(command -v "$arg" 2>/dev/null) ;;
+    free_space) out=$(df -B1 --output=avail -- "$arg" 2>/dev/null | tail -n 1) ;;
+    *) out=; false ;;
+  esac
+  status=$?
+  printf '%s\t%s\n' "$status" "$(printf '%s' "$out" | tr '\t\n' '  ')"
+done
+exit 0
+"""
+
+
+@dataclass(frozen=True)
+class RemoteProbe:
+    kind: str
+    argument: str
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    ok: bool
+    value: Optional[Union[int, str]] = None
+
+
+def build_probe_command(probes: Sequence[RemoteProbe]) -> list[str]:
+    command = ["sh", "-c", _PROBE_SCRIPT, "sh"]
+    for probe in probes:
+        command += [probe.kind, probe.argument]
+    return command
+
+
+def _parse_value(kind: str, raw: str) -> Optional[Union[int, str]]:
+    raw = raw.strip()
+    if kind in (PROBE_MTIME, PROBE_FREE_SPACE):
+        return int(raw) if raw.isdigit() else None
+    return raw or None
+
+
+def parse_probe_output(
+    probes: Sequence[RemoteProbe], output: str
+) -> dict[RemoteProbe, ProbeResult]:
+    """Map each probe to its result; probes without a line have failed."""
+    results = {probe: ProbeResult(False) for probe in probes}
+    for probe, line in zip(probes, output.splitlines()):
+        status, _sep, raw = line.partition("\t")
+        if status.strip() != "0":
+            continue
+        value = _parse_value(probe.kind, raw)
+        results[probe] = ProbeResult(value is not None, value)
+    return results
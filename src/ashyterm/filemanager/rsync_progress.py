@@ -0,0 +1,71 @@
+"""Streaming, bounded-memory parsing of rsync ``--info=progress2`` output."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+from typing import Callable, Optional
+
+# Lines kept for error reporting; rsync prints its errors last.
+OUTPUT_TAIL_LINES = 200
+# Matches the UI refresh rate of the transfer progress bar.
+PROGRESS_EMIT_INTERVAL = 0.1
+# "  1,234,567  45%  10.50MB/s  0:00:10 (xfr#3, to-chk=10/20)"
+_PROGRESS2_PATTERN = re.compile(r"^\s*[\d,]+\s+(\d{1,3})%")
+
+
+class RsyncProgressParser:
+    """Turns rsync output lines into coalesced whole-transfer percentages.
+
+    Only the last :data:`OUTPUT_TAIL_LINES` non-progress lines are kept,
+    and ``emit`` is called at most once per ``interval`` with the latest
+    percentage; :meth:`flush` delivers a value held back by the interval.
+    """
+
+    def __init__(
+        self,
+        emit: Optional[Callable[[float], None]],
+        interval: float = PROGRESS_EMIT_INTERVAL,
+        tail_lines: int = OUTPUT_TAIL_LINES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._emit = emit
+        self._interval = interval
+        self._clock = clock
+        self._tail: deque[str] = deque(maxlen=tail_lines)
+        self._last_emit_time: Optional[float] = None
+        self._emitted: Optional[float] = None
+        self._pending: Optional[float] = None
+
+    def feed(self, line: str) -> None:
+        match = _PROGRESS2_PATTERN.match(line)
+        if match is None:
+            self._tail.append(line)
+            return
+        progress = float(min(100, int(match.group(1))))
+        if progress == self._emitted:
+            self._pending = None
+            return
+        now = self._clock()
+        if (
+            self._last_emit_time is not None
+            and now - self._last_emit_time < self._interval
+        ):
+            self._pending = progress
+            return
+        self._send(progress, now)
+
+    def flush(self) -> None:
+        if self._pending is not None:
+            self._send(self._pending, self._clock())
+
+    def output_tail(self) -> str:
+        return "".join(self._tail)
+
+    def _send(self, progress: float, now: float) -> None:
+        self._pending = None
+        self._emitted = progress
+        self._last_emit_time = now
+        if self._emit:
+            self._emit(progress)
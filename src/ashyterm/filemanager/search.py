@@ -4,6 +4,8 @@
 import shlex
 import subprocess
 import threading
+import time
+from datetime import datetime
 from pathlib import PurePosixPath
 from typing import List, Optional
 
@@ -13,11 +15,23 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import GLib, Gtk
 
 from ..utils.translation_utils import _
+from .filename_index import (
+    FilenameIndex,
+    FilenameIndexTooLarge,
+    IndexedEntry,
+    refresh_local_index,
+    refresh_remote_index,
+)
 from .models import FileItem
 from .operations import FileOperations
 
 MAX_RECURSIVE_RESULTS = 1000
 MAX_RECURSIVE_ERROR_LINES = 20
+# Results are pushed to the view in batches while the search still runs.
+SEARCH_RESULT_BATCH_SIZE = 100
+SEARCH_RESULT_BATCH_INTERVAL = 0.1  # seconds
+# How often a running search checks whether it was cancelled or superseded.
+SEARCH_CANCEL_POLL_INTERVAL = 0.1  # seconds
 
 
 class FileSearchMixin:
@@ -167,6 +181,13 @@ class FileSearchMixin:
             self._schedule_search_complete(generation, [], "Search cancelled", False)
             return
 
+        if self._is_filename_index_enabled():
+            indexed = self._search_filename_index(base_path, search_term, show_hidden)
+            if indexed is not None:
+                self._schedule_search_complete(generation, *indexed)
+                self._schedule_filename_index_refresh(base_path, operations)
+                return
+
         use_fd = self._check_fd_available(operations)
         command = self._build_search_command(
             base_path, search_term, show_hidden, use_fd
@@ -188,6 +209,107 @@ class FileSearchMixin:
             results, error_message, truncated = [], str(exc), False
 
         self._schedule_search_complete(generation, results, error_message, truncated)
+        if self._is_filename_index_enabled() and not error_message:
+            self._schedule_filename_index_refresh(base_path, operations)
+
+    def _is_filename_index_enabled(self) -> bool:
+        settings_manager = getattr(self, "settings_manager", None)
+        if settings_manager is None:
+            return False
+        return bool(settings_manager.get("file_manager_search_index", False))
+
+    def _get_filename_index(self, base_path: str) -> Optional[FilenameIndex]:
+        """Return the session's index if it covers ``base_path``."""
+        index = self._filename_index
+        if (
+            index is None
+            or self._filename_index_session != self._get_current_session_key()
+            or not index.covers(base_path)
+        ):
+            return None
+        return index
+
+    def _search_filename_index(
+        self, base_path: str, search_term: str, show_hidden: bool
+    ) -> Optional[tuple[list, str, bool]]:
+        """Answer a recursive search from the index, or None if it can't."""
+        index = self._get_filename_index(base_path)
+        if index is None or not index.ready:
+            return None
+        matches, truncated = index.search(
+            base_path, search_term, show_hidden, MAX_RECURSIVE_RESULTS
+        )
+        results = [
+            self._file_item_from_index(relative_path, entry)
+            for relative_path, entry in matches
+        ]
+        return results, "", truncated
+
+    def _file_item_from_index(
+        self, relative_path: str, entry: IndexedEntry
+    ) -> FileItem:
+        return FileItem(
+            name=relative_path,
+            perms=entry.permissions,
+            size=entry.size,
+            date=datetime.fromtimestamp(entry.mtime),
+            owner=entry.owner,
+            group=entry.group,
+            is_link=entry.permissions.startswith("l"),
+            link_target=entry.link_target,
+        )
+
+    def _schedule_filename_index_refresh(self, base_path: str, operations) -> None:
+        """Refresh the index below ``base_path`` as its own IO task.
+
+        A refresh can run a full remote ``find``, so it must not hold the
+        search thread. Dropped while a refresh of the same index is running.
+        """
+        index = self._get_filename_index(base_path)
+        if index is None:
+            index = FilenameIndex(base_path)
+            self._filename_index = index
+            self._filename_index_session = self._get_current_session_key()
+        if index.too_large or not index.try_begin_refresh():
+            return
+
+        from ..core.tasks import AsyncTaskManager
+
+        future = AsyncTaskManager.get().submit_io(
+            self._refresh_filename_index,
+            index,
+            operations,
+            self._is_remote_session(),
+        )
+        if future is None:
+            index.end_refresh()
+
+    def _refresh_filename_index(
+        self, index: FilenameIndex, operations, is_remote: bool
+    ) -> None:
+        """Build or incrementally refresh ``index``; the caller claimed it."""
+        try:
+            if is_remote:
+                rescanned = refresh_remote_index(
+                    index, operations, is_cancelled=lambda: self._is_destroyed
+                )
+            else:
+                rescanned = refresh_local_index(
+                    index, is_cancelled=lambda: self._is_destroyed
+                )
+            self.logger.debug(
+                f"Filename index for {index.root}: {index.entry_count} entries, "
+                f"{rescanned} directories rescanned"
+            )
+        except FilenameIndexTooLarge as exc:
+            self.logger.info(f"Not indexing {index.root}: {exc}")
+            index.discard()
+        except Exception as exc:
+            self.logger.warning(f"Filename index refresh failed: {exc}")
+            if self._filename_index is index:
+                self._filename_index = None
+        finally:
+            index.end_refresh()
 
     def _build_search_command(
         self, base_path: str, search_term: str, show_hidden: bool, use_fd: bool
@@ -205,28 +327,23 @@ class FileSearchMixin:
         use_fd: bool,
         operations,
     ) -> tuple[list, str, bool]:
-        """Execute remote search and process results."""
+        """Stream remote search output over SSH, reading it as it arrives."""
         results: list[FileItem] = []
-        error_message = ""
-        truncated = False
 
-        success, output = operations.execute_command_on_session(command)
-        if not success:
-            return results, output.strip(), False
-
-        for line in output.splitlines():
-            if self._recursive_search_generation != generation:
-                return [], "", False
-
-            if not line or (not use_fd and line.startswith("find:")):
-                continue
-
-            file_item = self._process_search_result_line(line, base_posix)
-            if file_item:
-                results.append(file_item)
-                if len(results) >= MAX_RECURSIVE_RESULTS:
-                    return results, "", True
+        with operations.stream_command_on_session(command) as proc:
+            stderr_lines: List[str] = []
+            stderr_thread = self._start_stderr_collector(proc, stderr_lines)
+            truncated = self._process_search_output(
+                proc, generation, base_posix, use_fd, results
+            )
+            return_code = self._finish_search_process(proc)
+            stderr_thread.join(timeout=0.5)
+            error_message = self._get_process_error(
+                return_code, stderr_lines, truncated
+            )
 
+        if self._recursive_search_generation != generation:
+            return [], "", False
         return results, error_message, truncated
 
     def _search_local(
@@ -292,23 +409,59 @@ class FileSearchMixin:
         use_fd: bool,
         results: list,
     ) -> bool:
-        """Process search output line by line. Returns True if truncated."""
-        for line in proc.stdout:
-            if self._recursive_search_generation != generation:
-                proc.terminate()
-                return False
+        """Process search output line by line. Returns True if truncated.
 
-            line = line.rstrip("\n")
-            if not line or (not use_fd and line.startswith("find:")):
-                continue
+        Matches are handed to the view in batches as they arrive; ``results``
+        only keeps the batch not yet shown when the output ends.
+        """
+        finished = threading.Event()
+        threading.Thread(
+            target=self._watch_search_cancellation,
+            args=(proc, generation, finished),
+            daemon=True,
+        ).start()
+        found = 0
+        last_batch = time.monotonic()
+        try:
+            for line in proc.stdout:
+                if self._recursive_search_generation != generation:
+                    proc.terminate()
+                    return False
 
-            file_item = self._process_search_result_line(line, base_posix)
-            if file_item:
+                line = line.rstrip("\n")
+                if not line or (not use_fd and line.startswith("find:")):
+                    continue
+
+                file_item = self._process_search_result_line(line, base_posix)
+                if not file_item:
+                    continue
                 results.append(file_item)
-                if len(results) >= MAX_RECURSIVE_RESULTS:
+                found += 1
+                if found >= MAX_RECURSIVE_RESULTS:
                     proc.terminate()
                     return True
-        return False
+                now = time.monotonic()
+                # The first match is shown right away, later ones in batches.
+                if (
+                    found == 1
+                    or len(results) >= SEARCH_RESULT_BATCH_SIZE
+                    or now - last_batch >= SEARCH_RESULT_BATCH_INTERVAL
+                ):
+                    self._schedule_search_batch(generation, results[:])
+                    results.clear()
+                    last_batch = now
+            return False
+        finally:
+            finished.set()
+
+    def _watch_search_cancellation(
+        self, proc, generation: int, finished: threading.Event
+    ) -> None:
+        """Stop ``proc`` when the search is superseded while output is quiet."""
+        while not finished.wait(SEARCH_CANCEL_POLL_INTERVAL):
+            if self._recursive_search_generation != generation:
+                proc.terminate()
+                return
 
     def _get_process_error(
         self, return_code: int, stderr_lines: List[str], truncated: bool
@@ -322,6 +475,32 @@ class FileSearchMixin:
             return _("Search failed.")
         return ""
 
+    def _schedule_search_batch(self, generation: int, file_items: list) -> None:
+        GLib.idle_add(self._append_recursive_search_results, generation, file_items)
+
+    def _append_recursive_search_results(
+        self, generation: int, file_items: List[FileItem]
+    ):
+        """Show one batch of a running search. Returns False for GLib.idle_add."""
+        if (
+            generation != self._recursive_search_generation
+            or not self.recursive_search_enabled
+        ):
+            return False
+        self._show_recursive_results(generation, file_items)
+        return False
+
+    def _show_recursive_results(
+        self, generation: int, file_items: List[FileItem]
+    ) -> None:
+        """Replace the view with the first batch of a search, append later ones."""
+        if self._recursive_results_generation != generation:
+            self._recursive_results_generation = generation
+            self.store.splice(0, self.store.get_n_items(), file_items)
+            self.combined_filter.changed(Gtk.FilterChange.DIFFERENT)
+        elif file_items:
+            self.store.splice(self.store.get_n_items(), 0, file_items)
+
     def _schedule_search_complete(
         self, generation: int, results: list, error_message: str, truncated: bool
     ) -> None:
@@ -472,14 +651,9 @@ class FileSearchMixin:
         if error_message:
             self.logger.warning(f"Recursive search warning: {error_message}")
 
-        self.store.splice(0, self.store.get_n_items(), file_items)
-        self.combined_filter.changed(Gtk.FilterChange.DIFFERENT)
+        self._show_recursive_results(generation, file_items)
 
-        if (
-            self.selection_model
-            and file_items
-            and self.selection_model.get_n_items() > 0
-        ):
+        if self.selection_model and self.selection_model.get_n_items() > 0:
             self.selection_model.select_item(0, True)
             if hasattr(self, "column_view") and self.column_view:
                 self.column_view.scroll_to(0, None, Gtk.ListScrollFlags.NONE, None)
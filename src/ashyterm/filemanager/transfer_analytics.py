@@ -0,0 +1,149 @@
+"""Per-transfer telemetry and the engine statistics derived from history."""
+
+from __future__ import annotations
+
+import csv
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+ENGINE_ACCELERATED = "accelerated"
+ENGINE_DELTA = "delta"
+ENGINE_RSYNC = "rsync"
+ENGINE_SFTP = "sftp"
+
+# Below this a transfer measures connection setup rather than throughput,
+# so smaller ones are left out of engine comparisons.
+MIN_COMPARABLE_SIZE = 8 * 1024 * 1024
+MIN_ENGINE_SAMPLES = 3
+# Another engine must be this much faster before it replaces the default.
+ENGINE_SWITCH_MARGIN = 1.2
+
+CSV_COLUMNS = (
+    "host",
+    "engine",
+    "transfers",
+    "completed",
+    "failures",
+    "bytes",
+    "median_throughput_bps",
+    "chunk_retries",
+    "mean_rtt_ms",
+)
+
+
+@dataclass
+class TransferTelemetry:
+    """What an engine reports about a transfer it ran."""
+
+    engine: str
+    chunk_retries: int = 0
+    rtt_ms: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class EngineStats:
+    host: str
+    engine: str
+    transfers: int
+    completed: int
+    failures: int
+    bytes: int
+    median_throughput: float
+    chunk_retries: int
+    mean_rtt_ms: Optional[float]
+
+
+def transfer_throughput(item) -> Optional[float]:
+    """Bytes per second of a completed transfer, or None."""
+    duration = item.get_duration()
+    if item.status.value != "completed" or not duration or item.file_size <= 0:
+        return None
+    return item.file_size / duration
+
+
+def summarize_transfers(items: Iterable) -> list[EngineStats]:
+    """Group history items by host and engine, fastest engine first per host."""
+    groups: dict[tuple[str, str], list] = {}
+    for item in items:
+        if item.engine:
+            groups.setdefault((item.host, item.engine), []).append(item)
+
+    summary = []
+    for (host, engine), group in groups.items():
+        throughputs = [
+            rate for rate in map(transfer_throughput, group) if rate is not None
+        ]
+        rtts = [item.rtt_ms for item in group if item.rtt_ms is not None]
+        summary.append(
+            EngineStats(
+                host=host,
+                engine=engine,
+                transfers=len(group),
+                completed=len(throughputs),
+                failures=sum(1 for item in group if item.status.value == "failed"),
+                bytes=sum(
+                    item.file_size
+                    for item in group
+                    if item.status.value == "completed"
+                ),
+                median_throughput=(
+                    statistics.median(throughputs) if throughputs else 0.0
+                ),
+                chunk_retries=sum(item.chunk_retries for item in group),
+                mean_rtt_ms=statistics.fmean(rtts) if rtts else None,
+            )
+        )
+    summary.sort(key=lambda stats: (stats.host, -stats.median_throughput))
+    return summary
+
+
+def preferred_engine(items: Iterable, host: str, default: str) -> Optional[str]:
+    """Engine that moved large files fastest to ``host``.
+
+    Returns None while ``default`` has too few samples to compare against.
+    Once another engine wins, ``default`` samples age out of the history
+    and it gets measured again.
+    """
+    # Delta uploads move a fraction of the file size, so their apparent
+    # throughput is not comparable with full transfers.
+    comparable = [
+        item
+        for item in items
+        if item.host == host
+        and item.engine != ENGINE_DELTA
+        and item.file_size >= MIN_COMPARABLE_SIZE
+    ]
+    measured = {
+        stats.engine: stats
+        for stats in summarize_transfers(comparable)
+        if stats.completed >= MIN_ENGINE_SAMPLES
+    }
+    baseline = measured.get(default)
+    if baseline is None:
+        return None
+    best = max(measured.values(), key=lambda stats: stats.median_throughput)
+    if best.median_throughput >= baseline.median_throughput * ENGINE_SWITCH_MARGIN:
+        return best.engine
+    return default
+
+
+def export_summary_csv(items: Iterable, path: Path) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_COLUMNS)
+        for stats in summarize_transfers(items):
+            writer.writerow(
+                (
+                    stats.host,
+                    stats.engine,
+                    stats.transfers,
+                    stats.completed,
+                    stats.failures,
+                    stats.bytes,
+                    round(stats.median_throughput),
+                    stats.chunk_retries,
+                    "" if stats.mean_rtt_ms is None else f"{stats.mean_rtt_ms:.1f}",
+                )
+            )
@@ -9,14 +9,39 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, GLib, GObject, Gtk, Pango
+from gi.repository import Adw, Gio, GLib, GObject, Gtk, Pango
 
 from ..utils.icons import icon_button
 from ..utils.logger import get_logger
 from ..utils.tooltip_helper import get_tooltip_helper
 from ..utils.translation_utils import _
 from ..utils.accessibility import set_label as a11y_label
-from .transfer_manager import TransferItem, TransferStatus, TransferType
+from .transfer_analytics import (
+    export_summary_csv,
+    summarize_transfers,
+    transfer_throughput,
+)
+from .transfer_manager import (
+    HISTORY_PAGE_SIZE,
+    TransferItem,
+    TransferStatus,
+    TransferType,
+)
+
+
+def _format_file_size(size_bytes: int) -> str:
+    """Format file size with appropriate unit."""
+    if size_bytes == 0:
+        return "0 B"
+    units = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    size = float(size_bytes)
+    while size >= 1024 and i < len(units) - 1:
+        size /= 1024.0
+        i += 1
+    if i == 0:
+        return f"{int(size)} {units[i]}"
+    return f"{size:.1f} {units[i]}"
 
 
 class TransferRow(Gtk.Box):
@@ -144,6 +169,17 @@ class TransferRow(Gtk.Box):
         )
         action_container.append(self.cancel_button)
 
+        self.retry_button = icon_button("view-refresh-symbolic")
+        self.retry_button.add_css_class("flat")
+        self.retry_button.add_css_class("circular")
+        self.retry_button.set_valign(Gtk.Align.CENTER)
+        a11y_label(self.retry_button, _("Retry transfer"))
+        get_tooltip_helper().add_tooltip(self.retry_button, _("Retry"))
+        self.retry_button.connect(
+            "clicked", lambda _: self.transfer_manager.retry_transfer(self.transfer.id)
+        )
+        action_container.append(self.retry_button)
+
         self.remove_button = icon_button("edit-delete-symbolic")
         self.remove_button.add_css_class("flat")
         self.remove_button.add_css_class("circular")
@@ -168,6 +204,7 @@ class TransferRow(Gtk.Box):
         }
         self.cancel_button.set_visible(not is_final_state)
         self.remove_button.set_visible(is_final_state)
+        self.retry_button.set_visible(self.transfer_manager.can_retry(self.transfer))
         date_str = self._format_start_time()
         type_str = (
             _("Download")
@@ -224,7 +261,11 @@ class TransferRow(Gtk.Box):
         self._set_status(_("Done"), "emblem-ok-symbolic", "success")
         duration = self.transfer.get_duration()
         duration_str = self._format_duration(duration) if duration else ""
-        self._set_transfer_details(type_str, size_str, duration_str, date_str)
+        throughput = transfer_throughput(self.transfer)
+        speed_str = f"{self._format_file_size(int(throughput))}/s" if throughput else ""
+        self._set_transfer_details(
+            type_str, size_str, duration_str, speed_str, self.transfer.engine, date_str
+        )
         self.progress_container.set_visible(False)
         self.type_icon.add_css_class("success")
 
@@ -287,18 +328,7 @@ class TransferRow(Gtk.Box):
         self.progress_label.set_label(" • ".join(progress_parts))
 
     def _format_file_size(self, size_bytes: int) -> str:
-        """Format file size with appropriate unit."""
-        if size_bytes == 0:
-            return "0 B"
-        units = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-        while size >= 1024 and i < len(units) - 1:
-            size /= 1024.0
-            i += 1
-        if i == 0:
-            return f"{int(size)} {units[i]}"
-        return f"{size:.1f} {units[i]}"
+        return _format_file_size(size_bytes)
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable form."""
@@ -401,6 +431,16 @@ class TransferManagerDialog(Adw.Window):
         self.clear_button.connect("clicked", self._on_clear_clicked)
         button_box.append(self.clear_button)
 
+        # Engine statistics built from the history
+        self.stats_button = Gtk.MenuButton(icon_name="view-list-symbolic")
+        self.stats_button.add_css_class("flat")
+        a11y_label(self.stats_button, _("Transfer statistics"))
+        get_tooltip_helper().add_tooltip(self.stats_button, _("Statistics"))
+        self.stats_popover = Gtk.Popover()
+        self.stats_popover.connect("show", self._on_stats_popover_show)
+        self.stats_button.set_popover(self.stats_popover)
+        button_box.append(self.stats_button)
+
         # Cancel all button
         self.cancel_all_button = Gtk.Button()
         self.cancel_all_button.set_icon_name("media-playback-stop-symbolic")
@@ -440,6 +480,17 @@ class TransferManagerDialog(Adw.Window):
         self.transfer_listbox.add_css_class("boxed-list")
         list_box_container.append(self.transfer_listbox)
 
+        # Older entries stay on disk until asked for
+        self.older_button = Gtk.Button(
+            label=_("Show Older Transfers"),
+            halign=Gtk.Align.CENTER,
+            margin_top=12,
+            visible=len(self.transfer_manager.history) >= HISTORY_PAGE_SIZE,
+        )
+        self.older_button.add_css_class("pill")
+        self.older_button.connect("clicked", self._on_older_clicked)
+        list_box_container.append(self.older_button)
+
         self.content_stack.add_named(scrolled, "list")
 
         # Empty state with helpful message
@@ -451,6 +502,82 @@ class TransferManagerDialog(Adw.Window):
         )
         self.content_stack.add_named(empty_page, "empty")
 
+    def _on_stats_popover_show(self, popover):
+        """Rebuild the per-host engine summary each time it is opened."""
+        content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=12,
+            margin_top=12,
+            margin_bottom=12,
+            margin_start=12,
+            margin_end=12,
+            width_request=360,
+        )
+        stats = summarize_transfers(self.transfer_manager.recent_history())
+        if stats:
+            listbox = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+            listbox.add_css_class("boxed-list")
+            for entry in stats:
+                listbox.append(self._build_stats_row(entry))
+            content.append(listbox)
+        else:
+            empty_label = Gtk.Label(
+                label=_("No transfer statistics yet"), wrap=True
+            )
+            empty_label.add_css_class("dim-label")
+            content.append(empty_label)
+
+        export_button = Gtk.Button(label=_("Export CSV…"), sensitive=bool(stats))
+        export_button.connect("clicked", self._on_export_stats_clicked)
+        content.append(export_button)
+        popover.set_child(content)
+
+    def _build_stats_row(self, entry) -> Adw.ActionRow:
+        row = Adw.ActionRow(title=f"{entry.host or _('Local')} • {entry.engine}")
+        parts = [
+            _("{count} transfers").format(count=entry.transfers),
+        ]
+        if entry.completed:
+            parts.append(f"{_format_file_size(int(entry.median_throughput))}/s")
+        if entry.mean_rtt_ms is not None:
+            parts.append(_("RTT {ms:.0f} ms").format(ms=entry.mean_rtt_ms))
+        if entry.failures:
+            parts.append(_("{count} failed").format(count=entry.failures))
+        if entry.chunk_retries:
+            parts.append(_("{count} retries").format(count=entry.chunk_retries))
+        row.set_subtitle(" • ".join(parts))
+        return row
+
+    def _on_export_stats_clicked(self, _button):
+        self.stats_popover.popdown()
+        file_dialog = Gtk.FileDialog(title=_("Export Transfer Statistics"), modal=True)
+        file_dialog.set_initial_name("ashyterm-transfer-stats.csv")
+        file_dialog.save(self, None, self._on_export_stats_file_selected)
+
+    def _on_export_stats_file_selected(self, dialog, result):
+        try:
+            gio_file = dialog.save_finish(result)
+        except GLib.Error as e:
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                self.logger.error(f"Statistics export failed: {e.message}")
+            return
+        if not gio_file:
+            return
+        try:
+            export_summary_csv(
+                self.transfer_manager.recent_history(), gio_file.get_path()
+            )
+        except OSError as e:
+            self.logger.error(f"Statistics export failed: {e}")
+
+    def _on_older_clicked(self, _button):
+        older = self.transfer_manager.load_older_history()
+        for transfer in older:
+            self._add_transfer_row(transfer)
+        if len(older) < HISTORY_PAGE_SIZE:
+            self.older_button.set_visible(False)
+        self._update_view()
+
     def _update_view(self):
         """Switch between list and empty state based on content."""
         with self.transfer_manager._transfer_lock:
@@ -600,9 +727,8 @@ class TransferManagerDialog(Adw.Window):
             self.transfer_listbox.remove(row)
             self.transfer_rows.pop(transfer_id, None)
 
-        # Clear history and persist
-        self.transfer_manager.history.clear()
-        self.transfer_manager._save_history()
+        self.transfer_manager.clear_history()
+        self.older_button.set_visible(False)
         self._update_view()
 
     def _on_remove_row(self, transfer_id: str):
@@ -618,9 +744,5 @@ class TransferManagerDialog(Adw.Window):
         # Clean up tracking
         self.transfer_rows.pop(transfer_id, None)
 
-        # Update history
-        self.transfer_manager.history = [
-            t for t in self.transfer_manager.history if t.id != transfer_id
-        ]
-        self.transfer_manager._save_history()
+        self.transfer_manager.remove_from_history(transfer_id)
         self._update_view()
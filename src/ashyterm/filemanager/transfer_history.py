@@ -0,0 +1,178 @@
+"""Append-only JSON lines store for the transfer history."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Collection, Iterator, Optional
+
+from ..utils.logger import get_logger
+
+# Entries kept by compaction; older ones are dropped for good.
+MAX_HISTORY_ENTRIES = 1000
+# Appends between compactions. Compaction rewrites at most
+# MAX_HISTORY_ENTRIES lines, so its cost stays flat however many
+# transfers have run.
+COMPACT_EVERY = 500
+_READ_BLOCK_SIZE = 64 * 1024
+_OP_REMOVE = "remove"
+
+# Every file manager tab has its own store on the same file; compaction
+# must not interleave with another tab's append.
+_store_lock = threading.Lock()
+
+
+class TransferHistoryStore:
+    """Transfer records appended one JSON object per line, newest last.
+
+    Removing an entry appends a tombstone instead of rewriting the file.
+    Readers walk the file backwards from the end, so loading the most
+    recent entries costs the same regardless of the file's length.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = MAX_HISTORY_ENTRIES,
+        compact_every: int = COMPACT_EVERY,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.compact_every = compact_every
+        self.logger = get_logger("ashyterm.filemanager.transfer_history")
+        self._appends_since_compaction = 0
+
+    def append(self, record: dict[str, Any]) -> None:
+        self._append_line(record)
+
+    def remove(self, transfer_id: str) -> None:
+        self._append_line({"op": _OP_REMOVE, "id": transfer_id})
+
+    def clear(self) -> None:
+        with _store_lock:
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as exc:
+                self.logger.error(f"Failed to clear transfer history: {exc}")
+            self._appends_since_compaction = 0
+
+    def read_recent(
+        self, count: int, exclude_ids: Collection[str] = ()
+    ) -> list[dict[str, Any]]:
+        """Newest-first records, skipping removed ones and ``exclude_ids``."""
+        records = []
+        if count <= 0:
+            return records
+        with _store_lock:
+            for record in self._iter_live_records():
+                if record.get("id") in exclude_ids:
+                    continue
+                records.append(record)
+                if len(records) >= count:
+                    break
+        return records
+
+    def compact(self) -> None:
+        """Rewrite the file with only the newest live records."""
+        with _store_lock:
+            self._compact_locked()
+
+    def import_records(self, records: list[dict[str, Any]]) -> None:
+        """Replace the store with ``records`` (newest first)."""
+        with _store_lock:
+            self._write_records(list(reversed(records)))
+
+    def _append_line(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with _store_lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(
+                    self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+                )
+                try:
+                    os.write(fd, line.encode("utf-8"))
+                finally:
+                    os.close(fd)
+            except OSError as exc:
+                self.logger.error(f"Failed to append transfer history: {exc}")
+                return
+            self._appends_since_compaction += 1
+            if self._appends_since_compaction >= self.compact_every:
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        records = []
+        for record in self._iter_live_records():
+            records.append(record)
+            if len(records) >= self.max_entries:
+                break
+        records.reverse()
+        self._write_records(records)
+        self._appends_since_compaction = 0
+
+    def _write_records(self, records: list[dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}."
+            )
+        except OSError as exc:
+            self.logger.error(f"Failed to rewrite transfer history: {exc}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                for record in records:
+                    temp_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            self.logger.error(f"Failed to rewrite transfer history: {exc}")
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+
+    def _iter_live_records(self) -> Iterator[dict[str, Any]]:
+        removed: set[str] = set()
+        for line in self._iter_lines_reversed():
+            record = _decode(line)
+            if record is None:
+                continue
+            if record.get("op") == _OP_REMOVE:
+                removed.add(record.get("id"))
+            elif record.get("id") not in removed:
+                yield record
+
+    def _iter_lines_reversed(self) -> Iterator[bytes]:
+        try:
+            handle = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            self.logger.error(f"Failed to read transfer history: {exc}")
+            return
+        with handle:
+            position = handle.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0:
+                size = min(_READ_BLOCK_SIZE, position)
+                position -= size
+                handle.seek(position)
+                lines = (handle.read(size) + remainder).split(b"\n")
+                # The first piece may continue in the previous block.
+                remainder = lines.pop(0)
+                yield from reversed(lines)
+            yield remainder
+
+
+def _decode(line: bytes) -> Optional[dict[str, Any]]:
+    # Skips blank lines and a line torn by a crash mid-append.
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
@@ -0,0 +1,144 @@
+"""Chunk-level checkpoint journals for resumable segmented transfers."""
+
+from __future__ import annotations
+
+import base64
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils.logger import get_logger
+from ..utils.security import atomic_json_write
+
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".journal"
+# Completed chunks are persisted at most this often; a crash loses at most
+# the chunks finished since the last flush.
+JOURNAL_FLUSH_INTERVAL = 1.0  # seconds
+
+
+class ChunkJournal:
+    """Bitmap of completed chunks for one partial file.
+
+    The journal is only valid for the exact source it was written for:
+    ``source``, ``size``, ``mtime`` and ``chunk_size`` must all match on
+    load, otherwise the partial data is considered stale.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        source: str,
+        size: int,
+        mtime: float,
+        chunk_size: int,
+        done: Optional[bytearray] = None,
+    ) -> None:
+        self.path = path
+        self.source = source
+        self.size = size
+        self.mtime = mtime
+        self.chunk_size = chunk_size
+        self.chunk_count = (size + chunk_size - 1) // chunk_size if chunk_size else 0
+        self._done = done if done is not None else bytearray((self.chunk_count + 7) // 8)
+        self._last_flush = 0.0
+        self._dirty = False
+        self.logger = get_logger("ashyterm.filemanager.transfer_journal")
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        *,
+        source: str,
+        size: int,
+        mtime: float,
+        chunk_size: Optional[int],
+    ) -> Optional["ChunkJournal"]:
+        """Return the stored journal when it matches the given source, else None.
+
+        A ``chunk_size`` of None accepts whatever chunk size the journal was
+        written with, so a resumed file keeps its original chunk layout.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as journal_file:
+                data: dict[str, Any] = json.load(journal_file)
+            if (
+                data.get("version") != JOURNAL_VERSION
+                or data.get("source") != source
+                or data.get("size") != size
+                or data.get("mtime") != mtime
+                or (chunk_size is not None and data.get("chunk_size") != chunk_size)
+            ):
+                return None
+            chunk_size = int(data["chunk_size"])
+            if chunk_size <= 0:
+                return None
+            done = bytearray(base64.b64decode(data.get("done", "")))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        journal = cls(
+            path, source=source, size=size, mtime=mtime, chunk_size=chunk_size
+        )
+        if len(done) != len(journal._done):
+            return None
+        journal._done = done
+        return journal
+
+    def is_done(self, index: int) -> bool:
+        return bool(self._done[index >> 3] & (1 << (index & 7)))
+
+    def mark_done(self, index: int) -> None:
+        self._done[index >> 3] |= 1 << (index & 7)
+        self._dirty = True
+        self.flush()
+
+    def mark_pending(self, index: int) -> None:
+        self._done[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self._dirty = True
+
+    def pending_chunks(self, chunks: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Filter ``(offset, length)`` chunks down to those not yet completed."""
+        return [
+            chunk
+            for chunk in chunks
+            if not self.is_done(chunk[0] // self.chunk_size)
+        ]
+
+    def completed_bytes(self) -> int:
+        return sum(
+            min(self.chunk_size, self.size - index * self.chunk_size)
+            for index in range(self.chunk_count)
+            if self.is_done(index)
+        )
+
+    def flush(self, force: bool = False) -> None:
+        """Persist the bitmap, throttled to :data:`JOURNAL_FLUSH_INTERVAL`."""
+        now = time.monotonic()
+        if not self._dirty or (not force and now - self._last_flush < JOURNAL_FLUSH_INTERVAL):
+            return
+        try:
+            atomic_json_write(
+                self.path,
+                {
+                    "version": JOURNAL_VERSION,
+                    "source": self.source,
+                    "size": self.size,
+                    "mtime": self.mtime,
+                    "chunk_size": self.chunk_size,
+                    "done": base64.b64encode(bytes(self._done)).decode("ascii"),
+                },
+                indent=None,
+            )
+            self._dirty = False
+            self._last_flush = now
+        except OSError as exc:
+            self.logger.warning(f"Could not write transfer journal {self.path}: {exc}")
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as exc:
+            self.logger.debug(f"Could not remove transfer journal {self.path}: {exc}")
@@ -17,11 +17,17 @@ from gi.repository import Adw, GLib, GObject, Gtk
 
 from ..utils.icons import icon_button
 from ..utils.logger import get_logger
-from ..utils.security import atomic_json_write
 from ..utils.tooltip_helper import get_tooltip_helper
 from ..utils.translation_utils import _
+from .transfer_analytics import TransferTelemetry, preferred_engine
+from .transfer_history import TransferHistoryStore
+from .transfer_scheduler import TransferPriority, TransferScheduler, host_of
 
 PROGRESS_UPDATE_INTERVAL = 0.05  # seconds
+HISTORY_FILENAME = "transfer_history.jsonl"
+LEGACY_HISTORY_FILENAME = "transfer_history.json"
+# Entries read at startup and per "show older" step in the dialog.
+HISTORY_PAGE_SIZE = 50
 
 
 class TransferType(Enum):
@@ -55,6 +61,14 @@ class TransferItem:
     cancellation_event: threading.Event = field(
         default_factory=threading.Event, repr=False
     )
+    # Session the transfer ran against; only kept in memory for retries.
+    session_key: str = ""
+    priority: TransferPriority = TransferPriority.BULK
+    # Telemetry reported by the engine that ran the transfer.
+    host: str = ""
+    engine: str = ""
+    chunk_retries: int = 0
+    rtt_ms: Optional[float] = None
     # Warmup tracking to avoid initial spurious progress from rsync
     first_stable_progress: float = -1.0  # First monotonically increasing progress value
     warmup_end_time: Optional[float] = None  # When warmup period ends
@@ -88,19 +102,24 @@ class TransferManager(GObject.Object):
         "transfer-completed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
         "transfer-failed": (GObject.SignalFlags.RUN_FIRST, None, (str, str)),
         "transfer-cancelled": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        "transfer-retry-requested": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
     }
 
     def __init__(self, config_dir: str, file_operations=None):
         super().__init__()
         self.logger = get_logger(__name__)
         self.config_dir = config_dir
-        self.history_file = os.path.join(config_dir, "transfer_history.json")
+        self.history_file = os.path.join(config_dir, HISTORY_FILENAME)
+        self._history_store = TransferHistoryStore(Path(self.history_file))
         self.file_operations = file_operations
         self.active_transfers: Dict[str, TransferItem] = {}
         self.history: List[TransferItem] = []
+        # Loaded on first use by recent_history().
+        self._recent_history: Optional[List[TransferItem]] = None
 
         # Thread safety for active_transfers access
         self._transfer_lock = threading.Lock()
+        self.scheduler = TransferScheduler.get()
 
         # Throttle progress updates to avoid UI flooding
         self._last_progress_update = 0.0
@@ -116,54 +135,114 @@ class TransferManager(GObject.Object):
         self._load_history()
 
     def _load_history(self):
+        """Load only the most recent page; the dialog pages in older ones."""
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item_data in data:
-                        # Re-hydrate enums
-                        item_data["transfer_type"] = TransferType(
-                            item_data["transfer_type"]
-                        )
-                        item_data["status"] = TransferStatus(item_data["status"])
-                        # These are not saved, so they are not in item_data
-                        item_data.pop("cancellation_event", None)
-                        item_data.pop("is_cancellable", None)
-                        # For backward compatibility with old history files
-                        if "is_directory" not in item_data:
-                            item_data["is_directory"] = False
-                        self.history.append(TransferItem(**item_data))
-            # Keep history trimmed
-            self.history = self.history[:50]
+            self._migrate_legacy_history()
+            records = self._history_store.read_recent(HISTORY_PAGE_SIZE)
+            self.history = self._items_from_records(records)
         except Exception as e:
             self.logger.error(f"Failed to load transfer history: {e}")
 
-    def _save_history(self):
-        try:
-            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            data_to_save = []
-            # Persist only the last 50 items
-            for item in self.history[:50]:
-                # Create a serializable dictionary, excluding non-JSON types
-                serializable_item = {
-                    "id": item.id,
-                    "filename": item.filename,
-                    "local_path": item.local_path,
-                    "remote_path": item.remote_path,
-                    "file_size": item.file_size,
-                    "transfer_type": item.transfer_type.value,
-                    "status": item.status.value,
-                    "is_directory": item.is_directory,
-                    "start_time": item.start_time,
-                    "end_time": item.end_time,
-                    "progress": item.progress,
-                    "error_message": item.error_message,
-                }
-                data_to_save.append(serializable_item)
-
-            atomic_json_write(Path(self.history_file), data_to_save)
-        except Exception as e:
-            self.logger.error(f"Failed to save transfer history: {e}")
+    def _migrate_legacy_history(self) -> None:
+        """Move a ``transfer_history.json`` from older versions into the journal."""
+        legacy_file = os.path.join(self.config_dir, LEGACY_HISTORY_FILENAME)
+        if not os.path.exists(legacy_file):
+            return
+        if not os.path.exists(self.history_file):
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._history_store.import_records(
+                [item for item in data if isinstance(item, dict)]
+            )
+        os.remove(legacy_file)
+
+    def _items_from_records(self, records: List[dict]) -> List[TransferItem]:
+        items = []
+        for item_data in records:
+            try:
+                # Re-hydrate enums
+                item_data["transfer_type"] = TransferType(item_data["transfer_type"])
+                item_data["status"] = TransferStatus(item_data["status"])
+                # These are not saved, so they are not in item_data
+                item_data.pop("cancellation_event", None)
+                item_data.pop("is_cancellable", None)
+                # For backward compatibility with old history files
+                if "is_directory" not in item_data:
+                    item_data["is_directory"] = False
+                items.append(TransferItem(**item_data))
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.warning(f"Skipping unreadable transfer history entry: {e}")
+        return items
+
+    @staticmethod
+    def _serialize_history_item(item: TransferItem) -> dict:
+        # Only JSON-safe fields; runtime state such as the cancellation
+        # event and the session key is not persisted.
+        return {
+            "id": item.id,
+            "filename": item.filename,
+            "local_path": item.local_path,
+            "remote_path": item.remote_path,
+            "file_size": item.file_size,
+            "transfer_type": item.transfer_type.value,
+            "status": item.status.value,
+            "is_directory": item.is_directory,
+            "start_time": item.start_time,
+            "end_time": item.end_time,
+            "progress": item.progress,
+            "error_message": item.error_message,
+            "host": item.host,
+            "engine": item.engine,
+            "chunk_retries": item.chunk_retries,
+            "rtt_ms": item.rtt_ms,
+        }
+
+    def _record_history(self, transfer: TransferItem) -> None:
+        self._history_store.append(self._serialize_history_item(transfer))
+        with self._transfer_lock:
+            if self._recent_history is not None:
+                self._recent_history.insert(0, transfer)
+                del self._recent_history[self._history_store.max_entries :]
+
+    def recent_history(self) -> List[TransferItem]:
+        """Newest-first entries the journal keeps, for statistics and advice.
+
+        Unlike :attr:`history`, which only holds the pages the dialog has
+        shown, this covers up to ``MAX_HISTORY_ENTRIES`` transfers. It is
+        read from the journal once and then kept current in memory.
+        """
+        with self._transfer_lock:
+            if self._recent_history is None:
+                self._recent_history = self._items_from_records(
+                    self._history_store.read_recent(self._history_store.max_entries)
+                )
+            return list(self._recent_history)
+
+    def load_older_history(self, count: int = HISTORY_PAGE_SIZE) -> List[TransferItem]:
+        """Append up to ``count`` entries older than those loaded and return them."""
+        with self._transfer_lock:
+            loaded_ids = {t.id for t in self.history}
+        older = self._items_from_records(
+            self._history_store.read_recent(count, exclude_ids=loaded_ids)
+        )
+        with self._transfer_lock:
+            self.history.extend(older)
+        return older
+
+    def remove_from_history(self, transfer_id: str) -> None:
+        with self._transfer_lock:
+            self.history = [t for t in self.history if t.id != transfer_id]
+            if self._recent_history is not None:
+                self._recent_history = [
+                    t for t in self._recent_history if t.id != transfer_id
+                ]
+        self._history_store.remove(transfer_id)
+
+    def clear_history(self) -> None:
+        with self._transfer_lock:
+            self.history.clear()
+            self._recent_history = []
+        self._history_store.clear()
 
     def add_transfer(
         self,
@@ -194,6 +273,42 @@ class TransferManager(GObject.Object):
     def _emit_signal(self, signal_name: str, *args) -> None:
         GLib.idle_add(self.emit, signal_name, *args)
 
+    def _apply_scheduler_settings(self) -> None:
+        try:
+            from ..settings.manager import get_settings_manager
+
+            settings = get_settings_manager()
+            self.scheduler.configure(
+                int(settings.get("file_transfer_max_active", 4)),
+                int(settings.get("file_transfer_max_per_host", 2)),
+                int(settings.get("file_transfer_bandwidth_limit_kib", 0)) * 1024,
+            )
+        except Exception as e:
+            self.logger.debug(f"Using current transfer limits: {e}")
+
+    def queue_transfer(self, transfer_id: str, start) -> None:
+        """Hand ``start`` to the scheduler; it runs once a slot is free.
+
+        The transfer stays PENDING until then. ``start`` must only hand the
+        work off, since it may run on whichever thread frees the slot; if it
+        raises, the transfer fails and its slot goes to the next one.
+        """
+        with self._transfer_lock:
+            transfer = self.active_transfers.get(transfer_id)
+            if not transfer:
+                return
+            session_key, priority = transfer.session_key, transfer.priority
+
+        def start_or_fail() -> None:
+            try:
+                start()
+            except Exception as e:
+                self.logger.error(f"Failed to start transfer {transfer_id}: {e}")
+                self.fail_transfer(transfer_id, str(e))
+
+        self._apply_scheduler_settings()
+        self.scheduler.enqueue(transfer_id, session_key, priority, start_or_fail)
+
     def start_transfer(self, transfer_id: str) -> None:
         with self._transfer_lock:
             transfer = self.active_transfers.get(transfer_id)
@@ -232,19 +347,39 @@ class TransferManager(GObject.Object):
             self._emit_signal("transfer-progress", transfer_id, progress)
             self._update_progress_display()
 
+    def _apply_telemetry(self, transfer: TransferItem) -> None:
+        if transfer.session_key:
+            transfer.host = host_of(transfer.session_key)
+        pop_telemetry = getattr(self.file_operations, "pop_transfer_telemetry", None)
+        telemetry: Optional[TransferTelemetry] = (
+            pop_telemetry(transfer.id) if pop_telemetry else None
+        )
+        if telemetry:
+            transfer.engine = telemetry.engine
+            transfer.chunk_retries = telemetry.chunk_retries
+            transfer.rtt_ms = telemetry.rtt_ms
+
+    def preferred_engine(self, host: str, direction: str, default: str) -> Optional[str]:
+        """Fastest engine recorded for ``host`` in ``direction``, if known."""
+        transfer_type = TransferType(direction)
+        items = [t for t in self.recent_history() if t.transfer_type == transfer_type]
+        return preferred_engine(items, host, default)
+
     def complete_transfer(self, transfer_id: str) -> None:
         transfer = None
         with self._transfer_lock:
             if transfer_id in self.active_transfers:
                 transfer = self.active_transfers.pop(transfer_id)
+                self._apply_telemetry(transfer)
                 transfer.status = TransferStatus.COMPLETED
                 transfer.end_time = time.time()
                 transfer.progress = 100.0
                 self.history.insert(0, transfer)
 
         if transfer:
+            self.scheduler.release(transfer_id)
             self._emit_signal("transfer-completed", transfer_id)
-            self._save_history()
+            self._record_history(transfer)
             self._update_progress_display()
 
     def fail_transfer(self, transfer_id: str, error_message: str) -> None:
@@ -252,6 +387,7 @@ class TransferManager(GObject.Object):
         with self._transfer_lock:
             if transfer_id in self.active_transfers:
                 transfer = self.active_transfers.pop(transfer_id)
+                self._apply_telemetry(transfer)
                 if "cancel" in error_message.lower():
                     transfer.status = TransferStatus.CANCELLED
                 else:
@@ -261,14 +397,50 @@ class TransferManager(GObject.Object):
                 self.history.insert(0, transfer)
 
         if transfer:
+            self.scheduler.release(transfer_id)
             if transfer.status == TransferStatus.CANCELLED:
                 self._emit_signal("transfer-cancelled", transfer_id)
             else:
                 self._emit_signal("transfer-failed", transfer_id, error_message)
-            self._save_history()
+            self._record_history(transfer)
             self._update_progress_display()
 
+    def can_retry(self, transfer: TransferItem) -> bool:
+        return bool(transfer.session_key) and transfer.status in {
+            TransferStatus.FAILED,
+            TransferStatus.CANCELLED,
+        }
+
+    def retry_transfer(self, transfer_id: str) -> Optional[str]:
+        """Queue a failed or cancelled transfer again under a new id.
+
+        The new transfer targets the same paths, so accelerated transfers
+        pick up their chunk journal and only move the missing data.
+        """
+        with self._transfer_lock:
+            original = next((t for t in self.history if t.id == transfer_id), None)
+        if original is None or not self.can_retry(original):
+            return None
+        new_id = self.add_transfer(
+            filename=original.filename,
+            local_path=original.local_path,
+            remote_path=original.remote_path,
+            file_size=original.file_size,
+            transfer_type=original.transfer_type,
+            is_cancellable=True,
+            is_directory=original.is_directory,
+        )
+        with self._transfer_lock:
+            retried = self.active_transfers[new_id]
+            retried.session_key = original.session_key
+            retried.priority = original.priority
+        self._emit_signal("transfer-retry-requested", new_id)
+        return new_id
+
     def cancel_transfer(self, transfer_id: str) -> None:
+        if self.scheduler.remove(transfer_id):
+            self.fail_transfer(transfer_id, "Cancelled")
+            return
         with self._transfer_lock:
             if transfer_id in self.active_transfers:
                 transfer = self.active_transfers[transfer_id]
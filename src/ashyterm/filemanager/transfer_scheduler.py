@@ -0,0 +1,238 @@
+"""Process-wide admission control for file transfers.
+
+Every file manager tab owns its own :class:`TransferManager`, so limits
+that span tabs live here. Call sites::
+
+    TransferScheduler.get().enqueue(transfer_id, session_key, priority, start)
+    TransferScheduler.get().release(transfer_id)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Optional
+
+from ..utils.logger import get_logger
+
+DEFAULT_MAX_ACTIVE_TRANSFERS = 4
+DEFAULT_MAX_TRANSFERS_PER_HOST = 2
+# Interactive transfers may exceed the limits by this many slots so that
+# opening a file is never stuck behind a bulk copy.
+INTERACTIVE_EXTRA_SLOTS = 1
+# Burst allowance of the bandwidth bucket, in seconds of the capped rate.
+BANDWIDTH_BURST_SECONDS = 0.5
+LOCAL_SESSION_KEY = "local"
+
+
+class TransferPriority(Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+_PRIORITY_ORDER = (TransferPriority.INTERACTIVE, TransferPriority.BULK)
+
+
+def host_of(session_key: str) -> str:
+    """``user@host:port`` -> ``host:port``; per-host limits ignore the user."""
+    return session_key.rpartition("@")[2] or LOCAL_SESSION_KEY
+
+
+class TokenBucket:
+    """Shared byte budget; a rate of 0 disables throttling.
+
+    :meth:`reserve` never blocks. It books ``byte_count`` bytes and returns
+    how long the caller should wait before moving them, so threads can
+    ``time.sleep`` and coroutines ``asyncio.sleep`` on the same bucket.
+    """
+
+    def __init__(
+        self,
+        rate_bytes_per_second: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = 0
+        self._capacity = 0.0
+        self._tokens = 0.0
+        self._last = clock()
+        self.set_rate(rate_bytes_per_second)
+
+    @property
+    def rate(self) -> int:
+        return self._rate
+
+    def set_rate(self, rate_bytes_per_second: int) -> None:
+        with self._lock:
+            rate = max(0, int(rate_bytes_per_second))
+            if rate == self._rate:
+                return
+            self._rate = rate
+            self._capacity = rate * BANDWIDTH_BURST_SECONDS
+            self._tokens = self._capacity
+            self._last = self._clock()
+
+    def reserve(self, byte_count: int) -> float:
+        with self._lock:
+            if self._rate <= 0:
+                return 0.0
+            now = self._clock()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            # Tokens may go negative: the debt is what later callers wait for.
+            self._tokens -= byte_count
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+@dataclass
+class _QueuedTransfer:
+    transfer_id: str
+    session_key: str
+    priority: TransferPriority
+    start: Callable[[], None]
+
+
+class TransferScheduler:
+    """Starts queued transfers as global and per-host slots free up.
+
+    Queues are kept per priority and, inside a priority, per session; the
+    sessions are served round-robin so one tab's bulk copy cannot starve
+    another's. Start callbacks run outside the lock on the thread that
+    enqueued or released, and must only hand the work off (e.g. to the IO
+    pool).
+    """
+
+    _instance: Optional["TransferScheduler"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_active: int = DEFAULT_MAX_ACTIVE_TRANSFERS,
+        max_per_host: int = DEFAULT_MAX_TRANSFERS_PER_HOST,
+    ) -> None:
+        self.logger = get_logger("ashyterm.filemanager.transfer_scheduler")
+        self.max_active = max(1, max_active)
+        self.max_per_host = max(1, max_per_host)
+        self.bandwidth = TokenBucket()
+        self._lock = threading.Lock()
+        self._queues: dict[
+            TransferPriority, OrderedDict[str, deque[_QueuedTransfer]]
+        ] = {priority: OrderedDict() for priority in _PRIORITY_ORDER}
+        self._running: dict[str, str] = {}  # transfer id -> host
+
+    @classmethod
+    def get(cls) -> "TransferScheduler":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the singleton — test-only."""
+        with cls._instance_lock:
+            cls._instance = None
+
+    def configure(
+        self, max_active: int, max_per_host: int, bandwidth_bytes_per_second: int
+    ) -> None:
+        with self._lock:
+            self.max_active = max(1, max_active)
+            self.max_per_host = max(1, max_per_host)
+        self.bandwidth.set_rate(bandwidth_bytes_per_second)
+        self._dispatch()
+
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def is_queued(self, transfer_id: str) -> bool:
+        with self._lock:
+            return any(
+                entry.transfer_id == transfer_id
+                for sessions in self._queues.values()
+                for queue in sessions.values()
+                for entry in queue
+            )
+
+    def enqueue(
+        self,
+        transfer_id: str,
+        session_key: str,
+        priority: TransferPriority,
+        start: Callable[[], None],
+    ) -> None:
+        entry = _QueuedTransfer(
+            transfer_id, session_key or LOCAL_SESSION_KEY, priority, start
+        )
+        with self._lock:
+            sessions = self._queues[priority]
+            sessions.setdefault(entry.session_key, deque()).append(entry)
+        self._dispatch()
+
+    def remove(self, transfer_id: str) -> bool:
+        """Drop a transfer that has not started yet; True if it was queued."""
+        with self._lock:
+            for sessions in self._queues.values():
+                for session_key, queue in sessions.items():
+                    for entry in queue:
+                        if entry.transfer_id == transfer_id:
+                            queue.remove(entry)
+                            if not queue:
+                                del sessions[session_key]
+                            return True
+        return False
+
+    def release(self, transfer_id: str) -> None:
+        """Free the slot of a finished transfer and start the next ones."""
+        with self._lock:
+            if self._running.pop(transfer_id, None) is None:
+                return
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._lock:
+                entry = self._take_next_locked()
+                if entry is None:
+                    return
+                self._running[entry.transfer_id] = host_of(entry.session_key)
+            try:
+                entry.start()
+            except Exception as exc:
+                self.logger.error(
+                    f"Failed to start transfer {entry.transfer_id}: {exc}"
+                )
+                with self._lock:
+                    self._running.pop(entry.transfer_id, None)
+
+    def _take_next_locked(self) -> Optional[_QueuedTransfer]:
+        host_counts: dict[str, int] = {}
+        for host in self._running.values():
+            host_counts[host] = host_counts.get(host, 0) + 1
+        for priority in _PRIORITY_ORDER:
+            extra = INTERACTIVE_EXTRA_SLOTS if priority is TransferPriority.INTERACTIVE else 0
+            if len(self._running) >= self.max_active + extra:
+                continue
+            sessions = self._queues[priority]
+            for session_key in list(sessions):
+                host = host_of(session_key)
+                if host_counts.get(host, 0) >= self.max_per_host + extra:
+                    continue
+                queue = sessions.pop(session_key)
+                entry = queue.popleft()
+                if queue:
+                    # Re-insert at the end: the next pick serves another session.
+                    sessions[session_key] = queue
+                return entry
+        return None
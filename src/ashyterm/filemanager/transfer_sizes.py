@@ -3,19 +3,135 @@
 
 Before kicking off a download or upload, the transfer mixin needs the
 actual size of each item (for the progress bar and the free-space
-check). For directories the size is obtained via ``operations`` (which
-itself shells out to ``du``/SFTP), while plain files are read from the
-listing or the local stat. The rules are the same for remote and
-local, so they live here behind two small helpers.
+check). For directories the sizes are obtained in one batch via
+``operations.get_directory_sizes`` (a single remote ``du`` call, or
+parallel local ``os.scandir`` walks), while plain files are read from
+the listing or the local stat. The rules are the same for remote and
+local, so they live here behind two small helpers, together with the
+walker and cache the batch call is built on.
 """
 
 from __future__ import annotations
 
+import os
+import stat
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .models import FileItem
 
+# Sizes are reused while the directory's mtime is unchanged, but only for
+# this long: nested changes do not bump the top-level mtime.
+SIZE_CACHE_TTL_SECONDS = 60.0
+SIZE_CACHE_MAX_ENTRIES = 512
+
+
+class DirectorySizeCache:
+    """Recently measured sizes keyed by ``(scope, path)`` and mtime."""
+
+    def __init__(
+        self,
+        ttl: float = SIZE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str], Tuple[float, int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str], mtime: Optional[float]) -> Optional[int]:
+        if mtime is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_mtime, size, stored_at = entry
+        if cached_mtime != mtime or self._clock() - stored_at > self._ttl:
+            return None
+        return size
+
+    def put(self, key: Tuple[str, str], mtime: Optional[float], size: int) -> None:
+        if mtime is None:
+            return
+        with self._lock:
+            if len(self._entries) >= SIZE_CACHE_MAX_ENTRIES:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (mtime, size, self._clock())
+
+
+def walk_local_size(path: str) -> int:
+    """Apparent size of ``path`` in bytes, counted like ``du -sb``.
+
+    Symlinks are not followed and hard-linked files are counted once.
+    Unreadable subdirectories are skipped instead of failing the walk.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return 0
+    total = info.st_size
+    if not stat.S_ISDIR(info.st_mode):
+        return total
+
+    seen_inodes: set[Tuple[int, int]] = set()
+    pending = [path]
+    while pending:
+        try:
+            iterator = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with iterator:
+            for entry in iterator:
+                try:
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(info.st_mode):
+                    pending.append(entry.path)
+                elif info.st_nlink > 1:
+                    inode = (info.st_dev, info.st_ino)
+                    if inode in seen_inodes:
+                        continue
+                    seen_inodes.add(inode)
+                total += info.st_size
+    return total
+
+
+def measure_local_sizes(paths: Iterable[str]) -> Dict[str, int]:
+    """Walk ``paths`` concurrently on the IO pool.
+
+    The calling thread walks the first path itself and afterwards takes
+    over any walk the pool has not started yet, so it never blocks on a
+    pool that is busy (or that it is itself a worker of).
+    """
+    from ..core.tasks import AsyncTaskManager
+
+    paths = list(paths)
+    if not paths:
+        return {}
+    task_manager = AsyncTaskManager.get()
+    futures = [(path, task_manager.submit_io(walk_local_size, path)) for path in paths[1:]]
+    sizes = {paths[0]: walk_local_size(paths[0])}
+    for path, future in futures:
+        if future is None or future.cancel():
+            sizes[path] = walk_local_size(path)
+        else:
+            sizes[path] = future.result()
+    return sizes
+
+
+def parse_du_output(output: str) -> Dict[str, int]:
+    """Map each path of ``du -sb`` output (tab-separated size and path) to its size."""
+    sizes: Dict[str, int] = {}
+    for line in output.splitlines():
+        size, sep, path = line.partition("\t")
+        if sep and size.isdigit():
+            sizes[path] = int(size)
+    return sizes
+
 
 def calculate_remote_item_sizes(
     items: List[FileItem],
@@ -29,28 +145,34 @@ def calculate_remote_item_sizes(
     Directory sizes are resolved recursively because the free-space check
     and transfer progress must reflect what will actually be copied.
     Listing entries reporting ``0`` for non-directories are still resolved
-    via ``operations.get_directory_size`` because remote ``ls`` sometimes
-    omits a size for special files.
+    because remote ``ls`` sometimes omits a size for special files. All
+    of them are measured in a single ``operations.get_directory_sizes``
+    call; the listing mtimes let repeated plans hit its cache.
     """
     item_sizes: Dict[str, int] = {}
     base = current_path.rstrip("/")
+    to_measure: List[Tuple[FileItem, str]] = []
 
     for item in items:
-        remote_path = f"{base}/{item.name}"
-
-        if item.is_directory_like:
-            calculated = operations.get_directory_size(
-                remote_path, is_remote=True, session_override=session_override
-            )
-            item_sizes[item.name] = calculated if calculated > 0 else item.size
-        elif item.size == 0:
-            calculated = operations.get_directory_size(
-                remote_path, is_remote=True, session_override=session_override
-            )
-            item_sizes[item.name] = calculated if calculated > 0 else item.size
+        if item.is_directory_like or item.size == 0:
+            to_measure.append((item, f"{base}/{item.name}"))
         else:
             item_sizes[item.name] = item.size
 
+    if to_measure:
+        measured = operations.get_directory_sizes(
+            [remote_path for _item, remote_path in to_measure],
+            is_remote=True,
+            session_override=session_override,
+            mtimes={
+                remote_path: item.date.timestamp()
+                for item, remote_path in to_measure
+            },
+        )
+        for item, remote_path in to_measure:
+            calculated = measured.get(remote_path, 0)
+            item_sizes[item.name] = calculated if calculated > 0 else item.size
+
     return item_sizes
 
 
@@ -61,17 +183,26 @@ def calculate_local_paths_size(
 ) -> Tuple[int, Dict[str, int]]:
     """Return ``(total_bytes, {path: size})`` for the given local paths.
 
-    Directories are walked through ``operations.get_directory_size`` so
-    the computation matches what we do for remote sources. Regular
-    files use ``Path.stat()``; non-existent paths contribute zero so a
-    stale listing doesn't abort the whole upload batch.
+    Directories are measured together through
+    ``operations.get_directory_sizes`` so the computation matches what we
+    do for remote sources. Regular files use ``Path.stat()``; non-existent
+    paths contribute zero so a stale listing doesn't abort the whole
+    upload batch.
     """
-    total_bytes = 0
     path_sizes: Dict[str, int] = {}
+    directories = [str(local_path) for local_path in local_paths if local_path.is_dir()]
+    measured = (
+        operations.get_directory_sizes(directories, is_remote=False)
+        if directories
+        else {}
+    )
 
+    total_bytes = 0
     for local_path in local_paths:
-        if local_path.is_dir():
-            size = operations.get_directory_size(str(local_path), is_remote=False)
+        if str(local_path) in measured:
+            size = measured[str(local_path)]
+        elif local_path.is_dir():
+            size = 0
         else:
             size = local_path.stat().st_size if local_path.exists() else 0
         path_sizes[str(local_path)] = size
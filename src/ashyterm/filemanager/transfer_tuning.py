@@ -0,0 +1,173 @@
+"""Adaptive request concurrency and chunk sizing for segmented transfers."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..utils.logger import get_logger
+from ..utils.security import atomic_json_write
+
+MIN_CHUNK_SIZE_BYTES = 512 * 1024
+MAX_CHUNK_SIZE_BYTES = 16 * 1024 * 1024
+# Chunks that finish faster than this are dominated by request overhead;
+# slower ones hold a worker long enough to make cancellation sluggish.
+FAST_CHUNK_SECONDS = 0.25
+SLOW_CHUNK_SECONDS = 2.0
+TUNING_WINDOW_SECONDS = 0.5
+# A window must beat the previous one by this fraction to count as a gain.
+THROUGHPUT_GAIN_THRESHOLD = 0.05
+# Mean chunk latency this many times above the best seen means the link or
+# server is queueing requests rather than serving them faster.
+LATENCY_INFLATION_LIMIT = 2.0
+MAX_REMEMBERED_HOSTS = 200
+
+_store_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TransferTuning:
+    parallel_requests: int
+    chunk_size_bytes: int
+
+
+class TransferAutoTuner:
+    """AIMD controller for in-flight range requests and chunk size.
+
+    Every :data:`TUNING_WINDOW_SECONDS` the throughput of completed chunks
+    is compared with the previous window. A gain adds one request, a loss
+    or inflated latency halves the request count. Chunk size doubles or
+    halves based on mean chunk latency; it takes effect for the next file.
+    """
+
+    def __init__(
+        self,
+        initial: TransferTuning,
+        *,
+        min_requests: int,
+        max_requests: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_requests = max(1, min_requests)
+        self.max_requests = max(self.min_requests, max_requests)
+        self.parallel_requests = min(
+            self.max_requests, max(self.min_requests, initial.parallel_requests)
+        )
+        self.chunk_size_bytes = min(
+            MAX_CHUNK_SIZE_BYTES, max(MIN_CHUNK_SIZE_BYTES, initial.chunk_size_bytes)
+        )
+        self.adjustments = 0
+        self._clock = clock
+        self._window_start = clock()
+        self._window_bytes = 0
+        self._window_latency = 0.0
+        self._window_chunks = 0
+        self._previous_throughput: Optional[float] = None
+        self._best_latency: Optional[float] = None
+
+    @property
+    def tuning(self) -> TransferTuning:
+        return TransferTuning(self.parallel_requests, self.chunk_size_bytes)
+
+    def record_chunk(self, byte_count: int, elapsed: float) -> None:
+        """Account one completed range request and retune at window ends."""
+        self._window_bytes += byte_count
+        self._window_latency += elapsed
+        self._window_chunks += 1
+        now = self._clock()
+        duration = now - self._window_start
+        if duration >= TUNING_WINDOW_SECONDS:
+            self._adjust(duration)
+            self._window_start = now
+            self._window_bytes = 0
+            self._window_latency = 0.0
+            self._window_chunks = 0
+
+    def _adjust(self, duration: float) -> None:
+        throughput = self._window_bytes / duration
+        mean_latency = self._window_latency / self._window_chunks
+        if self._best_latency is None or mean_latency < self._best_latency:
+            self._best_latency = mean_latency
+        saturated = mean_latency > self._best_latency * LATENCY_INFLATION_LIMIT
+        previous = self._previous_throughput
+        if saturated or (
+            previous is not None
+            and throughput < previous * (1 - THROUGHPUT_GAIN_THRESHOLD)
+        ):
+            self.parallel_requests = max(
+                self.min_requests, self.parallel_requests // 2
+            )
+            # Probe upwards again from the reduced level.
+            self._previous_throughput = None
+        else:
+            if previous is None or throughput > previous * (
+                1 + THROUGHPUT_GAIN_THRESHOLD
+            ):
+                self.parallel_requests = min(
+                    self.max_requests, self.parallel_requests + 1
+                )
+            self._previous_throughput = throughput
+
+        if mean_latency < FAST_CHUNK_SECONDS:
+            self.chunk_size_bytes = min(MAX_CHUNK_SIZE_BYTES, self.chunk_size_bytes * 2)
+        elif mean_latency > SLOW_CHUNK_SECONDS:
+            self.chunk_size_bytes = max(MIN_CHUNK_SIZE_BYTES, self.chunk_size_bytes // 2)
+        self.adjustments += 1
+
+
+class TransferTuningStore:
+    """Learned :class:`TransferTuning` values per host, kept in one JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.logger = get_logger("ashyterm.filemanager.transfer_tuning")
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as tuning_file:
+                data = json.load(tuning_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            self.logger.debug(f"Ignoring unreadable transfer tuning file: {exc}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, host_key: str) -> Optional[TransferTuning]:
+        with _store_lock:
+            entry = self._read().get(host_key)
+        try:
+            return TransferTuning(
+                parallel_requests=int(entry["parallel_requests"]),
+                chunk_size_bytes=int(entry["chunk_size_bytes"]),
+            )
+        except (TypeError, KeyError, ValueError):
+            return None
+
+    def save(self, host_key: str, tuning: TransferTuning) -> None:
+        with _store_lock:
+            data = self._read()
+            data[host_key] = {
+                "parallel_requests": tuning.parallel_requests,
+                "chunk_size_bytes": tuning.chunk_size_bytes,
+                "updated": time.time(),
+            }
+            if len(data) > MAX_REMEMBERED_HOSTS:
+                oldest_first = sorted(
+                    data,
+                    key=lambda key: (
+                        data[key].get("updated", 0)
+                        if isinstance(data[key], dict)
+                        else 0
+                    ),
+                )
+                for key in oldest_first[: len(data) - MAX_REMEMBERED_HOSTS]:
+                    del data[key]
+            try:
+                atomic_json_write(self.path, data)
+            except OSError as exc:
+                self.logger.warning(f"Could not save transfer tuning: {exc}")
@@ -15,8 +15,10 @@ from ..sessions.models import SessionItem
 from ..utils.security import InputSanitizer
 from ..utils.translation_utils import _
 from .models import FileItem
+from .operations import FileOperations
 from .transfer_dialog import TransferManagerDialog
 from .transfer_manager import TransferType
+from .transfer_scheduler import TransferPriority
 from .transfer_sizes import (
     calculate_local_paths_size as _calculate_local_paths_size_impl,
     calculate_remote_item_sizes as _calculate_remote_item_sizes_impl,
@@ -210,11 +212,12 @@ class FileTransferMixin:
             transfer_id,
             "Uploading",
             self._background_upload_worker,
-            on_success_callback=lambda _, __: GLib.idle_add(
-                lambda: self.refresh(source="filemanager")
-            ),
+            on_success_callback=self._on_upload_success,
         )
 
+    def _on_upload_success(self, _local_path, _remote_path) -> None:
+        GLib.idle_add(lambda: self.refresh(source="filemanager"))
+
     def _calculate_local_paths_size(
         self, local_paths: list[Path]
     ) -> tuple[int, dict[str, int]]:
@@ -538,21 +541,66 @@ class FileTransferMixin:
             "Downloading",
             self._background_download_worker,
             success_callback_with_ts,
+            priority=TransferPriority.INTERACTIVE,
         )
         return GLib.SOURCE_REMOVE
 
     def _start_cancellable_transfer(
-        self, transfer_id, _verb, worker_func, on_success_callback
+        self,
+        transfer_id,
+        _verb,
+        worker_func,
+        on_success_callback,
+        priority: Optional[TransferPriority] = None,
     ):
         transfer = self.transfer_manager.get_transfer(transfer_id)
         if not transfer:
             return
+        transfer.session_key = self._get_transfer_session_key()
+        if priority is not None:
+            transfer.priority = priority
 
         from ..core.tasks import AsyncTaskManager
 
-        AsyncTaskManager.get().submit_io(
-            worker_func, transfer_id, on_success_callback
-        )
+        def start():
+            future = AsyncTaskManager.get().submit_io(
+                worker_func, transfer_id, on_success_callback
+            )
+            if future is None:
+                raise RuntimeError(_("The transfer could not be started."))
+
+        self.transfer_manager.queue_transfer(transfer_id, start)
+
+    def _get_transfer_session_key(self) -> str:
+        session = self.session_item
+        if not session or not session.is_ssh():
+            return ""
+        return FileOperations._get_session_key(session)
+
+    def _on_transfer_retry_requested(self, _manager, transfer_id: str) -> None:
+        transfer = self.transfer_manager.get_transfer(transfer_id)
+        if not transfer:
+            return
+        if transfer.session_key != self._get_transfer_session_key():
+            self.transfer_manager.fail_transfer(
+                transfer_id,
+                _("The session this transfer belongs to is no longer active."),
+            )
+            return
+        if transfer.transfer_type == TransferType.DOWNLOAD:
+            self._start_cancellable_transfer(
+                transfer_id,
+                "Downloading",
+                self._background_download_worker,
+                on_success_callback=self._on_download_success,
+            )
+        else:
+            self._start_cancellable_transfer(
+                transfer_id,
+                "Uploading",
+                self._background_upload_worker,
+                on_success_callback=self._on_upload_success,
+            )
 
     def _background_download_worker(self, transfer_id, on_success_callback):
         transfer = self.transfer_manager.get_transfer(transfer_id)
@@ -602,6 +650,7 @@ class FileTransferMixin:
                 Path(transfer.local_path),
                 transfer.remote_path,
                 is_directory=transfer.is_directory,
+                file_size=transfer.file_size,
                 progress_callback=self.transfer_manager.update_progress,
                 completion_callback=completion_callback,
                 cancellation_event=self.transfer_manager.get_cancellation_event(
@@ -981,21 +1030,39 @@ class FileTransferMixin:
                 is_cancellable=True,
                 is_directory=local_path.is_dir(),
             )
+            self._start_cancellable_transfer(
+                transfer_id,
+                "Uploading",
+                self._background_save_upload_worker,
+                on_success_callback=None,
+                priority=TransferPriority.INTERACTIVE,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to initiate upload-on-save: {e}")
+
+    def _background_save_upload_worker(self, transfer_id, _on_success_callback):
+        transfer = self.transfer_manager.get_transfer(transfer_id)
+        if not transfer:
+            return
+
+        try:
             self.transfer_manager.start_transfer(transfer_id)
             self.operations.start_upload_with_progress(
                 transfer_id,
                 self.session_item,
-                local_path,
-                remote_path,
-                is_directory=local_path.is_dir(),
+                Path(transfer.local_path),
+                transfer.remote_path,
+                is_directory=transfer.is_directory,
+                file_size=transfer.file_size,
                 progress_callback=self.transfer_manager.update_progress,
                 completion_callback=self._on_save_upload_complete,
                 cancellation_event=self.transfer_manager.get_cancellation_event(
                     transfer_id
                 ),
+                prefer_delta=True,
             )
         except Exception as e:
-            self.logger.error(f"Failed to initiate upload-on-save: {e}")
+            GLib.idle_add(self._on_save_upload_complete, transfer_id, False, str(e))
 
     def _on_rename_action(self, _action, _param, items: List[FileItem]):
         if not items or len(items) > 1:
@@ -0,0 +1,177 @@
+# ashyterm/sessions/audit.py
+"""Incremental security audit of loaded sessions.
+
+The audit runs on the IO pool in chunks of :data:`AUDIT_CHUNK_SIZE`
+sessions, each chunk a separate task, so a large sessions file never
+holds a worker for long and a newer load supersedes a run in progress.
+
+Findings are cached by each session's audit fingerprint: the fields
+:meth:`SecurityAuditor.audit_ssh_session` reads plus the ``stat()`` of
+its key file. A later run only audits (and logs) sessions whose
+fingerprint changed; the rest reuse their cached findings. Sessions that
+share a fingerprint are audited once but each is named in the log.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import gi
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
+
+from ..utils.logger import get_logger
+
+# Let startup finish before the first audit.
+AUDIT_DELAY_MS = 500
+AUDIT_CHUNK_SIZE = 200
+_REPORTED_SEVERITIES = frozenset({"high", "critical"})
+
+Findings = List[Dict[str, Any]]
+
+
+def _key_file_state(key_path: str) -> Hashable:
+    try:
+        info = os.stat(key_path)
+    except OSError as e:
+        return e.errno
+    return (info.st_ino, info.st_mode, info.st_size, info.st_mtime_ns)
+
+
+def audit_fingerprint(session_data: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """What an audit of ``session_data`` depends on; stats the key file."""
+    auth_type = session_data.get("auth_type", "")
+    auth_value = session_data.get("auth_value", "")
+    key_state = None
+    if auth_type == "key" and auth_value:
+        key_state = _key_file_state(auth_value)
+    return (
+        session_data.get("host", ""),
+        session_data.get("user", ""),
+        auth_type,
+        auth_value,
+        key_state,
+    )
+
+
+@dataclass
+class _AuditRun:
+    generation: int
+    sessions: List[Dict[str, Any]]
+    issues: int = 0
+    audited: int = 0
+    seen: Set[Tuple[Hashable, ...]] = field(default_factory=set)
+    # Fingerprints audited by this run; every session sharing one is logged.
+    fresh: Set[Tuple[Hashable, ...]] = field(default_factory=set)
+
+
+class IncrementalSessionAudit:
+    """Audits SSH sessions off the main loop, skipping unchanged ones.
+
+    ``submit(fn, *args)`` runs ``fn`` on the IO pool and returns a future,
+    or None when it cannot; without it chunks run inline.
+    """
+
+    def __init__(
+        self,
+        auditor: Any,
+        submit: Optional[Callable] = None,
+        chunk_size: int = AUDIT_CHUNK_SIZE,
+    ) -> None:
+        self.logger = get_logger("ashyterm.sessions.audit")
+        self._auditor = auditor
+        self._submit = submit
+        self._chunk_size = max(1, chunk_size)
+        # Chunks of overlapping runs take turns on the cache.
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+        self._cache: Dict[Tuple[Hashable, ...], Findings] = {}
+
+    def schedule(
+        self, sessions: List[Dict[str, Any]], delay_ms: int = AUDIT_DELAY_MS
+    ) -> None:
+        """Audit ``sessions`` after ``delay_ms``, cancelling any earlier run."""
+        run = self._new_run(sessions)
+        GLib.timeout_add(delay_ms, self._start, run)
+
+    def run_now(self, sessions: List[Dict[str, Any]]) -> int:
+        """Audit ``sessions`` on the calling thread; return the issue count."""
+        run = self._new_run(sessions)
+        for start in range(0, len(run.sessions), self._chunk_size):
+            if not self._audit_chunk(run, start):
+                break
+        return run.issues
+
+    def _new_run(self, sessions: List[Dict[str, Any]]) -> _AuditRun:
+        ssh_sessions = [s for s in sessions if s.get("session_type") == "ssh"]
+        self._generation += 1
+        return _AuditRun(self._generation, ssh_sessions)
+
+    def _start(self, run: _AuditRun) -> bool:
+        self._queue_chunk(run, 0)
+        return GLib.SOURCE_REMOVE
+
+    def _queue_chunk(self, run: _AuditRun, start: int) -> None:
+        future = None
+        if self._submit is not None:
+            future = self._submit(self._run_chunk, run, start)
+        if future is None:
+            self._run_chunk(run, start)
+
+    def _run_chunk(self, run: _AuditRun, start: int) -> None:
+        try:
+            more = self._audit_chunk(run, start)
+        except Exception as e:
+            self.logger.error(f"Security audit failed: {e}")
+            return
+        if more:
+            self._queue_chunk(run, start + self._chunk_size)
+
+    def _audit_chunk(self, run: _AuditRun, start: int) -> bool:
+        """Audit one chunk; False once the run is finished or superseded."""
+        with self._cache_lock:
+            if run.generation != self._generation:
+                return False
+            return self._audit_chunk_locked(run, start)
+
+    def _audit_chunk_locked(self, run: _AuditRun, start: int) -> bool:
+        for session_data in run.sessions[start : start + self._chunk_size]:
+            fingerprint = audit_fingerprint(session_data)
+            run.seen.add(fingerprint)
+            findings = self._cache.get(fingerprint)
+            if findings is None:
+                findings = self._auditor.audit_ssh_session(session_data)
+                self._cache[fingerprint] = findings
+                run.fresh.add(fingerprint)
+                run.audited += 1
+            for finding in findings:
+                if finding["severity"] in _REPORTED_SEVERITIES:
+                    run.issues += 1
+                    if fingerprint in run.fresh:
+                        self.logger.warning(
+                            f"Security issue in session '{session_data.get('name')}': {finding['message']}"
+                        )
+        if start + self._chunk_size < len(run.sessions):
+            return True
+        self._finish(run)
+        return False
+
+    def _finish(self, run: _AuditRun) -> None:
+        # Forget sessions that were edited or removed since the last run.
+        self._cache = {
+            fingerprint: findings
+            for fingerprint, findings in self._cache.items()
+            if fingerprint in run.seen
+        }
+        self.logger.debug(
+            f"Security audit done: {run.audited} of {len(run.sessions)} "
+            "sessions audited, the rest unchanged"
+        )
+        if run.issues > 0:
+            self.logger.warning(
+                f"Found {run.issues} security issues in loaded sessions"
+            )
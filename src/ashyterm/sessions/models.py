@@ -38,6 +38,15 @@ class BaseModel(GObject.GObject):
         """Subclasses override this. Return [] when valid."""
         return []
 
+    def get_load_errors(self) -> List[str]:
+        """Errors that can be found without materializing deferred fields."""
+        return self.get_validation_errors()
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "BaseModel":
+        """Build an item from stored data; subclasses may defer the work."""
+        return cls.from_dict(data)
+
     def validate(self) -> bool:
         """True when :meth:`get_validation_errors` is empty; logs otherwise."""
         errors = self.get_validation_errors()
@@ -80,8 +89,38 @@ class LayoutItem(GObject.GObject):
         return None
 
 
+# Fields SessionItem.from_record() leaves in the raw record, with their
+# defaults. Nothing that the sidebar, search or connection string reads.
+_DEFERRED_FIELDS: Dict[str, Any] = {
+    "post_login_command_enabled": False,
+    "post_login_command": "",
+    "sftp_session_enabled": False,
+    "sftp_local_directory": "",
+    "sftp_remote_directory": "",
+    "port_forwardings": [],
+    "x11_forwarding": False,
+    "proxy_jump": "",
+    "local_working_directory": "",
+    "local_startup_command": "",
+    # Highlighting overrides (tri-state)
+    "output_highlighting": None,
+    "command_specific_highlighting": None,
+    "cat_colorization": None,
+    "shell_input_highlighting": None,
+}
+
+
+def _raw_deferred(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: record.get(key, default) for key, default in _DEFERRED_FIELDS.items()}
+
+
 class SessionItem(BaseModel):
-    """Data model for a terminal session, either local or remote (SSH)."""
+    """Data model for a terminal session, either local or remote (SSH).
+
+    Sessions loaded with :meth:`from_record` keep the fields listed in
+    ``_DEFERRED_FIELDS`` as raw data until one of them is first read or
+    written; see :meth:`_materialize`.
+    """
 
     def __init__(
         self,
@@ -127,6 +166,44 @@ class SessionItem(BaseModel):
         self._folder_path = str(normalize_path(folder_path)) if folder_path else ""
         self._port = port
         self._tab_color = tab_color
+        self._source = source or "user"
+        # Raw data for the deferred fields until _materialize() runs.
+        self._record: Optional[Dict[str, Any]] = None
+        self._apply_details(
+            post_login_command_enabled=post_login_command_enabled,
+            post_login_command=post_login_command,
+            sftp_session_enabled=sftp_session_enabled,
+            sftp_local_directory=sftp_local_directory,
+            sftp_remote_directory=sftp_remote_directory,
+            port_forwardings=port_forwardings,
+            x11_forwarding=x11_forwarding,
+            proxy_jump=proxy_jump,
+            local_working_directory=local_working_directory,
+            local_startup_command=local_startup_command,
+            output_highlighting=output_highlighting,
+            command_specific_highlighting=command_specific_highlighting,
+            cat_colorization=cat_colorization,
+            shell_input_highlighting=shell_input_highlighting,
+        )
+
+    def _apply_details(
+        self,
+        post_login_command_enabled: bool,
+        post_login_command: str,
+        sftp_session_enabled: bool,
+        sftp_local_directory: str,
+        sftp_remote_directory: str,
+        port_forwardings: Optional[List[Dict[str, Any]]],
+        x11_forwarding: bool,
+        proxy_jump: str,
+        local_working_directory: str,
+        local_startup_command: str,
+        output_highlighting: Optional[bool],
+        command_specific_highlighting: Optional[bool],
+        cat_colorization: Optional[bool],
+        shell_input_highlighting: Optional[bool],
+    ) -> None:
+        """Set the deferred fields without marking the session modified."""
         self._post_login_command_enabled = bool(post_login_command_enabled)
         self._post_login_command = (
             post_login_command.strip() if post_login_command else ""
@@ -138,12 +215,11 @@ class SessionItem(BaseModel):
         self._sftp_remote_directory = (
             sftp_remote_directory.strip() if sftp_remote_directory else ""
         )
-        self._port_forwardings: List[Dict[str, Any]] = []
-        if port_forwardings:
-            self.port_forwardings = port_forwardings
+        self._port_forwardings: List[Dict[str, Any]] = [
+            self._normalize_port_forwarding(item) for item in port_forwardings or []
+        ]
         self._x11_forwarding = bool(x11_forwarding)
         self._proxy_jump = (proxy_jump or "").strip()
-        self._source = source or "user"
         # Local terminal specific properties
         self._local_working_directory = (
             str(normalize_path(local_working_directory))
@@ -162,6 +238,18 @@ class SessionItem(BaseModel):
         self._cat_colorization: Optional[bool] = cat_colorization
         self._shell_input_highlighting: Optional[bool] = shell_input_highlighting
 
+    @property
+    def is_materialized(self) -> bool:
+        return self._record is None
+
+    def _materialize(self) -> None:
+        """Turn the raw deferred fields into their normalized form, once."""
+        record = self._record
+        if record is None:
+            return
+        self._record = None
+        self._apply_details(**_raw_deferred(record))
+
     @property
     def children(self) -> Optional[Gio.ListStore]:
         """Session items are leaf nodes and have no children."""
@@ -293,10 +381,12 @@ class SessionItem(BaseModel):
 
     @property
     def post_login_command_enabled(self) -> bool:
+        self._materialize()
         return self._post_login_command_enabled
 
     @post_login_command_enabled.setter
     def post_login_command_enabled(self, value: bool) -> None:
+        self._materialize()
         new_value = bool(value)
         if self._post_login_command_enabled != new_value:
             self._post_login_command_enabled = new_value
@@ -304,10 +394,12 @@ class SessionItem(BaseModel):
 
     @property
     def post_login_command(self) -> str:
+        self._materialize()
         return self._post_login_command
 
     @post_login_command.setter
     def post_login_command(self, value: str) -> None:
+        self._materialize()
         new_value = value.strip() if value else ""
         if self._post_login_command != new_value:
             self._post_login_command = new_value
@@ -315,10 +407,12 @@ class SessionItem(BaseModel):
 
     @property
     def sftp_session_enabled(self) -> bool:
+        self._materialize()
         return self._sftp_session_enabled
 
     @sftp_session_enabled.setter
     def sftp_session_enabled(self, value: bool) -> None:
+        self._materialize()
         new_value = bool(value)
         if self._sftp_session_enabled != new_value:
             self._sftp_session_enabled = new_value
@@ -326,10 +420,12 @@ class SessionItem(BaseModel):
 
     @property
     def sftp_local_directory(self) -> str:
+        self._materialize()
         return self._sftp_local_directory
 
     @sftp_local_directory.setter
     def sftp_local_directory(self, value: str) -> None:
+        self._materialize()
         new_value = str(normalize_path(value)) if value and value.strip() else ""
         if self._sftp_local_directory != new_value:
             self._sftp_local_directory = new_value
@@ -337,10 +433,12 @@ class SessionItem(BaseModel):
 
     @property
     def sftp_remote_directory(self) -> str:
+        self._materialize()
         return self._sftp_remote_directory
 
     @sftp_remote_directory.setter
     def sftp_remote_directory(self, value: str) -> None:
+        self._materialize()
         new_value = value.strip() if value else ""
         if self._sftp_remote_directory != new_value:
             self._sftp_remote_directory = new_value
@@ -348,10 +446,12 @@ class SessionItem(BaseModel):
 
     @property
     def port_forwardings(self) -> List[Dict[str, Any]]:
+        self._materialize()
         return deepcopy(self._port_forwardings)
 
     @port_forwardings.setter
     def port_forwardings(self, value: List[Dict[str, Any]]) -> None:
+        self._materialize()
         normalized_list: List[Dict[str, Any]] = []
         if value:
             for item in value:
@@ -386,10 +486,12 @@ class SessionItem(BaseModel):
 
     @property
     def x11_forwarding(self) -> bool:
+        self._materialize()
         return self._x11_forwarding
 
     @x11_forwarding.setter
     def x11_forwarding(self, value: bool) -> None:
+        self._materialize()
         new_value = bool(value)
         if self._x11_forwarding != new_value:
             self._x11_forwarding = new_value
@@ -398,10 +500,12 @@ class SessionItem(BaseModel):
     @property
     def proxy_jump(self) -> str:
         """ProxyJump chain for SSH, e.g. "user@bastion" or "h1,h2" (no spaces)."""
+        self._materialize()
         return self._proxy_jump
 
     @proxy_jump.setter
     def proxy_jump(self, value: str) -> None:
+        self._materialize()
         new_value = (value or "").strip()
         if self._proxy_jump != new_value:
             self._proxy_jump = new_value
@@ -420,10 +524,12 @@ class SessionItem(BaseModel):
 
     @property
     def local_working_directory(self) -> str:
+        self._materialize()
         return self._local_working_directory
 
     @local_working_directory.setter
     def local_working_directory(self, value: str) -> None:
+        self._materialize()
         new_value = str(normalize_path(value)) if value and value.strip() else ""
         if self._local_working_directory != new_value:
             self._local_working_directory = new_value
@@ -431,10 +537,12 @@ class SessionItem(BaseModel):
 
     @property
     def local_startup_command(self) -> str:
+        self._materialize()
         return self._local_startup_command
 
     @local_startup_command.setter
     def local_startup_command(self, value: str) -> None:
+        self._materialize()
         new_value = value.strip() if value else ""
         if self._local_startup_command != new_value:
             self._local_startup_command = new_value
@@ -447,10 +555,12 @@ class SessionItem(BaseModel):
         None means automatic (inherit global local/ssh output-highlighting preference).
         """
 
+        self._materialize()
         return self._output_highlighting
 
     @output_highlighting.setter
     def output_highlighting(self, value: Optional[bool]) -> None:
+        self._materialize()
         if value is not None and not isinstance(value, bool):
             raise SessionValidationError(
                 self.name, ["Invalid output_highlighting value"]
@@ -463,10 +573,12 @@ class SessionItem(BaseModel):
     def command_specific_highlighting(self) -> Optional[bool]:
         """Per-session override for command-specific/context-aware output highlighting."""
 
+        self._materialize()
         return self._command_specific_highlighting
 
     @command_specific_highlighting.setter
     def command_specific_highlighting(self, value: Optional[bool]) -> None:
+        self._materialize()
         if value is not None and not isinstance(value, bool):
             raise SessionValidationError(
                 self.name, ["Invalid command_specific_highlighting value"]
@@ -479,10 +591,12 @@ class SessionItem(BaseModel):
     def cat_colorization(self) -> Optional[bool]:
         """Per-session override for Pygments-based cat output colorization."""
 
+        self._materialize()
         return self._cat_colorization
 
     @cat_colorization.setter
     def cat_colorization(self, value: Optional[bool]) -> None:
+        self._materialize()
         if value is not None and not isinstance(value, bool):
             raise SessionValidationError(self.name, ["Invalid cat_colorization value"])
         if self._cat_colorization != value:
@@ -493,10 +607,12 @@ class SessionItem(BaseModel):
     def shell_input_highlighting(self) -> Optional[bool]:
         """Per-session override for shell input highlighting."""
 
+        self._materialize()
         return self._shell_input_highlighting
 
     @shell_input_highlighting.setter
     def shell_input_highlighting(self, value: Optional[bool]) -> None:
+        self._materialize()
         if value is not None and not isinstance(value, bool):
             raise SessionValidationError(
                 self.name, ["Invalid shell_input_highlighting value"]
@@ -512,13 +628,18 @@ class SessionItem(BaseModel):
             errors.append(_("Session name is required."))
         return errors
 
-    def _validate_ssh_fields(self) -> List[str]:
-        """Validate SSH-specific fields."""
+    def _validate_endpoint(self) -> List[str]:
+        """Validate the SSH host and port."""
         errors = []
         if not self.host:
             errors.append(_("Host is required for SSH sessions."))
         if not (1 <= self.port <= 65535):
             errors.append(_("Port must be between 1 and 65535."))
+        return errors
+
+    def _validate_ssh_fields(self) -> List[str]:
+        """Validate SSH-specific fields."""
+        errors = self._validate_endpoint()
         if self.post_login_command_enabled and not self.post_login_command:
             errors.append(_("Post-login command cannot be empty when enabled."))
         return errors
@@ -535,10 +656,15 @@ class SessionItem(BaseModel):
             return [_("SFTP local directory must exist and be a directory.")]
         return []
 
-    def _validate_port_forwardings(self) -> List[str]:
+    def _validate_port_forwardings(
+        self, tunnels: Optional[List[Dict[str, Any]]] = None
+    ) -> List[str]:
         """Validate port forwarding configurations."""
         errors = []
-        for tunnel in self._port_forwardings:
+        if tunnels is None:
+            self._materialize()
+            tunnels = self._port_forwardings
+        for tunnel in tunnels:
             local_port = tunnel.get("local_port", 0)
             remote_port = tunnel.get("remote_port", 0)
             if not (1024 < int(local_port) <= 65535):
@@ -565,9 +691,40 @@ class SessionItem(BaseModel):
             errors.extend(self._validate_port_forwardings())
         return errors
 
+    def get_load_errors(self) -> List[str]:
+        """Validate a session from :meth:`from_record` against its raw record.
+
+        The SFTP local directory is not checked until the session is
+        materialized, so loading never stats the filesystem.
+        """
+        record = self._record
+        if record is None:
+            return self.get_validation_errors()
+        errors = self._validate_basic_fields()
+        if self.is_ssh():
+            errors.extend(self._validate_endpoint())
+            if record.get("post_login_command_enabled") and not str(
+                record.get("post_login_command") or ""
+            ).strip():
+                errors.append(_("Post-login command cannot be empty when enabled."))
+            errors.extend(
+                self._validate_port_forwardings(record.get("port_forwardings") or [])
+            )
+        return errors
+
+    def _deferred_values(self) -> Dict[str, Any]:
+        """The deferred fields, read from the raw record while it is pending."""
+        record = self._record
+        if record is None:
+            return {key: getattr(self, key) for key in _DEFERRED_FIELDS}
+        values = _raw_deferred(record)
+        values["port_forwardings"] = deepcopy(values["port_forwardings"] or [])
+        return values
+
     def to_dict(self) -> Dict[str, Any]:
         """Serializes the session item to a dictionary."""
         auth_value_to_save = "" if self.uses_password_auth() else self._auth_value
+        deferred = self._deferred_values()
         return {
             "name": self.name,
             "session_type": self._session_type,
@@ -578,21 +735,21 @@ class SessionItem(BaseModel):
             "folder_path": self._folder_path,
             "port": self.port,
             "tab_color": self.tab_color,
-            "post_login_command_enabled": self.post_login_command_enabled,
-            "post_login_command": self.post_login_command,
-            "sftp_session_enabled": self.sftp_session_enabled,
-            "sftp_local_directory": self.sftp_local_directory,
-            "sftp_remote_directory": self.sftp_remote_directory,
-            "port_forwardings": self.port_forwardings,
-            "x11_forwarding": self.x11_forwarding,
-            "proxy_jump": self.proxy_jump,
-            "local_working_directory": self.local_working_directory,
-            "local_startup_command": self.local_startup_command,
+            "post_login_command_enabled": deferred["post_login_command_enabled"],
+            "post_login_command": deferred["post_login_command"],
+            "sftp_session_enabled": deferred["sftp_session_enabled"],
+            "sftp_local_directory": deferred["sftp_local_directory"],
+            "sftp_remote_directory": deferred["sftp_remote_directory"],
+            "port_forwardings": deferred["port_forwardings"],
+            "x11_forwarding": deferred["x11_forwarding"],
+            "proxy_jump": deferred["proxy_jump"],
+            "local_working_directory": deferred["local_working_directory"],
+            "local_startup_command": deferred["local_startup_command"],
             # Highlighting overrides (tri-state)
-            "output_highlighting": self.output_highlighting,
-            "command_specific_highlighting": self.command_specific_highlighting,
-            "cat_colorization": self.cat_colorization,
-            "shell_input_highlighting": self.shell_input_highlighting,
+            "output_highlighting": deferred["output_highlighting"],
+            "command_specific_highlighting": deferred["command_specific_highlighting"],
+            "cat_colorization": deferred["cat_colorization"],
+            "shell_input_highlighting": deferred["shell_input_highlighting"],
             "created_at": self._created_at,
             "modified_at": self._modified_at,
             "source": self._source,
@@ -601,38 +758,33 @@ class SessionItem(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionItem":
         """Deserializes a dictionary into a SessionItem instance."""
+        session = cls.from_record(data)
+        session._materialize()
+        return session
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "SessionItem":
+        """Like :meth:`from_dict`, but the deferred fields stay raw until used.
+
+        Only what the sidebar, search and connection string need is parsed
+        up front, which keeps loading thousands of sessions cheap.
+        """
         session = cls(
-            name=data.get("name", _("Unnamed Session")),
+            name=data["name"] if "name" in data else _("Unnamed Session"),
             session_type=data.get("session_type", "ssh"),
             host=data.get("host", ""),
             user=data.get("user", ""),
             auth_type=data.get("auth_type", "key"),
             folder_path=data.get("folder_path", ""),
             port=data.get("port", 22),
-            post_login_command_enabled=data.get("post_login_command_enabled", False),
-            post_login_command=data.get("post_login_command", ""),
-            sftp_session_enabled=data.get("sftp_session_enabled", False),
-            sftp_local_directory=data.get("sftp_local_directory", ""),
-            sftp_remote_directory=data.get("sftp_remote_directory", ""),
-            port_forwardings=data.get("port_forwardings", []),
-            x11_forwarding=data.get("x11_forwarding", False),
-            proxy_jump=data.get("proxy_jump", ""),
             source=data.get("source", "user"),
-            local_working_directory=data.get("local_working_directory", ""),
-            local_startup_command=data.get("local_startup_command", ""),
-            # Highlighting overrides (tri-state)
-            output_highlighting=data.get("output_highlighting", None),
-            command_specific_highlighting=data.get(
-                "command_specific_highlighting", None
-            ),
-            cat_colorization=data.get("cat_colorization", None),
-            shell_input_highlighting=data.get("shell_input_highlighting", None),
         )
         # __init__ sets default metadata; overwrite with loaded data
         session._auth_value = data.get("auth_value", "")
-        session.tab_color = data.get("tab_color")
+        session._tab_color = data.get("tab_color")
         session._created_at = data.get("created_at", time.time())
         session._modified_at = data.get("modified_at", time.time())
+        session._record = dict(data)
         return session
 
     def is_local(self) -> bool:
@@ -2,6 +2,7 @@
 
 import os
 import threading
+from contextlib import AbstractContextManager
 from functools import partial
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Tuple, Union
@@ -9,11 +10,13 @@ from typing import Any, Callable, List, Optional, Tuple, Union
 from gi.repository import Gio
 
 from ..core.signals import AppSignals
+from ..core.tasks import submit_io
 from ..helpers import generate_unique_name
 from ..utils.logger import get_logger
-from ..utils.ssh_config_parser import SSHConfigParser
+from ..utils.ssh_config_parser import SSHConfigParser, parse_known_hosts
 from ..utils.translation_utils import _
 from .models import SessionFolder, SessionItem
+from .persistence import SessionPersistence
 from .results import OperationResult
 from .storage import get_storage_manager
 from .validation import validate_folder_for_add, validate_session_for_add
@@ -27,6 +30,7 @@ class SessionOperations:
         session_store: Gio.ListStore,
         folder_store: Gio.ListStore,
         settings_manager,
+        on_save_failed: Optional[Callable[[], None]] = None,
     ):
         self.logger = get_logger("ashyterm.sessions.operations")
         self.session_store = session_store
@@ -34,6 +38,13 @@ class SessionOperations:
         self.settings_manager = settings_manager
         self._operation_lock = threading.RLock()
         self.storage_manager = get_storage_manager()
+        self.persistence = SessionPersistence(
+            self.storage_manager,
+            session_store,
+            folder_store,
+            submit=submit_io,
+            on_save_failed=on_save_failed,
+        )
         ignored_list = self.settings_manager.get("ignored_ssh_config_hosts", []) or []
         self._ignored_ssh_config_hosts = set(ignored_list)
 
@@ -311,7 +322,7 @@ class SessionOperations:
         """Parse SSH config file and return entries or error message."""
         parser = SSHConfigParser()
         try:
-            entries = parser.parse(target_path)
+            entries = list(parser.iter_hosts(target_path))
             if not entries:
                 return False, _("No host entries found in SSH config.")
             return True, entries
@@ -322,8 +333,13 @@ class SessionOperations:
         self,
         entry: Any,
         existing_names: set,
+        existing_keys: set,
     ) -> tuple[Optional["SessionItem"], Optional[str]]:
-        """Create a SessionItem from an SSH config entry."""
+        """Create a SessionItem from an SSH config entry.
+
+        ``existing_keys`` holds the ``user@host:port`` key of every SSH
+        session, including the ones created earlier in the same import.
+        """
         hostname = entry.hostname or entry.alias
         if not hostname:
             return None, _("Skipped host '{alias}': missing hostname.").format(
@@ -338,8 +354,7 @@ class SessionOperations:
             self.logger.debug(f"Skipping ignored SSH config host: {entry_key}")
             return None, None
 
-        existing_session = self._find_existing_ssh_session(hostname, user, port)
-        if existing_session:
+        if entry_key in existing_keys:
             return None, None
 
         session_name = generate_unique_name(entry.alias, existing_names)
@@ -360,75 +375,131 @@ class SessionOperations:
         ), None
 
     def import_sessions_from_ssh_config(
-        self, config_path: Optional[Union[str, Path]] = None
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        known_hosts_path: Optional[Union[str, Path]] = None,
     ) -> OperationResult:
-        """Imports SSH sessions from an OpenSSH-style config file."""
+        """Imports SSH sessions from an OpenSSH-style config file.
+
+        Hosts from ``known_hosts_path`` (by default ~/.ssh/known_hosts when
+        the ``ssh_import_known_hosts`` setting is on) are imported too,
+        unless a session or config entry already points at them. The new
+        sessions are added in one batch: one store splice, one save and
+        one tree refresh, however many hosts there are.
+        """
         with self._operation_lock:
             default_path = Path.home() / ".ssh" / "config"
             target_path = (
                 Path(config_path).expanduser() if config_path else default_path
             )
-
-            if not target_path.exists():
+            if known_hosts_path is not None:
+                known_hosts: Optional[Path] = Path(known_hosts_path).expanduser()
+            elif self.settings_manager.get("ssh_import_known_hosts", False):
+                known_hosts = Path.home() / ".ssh" / "known_hosts"
+            else:
+                known_hosts = None
+
+            if not target_path.exists() and known_hosts is None:
                 message = _("SSH config file not found at {path}").format(
                     path=str(target_path)
                 )
                 self.logger.warning(message)
                 return OperationResult(False, message)
 
-            success, result = self._parse_ssh_config_file(target_path)
-            if not success:
-                assert isinstance(result, str)
-                self.logger.info(result) if "No host" in result else self.logger.error(
-                    result
-                )
-                return OperationResult(False, result)
-            assert isinstance(result, list)
-            entries = result
-
-            imported_count = 0
-            warnings: List[str] = []
-            existing_names = self._get_session_names_in_folder("")
-
-            for entry in entries:
-                session, warning = self._create_session_from_ssh_entry(
-                    entry, existing_names
-                )
-                if warning:
-                    warnings.append(warning)
-                    continue
-                if session is None:
-                    continue
-
-                add_result = self.add_session(session)
-                if add_result.success:
-                    entry_key = self._make_ssh_config_key(
-                        session.user, session.host, session.port
-                    )
-                    if entry_key in self._ignored_ssh_config_hosts:
-                        self._ignored_ssh_config_hosts.remove(entry_key)
-                        self._persist_ignored_hosts()
-                    imported_count += 1
-                    existing_names.add(session.name)
+            config_entries: list = []
+            if target_path.exists():
+                success, result = self._parse_ssh_config_file(target_path)
+                if not success:
+                    assert isinstance(result, str)
+                    if "No host" in result:
+                        self.logger.info(result)
+                    else:
+                        self.logger.error(result)
+                    if known_hosts is None:
+                        return OperationResult(False, result)
                 else:
-                    warning_text = add_result.message or _(
-                        "Failed to import host '{alias}'."
-                    ).format(alias=entry.alias)
-                    warnings.append(warning_text)
+                    assert isinstance(result, list)
+                    config_entries = result
+            known_entries = list(parse_known_hosts(known_hosts)) if known_hosts else []
 
-            if imported_count == 0:
+            new_sessions, warnings = self._plan_ssh_import(
+                config_entries, known_entries
+            )
+            if not new_sessions:
                 message = _("No sessions were imported from {path}.").format(
                     path=str(target_path)
                 )
                 self.logger.info(message)
                 return OperationResult(False, message, warnings=warnings)
 
+            position = self.session_store.get_n_items()
+            self.session_store.splice(position, 0, new_sessions)
+            if not self._save_changes():
+                self.session_store.splice(position, len(new_sessions), [])  # Rollback
+                return OperationResult(
+                    False, _("Failed to save imported sessions."), warnings=warnings
+                )
+            AppSignals.get().emit("request-tree-refresh")
+
             success_message = _("Imported {count} session(s) from {path}.").format(
-                count=imported_count, path=str(target_path)
+                count=len(new_sessions), path=str(target_path)
             )
             self.logger.info(success_message)
             return OperationResult(True, success_message, warnings=warnings)
 
+    def _plan_ssh_import(
+        self, config_entries: List[Any], known_entries: List[Any]
+    ) -> Tuple[List[SessionItem], List[str]]:
+        """Diffs parsed host entries against the store; returns new sessions.
+
+        ssh_config entries go first so their aliases win over the bare
+        hostnames of known_hosts.
+        """
+        existing_names = self._get_session_names_in_folder("")
+        existing_keys = set()
+        # Hosts already reachable under some name; known_hosts carries
+        # no user, so its entries are matched on host and port alone.
+        known_targets = set()
+        for session in self.session_store:
+            if isinstance(session, SessionItem) and session.is_ssh():
+                existing_keys.add(
+                    self._make_ssh_config_key(session.user, session.host, session.port)
+                )
+                known_targets.add((session.host, session.port))
+
+        new_sessions: List[SessionItem] = []
+        warnings: List[str] = []
+        entries = config_entries + known_entries
+        for position, entry in enumerate(entries):
+            port = entry.port or 22
+            from_known_hosts = position >= len(config_entries)
+            if from_known_hosts and (entry.hostname, port) in known_targets:
+                continue
+            session, warning = self._create_session_from_ssh_entry(
+                entry, existing_names, existing_keys
+            )
+            known_targets.add((entry.alias, port))
+            if entry.hostname:
+                known_targets.add((entry.hostname, port))
+            if warning:
+                warnings.append(warning)
+                continue
+            if session is None:
+                continue
+            if not session.validate():
+                warnings.append(
+                    _("Session validation failed: {}").format(
+                        ", ".join(session.get_validation_errors())
+                    )
+                )
+                continue
+            new_sessions.append(session)
+            existing_names.add(session.name)
+            existing_keys.add(
+                self._make_ssh_config_key(session.user, session.host, session.port)
+            )
+        return new_sessions, warnings
+
     def paste_item(
         self,
         item_to_paste: Union[SessionItem, SessionFolder],
@@ -473,10 +544,27 @@ class SessionOperations:
         return None, -1
 
     def _save_changes(self) -> bool:
-        """Saves all session and folder data."""
-        return self.storage_manager.save_sessions_and_folders_safe(
-            self.session_store, self.folder_store
-        )
+        """Schedules a save of all session and folder data.
+
+        The write is debounced and runs on the IO pool, so False only
+        means the save could not be scheduled and the callers' rollbacks
+        cover nothing else. Write errors are retried by
+        :class:`SessionPersistence` and reported through ``on_save_failed``.
+        """
+        try:
+            self.persistence.mark_dirty()
+        except Exception as e:
+            self.logger.error(f"Failed to schedule session save: {e}")
+            return False
+        return True
+
+    def batch(self) -> AbstractContextManager:
+        """Coalesce every save made inside the ``with`` block into one."""
+        return self.persistence.batch()
+
+    def flush_pending_saves(self) -> bool:
+        """Write any pending change to disk now."""
+        return self.persistence.flush()
 
     def _update_child_paths(self, old_path: str, new_path: str):
         """Updates the paths of all children when a folder is moved or renamed."""
@@ -548,22 +636,6 @@ class SessionOperations:
         """Gets a set of session names within a specific folder."""
         return {s.name for s in self.session_store if s.folder_path == folder_path}
 
-    def _find_existing_ssh_session(
-        self, hostname: str, user: str, port: int
-    ) -> Optional[SessionItem]:
-        for session in self.session_store:
-            if not isinstance(session, SessionItem):
-                continue
-            if not session.is_ssh():
-                continue
-            if (
-                session.host == hostname
-                and session.user == user
-                and session.port == port
-            ):
-                return session
-        return None
-
     def _make_ssh_config_key(self, user: str, host: str, port: int) -> str:
         user_part = user or ""
         return f"{user_part}@{host}:{port}"
@@ -0,0 +1,181 @@
+# ashyterm/sessions/persistence.py
+"""Debounced, coalesced saving of the session and folder stores.
+
+Mutations mark the stores dirty instead of writing sessions.json right
+away. Once nothing has changed for :data:`SAVE_DELAY_MS`, the stores are
+snapshotted on the main loop and written once on the IO pool, so a bulk
+rename, move or delete costs a single write however many items it
+touches. :meth:`SessionPersistence.batch` holds the write back until the
+outermost batch ends, and :meth:`SessionPersistence.flush` writes any
+pending change synchronously before the window goes away.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import gi
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
+
+from ..utils.logger import get_logger
+
+SAVE_DELAY_MS = 400
+# Retry a failed write after this long instead of the usual delay.
+RETRY_DELAY_MS = 5000
+# How long flush() waits for a write already running on the IO pool.
+FLUSH_TIMEOUT_S = 5.0
+
+
+class SessionPersistence:
+    """Coalesces store mutations into one deferred write.
+
+    ``submit(fn, *args)`` runs ``fn`` off the main loop and returns a
+    future, or None when it cannot; without it writes happen inline.
+    ``on_save_failed()`` is called on the main loop when a deferred write
+    fails, once per run of failures; the write keeps being retried.
+    """
+
+    def __init__(
+        self,
+        storage_manager: Any,
+        session_store: Any,
+        folder_store: Any,
+        submit: Optional[Callable] = None,
+        delay_ms: int = SAVE_DELAY_MS,
+        on_save_failed: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.logger = get_logger("ashyterm.sessions.persistence")
+        self._storage = storage_manager
+        self._session_store = session_store
+        self._folder_store = folder_store
+        self._submit = submit
+        self._delay_ms = delay_ms
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer_id: Optional[int] = None
+        self._pending_write = None
+        self._on_save_failed = on_save_failed
+        self._failing = False
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Schedule a save, pushing back any save already scheduled."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._schedule(self._delay_ms)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer every save requested inside the block to its end."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule(self._delay_ms)
+
+    def flush(self) -> bool:
+        """Write pending changes now, on the calling thread."""
+        self._cancel_timer()
+        if self._pending_write is not None:
+            try:
+                saved = self._pending_write.result(timeout=FLUSH_TIMEOUT_S)
+            except Exception as e:
+                self.logger.warning(f"Background session save did not finish: {e}")
+                saved = False
+            self._pending_write = None
+            self._dirty = self._dirty or not saved
+        if not self._dirty:
+            return True
+        self._dirty = False
+        try:
+            saved = self._write(self._snapshot())
+        except Exception as e:
+            self.logger.error(f"Cannot snapshot sessions for saving: {e}")
+            saved = False
+        self._dirty = not saved
+        return saved
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return self._storage.snapshot(self._session_store, self._folder_store)
+
+    def _write(self, data: Dict[str, Any]) -> bool:
+        """Write a snapshot; runs on the IO pool when one is available."""
+        try:
+            return bool(self._storage.write_snapshot(data))
+        except Exception as e:
+            self.logger.error(f"Failed to save sessions: {e}")
+            return False
+
+    def _schedule(self, delay_ms: int) -> None:
+        self._cancel_timer()
+        self._timer_id = GLib.timeout_add(delay_ms, self._on_timeout)
+
+    def _cancel_timer(self) -> None:
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+
+    def _on_timeout(self) -> bool:
+        self._timer_id = None
+        if self._batch_depth or not self._dirty:
+            return GLib.SOURCE_REMOVE
+        if self._pending_write is not None:
+            # Picked up again by _on_write_finished.
+            return GLib.SOURCE_REMOVE
+        try:
+            data = self._snapshot()
+        except Exception as e:
+            self.logger.error(f"Cannot snapshot sessions for saving: {e}")
+            self._schedule(RETRY_DELAY_MS)
+            return GLib.SOURCE_REMOVE
+        self._dirty = False
+        future = None
+        if self._submit is not None:
+            future = self._submit(self._write, data)
+        if future is None:
+            self._on_write_finished(self._write(data))
+        else:
+            self._pending_write = future
+            future.add_done_callback(self._on_write_done)
+        return GLib.SOURCE_REMOVE
+
+    def _on_write_done(self, future) -> None:
+        try:
+            saved = future.result()
+        except Exception as e:
+            self.logger.error(f"Background session save failed: {e}")
+            saved = False
+        GLib.idle_add(self._on_write_finished, saved, future)
+
+    def _on_write_finished(self, saved: bool, future=None) -> bool:
+        if future is not None and future is not self._pending_write:
+            # flush() already waited for this write.
+            return GLib.SOURCE_REMOVE
+        self._pending_write = None
+        if not saved:
+            self._dirty = True
+            self._schedule(RETRY_DELAY_MS)
+            self._report_failure()
+            return GLib.SOURCE_REMOVE
+        self._failing = False
+        if self._dirty and self._batch_depth == 0:
+            self._schedule(self._delay_ms)
+        return GLib.SOURCE_REMOVE
+
+    def _report_failure(self) -> None:
+        if self._failing:
+            return
+        self._failing = True
+        if self._on_save_failed is not None:
+            try:
+                self._on_save_failed()
+            except Exception as e:
+                self.logger.error(f"Session save failure handler raised: {e}")
@@ -0,0 +1,291 @@
+# ashyterm/sessions/search_index.py
+"""Fuzzy search over sessions, folders and layouts.
+
+Every item is indexed once with its lowercased name, host, user and
+folder path, plus the trigrams of those fields. A query is split on
+whitespace and every term must match some field:
+
+* ``term`` matches fuzzily (the characters in order, gaps allowed) and
+  is ranked the way fzf ranks: word boundaries and consecutive runs
+  score higher, gaps cost points.
+* ``'term`` must appear verbatim; candidates come from the trigram
+  postings, so an exact term never scans the whole index.
+
+Typing more of the same query only looks at the items that matched the
+previous, shorter query.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .models import LayoutItem, SessionFolder, SessionItem
+
+# Above this many entries, callers should run searches off the main loop.
+SYNC_SEARCH_LIMIT = 2000
+
+# fzf's scoring constants.
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+_BOUNDARY_CHARS = frozenset(" -_./@:")
+
+# Name, host, user, folder path: a hit on the name outranks one on the path.
+FIELD_WEIGHTS = (4, 3, 2, 1)
+
+SearchFields = Tuple[str, str, str, str]
+
+
+def session_search_fields(item: Any) -> SearchFields:
+    """The searchable text of a tree item: name, host, user, folder."""
+    if isinstance(item, SessionItem):
+        return (item.name, item.host, item.user, item.folder_path)
+    if isinstance(item, SessionFolder):
+        return (item.name, "", "", item.parent_path)
+    if isinstance(item, LayoutItem):
+        return (item.name, "", "", item.folder_path)
+    return (getattr(item, "name", ""), "", "", "")
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _score_window(pattern: str, text: str, start: int, end: int) -> int:
+    score = 0
+    matched = 0
+    in_gap = False
+    previous_matched = False
+    for i in range(start, end):
+        if matched < len(pattern) and text[i] == pattern[matched]:
+            bonus = 0
+            if i == 0 or text[i - 1] in _BOUNDARY_CHARS:
+                bonus = BONUS_BOUNDARY
+                if matched == 0:
+                    bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+            if previous_matched:
+                bonus = max(bonus, BONUS_CONSECUTIVE)
+            score += SCORE_MATCH + bonus
+            matched += 1
+            previous_matched, in_gap = True, False
+        else:
+            score -= PENALTY_GAP_EXTENSION if in_gap else PENALTY_GAP_START
+            previous_matched, in_gap = False, True
+    return max(score, 1)
+
+
+def fuzzy_score(pattern: str, text: str) -> int:
+    """fzf-style score of ``pattern`` in ``text``; 0 when it does not match.
+
+    Like fzf's v1 algorithm, the match is the shortest window ending at the
+    first complete forward match, found by scanning back from its end. A
+    verbatim occurrence is scored too and the better of the two wins.
+    """
+    if not pattern:
+        return 0
+    matched = 0
+    end = -1
+    for i, char in enumerate(text):
+        if char == pattern[matched]:
+            matched += 1
+            if matched == len(pattern):
+                end = i + 1
+                break
+    if end < 0:
+        return 0
+    matched = len(pattern) - 1
+    start = 0
+    for i in range(end - 1, -1, -1):
+        if text[i] == pattern[matched]:
+            matched -= 1
+            if matched < 0:
+                start = i
+                break
+    best = _score_window(pattern, text, start, end)
+    exact = text.find(pattern)
+    if exact >= 0:
+        best = max(best, _score_window(pattern, text, exact, exact + len(pattern)))
+    return best
+
+
+def exact_score(needle: str, text: str) -> int:
+    position = text.find(needle)
+    if position < 0:
+        return 0
+    return _score_window(needle, text, position, position + len(needle))
+
+
+@dataclass(frozen=True)
+class SearchMatch:
+    item: Any
+    score: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    item: Any
+    fields: SearchFields
+    chars: FrozenSet[str]
+    trigrams: FrozenSet[str]
+
+
+def _parse_query(query: str) -> List[Tuple[str, bool]]:
+    """``(term, exact)`` pairs; empty terms are dropped."""
+    terms = []
+    for raw in query.lower().split():
+        exact = raw.startswith("'")
+        term = raw[1:] if exact else raw
+        if term:
+            terms.append((term, exact))
+    return terms
+
+
+class SessionSearchIndex:
+    """Search entries for a set of items, kept in step with the stores.
+
+    ``fields_fn(item)`` returns the ``(name, host, user, folder)`` text to
+    search; the default reads sessions, folders and layouts. Searches may
+    run on a worker thread while the main loop updates the index.
+    """
+
+    def __init__(
+        self, fields_fn: Callable[[Any], SearchFields] = session_search_fields
+    ) -> None:
+        self._fields_fn = fields_fn
+        self._entries: Dict[int, _Entry] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        # (generation, query, ids that matched it) of the last search.
+        self._last: Optional[Tuple[int, str, FrozenSet[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, items: Iterable[Any]) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._generation += 1
+            for item in items:
+                self._add(item, self._fields_fn(item))
+
+    def sync(self, items: Iterable[Any]) -> int:
+        """Re-index items that are new, gone or edited; return how many."""
+        current = {id(item): item for item in items}
+        changed = 0
+        with self._lock:
+            for item_id in [i for i in self._entries if i not in current]:
+                self._remove(item_id)
+                changed += 1
+            for item_id, item in current.items():
+                fields = self._fields_fn(item)
+                entry = self._entries.get(item_id)
+                if entry is not None and entry.fields == _fold(fields):
+                    continue
+                if entry is not None:
+                    self._remove(item_id)
+                self._add(item, fields)
+                changed += 1
+            if changed:
+                self._generation += 1
+        return changed
+
+    def _add(self, item: Any, fields: SearchFields) -> None:
+        folded = _fold(fields)
+        grams: Set[str] = set()
+        for field in folded:
+            grams |= trigrams(field)
+        entry = _Entry(item, folded, frozenset("".join(folded)), frozenset(grams))
+        item_id = id(item)
+        self._entries[item_id] = entry
+        for gram in entry.trigrams:
+            self._postings.setdefault(gram, set()).add(item_id)
+
+    def _remove(self, item_id: int) -> None:
+        entry = self._entries.pop(item_id)
+        for gram in entry.trigrams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchMatch]:
+        """Items matching every term of ``query``, best first."""
+        terms = _parse_query(query)
+        if not terms:
+            return []
+        query = query.lower()
+        with self._lock:
+            candidates = self._candidates(query, terms)
+            matches = []
+            for item_id in candidates:
+                entry = self._entries.get(item_id)
+                if entry is None:
+                    continue
+                score = _score_entry(entry, terms)
+                if score:
+                    matches.append((-score, entry.fields[0], item_id, entry.item))
+            self._last = (
+                self._generation,
+                query,
+                frozenset(match[2] for match in matches),
+            )
+        matches.sort(key=lambda match: match[:3])
+        if limit is not None:
+            matches = matches[:limit]
+        return [SearchMatch(item, -score) for score, _name, _id, item in matches]
+
+    def _candidates(self, query: str, terms: List[Tuple[str, bool]]) -> Iterable[int]:
+        candidates: Optional[Set[int]] = None
+        if self._last is not None:
+            generation, last_query, last_ids = self._last
+            # A longer query can only match a subset of a shorter one.
+            if generation == self._generation and query.startswith(last_query):
+                candidates = set(last_ids)
+        for term, exact in terms:
+            if exact and len(term) >= 3:
+                for gram in trigrams(term):
+                    posting = self._postings.get(gram, set())
+                    candidates = (
+                        set(posting) if candidates is None else candidates & posting
+                    )
+        if candidates is None:
+            return list(self._entries)
+        return candidates
+
+
+def _fold(fields: SearchFields) -> SearchFields:
+    return tuple(field.lower() if field else "" for field in fields)  # type: ignore[return-value]
+
+
+def _score_entry(entry: _Entry, terms: List[Tuple[str, bool]]) -> int:
+    total = 0
+    for term, exact in terms:
+        if not exact and not entry.chars.issuperset(term):
+            return 0
+        scorer = exact_score if exact else fuzzy_score
+        best = 0
+        for weight, field in zip(FIELD_WEIGHTS, entry.fields):
+            if field:
+                best = max(best, scorer(term, field) * weight)
+        if not best:
+            return 0
+        total += best
+    return total
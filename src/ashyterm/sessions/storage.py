@@ -1,5 +1,6 @@
 # ashyterm/sessions/storage.py
 
+import hashlib
 import json
 import os
 import threading
@@ -8,6 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from gi.repository import Gio
 
+from ..core.tasks import submit_io
 from ..settings.config import SESSIONS_FILE
 from ..utils.exceptions import (
     StorageCorruptedError,
@@ -31,6 +33,7 @@ from ..utils.security import (
     validate_file_path,
 )
 from ..utils.translation_utils import _
+from .audit import IncrementalSessionAudit
 from .models import SessionFolder, SessionItem
 
 
@@ -46,6 +49,9 @@ class SessionStorageManager:
         self._file_lock = threading.RLock()
         self.sessions_file = Path(SESSIONS_FILE)
         self.security_auditor = None
+        self._session_audit: Optional[IncrementalSessionAudit] = None
+        # (sha256, mtime_ns, size) of the file as last written by us.
+        self._last_written: Optional[Tuple[str, int, int]] = None
         self._initialize_storage()
         self.logger.info("Session storage manager initialized")
 
@@ -58,6 +64,9 @@ class SessionStorageManager:
             ensure_secure_directory_permissions(str(config_dir))
             try:
                 self.security_auditor = create_security_auditor()
+                self._session_audit = IncrementalSessionAudit(
+                    self.security_auditor, submit=submit_io
+                )
             except Exception as e:
                 self.logger.warning(f"Security auditor initialization failed: {e}")
             if self.sessions_file.exists():
@@ -134,16 +143,9 @@ class SessionStorageManager:
     def _schedule_security_audit(
         self, sessions: List[Dict[str, Any]], folders: List[Dict[str, Any]]
     ) -> None:
-        """Defer security audit to run after startup completes."""
-        if self.security_auditor:
-            from gi.repository import GLib
-
-            GLib.timeout_add(
-                500,  # 500ms delay - run after startup
-                self._audit_loaded_data,
-                sessions,
-                folders,
-            )
+        """Audit the loaded sessions on the IO pool once startup completes."""
+        if self._session_audit is not None:
+            self._session_audit.schedule(sessions)
 
     def load_sessions_and_folders_safe(
         self,
@@ -202,12 +204,13 @@ class SessionStorageManager:
                     )
                     continue
                 try:
-                    item = item_class.from_dict(item_data)
-                    if item.validate():
+                    item = item_class.from_record(item_data)
+                    errors = item.get_load_errors()
+                    if not errors:
                         validated_items.append(item.to_dict())
                     else:
                         self.logger.warning(
-                            f"{item_type_name} '{item.name}' validation failed: {item.get_validation_errors()}"
+                            f"{item_type_name} '{item.name}' validation failed: {errors}"
                         )
                 except Exception as e:
                     self.logger.warning(f"{item_type_name} {i} creation failed: {e}")
@@ -229,34 +232,10 @@ class SessionStorageManager:
         """Validate and sanitize folders data."""
         return self._validate_items_data(folders, SessionFolder, "Folder", ["name"])
 
-    def _audit_loaded_data(
-        self, sessions: List[Dict[str, Any]], folders: List[Dict[str, Any]]
-    ) -> bool:
-        """Perform security audit on loaded data. Returns False to not repeat GLib.idle_add."""
-        try:
-            security_issues = 0
-            for session_data in sessions:
-                if session_data.get("session_type") == "ssh":
-                    for finding in self.security_auditor.audit_ssh_session(
-                        session_data
-                    ):
-                        if finding["severity"] in ["high", "critical"]:
-                            security_issues += 1
-                            self.logger.warning(
-                                f"Security issue in session '{session_data.get('name')}': {finding['message']}"
-                            )
-            if security_issues > 0:
-                self.logger.warning(
-                    f"Found {security_issues} security issues in loaded sessions"
-                )
-        except Exception as e:
-            self.logger.error(f"Security audit failed: {e}")
-        return False  # Don't repeat idle callback
-
-    def _write_temp_file(self, temp_file: Path, data_to_save: Dict[str, Any]) -> None:
-        """Write data to temporary file with proper sync."""
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, indent=4, ensure_ascii=False)
+    def _write_temp_file(self, temp_file: Path, payload: bytes) -> None:
+        """Write the serialized data to a temporary file with proper sync."""
+        with open(temp_file, "wb") as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         if not temp_file.exists() or temp_file.stat().st_size == 0:
@@ -289,24 +268,57 @@ class SessionStorageManager:
             f"{sessions_count} sessions, {folders_count} folders",
         )
 
-    def _perform_save_operation(self, data_to_save: Dict[str, Any]) -> None:
-        """Perform the actual save operation with validation."""
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            info = self.sessions_file.stat()
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _perform_save_operation(self, data_to_save: Dict[str, Any]) -> bool:
+        """Perform the actual save operation with validation.
+
+        Returns False when the file already holds exactly this data.
+        """
         if not self._validate_save_data(data_to_save):
             raise StorageWriteError(
                 str(self.sessions_file), _("Data validation failed")
             )
 
+        payload = json.dumps(data_to_save, indent=4, ensure_ascii=False).encode(
+            "utf-8"
+        )
+        digest = hashlib.sha256(payload).hexdigest()
+        if (
+            self._last_written is not None
+            and self._last_written[0] == digest
+            and self._last_written[1:] == self._file_signature()
+        ):
+            return False
+
         self.sessions_file.parent.mkdir(parents=True, exist_ok=True)
         ensure_secure_directory_permissions(str(self.sessions_file.parent))
 
         temp_file = self.sessions_file.with_suffix(".tmp")
-        self._write_temp_file(temp_file, data_to_save)
+        self._write_temp_file(temp_file, payload)
         self._atomic_replace(temp_file)
 
-        if not self._verify_saved_file(data_to_save):
+        if not self._verify_saved_file(digest):
+            self._last_written = None
             raise StorageWriteError(
                 str(self.sessions_file), _("Save verification failed")
             )
+        signature = self._file_signature()
+        self._last_written = (digest, *signature) if signature else None
+        return True
+
+    def snapshot(
+        self,
+        session_store: Optional[Gio.ListStore] = None,
+        folder_store: Optional[Gio.ListStore] = None,
+    ) -> Dict[str, Any]:
+        """Serializable copy of the stores; call on the main thread."""
+        return self._prepare_save_data(session_store, folder_store)
 
     def save_sessions_and_folders_safe(
         self,
@@ -314,11 +326,16 @@ class SessionStorageManager:
         folder_store: Optional[Gio.ListStore] = None,
     ) -> bool:
         """Safely save sessions and folders with backup and validation."""
+        return self.write_snapshot(self.snapshot(session_store, folder_store))
+
+    def write_snapshot(self, data_to_save: Dict[str, Any]) -> bool:
+        """Write data from :meth:`snapshot`; safe to call from a worker thread."""
         with self._file_lock:
             try:
-                data_to_save = self._prepare_save_data(session_store, folder_store)
-                self._perform_save_operation(data_to_save)
-                self._log_save_success(data_to_save)
+                if self._perform_save_operation(data_to_save):
+                    self._log_save_success(data_to_save)
+                else:
+                    self.logger.debug("Sessions file already up to date")
                 return True
             except (StorageWriteError, StorageError):
                 raise
@@ -344,11 +361,12 @@ class SessionStorageManager:
             if not isinstance(item, item_class):
                 continue
             try:
-                if item.validate():
+                errors = item.get_load_errors()
+                if not errors:
                     items_list.append(item.to_dict())
                 else:
                     self.logger.warning(
-                        f"Skipping invalid {item_type_name} '{item.name}': {item.get_validation_errors()}"
+                        f"Skipping invalid {item_type_name} '{item.name}': {errors}"
                     )
             except Exception as e:
                 self.logger.error(
@@ -417,20 +435,16 @@ class SessionStorageManager:
             self.logger.error(f"Save data validation failed: {e}")
             return False
 
-    def _verify_saved_file(self, expected_data: Dict[str, Any]) -> bool:
-        """Verify that the saved file contains the expected data."""
+    def _verify_saved_file(self, expected_digest: str) -> bool:
+        """Verify that the saved file hashes to what was written."""
         try:
             if not self.sessions_file.exists():
                 self.logger.error("Saved file does not exist")
                 return False
-            with open(self.sessions_file, "r", encoding="utf-8") as f:
-                saved_data = json.load(f)
-            if len(expected_data.get("sessions", [])) != len(
-                saved_data.get("sessions", [])
-            ) or len(expected_data.get("folders", [])) != len(
-                saved_data.get("folders", [])
-            ):
-                self.logger.error("Item count mismatch after saving")
+            with open(self.sessions_file, "rb") as f:
+                saved_digest = hashlib.sha256(f.read()).hexdigest()
+            if saved_digest != expected_digest:
+                self.logger.error("Checksum mismatch after saving")
                 return False
             return True
         except Exception as e:
@@ -460,24 +474,30 @@ def load_sessions_and_folders() -> Tuple[List[Dict[str, Any]], List[Dict[str, An
 def load_sessions_to_store(
     session_store: Gio.ListStore, sessions_data: Optional[List[Dict[str, Any]]] = None
 ) -> None:
-    """Load sessions and populate the given store."""
+    """Load sessions and populate the given store.
+
+    Sessions are built with :meth:`SessionItem.from_record`, so the fields
+    only needed to open or edit a session are parsed on first use.
+    """
     logger = get_logger("ashyterm.sessions.storage")
     try:
         if sessions_data is None:
             sessions_data, _ = load_sessions_and_folders()
-        loaded_count = 0
+        loaded = []
         for session_dict in sessions_data:
             try:
-                session_item = SessionItem.from_dict(session_dict)
-                if session_item.validate():
-                    session_store.append(session_item)
-                    loaded_count += 1
+                session_item = SessionItem.from_record(session_dict)
+                errors = session_item.get_load_errors()
+                if not errors:
+                    loaded.append(session_item)
                 else:
                     logger.warning(
-                        f"Skipping invalid session '{session_item.name}': {session_item.get_validation_errors()}"
+                        f"Skipping invalid session '{session_item.name}': {errors}"
                     )
             except Exception as e:
                 logger.error(f"Error loading session: {e}")
+        session_store.splice(session_store.get_n_items(), 0, loaded)
+        loaded_count = len(loaded)
         logger.info(f"Loaded {loaded_count} sessions to store")
     except Exception as e:
         logger.error(f"Failed to load sessions to store: {e}")
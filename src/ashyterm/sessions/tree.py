@@ -56,6 +56,8 @@ from .tree_context_menu import (
     show_popover_context_menu as _show_popover_context_menu_impl,
     show_popover_root_context_menu as _show_popover_root_context_menu_impl,
 )
+from .search_index import SessionSearchIndex
+from .tree_index import IndexChange, SessionTreeIndex
 from .tree_search import SessionTreeSearch
 
 
@@ -143,6 +145,8 @@ class SessionTreeView:
         self._clipboard_is_cut: bool = False
         self._is_restoring_state: bool = False
         self._populated_folders: set[str] = set()
+        self._index = SessionTreeIndex()
+        self.search_index = SessionSearchIndex()
         # Search / expansion state now lives in the SessionTreeSearch
         # collaborator. The _filter_text / _saved_expansion_state
         # attributes below are kept as properties that read through
@@ -354,14 +358,7 @@ class SessionTreeView:
 
     def _folder_has_children(self, item: "SessionFolder") -> bool:
         """Checks if a folder has any children."""
-        if any(s.folder_path == item.path for s in self.session_store):
-            return True
-        if any(f.parent_path == item.path for f in self.folder_store):
-            return True
-        return any(
-            isinstance(layout, LayoutItem) and layout.folder_path == item.path
-            for layout in self.parent_window.layouts
-        )
+        return self._index.has_children(item.path)
 
     def _on_factory_unbind(
         self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
@@ -489,7 +486,7 @@ class SessionTreeView:
                 return  # move_layout handles its own refresh
 
             if result and result.success:
-                self.refresh_tree()
+                self._sync_tree()
             elif result and hasattr(self.parent_window, "_show_error_dialog"):
                 self.parent_window._show_error_dialog(_("Move Error"), result.message)
         except Exception as e:
@@ -497,6 +494,13 @@ class SessionTreeView:
             if hasattr(self.parent_window, "_show_error_dialog"):
                 self.parent_window._show_error_dialog(_("Move Error"), str(e))
 
+    def _all_items(self) -> List[Any]:
+        return (
+            list(self.session_store)
+            + list(self.folder_store)
+            + list(self.parent_window.layouts)
+        )
+
     def refresh_tree(self) -> None:
         """Rebuilds the entire tree view from the session and folder stores."""
         self._is_restoring_state = True
@@ -505,77 +509,91 @@ class SessionTreeView:
         for i in range(self.folder_store.get_n_items()):
             self.folder_store.get_item(i).clear_children()
 
-        root_items = []
-        # Add sessions, folders, and layouts to their parent (or root)
-        all_items = (
-            list(self.session_store)
-            + list(self.folder_store)
-            + self.parent_window.layouts
-        )
+        items = self._all_items()
+        self._index.rebuild(items)
+        self.search_index.rebuild(items)
+        self.root_store.splice(0, 0, self._index.children(""))
+
+        GLib.idle_add(self._apply_expansion_state)
+
+    def _sync_tree(self) -> None:
+        """Applies store changes to the tree as minimal list splices.
+
+        The index reports which items were added, removed, renamed or
+        moved; only the lists showing those items are touched, so
+        expansion, selection and scroll position survive. Renaming or
+        moving a folder whose contents are on screen falls back to a
+        full rebuild, since every row below it changes path.
+        """
+        items = self._all_items()
+        if self.search_index.sync(items) and self._filter_text:
+            self.search.set_filter_text(self._filter_text)
+        changes = self._index.sync(items)
+        if not changes:
+            return
+        if any(self._moves_populated_folder(change) for change in changes):
+            self.refresh_tree()
+            return
+        for change in changes:
+            self._apply_index_change(change)
 
-        for item in all_items:
-            parent_path = getattr(item, "parent_path", None)
-            if parent_path is None:  # SessionItem or LayoutItem
-                parent_path = getattr(item, "folder_path", "")
-
-            if not parent_path:
-                root_items.append(item)
-
-        sorted_root = sorted(
-            root_items,
-            key=lambda item: (
-                isinstance(item, SessionItem),
-                isinstance(item, LayoutItem),
-                item.name,
-            ),
+    def _moves_populated_folder(self, change: IndexChange) -> bool:
+        if change.added or change.path is None:
+            return False
+        if change.path == change.item.path:
+            return False
+        prefix = change.path + "/"
+        return any(
+            path == change.path or path.startswith(prefix)
+            for path in self._populated_folders
         )
-        for item in sorted_root:
-            self.root_store.append(item)
 
-        GLib.idle_add(self._apply_expansion_state)
+    def _apply_index_change(self, change: IndexChange) -> None:
+        if change.parent_path and change.parent_path not in self._populated_folders:
+            # Not expanded yet; the folder reads the index when it is.
+            store = None
+        elif change.parent_path:
+            store = self._populated_folder_store(change.parent_path)
+        else:
+            store = self.root_store
+        if store is not None:
+            if change.added:
+                store.insert(change.position, change.item)
+            elif change.position < store.get_n_items():
+                store.remove(change.position)
+        if not change.added and isinstance(change.item, SessionFolder):
+            if not self._index.contains(change.item):
+                prefix = change.path + "/"
+                self._populated_folders = {
+                    path
+                    for path in self._populated_folders
+                    if path != change.path and not path.startswith(prefix)
+                }
+
+    def _populated_folder_store(self, path: str) -> Optional[Gio.ListStore]:
+        for item in self._index.children(path.rsplit("/", 1)[0]):
+            if isinstance(item, SessionFolder) and item.path == path:
+                return item.children
+        return None
 
     def _on_session_signal(self, signals, data):
         """Handle session-related signals from AppSignals."""
-        self.refresh_tree()
+        self._sync_tree()
 
     def _on_folder_signal(self, signals, data):
         """Handle folder-related signals from AppSignals."""
-        self.refresh_tree()
+        self._sync_tree()
 
     def _on_request_tree_refresh(self, signals):
         """Handle explicit tree refresh request."""
-        self.refresh_tree()
+        self._sync_tree()
 
     def _populate_folder_children(self, folder: SessionFolder):
         """Populates the children of a specific folder on-demand."""
         if folder.path in self._populated_folders:
             return
         folder.clear_children()
-        children = []
-
-        all_items = (
-            list(self.session_store)
-            + list(self.folder_store)
-            + self.parent_window.layouts
-        )
-        for item in all_items:
-            parent_path = getattr(item, "parent_path", None)
-            if parent_path is None:
-                parent_path = getattr(item, "folder_path", "")
-
-            if parent_path == folder.path:
-                children.append(item)
-
-        sorted_children = sorted(
-            children,
-            key=lambda item: (
-                isinstance(item, SessionItem),
-                isinstance(item, LayoutItem),
-                item.name,
-            ),
-        )
-        for child in sorted_children:
-            folder.add_child(child)
+        folder.children.splice(0, 0, self._index.children(folder.path))
         self._populated_folders.add(folder.path)
 
     def _apply_expansion_state(self) -> bool:
@@ -941,7 +959,7 @@ class SessionTreeView:
                 is_cut,  # type: ignore[arg-type]
             )
             if result and result.success:
-                self.refresh_tree()
+                self._sync_tree()
             elif result and hasattr(self.parent_window, "_show_error_dialog"):
                 self.parent_window._show_error_dialog(_("Paste Error"), result.message)
         except Exception as e:
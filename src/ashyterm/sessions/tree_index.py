@@ -0,0 +1,149 @@
+# ashyterm/sessions/tree_index.py
+"""Parent-path index behind the sessions tree view.
+
+Sessions, folders and layouts are filed under the path of the folder
+that contains them ("" for the root), each bucket kept in display order.
+Expanding a folder is then a dictionary lookup instead of a scan of
+every item, and a change to the stores is turned into the handful of
+removals and insertions that bring the affected buckets up to date.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import LayoutItem, SessionFolder, SessionItem
+
+SortKey = Tuple[bool, bool, str]
+
+
+def tree_sort_key(item: Any) -> SortKey:
+    """Folders first, then layouts, then sessions; by name within each."""
+    return (isinstance(item, SessionItem), isinstance(item, LayoutItem), item.name)
+
+
+def tree_parent_path(item: Any) -> str:
+    """Path of the folder ``item`` is shown in; "" for the root."""
+    if isinstance(item, SessionFolder):
+        return item.parent_path or ""
+    return item.folder_path or ""  # SessionItem or LayoutItem
+
+
+def _own_path(item: Any) -> Optional[str]:
+    return item.path if isinstance(item, SessionFolder) else None
+
+
+@dataclass(frozen=True)
+class IndexChange:
+    """One splice: ``item`` left or joined ``parent_path`` at ``position``.
+
+    ``path`` is the folder path ``item`` was filed with (folders only), so
+    a removal reports where a since-renamed folder used to be.
+    """
+
+    parent_path: str
+    position: int
+    item: Any
+    added: bool
+    path: Optional[str] = None
+
+
+@dataclass
+class _Placement:
+    item: Any
+    parent_path: str
+    key: SortKey
+    path: Optional[str]
+
+
+class SessionTreeIndex:
+    """Sorted children per parent path, updated incrementally."""
+
+    def __init__(self) -> None:
+        self._children: Dict[str, List[Any]] = {}
+        self._keys: Dict[str, List[SortKey]] = {}
+        self._placements: Dict[int, _Placement] = {}
+
+    def __len__(self) -> int:
+        return len(self._placements)
+
+    def rebuild(self, items: Iterable[Any]) -> None:
+        self._children.clear()
+        self._keys.clear()
+        self._placements.clear()
+        for item in items:
+            self.insert(item)
+
+    def children(self, parent_path: str) -> List[Any]:
+        """The items shown directly under ``parent_path``, in order."""
+        return list(self._children.get(parent_path, ()))
+
+    def has_children(self, parent_path: str) -> bool:
+        return bool(self._children.get(parent_path))
+
+    def contains(self, item: Any) -> bool:
+        return id(item) in self._placements
+
+    def insert(self, item: Any) -> IndexChange:
+        """File ``item`` under its current parent path."""
+        if id(item) in self._placements:
+            self.remove(item)
+        parent_path = tree_parent_path(item)
+        key = tree_sort_key(item)
+        path = _own_path(item)
+        keys = self._keys.setdefault(parent_path, [])
+        position = bisect_left(keys, key)
+        # Keep insertion order among equal keys.
+        while position < len(keys) and keys[position] == key:
+            position += 1
+        keys.insert(position, key)
+        self._children.setdefault(parent_path, []).insert(position, item)
+        self._placements[id(item)] = _Placement(item, parent_path, key, path)
+        return IndexChange(parent_path, position, item, True, path)
+
+    def remove(self, item: Any) -> Optional[IndexChange]:
+        """Drop ``item`` from wherever it was filed."""
+        placement = self._placements.pop(id(item), None)
+        if placement is None:
+            return None
+        keys = self._keys[placement.parent_path]
+        siblings = self._children[placement.parent_path]
+        position = bisect_left(keys, placement.key)
+        while siblings[position] is not item:
+            position += 1
+        del keys[position]
+        del siblings[position]
+        if not siblings:
+            del self._keys[placement.parent_path]
+            del self._children[placement.parent_path]
+        return IndexChange(
+            placement.parent_path, position, item, False, placement.path
+        )
+
+    def sync(self, items: Iterable[Any]) -> List[IndexChange]:
+        """Bring the index in line with ``items``; return the splices made.
+
+        Items that are new, gone, renamed or moved produce a removal
+        and/or an insertion, in the order they must be applied to views
+        mirroring the buckets. Untouched items cost one lookup each.
+        """
+        current = {id(item): item for item in items}
+        changes: List[IndexChange] = []
+        for item_id in [i for i in self._placements if i not in current]:
+            change = self.remove(self._placements[item_id].item)
+            if change is not None:
+                changes.append(change)
+        for item_id, item in current.items():
+            placement = self._placements.get(item_id)
+            if placement is not None and (
+                placement.parent_path == tree_parent_path(item)
+                and placement.key == tree_sort_key(item)
+                and placement.path == _own_path(item)
+            ):
+                continue
+            if placement is not None:
+                changes.append(self.remove(item))
+            changes.append(self.insert(item))
+        return changes
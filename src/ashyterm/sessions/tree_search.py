@@ -7,20 +7,26 @@ state on clear) is independent of the widget itself — it only needs
 access to the filter model, the tree model, and the populator. Keeping
 it here isolates a normally-flaky UI feature so the matching rules can
 be exercised directly in tests.
+
+When the view has a ``search_index``, each query is answered once by
+the fuzzy index (on the CPU pool for large trees) and the filter reads
+the result; views without one fall back to name substring matching.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional, Set
+from typing import TYPE_CHECKING, Callable, List, Optional, Set
 
 import gi
 from typing import Any
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from ..utils.logger import get_logger
 from .models import SessionFolder
+from .search_index import SYNC_SEARCH_LIMIT, SearchMatch
+from .tree_index import tree_parent_path
 
 if TYPE_CHECKING:
     from .tree import SessionTreeView
@@ -56,6 +62,25 @@ def item_matches_filter(
     return False
 
 
+class SearchResult:
+    """The items matching one query, and the folders leading to them."""
+
+    def __init__(self, matches: List[SearchMatch]) -> None:
+        self.items = [match.item for match in matches]
+        self.item_ids = {id(item) for item in self.items}
+        self.folder_paths: Set[str] = set()
+        for item in self.items:
+            path = tree_parent_path(item)
+            while path and path not in self.folder_paths:
+                self.folder_paths.add(path)
+                path = path.rsplit("/", 1)[0]
+
+    def matches(self, item: Any) -> bool:
+        if id(item) in self.item_ids:
+            return True
+        return isinstance(item, SessionFolder) and item.path in self.folder_paths
+
+
 class SessionTreeSearch:
     """Owns the filter state (text + saved expansion) for a tree view."""
 
@@ -64,6 +89,7 @@ class SessionTreeSearch:
         self.logger = get_logger("ashyterm.sessions.tree_search")
         self._filter_text = ""
         self._saved_expansion_state: Optional[Set[str]] = None
+        self._result: Optional[SearchResult] = None
 
     # ── read-only accessors ──────────────────────────────────
 
@@ -78,6 +104,9 @@ class SessionTreeSearch:
 
     def filter_func(self, item: Any) -> bool:
         """Filter callback compatible with ``Gtk.CustomFilter.new``."""
+        if self._result is not None and self._filter_text:
+            actual = item.get_item() if hasattr(item, "get_item") else item
+            return actual is not None and self._result.matches(actual)
         return item_matches_filter(
             item, self._filter_text, self.folder_contains_matching
         )
@@ -86,6 +115,8 @@ class SessionTreeSearch:
         """Recursively check whether any descendant of ``folder`` matches."""
         if not self._filter_text:
             return False
+        if self._result is not None:
+            return folder.path in self._result.folder_paths
 
         if folder.path not in self.view._populated_folders:
             self.view._populate_folder_children(folder)
@@ -113,15 +144,55 @@ class SessionTreeSearch:
 
         # Either the filter just started or the user kept typing ⇒ expand
         # folders whose descendants match so hits are visible immediately.
-        if text and (not old_filter_text or text.startswith(old_filter_text)):
-            self._expand_folders_with_matches()
+        expand = bool(text) and (
+            not old_filter_text or text.startswith(old_filter_text)
+        )
+        if self._search_index(expand):
+            return  # the result arrives from the CPU pool
+        self._apply_filter(expand)
 
+    def _apply_filter(self, expand: bool) -> None:
+        if expand:
+            self._expand_folders_with_matches()
         self.view.filter.changed(Gtk.FilterChange.DIFFERENT)
 
+    def _search_index(self, expand: bool) -> bool:
+        """Query the view's search index; True if the answer comes later."""
+        index = getattr(self.view, "search_index", None)
+        if index is None or not self._filter_text:
+            self._result = None
+            return False
+        query = self._filter_text
+        if len(index) > SYNC_SEARCH_LIMIT:
+            from ..core.tasks import submit_cpu
+
+            future = submit_cpu(index.search, query)
+            if future is not None:
+                future.add_done_callback(
+                    lambda done: GLib.idle_add(
+                        self._on_search_done, query, done, expand
+                    )
+                )
+                return True
+        self._result = SearchResult(index.search(query))
+        return False
+
+    def _on_search_done(self, query: str, future, expand: bool) -> bool:
+        if query != self._filter_text:
+            return GLib.SOURCE_REMOVE  # a newer query superseded this one
+        try:
+            self._result = SearchResult(future.result())
+        except Exception as e:
+            self.logger.error(f"Session search failed: {e}")
+            self._result = None
+        self._apply_filter(expand)
+        return GLib.SOURCE_REMOVE
+
     def clear(self) -> None:
         """Clear the filter and restore the user's original expansion."""
         if self._filter_text:
             self._filter_text = ""
+            self._result = None
             self.restore_expansion_state()
             self.view.filter.changed(Gtk.FilterChange.DIFFERENT)
 
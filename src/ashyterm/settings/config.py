@@ -242,6 +242,7 @@ class DefaultSettings:
         ],
         "ssh": [
             "ssh_control_persist_duration",
+            "ssh_import_known_hosts",
         ],
         "logging": [
             "log_to_file",
@@ -311,6 +312,8 @@ class DefaultSettings:
             "auto_hide_sidebar": True,
             "sidebar_width": 300,  # Default sidebar width in pixels
             "file_manager_height": 250,  # Default file manager height in pixels
+            # Keep a per-session filename index for repeated recursive searches
+            "file_manager_search_index": False,
             "scroll_on_output": True,  # Enables smart scrolling
             "scroll_on_keystroke": True,
             "scroll_on_insert": True,  # Scroll to bottom on paste
@@ -321,6 +324,8 @@ class DefaultSettings:
             "cursor_blink": 0,
             "new_instance_behavior": "new_tab",
             "use_login_shell": False,
+            "warm_shell_pool_size": 1,  # Shells kept running for new tabs
+            "warm_shell_pool_max_mb": 64,  # Memory cap for the pooled shells
             "close_multiple_tabs_policy": "ask",  # ask, save_and_close, just_close
             # VTE Features
             "terminal_scroll_mode": "automatic",
@@ -340,11 +345,25 @@ class DefaultSettings:
             "cjk_ambiguous_width": 1,
             "word_char_exceptions": "-_.:/~",  # For word selection on double-click
             "ssh_control_persist_duration": 60,  # Duration in seconds for SSH connection multiplexing
+            # Also import hosts from ~/.ssh/known_hosts that ssh_config lacks.
+            "ssh_import_known_hosts": False,
             # Rsync transfer compression: "auto", "always", or "never"
             "file_transfer_rsync_compression": "auto",
             "file_transfer_accelerated_downloads": True,
+            "file_transfer_accelerated_uploads": True,
+            # Learn request concurrency and chunk size per host; the
+            # parallel requests value below is only the starting point.
+            "file_transfer_auto_tune": True,
+            # Edit-on-save uploads only send the blocks that changed.
+            "file_transfer_delta_save_uploads": True,
             "file_transfer_parallel_requests": 6,
             "file_transfer_accelerated_min_size_mb": 64,
+            "file_transfer_accelerated_upload_min_size_mb": 64,
+            # Transfer scheduler: concurrent transfers across all tabs and per
+            # host; bandwidth cap in KiB/s shared by all of them (0 = no cap).
+            "file_transfer_max_active": 4,
+            "file_transfer_max_per_host": 2,
+            "file_transfer_bandwidth_limit_kib": 0,
             # SSH host key verification: "ask" (prompt), "accept-new" (auto-add new hosts),
             # "yes" (reject unknown hosts), "no" (disable — DISCOURAGED).
             "ssh_strict_host_key_checking": "accept-new",
@@ -34,6 +34,11 @@ _BOOLEAN_SETTINGS = (
     "mouse_autohide",
     "bell_sound",
     "file_transfer_accelerated_downloads",
+    "file_transfer_accelerated_uploads",
+    "file_transfer_auto_tune",
+    "file_transfer_delta_save_uploads",
+    "file_manager_search_index",
+    "ssh_import_known_hosts",
     "log_to_file",
     "ai_assistant_enabled",
 )
@@ -422,6 +422,14 @@ class HighlightedTerminalProxy(CatModeHandler, StreamingHandler):
         """Get the unique proxy ID for this instance."""
         return self._proxy_id
 
+    def rebind_proxy_id(self, proxy_id: int) -> None:
+        """Move to a new ID; pre-started shells only learn their terminal ID later."""
+        if proxy_id == self._proxy_id:
+            return
+        self._highlighter.unregister_proxy(self._proxy_id)
+        self._proxy_id = proxy_id
+        self._highlighter.register_proxy(proxy_id)
+
     @property
     def highlighter(self) -> OutputHighlighter:
         """Get the highlighter instance for context management."""
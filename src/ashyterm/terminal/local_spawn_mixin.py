@@ -1,11 +1,8 @@
 # ashyterm/terminal/local_spawn_mixin.py
 
-import fcntl
 import os
 import shutil
-import subprocess
 import tempfile
-import termios
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
@@ -20,6 +17,7 @@ if TYPE_CHECKING:
 
 from ..utils.logger import log_terminal_event
 from ..utils.osc7 import OSC7_HOST_DETECTION_SNIPPET
+from .pty_spawn import spawn_on_pty
 
 
 class LocalSpawnMixin:
@@ -124,23 +122,6 @@ class LocalSpawnMixin:
 
         return cmd, env, temp_dir_path, shell_basename
 
-    def _create_pty_preexec_fn(
-        self, slave_fd: int, master_fd: int
-    ) -> Callable[[], None]:
-        """Create preexec_fn for PTY setup in child process."""
-
-        def preexec_fn() -> None:
-            os.setsid()
-            fcntl.ioctl(slave_fd, termios.TIOCSCTTY, 0)
-            os.dup2(slave_fd, 0)
-            os.dup2(slave_fd, 1)
-            os.dup2(slave_fd, 2)
-            if slave_fd > 2:
-                os.close(slave_fd)
-            os.close(master_fd)
-
-        return preexec_fn
-
     def _cleanup_pty_fds(
         self,
         slave_fd: Optional[int],
@@ -206,16 +187,7 @@ class LocalSpawnMixin:
             rows, cols = self._get_expected_terminal_size(terminal)
             proxy.set_window_size(rows, cols)
 
-            preexec_fn = self._create_pty_preexec_fn(slave_fd, master_fd)
-
-            proc = subprocess.Popen(
-                cmd,
-                cwd=working_dir,
-                env=env,
-                preexec_fn=preexec_fn,
-                close_fds=False,
-            )
-            pid = proc.pid
+            pid = spawn_on_pty(cmd, slave_fd, master_fd, working_dir, env)
 
             os.close(slave_fd)
             slave_fd_closed = True
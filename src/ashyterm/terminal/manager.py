@@ -1,6 +1,9 @@
 # ashyterm/terminal/manager.py
 
+import itertools
 import os
+import shutil
+import signal
 import threading
 from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Union
@@ -22,6 +25,7 @@ from ..utils.security import validate_session_data
 from ..utils.translation_utils import _
 from .clipboard_image import clipboard_has_image, save_clipboard_image_async
 from .paste_confirmation import build_paste_confirmation_dialog
+from .proc_sampler import ProcSampler, SampleTarget
 from .registry import ManualSSHTracker, TerminalLifecycleManager, TerminalRegistry
 from .ssh_lifecycle import SSHLifecycleMixin
 from .terminal_config import (
@@ -45,6 +49,7 @@ from .terminal_title import (
     ssh_title,
 )
 from .url_handler import URLHandlerMixin
+from .warm_pool import WarmShell, WarmShellPool
 
 # Lazy imports for heavy modules - loaded on first use
 
@@ -149,20 +154,25 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
         # Cached hostname for OSC7 URI assembly; os.uname() is a syscall we
         # don't want to do once per tab per tick.
         self._cached_hostname: str = os.uname().nodename
-        # Process check timer — runs every 2 seconds. Low enough that tab
-        # titles feel live, high enough not to waste CPU scanning /proc.
-        self._PERIODIC_INTERVAL_MS = 2000
-        self._process_check_timer_id = GLib.timeout_add(
-            self._PERIODIC_INTERVAL_MS, self._periodic_process_check
+        # One shared /proc pass per tick feeds CWD titles, manual SSH
+        # detection and long-command notifications.
+        self._proc_sampler = ProcSampler(self._proc_sample_targets, self._submit_io)
+        self._proc_sampler.subscribe(self._on_proc_samples)
+        self._proc_sampler.start()
+        # Pooled shells get negative proxy IDs until a tab claims them, so
+        # they never collide with registry terminal IDs.
+        self._warm_proxy_ids = itertools.count(-1, -1)
+        self._warm_pool = WarmShellPool(
+            self._spawn_warm_shell,
+            self._discard_warm_shell,
+            self._warm_shell_signature,
+            settings_manager,
         )
         self.logger.info("Terminal manager initialized")
 
     def _ensure_process_check_timer(self) -> None:
-        """Re-arm the periodic process check timer if it was stopped."""
-        if self._process_check_timer_id is None:
-            self._process_check_timer_id = GLib.timeout_add(
-                self._PERIODIC_INTERVAL_MS, self._periodic_process_check
-            )
+        """Re-arm the /proc sampler if it stopped for lack of terminals."""
+        self._proc_sampler.start()
 
     def prepare_initial_terminal(self) -> None:
         """
@@ -239,6 +249,9 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
                 self.logger.warning(f"Failed to pre-load highlights: {e}")
             finally:
                 self._highlights_ready.set()
+            # The first tab uses the pre-created widget; later tabs come
+            # from the warm pool, filled once startup has settled.
+            self._warm_pool.schedule_refill()
             return GLib.SOURCE_REMOVE
 
         GLib.idle_add(prepare_highlights_on_main_thread)
@@ -307,79 +320,46 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
     def set_terminal_exit_handler(self, handler: Callable) -> None:
         self.terminal_exit_handler = handler
 
-    def _periodic_process_check(self) -> bool:
-        """
-        Periodic check to detect manual SSH sessions and update CWD titles.
-
-        Runs every self._PERIODIC_INTERVAL_MS. Does two things:
-        - Probes the active tab for a manual SSH session.
-        - Kicks off an off-thread /proc/<pid>/cwd snapshot and applies the
-          results back on the main thread.
-        """
-        if not self.registry.get_all_terminal_ids():
-            self._process_check_timer_id = None
-            return False
-
-        try:
-            if self.parent_window and hasattr(self.parent_window, "tab_manager"):
-                active_terminal = self.parent_window.tab_manager.get_selected_terminal()
-
-                if active_terminal:
-                    terminal_id = getattr(active_terminal, "terminal_id", None)
-                    if terminal_id is not None:
-                        self.manual_ssh_tracker.check_process_tree(terminal_id)
-
-            self._poll_terminal_cwd_async()
-        except Exception as e:
-            self.logger.debug(f"Periodic check error: {e}")
-        return True
-
-    def _poll_terminal_cwd_async(self) -> None:
-        """Read /proc/<pid>/cwd off the main thread, apply titles back on it.
-
-        `os.readlink` itself is cheap, but doing N of them per tick in the
-        GTK main thread can still stall the UI when /proc is slow (e.g.
-        under heavy fork load or on containers with cgroup limits).
-        """
-        candidates = self._local_cwd_candidates(self.spawner.process_tracker.snapshot())
-        if not candidates:
-            return
+    def set_window_suspended(self, suspended: bool) -> None:
+        """Stop sampling /proc while the window is hidden or minimised."""
+        self._proc_sampler.set_suspended(suspended)
 
+    @staticmethod
+    def _submit_io(fn, *args):
         from ..core.tasks import AsyncTaskManager
 
-        future = AsyncTaskManager.get().submit_io(self._read_changed_cwds, candidates)
-        if future is None:
-            self._apply_cwd_updates(self._read_changed_cwds(candidates))
-            return
-        future.add_done_callback(self._on_cwd_poll_done)
+        return AsyncTaskManager.get().submit_io(fn, *args)
 
-    @staticmethod
-    def _local_cwd_candidates(
-        processes: dict,
-    ) -> list[tuple[int, Vte.Terminal, str]]:
-        candidates = []
-        for pid, process_info in processes.items():
-            if process_info.get("type") != "local":
+    def _proc_sample_targets(self) -> list[SampleTarget]:
+        targets = []
+        for terminal_id in self.registry.get_all_terminal_ids():
+            info = self.registry.get_terminal_info(terminal_id)
+            if not info or info.get("type") != "local":
                 continue
-            terminal = process_info.get("terminal")
-            if terminal is not None:
-                last_cwd = getattr(terminal, "_last_polled_cwd", "") or ""
-                candidates.append((pid, terminal, last_cwd))
-        return candidates
-
-    @staticmethod
-    def _read_changed_cwds(
-        candidates: list[tuple[int, Vte.Terminal, str]],
-    ) -> list[tuple[Vte.Terminal, str]]:
-        updates = []
-        for pid, terminal, last_cwd in candidates:
-            try:
-                cwd = os.readlink(f"/proc/{pid}/cwd")
-            except OSError:
+            pid = info.get("process_id")
+            terminal = self.registry.get_terminal(terminal_id)
+            if not pid or terminal is None:
                 continue
-            if cwd != last_cwd:
-                updates.append((terminal, cwd))
-        return updates
+            pty = terminal.get_pty()
+            pty_fd = pty.get_fd() if pty is not None else -1
+            targets.append(SampleTarget(terminal_id, pid, pty_fd))
+        return targets
+
+    def _on_proc_samples(self, changes: dict) -> None:
+        cwd_updates = []
+        for terminal_id, (old, new) in changes.items():
+            terminal = self.registry.get_terminal(terminal_id)
+            if terminal is None or not new.alive:
+                continue
+            if new.cwd and (old is None or old.cwd != new.cwd):
+                cwd_updates.append((terminal, new.cwd))
+            if old is not None and old.fg_pgrp != new.fg_pgrp:
+                # Catches jobs that changed without printing anything yet.
+                self.manual_ssh_tracker.check_foreground(terminal_id)
+                if old.running_job and not new.running_job:
+                    self._check_long_command_notification(terminal)
+        if cwd_updates:
+            self._apply_cwd_updates(cwd_updates)
 
     def _apply_cwd_updates(self, updates: list[tuple[Vte.Terminal, str]]) -> bool:
         for terminal, cwd in updates:
@@ -392,15 +372,6 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
                 self._update_title(terminal, osc7_info)
         return False
 
-    def _on_cwd_poll_done(self, future) -> None:
-        try:
-            updates = future.result()
-        except Exception as exc:
-            self.logger.debug(f"CWD poll worker failed: {exc}")
-            return
-        if updates:
-            GLib.idle_add(self._apply_cwd_updates, updates)
-
     def _on_manual_ssh_state_changed(self, terminal: Vte.Terminal):
         _sync_manual_ssh_drop_impl(self, terminal)
         self._update_title(terminal)
@@ -411,6 +382,11 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
     ) -> Optional[str]:
         return _resolve_working_directory_impl(working_directory)
 
+    def _on_terminal_contents_changed(
+        self, _terminal: Vte.Terminal, terminal_id: int
+    ) -> None:
+        self.manual_ssh_tracker.check_foreground(terminal_id)
+
     def _on_directory_uri_changed(self, terminal: Vte.Terminal, _param_spec):
         try:
             uri = terminal.get_current_directory_uri()
@@ -577,7 +553,8 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
         execute_command: Optional[str] = None,
         close_after_execute: bool = False,
     ) -> Any:
-        terminal = self._get_or_create_terminal()
+        warm_shell = self._acquire_warm_shell(session, working_directory)
+        terminal = warm_shell.terminal if warm_shell else self._get_or_create_terminal()
         if not terminal:
             raise TerminalCreationError("base terminal creation failed", "local")
 
@@ -605,7 +582,9 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
                 session, is_local=True
             )
 
-            if should_highlight:
+            if warm_shell:
+                self._attach_warm_shell(warm_shell, terminal_id, user_data_for_spawn)
+            elif should_highlight:
                 self._spawn_highlighted_local(
                     terminal,
                     session,
@@ -642,6 +621,114 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
             terminal = self._create_base_terminal()
         return terminal
 
+    def _warm_shell_signature(
+        self, session: Optional[SessionItem] = None
+    ) -> tuple:
+        """How a plain local shell would be launched for ``session`` now."""
+        should_highlight, _ = self._compute_highlighting_config(
+            session, is_local=True
+        )
+        env = self.environment_manager.get_terminal_environment()
+        return (
+            Vte.get_user_shell(),
+            bool(self.settings_manager.get("use_login_shell", False)),
+            should_highlight,
+            hash(frozenset(env.items())),
+        )
+
+    def _acquire_warm_shell(
+        self, session: Optional[SessionItem], working_directory: Optional[str]
+    ) -> Optional[WarmShell]:
+        """Take a pooled shell if it matches what this tab would launch."""
+        # Pooled shells start in the home directory.
+        if working_directory and self._resolve_working_directory(
+            working_directory
+        ) != str(self.platform_info.home_dir):
+            return None
+        try:
+            signature = self._warm_shell_signature(session)
+        except Exception as e:
+            self.logger.debug(f"Skipping warm shell pool: {e}")
+            return None
+        warm_shell = self._warm_pool.acquire(signature)
+        if not warm_shell:
+            return None
+        if warm_shell.exit_handler_id:
+            warm_shell.terminal.disconnect(warm_shell.exit_handler_id)
+            warm_shell.exit_handler_id = 0
+        self.settings_manager.apply_terminal_settings(
+            warm_shell.terminal, self.parent_window
+        )
+        self.logger.debug(f"Using warm shell PID {warm_shell.pid}")
+        return warm_shell
+
+    def _attach_warm_shell(
+        self, warm_shell: WarmShell, terminal_id: int, user_data_for_spawn
+    ) -> None:
+        if warm_shell.proxy:
+            warm_shell.proxy.rebind_proxy_id(terminal_id)
+            self._highlight_proxies[terminal_id] = warm_shell.proxy
+        final_user_data = {
+            "original_user_data": user_data_for_spawn,
+            "temp_dir_path": warm_shell.temp_dir_path,
+        }
+        self._on_spawn_callback(
+            warm_shell.terminal, warm_shell.pid, None, (final_user_data,)
+        )
+
+    def _spawn_warm_shell(self, signature: tuple) -> Optional[WarmShell]:
+        terminal = self._create_base_terminal(apply_settings=False)
+        if not terminal:
+            return None
+        warm_shell = WarmShell(terminal=terminal, signature=signature)
+
+        def on_spawned(_terminal, pid, error, user_data):
+            if error or pid <= 0:
+                self._warm_pool.entry_exited(warm_shell)
+                return
+            final_user_data = user_data[0] if isinstance(user_data, tuple) else {}
+            warm_shell.temp_dir_path = final_user_data.get("temp_dir_path")
+            warm_shell.pid = pid
+            if warm_shell.discarded:
+                self._discard_warm_shell(warm_shell)
+
+        warm_shell.exit_handler_id = terminal.connect(
+            "child-exited", lambda *_args: self._warm_pool.entry_exited(warm_shell)
+        )
+        should_highlight = signature[2]
+        if should_highlight:
+            warm_shell.proxy = self.spawner.spawn_highlighted_local_terminal(
+                terminal,
+                callback=on_spawned,
+                user_data="Terminal",
+                terminal_id=next(self._warm_proxy_ids),
+            )
+            if not warm_shell.proxy:
+                return None
+        else:
+            self.spawner.spawn_local_terminal(terminal, callback=on_spawned)
+        return warm_shell
+
+    def _discard_warm_shell(self, warm_shell: WarmShell) -> None:
+        if warm_shell.exit_handler_id:
+            warm_shell.terminal.disconnect(warm_shell.exit_handler_id)
+            warm_shell.exit_handler_id = 0
+        if warm_shell.proxy:
+            warm_shell.proxy.stop()
+            warm_shell.proxy = None
+        if warm_shell.pid <= 0:
+            # Still spawning; on_spawned discards it once the PID is known.
+            return
+        try:
+            # The shell leads its own process group.
+            os.killpg(warm_shell.pid, signal.SIGHUP)
+        except OSError:
+            pass
+        if not self.spawner.process_tracker.unregister_process(warm_shell.pid):
+            if warm_shell.temp_dir_path:
+                shutil.rmtree(warm_shell.temp_dir_path, ignore_errors=True)
+        warm_shell.pid = -1
+
     def _get_precreated_env(self, working_directory: Optional[str]):
         """Get pre-prepared environment if no custom working directory."""
         if not working_directory:
@@ -987,6 +1074,12 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
             terminal.ashy_handler_ids.append(handler_id)
 
             self.manual_ssh_tracker.track(terminal_id, terminal)
+            # A new foreground job (such as ``ssh``) shows itself through
+            # output, so that is when the PTY's foreground group is read.
+            handler_id = terminal.connect(
+                "contents-changed", self._on_terminal_contents_changed, terminal_id
+            )
+            terminal.ashy_handler_ids.append(handler_id)
 
             click_controller = Gtk.GestureClick()
             click_controller.set_button(1)
@@ -1057,6 +1150,7 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
     def _on_terminal_focus_in(self, _controller, terminal, terminal_id):
         try:
             self.registry.update_terminal_status(terminal_id, "focused")
+            self._proc_sampler.set_focus(terminal_id)
             if self.on_terminal_focus_changed:
                 self.on_terminal_focus_changed(terminal, False)
         except Exception as e:
@@ -1216,9 +1310,8 @@ class TerminalManager(SSHLifecycleMixin, URLHandlerMixin):
         Force closes all terminals managed by this window instance.
         Corrected to only kill processes owned by this window, avoiding global app shutdown.
         """
-        if self._process_check_timer_id:
-            GLib.source_remove(self._process_check_timer_id)
-            self._process_check_timer_id = None
+        self._proc_sampler.stop()
+        self._warm_pool.close()
 
         # Clean up all highlight proxies
         for terminal_id in self._highlight_proxies.copy():
@@ -0,0 +1,229 @@
+# ashyterm/terminal/proc_sampler.py
+"""Shared /proc sampler for the shells behind a window's terminals.
+
+One timer per window reads, in a single pass on the IO pool, everything
+the terminal code wants to know about each shell: working directory,
+foreground process group, the foreground job's command line and the
+shell's scheduler state. Results are cached and subscribers are told
+only about terminals whose sample changed.
+
+The focused terminal is sampled every tick; the others every
+:data:`BACKGROUND_EVERY` ticks. A suspended (hidden or minimised)
+window does not sample at all.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import gi
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
+
+from ..utils.logger import get_logger
+from .ssh_process_detection import foreground_process_group, read_cmdline
+
+TICK_INTERVAL_MS = 1000
+# Unfocused terminals are sampled once every this many ticks.
+BACKGROUND_EVERY = 5
+
+
+@dataclass(frozen=True)
+class SampleTarget:
+    key: Hashable
+    pid: int
+    pty_fd: int = -1
+
+
+@dataclass(frozen=True)
+class ProcSample:
+    pid: int
+    cwd: Optional[str] = None
+    state: str = ""
+    fg_pgrp: Optional[int] = None
+    fg_cmdline: Tuple[str, ...] = ()
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.state) and self.state != "Z"
+
+    @property
+    def running_job(self) -> bool:
+        """True while a job other than the shell owns the terminal."""
+        return self.fg_pgrp is not None and self.fg_pgrp != self.pid
+
+
+def _read_state(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as stat:
+            raw = stat.read()
+    except OSError:
+        return ""
+    # The command name may contain spaces; the state follows its ")".
+    fields = raw[raw.rfind(b")") + 2 :].split()
+    return fields[0].decode() if fields else ""
+
+
+def sample_process(
+    target: SampleTarget, previous: Optional[ProcSample] = None
+) -> ProcSample:
+    """Read one shell's /proc entries; safe to call from any thread."""
+    state = _read_state(target.pid)
+    if not state:
+        return ProcSample(pid=target.pid)
+    try:
+        cwd: Optional[str] = os.readlink(f"/proc/{target.pid}/cwd")
+    except OSError:
+        cwd = None
+    fg_pgrp = None
+    if target.pty_fd >= 0:
+        fg_pgrp = foreground_process_group(target.pty_fd)
+    if fg_pgrp is None or fg_pgrp == target.pid:
+        fg_cmdline: Tuple[str, ...] = ()
+    elif previous is not None and previous.fg_pgrp == fg_pgrp:
+        # Same job as last time: its argv has not changed.
+        fg_cmdline = previous.fg_cmdline
+    else:
+        fg_cmdline = tuple(read_cmdline(fg_pgrp))
+    return ProcSample(target.pid, cwd, state, fg_pgrp, fg_cmdline)
+
+
+Subscriber = Callable[[Dict[Hashable, Tuple[Optional[ProcSample], ProcSample]]], None]
+
+
+class ProcSampler:
+    """Samples every target returned by ``targets_fn`` on a shared timer.
+
+    ``targets_fn()`` runs on the main loop at each tick. Subscribers get
+    ``{key: (old, new)}`` on the main loop for the samples that changed.
+    """
+
+    def __init__(
+        self,
+        targets_fn: Callable[[], List[SampleTarget]],
+        submit: Optional[Callable] = None,
+        tick_interval_ms: int = TICK_INTERVAL_MS,
+        background_every: int = BACKGROUND_EVERY,
+    ) -> None:
+        self.logger = get_logger("ashyterm.terminal.proc_sampler")
+        self._targets_fn = targets_fn
+        self._submit = submit
+        self._tick_interval_ms = tick_interval_ms
+        self._background_every = max(1, background_every)
+        self._subscribers: List[Subscriber] = []
+        self._cache: Dict[Hashable, ProcSample] = {}
+        self._focused_key: Optional[Hashable] = None
+        self._timer_id: Optional[int] = None
+        self._tick_count = 0
+        self._sampling = False
+        self._suspended = False
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._subscribers.append(callback)
+
+    def latest(self, key: Hashable) -> Optional[ProcSample]:
+        return self._cache.get(key)
+
+    def set_focus(self, key: Optional[Hashable]) -> None:
+        """Sample ``key`` every tick from now on, starting right away."""
+        if key == self._focused_key:
+            return
+        self._focused_key = key
+        if key is not None and self._timer_id is not None and key not in self._cache:
+            self.sample_now()
+
+    def set_suspended(self, suspended: bool) -> None:
+        if suspended == self._suspended:
+            return
+        self._suspended = suspended
+        if suspended:
+            self.stop()
+        else:
+            self.start()
+            self.sample_now()
+
+    def start(self) -> None:
+        if self._timer_id is None and not self._suspended:
+            self._timer_id = GLib.timeout_add(self._tick_interval_ms, self._on_tick)
+
+    def stop(self) -> None:
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+
+    def sample_now(self) -> None:
+        """Sample every target on the next pass instead of waiting."""
+        self._tick_count = 0
+        self._run_pass(full=True)
+
+    def _on_tick(self) -> bool:
+        self._tick_count += 1
+        full = self._tick_count % self._background_every == 0
+        if not self._run_pass(full):
+            self._timer_id = None
+            return GLib.SOURCE_REMOVE
+        return GLib.SOURCE_CONTINUE
+
+    def _run_pass(self, full: bool) -> bool:
+        """Start one sampling pass; False once there is nothing to track."""
+        try:
+            targets = self._targets_fn()
+        except Exception as e:
+            self.logger.debug(f"Cannot collect sampling targets: {e}")
+            return True
+        if not targets:
+            self._cache.clear()
+            return False
+        live_keys = {target.key for target in targets}
+        for key in list(self._cache):
+            if key not in live_keys:
+                del self._cache[key]
+        if not full:
+            targets = [t for t in targets if t.key == self._focused_key]
+        if not targets or self._sampling:
+            return True
+
+        previous = {t.key: self._cache.get(t.key) for t in targets}
+        self._sampling = True
+        if self._submit is None:
+            self._publish(self._sample_all(targets, previous))
+            return True
+        future = self._submit(self._sample_all, targets, previous)
+        if future is None:
+            self._publish(self._sample_all(targets, previous))
+        else:
+            future.add_done_callback(self._on_pass_done)
+        return True
+
+    @staticmethod
+    def _sample_all(
+        targets: List[SampleTarget], previous: Dict[Hashable, Optional[ProcSample]]
+    ) -> Dict[Hashable, ProcSample]:
+        return {t.key: sample_process(t, previous.get(t.key)) for t in targets}
+
+    def _on_pass_done(self, future) -> None:
+        try:
+            samples = future.result()
+        except Exception as e:
+            self.logger.debug(f"/proc sampling pass failed: {e}")
+            samples = {}
+        GLib.idle_add(self._publish, samples)
+
+    def _publish(self, samples: Dict[Hashable, ProcSample]) -> bool:
+        self._sampling = False
+        changes = {}
+        for key, sample in samples.items():
+            old = self._cache.get(key)
+            if old != sample:
+                self._cache[key] = sample
+                changes[key] = (old, sample)
+        if changes:
+            for callback in list(self._subscribers):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    self.logger.error(f"/proc sample subscriber failed: {e}")
+        return GLib.SOURCE_REMOVE
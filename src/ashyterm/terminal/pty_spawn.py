@@ -0,0 +1,106 @@
+# ashyterm/terminal/pty_spawn.py
+"""Start a process as the session leader of a pseudo-terminal.
+
+A ``preexec_fn`` makes ``subprocess`` fall back to a full ``fork()`` of
+the GTK process and run Python in the child, so spawn time grows with
+the application's memory and the child can deadlock on a lock held by
+another thread. Here the child only execs: the PTY slave is mapped to
+stdio by ``subprocess`` itself (which uses ``vfork`` when no Python
+code has to run in the child), and the small ``setsid -c`` helper
+from util-linux or busybox makes it the controlling terminal before
+exec'ing the real command. The helper does not fork, so the returned
+PID is the command's own.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import re
+import shutil
+import subprocess
+import termios
+from typing import Callable, Dict, List, Optional
+
+from ..utils.logger import get_logger
+
+# util-linux prints "-c, --ctty", busybox "-c\tSet controlling tty".
+_CTTY_OPTION = re.compile(r"(^|\s)-c\b", re.MULTILINE)
+_UNRESOLVED = object()
+_ctty_helper = _UNRESOLVED
+
+logger = get_logger("ashyterm.terminal.pty_spawn")
+
+
+def find_ctty_helper() -> Optional[str]:
+    """Path of a ``setsid`` that supports ``-c`` (``--ctty``), or None."""
+    global _ctty_helper
+    if _ctty_helper is _UNRESOLVED:
+        helper = shutil.which("setsid")
+        if helper:
+            try:
+                result = subprocess.run(
+                    [helper, "--help"],
+                    capture_output=True,
+                    text=True,
+                    timeout=2,
+                )
+                if not _CTTY_OPTION.search(result.stdout + result.stderr):
+                    helper = None
+            except (OSError, subprocess.SubprocessError):
+                helper = None
+        if not helper:
+            logger.info("setsid -c not available; spawning with preexec_fn")
+        _ctty_helper = helper
+    return _ctty_helper
+
+
+def _preexec_pty_setup(slave_fd: int, master_fd: int) -> Callable[[], None]:
+    def preexec_fn() -> None:
+        os.setsid()
+        fcntl.ioctl(slave_fd, termios.TIOCSCTTY, 0)
+        os.dup2(slave_fd, 0)
+        os.dup2(slave_fd, 1)
+        os.dup2(slave_fd, 2)
+        if slave_fd > 2:
+            os.close(slave_fd)
+        os.close(master_fd)
+
+    return preexec_fn
+
+
+def spawn_on_pty(
+    cmd: List[str],
+    slave_fd: int,
+    master_fd: int,
+    cwd: str,
+    env: Dict[str, str],
+    use_helper: bool = True,
+) -> int:
+    """Start ``cmd`` with the PTY slave as its stdio and controlling tty.
+
+    Returns the child's PID. The caller still owns both descriptors and
+    closes the slave once the child has started.
+    """
+    helper = find_ctty_helper() if use_helper else None
+    if helper:
+        # close_fds keeps the master and every other app descriptor out
+        # of the shell; stdio already points at the slave.
+        proc = subprocess.Popen(
+            [helper, "-c", *cmd],
+            cwd=cwd,
+            env=env,
+            stdin=slave_fd,
+            stdout=slave_fd,
+            stderr=slave_fd,
+            close_fds=True,
+        )
+    else:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            preexec_fn=_preexec_pty_setup(slave_fd, master_fd),
+            close_fds=False,
+        )
+    return proc.pid
@@ -1,6 +1,7 @@
 # ashyterm/terminal/registry.py
 """Terminal registry, lifecycle management, and SSH process tracking."""
 
+import os
 import threading
 import time
 import weakref
@@ -15,7 +16,11 @@ from gi.repository import GLib, Vte
 
 from ..sessions.models import SessionItem
 from ..utils.logger import get_logger
-from .ssh_process_detection import find_ssh_process
+from .ssh_process_detection import (
+    find_foreground_ssh_target,
+    find_ssh_process,
+    foreground_process_group,
+)
 
 # Lazy import psutil - only when actually needed for process info
 PSUTIL_AVAILABLE: Optional[bool] = None
@@ -89,12 +94,16 @@ class ManualSSHTracker:
                     "terminal_ref": weakref.ref(terminal),
                     "in_ssh": False,
                     "ssh_target": None,
+                    "fg_pgrp": None,
+                    "exit_watch": None,
                 }
 
     def untrack(self, terminal_id: int) -> None:
         with self._lock:
-            self._tracked_terminals.pop(terminal_id, None)
+            state = self._tracked_terminals.pop(terminal_id, None)
             self._last_child_count.pop(terminal_id, None)
+            if state:
+                self._clear_exit_watch(state)
 
     def get_ssh_target(self, terminal_id: int) -> Optional[str]:
         with self._lock:
@@ -103,6 +112,69 @@ class ManualSSHTracker:
                 return state.get("ssh_target")
             return None
 
+    def check_foreground(self, terminal_id: int) -> None:
+        """Re-evaluate manual SSH state if the foreground job changed.
+
+        Called on terminal output. Reading the foreground process group
+        from the PTY master is a single ioctl; the SSH target is only
+        looked up when the group differs from the last one seen.
+        """
+        with self._lock:
+            state = self._tracked_terminals.get(terminal_id)
+            if state is None or not self._get_terminal_pid(terminal_id):
+                return
+            terminal = state["terminal_ref"]()
+            pty = terminal.get_pty() if terminal is not None else None
+            if pty is None:
+                return
+            pgrp = foreground_process_group(pty.get_fd())
+            if pgrp is None or pgrp == state["fg_pgrp"]:
+                return
+            state["fg_pgrp"] = pgrp
+            self._clear_exit_watch(state)
+
+            ssh_target = find_foreground_ssh_target(pgrp)
+            currently_in_ssh = ssh_target is not None
+            if currently_in_ssh:
+                self._watch_exit(terminal_id, state, pgrp)
+            target_changed = currently_in_ssh and ssh_target != state["ssh_target"]
+            if currently_in_ssh != state["in_ssh"] or target_changed:
+                self._update_ssh_state(
+                    terminal_id, state, ssh_target, currently_in_ssh
+                )
+
+    def _watch_exit(self, terminal_id: int, state: dict, pid: int) -> None:
+        """Notice the SSH client exiting even if nothing is printed after it."""
+        if not hasattr(os, "pidfd_open"):
+            return
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            return
+
+        def on_exit(_fd, _condition):
+            with self._lock:
+                if state.get("exit_watch") != (pidfd, source_id):
+                    return GLib.SOURCE_REMOVE
+                state["exit_watch"] = None
+                state["fg_pgrp"] = None
+            os.close(pidfd)
+            self.check_foreground(terminal_id)
+            return GLib.SOURCE_REMOVE
+
+        source_id = GLib.io_add_watch(
+            pidfd, GLib.PRIORITY_DEFAULT, GLib.IOCondition.IN, on_exit
+        )
+        state["exit_watch"] = (pidfd, source_id)
+
+    def _clear_exit_watch(self, state: dict) -> None:
+        watch = state.get("exit_watch")
+        if watch:
+            pidfd, source_id = watch
+            state["exit_watch"] = None
+            GLib.source_remove(source_id)
+            os.close(pidfd)
+
     def check_process_tree(self, terminal_id: int) -> None:
         psutil_mod = _get_psutil()
         if not psutil_mod:
@@ -82,3 +82,47 @@ def find_ssh_process(
         if target:
             return process, target
     return None, None
+
+
+def foreground_process_group(pty_fd: int) -> Optional[int]:
+    """Foreground process group of the terminal behind ``pty_fd``.
+
+    Works on the PTY master, so it costs one ioctl and no /proc walk.
+    """
+    try:
+        pgrp = os.tcgetpgrp(pty_fd)
+    except OSError:
+        return None
+    # 0 means no process has made the PTY its controlling terminal yet.
+    return pgrp if pgrp > 0 else None
+
+
+def read_cmdline(pid: int) -> list[str]:
+    """argv of ``pid``, or an empty list when it is gone or unreadable."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as cmdline:
+            raw = cmdline.read()
+    except OSError:
+        return []
+    return [arg.decode(errors="replace") for arg in raw.split(b"\0") if arg]
+
+
+def _child_pids(pid: int) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", "rb") as children:
+            return [int(child) for child in children.read().split()]
+    except (OSError, ValueError):
+        return []
+
+
+def find_foreground_ssh_target(pgrp: int) -> Optional[str]:
+    """SSH target of a foreground job led by ``pgrp``, if it is one.
+
+    Checks the group leader and its direct children, which covers
+    wrappers such as ``sshpass`` and ``exec ssh`` from the shell.
+    """
+    for pid in [pgrp, *_child_pids(pgrp)]:
+        target = extract_ssh_target(read_cmdline(pid))
+        if target:
+            return target
+    return None
@@ -3,8 +3,18 @@
 import os
 import shlex
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import gi
 
@@ -317,12 +327,7 @@ class SSHSpawnMixin:
                 )
             finally:
                 if pass_file:
-                    try:
-                        Path(pass_file).unlink(missing_ok=True)
-                    except OSError as unlink_exc:
-                        self.logger.debug(
-                            f"Could not remove sshpass temp file {pass_file}: {unlink_exc}"
-                        )
+                    self._unlink_sshpass_file(pass_file)
 
             if proc_result.returncode == 0:
                 return True, proc_result.stdout
@@ -661,10 +666,55 @@ class SSHSpawnMixin:
         if not path:
             return
         self._last_sshpass_file = None
+        self._unlink_sshpass_file(path)
+
+    @contextmanager
+    def stream_remote_command(
+        self, session: "SessionItem", command: List[str], connect_timeout: int = 8
+    ) -> Iterator[subprocess.Popen]:
+        """Run a non-interactive remote command with stdout piped for streaming.
+
+        The caller reads ``proc.stdout`` line by line. Leaving the context
+        terminates the process if it is still running, closing the channel.
+        """
+        if not session.is_ssh():
+            raise SSHConnectionError(session.host, "Not an SSH session")
+        self._validate_ssh_session(session)
+        result = self._build_non_interactive_ssh_command(
+            session, command, connect_timeout=connect_timeout
+        )
+        if not result:
+            raise TerminalCreationError(
+                "Failed to build non-interactive SSH command", "ssh"
+            )
+        full_cmd, sshpass_env = result
+        pass_file = (sshpass_env or {}).get("_ASHYTERM_SSHPASS_FILE")
+        self.logger.debug(f"Streaming remote command: {' '.join(full_cmd)}")
         try:
-            Path(path).unlink(missing_ok=True)
-        except OSError as exc:
-            self.logger.debug(f"Could not remove sshpass temp file {path}: {exc}")
+            with subprocess.Popen(
+                full_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                errors="replace",
+            ) as proc:
+                try:
+                    yield proc
+                finally:
+                    if proc.poll() is None:
+                        proc.terminate()
+        finally:
+            if pass_file:
+                self._unlink_sshpass_file(pass_file)
+
+    def _unlink_sshpass_file(self, pass_file: str) -> None:
+        try:
+            Path(pass_file).unlink(missing_ok=True)
+        except OSError as unlink_exc:
+            self.logger.debug(
+                f"Could not remove sshpass temp file {pass_file}: {unlink_exc}"
+            )
 
     def _build_remote_command_secure(
         self,
@@ -0,0 +1,215 @@
+# ashyterm/terminal/warm_pool.py
+"""Local shells started ahead of time so new tabs attach instantly.
+
+The pool holds terminal widgets whose shell is already running and
+sitting at its prompt. Taking one skips widget construction, PTY setup
+and shell startup (rc files included), which is most of the latency of
+a new tab or split. Shells are started one at a time from the main loop
+after a short delay, so refilling never competes with the tab that was
+just opened.
+
+Every shell is started for a *signature*: the inputs that decide how it
+was launched (shell, login flag, highlighting, environment). A shell is
+only handed out for an identical signature, and the whole pool is
+discarded when the default signature changes.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, List, Optional
+
+import gi
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
+
+from ..utils.logger import get_logger
+
+# Delay before starting the next pooled shell.
+REFILL_DELAY_MS = 1500
+
+# Settings that change how a shell is launched; existing shells are stale.
+_INVALIDATING_SETTINGS = frozenset(
+    {
+        "use_login_shell",
+        "osc52_clipboard_enabled",
+        "cat_colorization_enabled",
+        "shell_input_highlighting_enabled",
+    }
+)
+_SIZE_SETTINGS = frozenset({"warm_shell_pool_size", "warm_shell_pool_max_mb"})
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+@dataclass
+class WarmShell:
+    """A pooled terminal widget and the shell running in it."""
+
+    terminal: Any
+    signature: Hashable
+    pid: int = -1
+    proxy: Any = None
+    temp_dir_path: Optional[str] = None
+    exit_handler_id: int = 0
+    discarded: bool = False
+
+    @property
+    def ready(self) -> bool:
+        return self.pid > 0 and not self.discarded
+
+
+def process_rss_bytes(pid: int) -> int:
+    """Resident memory of ``pid`` in bytes, 0 if unknown."""
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class WarmShellPool:
+    """Keeps up to ``warm_shell_pool_size`` ready shells.
+
+    ``spawn_shell(signature)`` starts a shell and returns its
+    :class:`WarmShell` (its ``pid`` is filled in once the spawn
+    completes); ``discard_shell(entry)`` ends it. ``default_signature()``
+    describes how a plain new tab would be launched right now.
+    """
+
+    def __init__(
+        self,
+        spawn_shell: Callable[[Hashable], Optional[WarmShell]],
+        discard_shell: Callable[[WarmShell], None],
+        default_signature: Callable[[], Hashable],
+        settings_manager: Any,
+        refill_delay_ms: int = REFILL_DELAY_MS,
+    ) -> None:
+        self.logger = get_logger("ashyterm.terminal.warm_pool")
+        self._spawn_shell = spawn_shell
+        self._discard_shell = discard_shell
+        self._default_signature = default_signature
+        self.settings_manager = settings_manager
+        self._refill_delay_ms = refill_delay_ms
+        self._entries: List[WarmShell] = []
+        self._signature: Optional[Hashable] = None
+        self._refill_source_id = 0
+        self._closed = False
+        if hasattr(settings_manager, "add_change_listener"):
+            settings_manager.add_change_listener(self._on_setting_changed)
+
+    @property
+    def size(self) -> int:
+        return max(0, int(self.settings_manager.get("warm_shell_pool_size", 1)))
+
+    @property
+    def max_bytes(self) -> int:
+        max_mb = int(self.settings_manager.get("warm_shell_pool_max_mb", 64))
+        return max(0, max_mb) * 1024 * 1024
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def memory_in_use(self) -> int:
+        return sum(
+            process_rss_bytes(entry.pid) for entry in self._entries if entry.ready
+        )
+
+    def acquire(self, signature: Hashable) -> Optional[WarmShell]:
+        """Take a ready shell started for ``signature``, if there is one."""
+        if self._closed or not self.size:
+            return None
+        self._check_signature()
+        for entry in self._entries:
+            if entry.ready and entry.signature == signature:
+                self._entries.remove(entry)
+                self.schedule_refill()
+                return entry
+        self.schedule_refill()
+        return None
+
+    def entry_exited(self, entry: WarmShell) -> None:
+        """A pooled shell died before anyone took it."""
+        if entry in self._entries:
+            self._entries.remove(entry)
+            self._discard(entry)
+            self.schedule_refill()
+
+    def invalidate(self) -> None:
+        """Discard every pooled shell; the next refill starts fresh ones."""
+        entries, self._entries = self._entries, []
+        for entry in entries:
+            self._discard(entry)
+        self._signature = None
+
+    def schedule_refill(self) -> None:
+        if self._closed or self._refill_source_id:
+            return
+        self._refill_source_id = GLib.timeout_add(
+            self._refill_delay_ms, self._refill
+        )
+
+    def close(self) -> None:
+        self._closed = True
+        if self._refill_source_id:
+            GLib.source_remove(self._refill_source_id)
+            self._refill_source_id = 0
+        self.invalidate()
+
+    def _check_signature(self) -> None:
+        try:
+            signature = self._default_signature()
+        except Exception as e:
+            self.logger.debug(f"Cannot compute warm shell signature: {e}")
+            return
+        if signature != self._signature:
+            if self._entries:
+                self.logger.debug("Launch settings changed; discarding warm shells")
+            self.invalidate()
+            self._signature = signature
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.size:
+            self._discard(self._entries.pop())
+
+    def _refill(self) -> bool:
+        self._refill_source_id = 0
+        if self._closed:
+            return GLib.SOURCE_REMOVE
+        self._check_signature()
+        self._trim()
+        if self._signature is None or len(self._entries) >= self.size:
+            return GLib.SOURCE_REMOVE
+        if self.memory_in_use() >= self.max_bytes:
+            self.logger.debug("Warm shell pool is at its memory cap")
+            return GLib.SOURCE_REMOVE
+
+        try:
+            entry = self._spawn_shell(self._signature)
+        except Exception as e:
+            self.logger.warning(f"Failed to start warm shell: {e}")
+            return GLib.SOURCE_REMOVE
+        if entry is None:
+            return GLib.SOURCE_REMOVE
+        self._entries.append(entry)
+        self.logger.debug(f"Warm shell pool: {len(self._entries)}/{self.size}")
+        if len(self._entries) < self.size:
+            self.schedule_refill()
+        return GLib.SOURCE_REMOVE
+
+    def _discard(self, entry: WarmShell) -> None:
+        entry.discarded = True
+        try:
+            self._discard_shell(entry)
+        except Exception as e:
+            self.logger.debug(f"Failed to discard warm shell: {e}")
+
+    def _on_setting_changed(self, key: str, _old_value: Any, _new_value: Any) -> None:
+        if key in _INVALIDATING_SETTINGS:
+            self.invalidate()
+            self.schedule_refill()
+        elif key in _SIZE_SETTINGS:
+            self._trim()
+            self.schedule_refill()
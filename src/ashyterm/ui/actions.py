@@ -775,21 +775,24 @@ class WindowActions:
     def _execute_deletions(self, items) -> list[tuple[str, Any]]:
         """Execute deletion of items and return snapshots for undo."""
         deleted_snapshots: list[tuple[str, Any]] = []
-        for item_to_delete in items:
-            if isinstance(item_to_delete, SessionFolder):
-                self.window.session_operations.remove_folder(item_to_delete, force=True)
-                deleted_snapshots.append(("folder", item_to_delete.to_dict()))
-            elif isinstance(item_to_delete, SessionItem):
-                self.window.session_operations.remove_session(item_to_delete)
-                deleted_snapshots.append(("session", item_to_delete.to_dict()))
-            elif isinstance(item_to_delete, LayoutItem):
-                self.window.state_manager.delete_saved_layout(
-                    item_to_delete.name, confirm=False
-                )
-                deleted_snapshots.append(("layout", {"name": item_to_delete.name}))
-                from ..core.signals import AppSignals
+        with self.window.session_operations.batch():
+            for item_to_delete in items:
+                if isinstance(item_to_delete, SessionFolder):
+                    self.window.session_operations.remove_folder(
+                        item_to_delete, force=True
+                    )
+                    deleted_snapshots.append(("folder", item_to_delete.to_dict()))
+                elif isinstance(item_to_delete, SessionItem):
+                    self.window.session_operations.remove_session(item_to_delete)
+                    deleted_snapshots.append(("session", item_to_delete.to_dict()))
+                elif isinstance(item_to_delete, LayoutItem):
+                    self.window.state_manager.delete_saved_layout(
+                        item_to_delete.name, confirm=False
+                    )
+                    deleted_snapshots.append(("layout", {"name": item_to_delete.name}))
+                    from ..core.signals import AppSignals
 
-                AppSignals.get().emit("request-tree-refresh")
+                    AppSignals.get().emit("request-tree-refresh")
         return deleted_snapshots
 
     def _show_undo_toast(self, label: str, snapshots: list[tuple[str, Any]]) -> None:
@@ -801,13 +804,14 @@ class WindowActions:
         toast = Adw.Toast(title=label, timeout=5, button_label=_("Undo"))
 
         def _on_undo(_toast: Adw.Toast) -> None:
-            for kind, data in snapshots:
-                if kind == "session":
-                    restored = SessionItem.from_dict(data)
-                    self.window.session_operations.add_session(restored)
-                elif kind == "folder":
-                    restored_folder = SessionFolder.from_dict(data)
-                    self.window.session_operations.add_folder(restored_folder)
+            with self.window.session_operations.batch():
+                for kind, data in snapshots:
+                    if kind == "session":
+                        restored = SessionItem.from_dict(data)
+                        self.window.session_operations.add_session(restored)
+                    elif kind == "folder":
+                        restored_folder = SessionFolder.from_dict(data)
+                        self.window.session_operations.add_folder(restored_folder)
 
         toast.connect("button-clicked", _on_undo)
         toast_overlay.add_toast(toast)
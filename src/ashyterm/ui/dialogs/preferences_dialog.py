@@ -529,6 +529,20 @@ class PreferencesDialog(Adw.PreferencesWindow):
         )
         shell_group.add(login_shell_row)
 
+        warm_pool_spin = Adw.SpinRow.new_with_range(0, 4, 1)
+        warm_pool_spin.set_title(_("Ready Shells"))
+        warm_pool_spin.set_subtitle(
+            _("Shells started in advance so new tabs open instantly (0 to disable)")
+        )
+        warm_pool_spin.set_value(self.settings_manager.get("warm_shell_pool_size", 1))
+        warm_pool_spin.connect(
+            "notify::value",
+            lambda row, _pspec: self._on_setting_changed(
+                "warm_shell_pool_size", int(row.get_value())
+            ),
+        )
+        shell_group.add(warm_pool_spin)
+
         bell_row = self._create_switch_row(
             _("Audible Bell"),
             "",
@@ -608,6 +622,14 @@ class PreferencesDialog(Adw.PreferencesWindow):
         )
         remote_edit_group.add(clear_on_exit_row)
 
+        search_index_row = self._create_switch_row(
+            _("Index Files for Recursive Search"),
+            _("Answer repeated searches from an index refreshed in the background"),
+            "file_manager_search_index",
+            default_value=False,
+        )
+        remote_edit_group.add(search_index_row)
+
         ssh_group = Adw.PreferencesGroup()
         page.add(ssh_group)
 
@@ -620,6 +642,14 @@ class PreferencesDialog(Adw.PreferencesWindow):
         persist_spin.connect("notify::value", self._on_ssh_persist_changed)
         ssh_group.add(persist_spin)
 
+        known_hosts_row = self._create_switch_row(
+            _("Import Known Hosts"),
+            _("Add hosts from ~/.ssh/known_hosts that are not in the SSH config"),
+            "ssh_import_known_hosts",
+            default_value=False,
+        )
+        ssh_group.add(known_hosts_row)
+
         rsync_compression_row = create_mapped_combo_row(
             title=_("Rsync Compression"),
             value_map=["auto", "always", "never"],
@@ -646,6 +676,30 @@ class PreferencesDialog(Adw.PreferencesWindow):
         )
         ssh_group.add(accelerated_downloads_row)
 
+        accelerated_uploads_row = self._create_switch_row(
+            _("Accelerated SFTP Uploads"),
+            _("Use parallel AsyncSSH writes for large uploads"),
+            "file_transfer_accelerated_uploads",
+            default_value=True,
+        )
+        ssh_group.add(accelerated_uploads_row)
+
+        auto_tune_row = self._create_switch_row(
+            _("Adaptive Transfer Tuning"),
+            _("Learn request concurrency and chunk size for each host"),
+            "file_transfer_auto_tune",
+            default_value=True,
+        )
+        ssh_group.add(auto_tune_row)
+
+        delta_uploads_row = self._create_switch_row(
+            _("Delta Uploads on Save"),
+            _("Send only the changed parts of files edited from the server"),
+            "file_transfer_delta_save_uploads",
+            default_value=True,
+        )
+        ssh_group.add(delta_uploads_row)
+
         parallel_requests_spin = Adw.SpinRow.new_with_range(2, 10, 1)
         parallel_requests_spin.set_title(_("Parallel Download Requests"))
         parallel_requests_spin.set_subtitle(_("Concurrent range reads per file"))
@@ -661,7 +715,7 @@ class PreferencesDialog(Adw.PreferencesWindow):
         ssh_group.add(parallel_requests_spin)
 
         acceleration_threshold_spin = Adw.SpinRow.new_with_range(0, 4096, 16)
-        acceleration_threshold_spin.set_title(_("Acceleration Threshold"))
+        acceleration_threshold_spin.set_title(_("Download Acceleration Threshold"))
         acceleration_threshold_spin.set_subtitle(_("Minimum file size in MB"))
         acceleration_threshold_spin.set_value(
             self.settings_manager.get("file_transfer_accelerated_min_size_mb", 64)
@@ -674,6 +728,64 @@ class PreferencesDialog(Adw.PreferencesWindow):
         )
         ssh_group.add(acceleration_threshold_spin)
 
+        upload_threshold_spin = Adw.SpinRow.new_with_range(0, 4096, 16)
+        upload_threshold_spin.set_title(_("Upload Acceleration Threshold"))
+        upload_threshold_spin.set_subtitle(_("Minimum file size in MB"))
+        upload_threshold_spin.set_value(
+            self.settings_manager.get(
+                "file_transfer_accelerated_upload_min_size_mb", 64
+            )
+        )
+        upload_threshold_spin.connect(
+            "notify::value",
+            lambda row, _pspec: self._on_setting_changed(
+                "file_transfer_accelerated_upload_min_size_mb", int(row.get_value())
+            ),
+        )
+        ssh_group.add(upload_threshold_spin)
+
+        max_active_spin = Adw.SpinRow.new_with_range(1, 16, 1)
+        max_active_spin.set_title(_("Simultaneous Transfers"))
+        max_active_spin.set_subtitle(_("Further transfers wait in a queue"))
+        max_active_spin.set_value(
+            self.settings_manager.get("file_transfer_max_active", 4)
+        )
+        max_active_spin.connect(
+            "notify::value",
+            lambda row, _pspec: self._on_setting_changed(
+                "file_transfer_max_active", int(row.get_value())
+            ),
+        )
+        ssh_group.add(max_active_spin)
+
+        max_per_host_spin = Adw.SpinRow.new_with_range(1, 16, 1)
+        max_per_host_spin.set_title(_("Simultaneous Transfers per Host"))
+        max_per_host_spin.set_subtitle(_("Opening files for editing may use one more"))
+        max_per_host_spin.set_value(
+            self.settings_manager.get("file_transfer_max_per_host", 2)
+        )
+        max_per_host_spin.connect(
+            "notify::value",
+            lambda row, _pspec: self._on_setting_changed(
+                "file_transfer_max_per_host", int(row.get_value())
+            ),
+        )
+        ssh_group.add(max_per_host_spin)
+
+        bandwidth_spin = Adw.SpinRow.new_with_range(0, 1048576, 256)
+        bandwidth_spin.set_title(_("Bandwidth Limit"))
+        bandwidth_spin.set_subtitle(_("KiB/s shared by all transfers (0 for no limit)"))
+        bandwidth_spin.set_value(
+            self.settings_manager.get("file_transfer_bandwidth_limit_kib", 0)
+        )
+        bandwidth_spin.connect(
+            "notify::value",
+            lambda row, _pspec: self._on_setting_changed(
+                "file_transfer_bandwidth_limit_kib", int(row.get_value())
+            ),
+        )
+        ssh_group.add(bandwidth_spin)
+
     def _setup_advanced_page(self) -> None:
         advanced_page = Adw.PreferencesPage(
             title=_("Advanced"), icon_name="preferences-other-symbolic"
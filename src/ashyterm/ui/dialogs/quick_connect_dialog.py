@@ -11,6 +11,7 @@ from gi.repository import Adw, GLib, Gtk
 
 from ...helpers import clear_children
 from ...sessions.models import SessionItem
+from ...sessions.search_index import SessionSearchIndex
 from ...utils.ssh_config_parser import SSHConfigParser, SSHConfigHost
 from ...utils.translation_utils import _
 
@@ -22,6 +23,9 @@ class QuickConnectDialog(Adw.Dialog):
         super().__init__()
         self.window = window
         self._hosts: list[SSHConfigHost] = []
+        self._search_index = SessionSearchIndex(
+            lambda host: (host.alias, host.hostname or "", host.user or "", "")
+        )
         self._selected_host: SSHConfigHost | None = None
 
         self.set_title(_("Quick Connect"))
@@ -80,6 +84,7 @@ class QuickConnectDialog(Adw.Dialog):
         parser = SSHConfigParser()
         config_path = Path("~/.ssh/config")
         self._hosts = parser.parse(config_path)
+        self._search_index.rebuild(self._hosts)
         self._populate_list(self._hosts)
 
     def _populate_list(self, hosts: list[SSHConfigHost]) -> None:
@@ -116,18 +121,12 @@ class QuickConnectDialog(Adw.Dialog):
             self._list_box.append(row)
 
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
-        query = entry.get_text().strip().lower()
+        query = entry.get_text().strip()
         if not query:
             self._populate_list(self._hosts)
             return
-        filtered = [
-            h
-            for h in self._hosts
-            if query in h.alias.lower()
-            or (h.hostname and query in h.hostname.lower())
-            or (h.user and query in h.user.lower())
-        ]
-        self._populate_list(filtered)
+        matches = self._search_index.search(query)
+        self._populate_list([match.item for match in matches])
 
     def _on_host_activated(self, _row, host: SSHConfigHost) -> None:
         self.close()
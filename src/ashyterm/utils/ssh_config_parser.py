@@ -5,7 +5,7 @@ import os
 import shlex
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .logger import get_logger
 
@@ -33,12 +33,14 @@ class SSHConfigParser:
     def parse(self, config_path: Path) -> List[SSHConfigHost]:
         """Parses the provided ssh_config file and returns host entries."""
         self._entries.clear()
-        self._visited.clear()
-
-        expanded_path = config_path.expanduser()
-        self._parse_file(expanded_path)
+        self._entries.extend(self.iter_hosts(config_path))
         return self._entries
 
+    def iter_hosts(self, config_path: Path) -> Iterator[SSHConfigHost]:
+        """Yields host entries as they are read, following ``Include``s."""
+        self._visited.clear()
+        yield from self._parse_file(config_path.expanduser())
+
     # --- Internal helpers -------------------------------------------------
 
     def _resolve_config_path(self, path: Path) -> Optional[Path]:
@@ -63,24 +65,30 @@ class SSHConfigParser:
         current_patterns: List[str],
         current_options: Dict[str, str],
         directory: Path,
+        found: Optional[List[SSHConfigHost]] = None,
     ) -> tuple[List[str], Dict[str, str], bool]:
-        """Process a single config line and return updated state."""
+        """Process a single config line and return updated state.
+
+        Completed host entries are appended to ``found``.
+        """
+        if found is None:
+            found = []
         if keyword == "match":
-            self._flush_hosts(current_patterns, current_options)
+            found.extend(self._flush_hosts(current_patterns, current_options))
             return [], {}, True  # stop_processing = True
         elif keyword == "host":
-            self._flush_hosts(current_patterns, current_options)
+            found.extend(self._flush_hosts(current_patterns, current_options))
             return values, {}, False
         elif keyword == "include":
-            self._flush_hosts(current_patterns, current_options)
-            self._handle_include(values, directory)
+            found.extend(self._flush_hosts(current_patterns, current_options))
+            found.extend(self._handle_include(values, directory))
             return [], {}, False
         else:
             if current_patterns and values:
                 current_options[keyword] = " ".join(values)
             return current_patterns, current_options, False
 
-    def _parse_file(self, path: Path) -> None:
+    def _parse_file(self, path: Path) -> Iterator[SSHConfigHost]:
         resolved = self._resolve_config_path(path)
         if resolved is None:
             return
@@ -90,6 +98,7 @@ class SSHConfigParser:
 
         current_patterns: List[str] = []
         current_options: Dict[str, str] = {}
+        found: List[SSHConfigHost] = []
 
         with resolved.open("r", encoding="utf-8", errors="ignore") as handle:
             for raw_line in handle:
@@ -105,20 +114,31 @@ class SSHConfigParser:
                 values = tokens[1:]
 
                 current_patterns, current_options, stop = self._process_config_line(
-                    keyword, values, current_patterns, current_options, directory
+                    keyword,
+                    values,
+                    current_patterns,
+                    current_options,
+                    directory,
+                    found,
                 )
+                yield from found
+                found.clear()
                 if stop:
                     break
 
-        self._flush_hosts(current_patterns, current_options)
+        yield from self._flush_hosts(current_patterns, current_options)
 
-    def _handle_include(self, patterns: Iterable[str], base_dir: Path) -> None:
+    def _handle_include(
+        self, patterns: Iterable[str], base_dir: Path
+    ) -> Iterator[SSHConfigHost]:
         for pattern in patterns:
             expanded = self._expand_path(pattern, base_dir)
             for match in glob.glob(str(expanded), recursive=True):
-                self._parse_file(Path(match))
+                yield from self._parse_file(Path(match))
 
-    def _flush_hosts(self, patterns: List[str], options: Dict[str, str]) -> None:
+    def _flush_hosts(
+        self, patterns: List[str], options: Dict[str, str]
+    ) -> Iterator[SSHConfigHost]:
         if not patterns:
             return
 
@@ -144,7 +164,7 @@ class SSHConfigParser:
             if forward := options.get("forwardx11"):
                 entry.forward_x11 = forward.lower() in {"yes", "true", "on"}
 
-            self._entries.append(entry)
+            yield entry
 
     @staticmethod
     def _expand_path(path_str: str, base_dir: Path) -> Path:
@@ -159,3 +179,43 @@ class SSHConfigParser:
         lexer.commenters = "#"
         lexer.whitespace_split = True
         return list(lexer)
+
+
+def _split_known_host(pattern: str) -> Optional[Tuple[str, Optional[int]]]:
+    """``host`` or ``[host]:port`` from a known_hosts host pattern."""
+    if pattern.startswith("["):
+        host, sep, port = pattern[1:].partition("]:")
+        if not sep:
+            return None
+        try:
+            return host, int(port)
+        except ValueError:
+            return None
+    return pattern, None
+
+
+def parse_known_hosts(path: Path) -> Iterator[SSHConfigHost]:
+    """Yields one entry per distinct host named in a known_hosts file.
+
+    Hashed hosts, wildcard patterns and ``@cert-authority``/``@revoked``
+    lines name no connectable host and are skipped.
+    """
+    seen: Set[Tuple[str, Optional[int]]] = set()
+    try:
+        handle = path.expanduser().open("r", encoding="utf-8", errors="ignore")
+    except OSError:
+        return
+    with handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line or line.startswith(("#", "@", "|")):
+                continue
+            for pattern in line.split(None, 1)[0].split(","):
+                if not pattern or any(ch in pattern for ch in "*?!|"):
+                    continue
+                parsed = _split_known_host(pattern)
+                if parsed is None or parsed in seen:
+                    continue
+                seen.add(parsed)
+                host, port = parsed
+                yield SSHConfigHost(alias=host, hostname=host, port=port)
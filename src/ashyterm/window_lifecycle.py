@@ -75,7 +75,10 @@ class WindowLifecycleMixin:
         self.folder_store = Gio.ListStore.new(SessionFolder)
 
         self.session_operations = SessionOperations(
-            self.session_store, self.folder_store, self.settings_manager
+            self.session_store,
+            self.folder_store,
+            self.settings_manager,
+            on_save_failed=self._on_session_save_failed,
         )
 
         self.terminal_manager = TerminalManager(self, self.settings_manager)
@@ -173,6 +176,9 @@ class WindowLifecycleMixin:
         self.connect("notify::default-width", self._on_window_size_changed)
         self.connect("notify::default-height", self._on_window_size_changed)
         self.connect("notify::maximized", self._on_window_maximized_changed)
+        # GTK >= 4.12 reports when the window is hidden or minimised.
+        if self.find_property("suspended") is not None:
+            self.connect("notify::suspended", self._on_window_suspended_changed)
 
         if not self._is_for_detached_tab:
             self._initial_tab_created = False
@@ -248,6 +254,10 @@ class WindowLifecycleMixin:
         maximized = self.is_maximized()
         self.settings_manager.set("window_maximized", maximized)
 
+    def _on_window_suspended_changed(self, window, _param_spec) -> None:
+        """Pause background /proc sampling while nothing is visible."""
+        self.terminal_manager.set_window_suspended(self.is_suspended())
+
     # ─── Window Map / Deferred Init ────────────────────────────────────
 
     def _on_window_mapped(self, window) -> None:
@@ -340,7 +350,6 @@ class WindowLifecycleMixin:
             import_result = self.session_operations.import_sessions_from_ssh_config()
             if import_result.success:
                 self.logger.info(import_result.message)
-                self.refresh_tree()
                 if import_result.warnings:
                     skipped = len(import_result.warnings)
                     self.toast_overlay.add_toast(
@@ -669,12 +678,22 @@ class WindowLifecycleMixin:
         if hasattr(self, "session_tree") and self.session_tree:
             self.session_tree.disconnect_signals()
 
+        if hasattr(self, "session_operations") and self.session_operations:
+            self.session_operations.flush_pending_saves()
+
     def destroy(self) -> None:
         self._perform_cleanup()
         super().destroy()
 
     # ─── Helpers ───────────────────────────────────────────────────────
 
+    def _on_session_save_failed(self) -> None:
+        self.toast_overlay.add_toast(
+            Adw.Toast(
+                title=_("Could not save sessions. Retrying in the background.")
+            )
+        )
+
     def refresh_tree(self) -> None:
         self.session_tree.refresh_tree()
         self.sidebar_manager.update_sidebar_sizes()
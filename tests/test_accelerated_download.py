@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import threading
 from pathlib import Path
 from types import SimpleNamespace
@@ -16,6 +18,7 @@ from ashyterm.filemanager.accelerated_download import (
     AsyncSSHSegmentedDownloader,
     build_download_chunks,
 )
+from ashyterm.filemanager.transfer_tuning import MIN_CHUNK_SIZE_BYTES
 from ashyterm.sessions.models import SessionItem
 
 
@@ -234,7 +237,8 @@ def test_segmented_download_writes_all_ranges_and_reports_progress(tmp_path):
         (20, 5),
         (25, 1),
     ]
-    assert len(factory.sftp.opened_files) == 3
+    assert 1 <= len(factory.sftp.opened_files) <= 3
+    assert all(remote_file.closed for remote_file in factory.sftp.opened_files)
     assert progress[-1] == 100.0
     assert factory.connection_context.exited is True
     assert factory.sftp_context.exited is True
@@ -371,3 +375,222 @@ def test_short_local_write_removes_partial_file_and_raises(monkeypatch, tmp_path
 
     assert not local_path.exists()
     assert not (tmp_path / "download.bin.part").exists()
+
+
+def _plain_session():
+    return SimpleNamespace(
+        host="example.com",
+        user="alice",
+        port=2222,
+        auth_value="/home/alice/.ssh/id_ed25519",
+        proxy_jump="",
+        is_ssh=lambda: True,
+        uses_key_auth=lambda: True,
+        uses_password_auth=lambda: False,
+    )
+
+
+class FakeSlowTreeRemoteFile(FakeTreeRemoteFile):
+    async def read(self, size, offset=None):
+        self._sftp.open_handles += 1
+        self._sftp.max_open_handles = max(
+            self._sftp.max_open_handles, self._sftp.open_handles
+        )
+        await asyncio.sleep(0)
+        self._sftp.open_handles -= 1
+        return await super().read(size, offset)
+
+
+class FakeManySmallFilesSFTP(FakeTreeSFTP):
+    def __init__(self, file_count):
+        super().__init__()
+        names = [f"f{index:03d}.txt" for index in range(file_count)]
+        self.files = {f"/srv/many/{name}": name.encode() for name in names}
+        self.dirs = {"/srv/many": names}
+        self.open_handles = 0
+        self.max_open_handles = 0
+
+    async def open(self, path, _mode):
+        remote_file = FakeSlowTreeRemoteFile(self, path)
+        self.opened_files.append(remote_file)
+        return remote_file
+
+
+def test_directory_download_runs_small_files_concurrently_within_handle_cap(tmp_path):
+    factory = FakeTreeConnectFactory()
+    factory.sftp = FakeManySmallFilesSFTP(20)
+    factory.sftp_context.sftp = factory.sftp
+    progress = []
+    downloader = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(parallel_requests=2, parallel_files=4),
+        progress_callback=progress.append,
+        connect_factory=factory,
+    )
+
+    downloader.download_directory(
+        "/srv/many", tmp_path / "many", min_segment_size=1024
+    )
+
+    for name in factory.sftp.dirs["/srv/many"]:
+        assert (tmp_path / "many" / name).read_bytes() == name.encode()
+    assert factory.sftp.max_open_handles == 4
+    assert all(remote_file.closed for remote_file in factory.sftp.opened_files)
+    assert progress == sorted(progress)
+    assert progress[-1] == 100.0
+
+
+def test_directory_download_cancellation_stops_small_file_workers(tmp_path):
+    factory = FakeTreeConnectFactory()
+    factory.sftp = FakeManySmallFilesSFTP(20)
+    factory.sftp_context.sftp = factory.sftp
+    cancellation_event = threading.Event()
+    downloader = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(parallel_requests=2, parallel_files=4),
+        progress_callback=lambda _progress: cancellation_event.set(),
+        cancellation_event=cancellation_event,
+        connect_factory=factory,
+    )
+
+    with pytest.raises(AcceleratedDownloadCancelled):
+        downloader.download_directory(
+            "/srv/many", tmp_path / "many", min_segment_size=1024
+        )
+
+    assert len(factory.sftp.opened_files) < 20
+    assert all(remote_file.closed for remote_file in factory.sftp.opened_files)
+    assert not list((tmp_path / "many").glob("*.part"))
+
+
+def test_resumable_download_keeps_partial_and_fetches_only_missing_chunks(tmp_path):
+    payload = b"0123456789"
+    local_path = tmp_path / "download.bin"
+    config = AcceleratedDownloadConfig(
+        parallel_requests=1, chunk_size_bytes=4, resumable=True
+    )
+    failing = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        config,
+        connect_factory=FakeConnectFactory(payload, short_read_offset=4),
+    )
+
+    with pytest.raises(AcceleratedDownloadError, match="Short read"):
+        failing.download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    assert failing.resumable_bytes == 4
+    assert (tmp_path / "download.bin.part").exists()
+    assert (tmp_path / "download.bin.part.journal").exists()
+
+    factory = FakeConnectFactory(payload)
+    AsyncSSHSegmentedDownloader(
+        _plain_session(), config, connect_factory=factory
+    ).download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    assert local_path.read_bytes() == payload
+    assert sorted(factory.sftp.reads) == [(4, 4), (8, 2)]
+    assert not (tmp_path / "download.bin.part.journal").exists()
+
+
+def test_download_preallocates_and_writes_sftp_buffers_without_copies(
+    monkeypatch, tmp_path
+):
+    payload = b"abcdefghijklmnopqrstuvwxyz"
+    fallocate_calls = []
+    monkeypatch.setattr(
+        accelerated_download_module.os,
+        "posix_fallocate",
+        lambda fd, offset, size: fallocate_calls.append((offset, size)),
+        raising=False,
+    )
+    factory = FakeConnectFactory(payload)
+    original_read = FakeRemoteFile.read
+
+    async def read_as_bytearray(self, size, offset=None):
+        return bytearray(await original_read(self, size, offset))
+
+    monkeypatch.setattr(FakeRemoteFile, "read", read_as_bytearray)
+    downloader = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(parallel_requests=3, chunk_size_bytes=5),
+        connect_factory=factory,
+    )
+    local_path = tmp_path / "download.bin"
+
+    downloader.download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    assert local_path.read_bytes() == payload
+    assert fallocate_calls == [(0, len(payload))]
+    assert downloader.bytes_written == len(payload)
+    assert downloader.copied_bytes_per_mb() == 0.0
+
+
+def test_auto_tuned_resume_keeps_the_journal_chunk_layout(tmp_path):
+    payload = b"0123456789"
+    local_path = tmp_path / "download.bin"
+    failing = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(
+            parallel_requests=1, chunk_size_bytes=4, resumable=True
+        ),
+        connect_factory=FakeConnectFactory(payload, short_read_offset=4),
+    )
+    with pytest.raises(AcceleratedDownloadError):
+        failing.download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    factory = FakeConnectFactory(payload)
+    tuned = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(resumable=True, auto_tune=True),
+        connect_factory=factory,
+    )
+    tuned.download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    assert local_path.read_bytes() == payload
+    assert sorted(factory.sftp.reads) == [(4, 4), (8, 2)]
+
+
+def test_auto_tuned_download_keeps_open_handles_within_the_tuned_limit(tmp_path):
+    class SuspendingRemoteFile(FakeRemoteFile):
+        async def read(self, size, offset=None):
+            await asyncio.sleep(0)
+            return await super().read(size, offset)
+
+        async def close(self):
+            self._sftp.open_handles -= 1
+            await super().close()
+
+    class CountingSFTP(FakeSFTP):
+        open_handles = 0
+        max_open_handles = 0
+
+        async def open(self, _path, _mode):
+            self.open_handles += 1
+            self.max_open_handles = max(self.max_open_handles, self.open_handles)
+            remote_file = SuspendingRemoteFile(self)
+            self.opened_files.append(remote_file)
+            return remote_file
+
+    # Eight chunks at the tuner's smallest chunk size.
+    payload = os.urandom(8 * MIN_CHUNK_SIZE_BYTES)
+    factory = FakeConnectFactory(payload)
+    factory.sftp = CountingSFTP(payload)
+    factory.sftp_context.sftp = factory.sftp
+    downloader = AsyncSSHSegmentedDownloader(
+        _plain_session(),
+        AcceleratedDownloadConfig(
+            parallel_requests=2,
+            chunk_size_bytes=MIN_CHUNK_SIZE_BYTES,
+            auto_tune=True,
+            max_parallel_requests=16,
+        ),
+        connect_factory=factory,
+    )
+    local_path = tmp_path / "download.bin"
+
+    downloader.download("/srv/download.bin", local_path, expected_size=len(payload))
+
+    assert local_path.read_bytes() == payload
+    assert downloader.tuner.adjustments == 0
+    assert factory.sftp.max_open_handles == 2
+    assert factory.sftp.open_handles == 0
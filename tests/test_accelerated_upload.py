@@ -0,0 +1,312 @@
+"""Tests for AsyncSSH segmented uploads."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shlex
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ashyterm.filemanager.accelerated_upload import (
+    AcceleratedUploadCancelled,
+    AcceleratedUploadConfig,
+    AcceleratedUploadError,
+    AcceleratedUploadUnavailable,
+    AsyncSSHSegmentedUploader,
+)
+
+
+def _session():
+    return SimpleNamespace(
+        host="example.com",
+        user="alice",
+        port=2222,
+        auth_value="/home/alice/.ssh/id_ed25519",
+        proxy_jump="",
+        is_ssh=lambda: True,
+        uses_key_auth=lambda: True,
+        uses_password_auth=lambda: False,
+    )
+
+
+class FakeRemoteWriteFile:
+    def __init__(self, sftp, path):
+        self._sftp = sftp
+        self._path = path
+        self.closed = False
+
+    async def write(self, data, offset):
+        self._sftp.writes.append((self._path, offset, len(data)))
+        key = (self._path, offset)
+        if self._sftp.corrupt_always or key in self._sftp.corrupt_once:
+            self._sftp.corrupt_once.discard(key)
+            data = bytes(len(data))
+        buffer = self._sftp.files[self._path]
+        if len(buffer) < offset:
+            buffer.extend(bytes(offset - len(buffer)))
+        buffer[offset : offset + len(data)] = data
+
+    async def read(self, size, offset):
+        self._sftp.reads.append((self._path, offset, size))
+        return bytes(self._sftp.files[self._path][offset : offset + size])
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeUploadSFTP:
+    def __init__(self, corrupt_always=False):
+        self.files: dict[str, bytearray] = {}
+        self.dirs: set[str] = set()
+        self.writes = []
+        self.reads = []
+        self.opened_files = []
+        self.attrs = {}
+        self.corrupt_once: set[tuple[str, int]] = set()
+        self.corrupt_always = corrupt_always
+
+    async def open(self, path, mode):
+        if "w" in mode or path not in self.files:
+            self.files[path] = bytearray()
+        remote_file = FakeRemoteWriteFile(self, path)
+        self.opened_files.append(remote_file)
+        return remote_file
+
+    async def stat(self, path):
+        return SimpleNamespace(size=len(self.files[path]))
+
+    async def makedirs(self, path, exist_ok=False):
+        self.dirs.add(path)
+
+    async def posix_rename(self, old, new):
+        self.files[new] = self.files.pop(old)
+
+    async def remove(self, path):
+        self.files.pop(path)
+
+    async def chmod(self, path, mode):
+        self.attrs.setdefault(path, {})["mode"] = mode
+
+    async def utime(self, path, times):
+        self.attrs.setdefault(path, {})["mtime"] = times[1]
+
+
+class FakeSFTPContext:
+    def __init__(self, sftp):
+        self.sftp = sftp
+
+    async def __aenter__(self):
+        return self.sftp
+
+    async def __aexit__(self, _exc_type, _exc, _tb):
+        return None
+
+
+class FakeConnection:
+    """Answers the per-chunk checksum exec from the fake SFTP files."""
+
+    def __init__(self, sftp, can_exec=True):
+        self._sftp = sftp
+        self._can_exec = can_exec
+        self.commands = []
+
+    def start_sftp_client(self):
+        return FakeSFTPContext(self._sftp)
+
+    async def run(self, command, check=False):
+        self.commands.append(command)
+        *_script, path, block_size, program = shlex.split(command)
+        if not self._can_exec or path not in self._sftp.files:
+            return SimpleNamespace(exit_status=127, stdout="")
+        data = bytes(self._sftp.files[path])
+        step = int(block_size)
+        digests = [
+            hashlib.new(program.removesuffix("sum"), data[i : i + step]).hexdigest()
+            for i in range(0, len(data), step)
+        ]
+        stdout = "\n".join([str(len(data)), *digests])
+        return SimpleNamespace(exit_status=0, stdout=stdout)
+
+
+class FakeConnectFactory:
+    def __init__(self, sftp=None, can_exec=True):
+        self.sftp = sftp or FakeUploadSFTP()
+        self.connection = FakeConnection(self.sftp, can_exec)
+
+    async def __call__(self, **_kwargs):
+        return self.connection
+
+
+def _uploader(factory, **config_overrides):
+    progress = []
+    config = dict(parallel_requests=3, chunk_size_bytes=5)
+    config.update(config_overrides)
+    uploader = AsyncSSHSegmentedUploader(
+        _session(),
+        AcceleratedUploadConfig(**config),
+        progress_callback=progress.append,
+        connect_factory=factory,
+    )
+    return uploader, progress
+
+
+def test_segmented_upload_writes_all_ranges_and_renames_into_place(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"abcdefghijklmnopqrstuvwxyz")
+    os.utime(local_path, (1_700_000_000, 1_700_000_000))
+    factory = FakeConnectFactory()
+    uploader, progress = _uploader(factory)
+
+    uploader.upload(local_path, "/srv/upload.bin")
+
+    assert bytes(factory.sftp.files["/srv/upload.bin"]) == b"abcdefghijklmnopqrstuvwxyz"
+    assert "/srv/upload.bin.part" not in factory.sftp.files
+    assert sorted(offset for _path, offset, _size in factory.sftp.writes) == [
+        0,
+        5,
+        10,
+        15,
+        20,
+        25,
+    ]
+    assert factory.sftp.attrs["/srv/upload.bin"]["mtime"] == 1_700_000_000
+    assert all(remote_file.closed for remote_file in factory.sftp.opened_files)
+    assert progress[-1] == 100.0
+    # Verified by one checksum exec, not by reading the data back.
+    assert len(factory.connection.commands) == 1
+    assert factory.sftp.reads == []
+
+
+def test_corrupted_chunk_is_rewritten_after_verification(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"0123456789")
+    factory = FakeConnectFactory()
+    factory.sftp.corrupt_once.add(("/srv/upload.bin.part", 5))
+    uploader, _progress = _uploader(factory)
+
+    uploader.upload(local_path, "/srv/upload.bin")
+
+    assert bytes(factory.sftp.files["/srv/upload.bin"]) == b"0123456789"
+    assert [offset for _path, offset, _size in factory.sftp.writes].count(5) == 2
+    assert uploader.chunk_retries == 1
+
+
+def test_single_chunk_files_skip_the_checksum_exec(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    for index in range(4):
+        (root / f"f{index}.txt").write_bytes(b"tiny")
+    factory = FakeConnectFactory()
+    uploader, _progress = _uploader(factory, parallel_files=2)
+
+    uploader.upload_directory(root, "/srv/project", min_segment_size=10)
+
+    assert len(factory.sftp.files) == 4
+    assert factory.connection.commands == []
+    assert factory.sftp.reads == []
+
+
+def test_servers_without_exec_are_verified_by_reading_back(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"0123456789")
+    factory = FakeConnectFactory(can_exec=False)
+    factory.sftp.corrupt_once.add(("/srv/upload.bin.part", 5))
+    uploader, _progress = _uploader(factory)
+
+    uploader.upload(local_path, "/srv/upload.bin")
+
+    assert bytes(factory.sftp.files["/srv/upload.bin"]) == b"0123456789"
+    assert [offset for _path, offset, _size in factory.sftp.writes].count(5) == 2
+    assert sorted(offset for _path, offset, _size in factory.sftp.reads) == [0, 5, 5]
+
+
+def test_persistent_integrity_failure_removes_remote_partial(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"0123456789")
+    factory = FakeConnectFactory(FakeUploadSFTP(corrupt_always=True))
+    uploader, _progress = _uploader(factory, parallel_requests=1)
+
+    with pytest.raises(AcceleratedUploadError, match="Integrity check failed"):
+        uploader.upload(local_path, "/srv/upload.bin")
+
+    assert factory.sftp.files == {}
+
+
+def test_cancelled_upload_removes_remote_partial(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"0123456789")
+    cancellation_event = threading.Event()
+    factory = FakeConnectFactory()
+    uploader = AsyncSSHSegmentedUploader(
+        _session(),
+        AcceleratedUploadConfig(parallel_requests=1, chunk_size_bytes=2),
+        progress_callback=lambda _progress: cancellation_event.set(),
+        cancellation_event=cancellation_event,
+        connect_factory=factory,
+    )
+
+    with pytest.raises(AcceleratedUploadCancelled):
+        uploader.upload(local_path, "/srv/upload.bin")
+
+    assert factory.sftp.files == {}
+
+
+def test_directory_upload_recreates_tree(tmp_path):
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "big.bin").write_bytes(b"abcdefghijklmnopqrstuvwxyz")
+    (root / "README").write_bytes(b"readme")
+    (root / "src" / "main.py").write_bytes(b"print()")
+    factory = FakeConnectFactory()
+    uploader, progress = _uploader(factory, parallel_files=2)
+
+    uploader.upload_directory(root, "/srv/project", min_segment_size=10)
+
+    assert factory.sftp.dirs == {"/srv/project", "/srv/project/src"}
+    assert {path: bytes(data) for path, data in factory.sftp.files.items()} == {
+        "/srv/project/big.bin": b"abcdefghijklmnopqrstuvwxyz",
+        "/srv/project/README": b"readme",
+        "/srv/project/src/main.py": b"print()",
+    }
+    assert progress == sorted(progress)
+    assert progress[-1] == 100.0
+
+
+def test_directory_upload_with_symlink_is_unavailable(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    Path(root / "link").symlink_to("/etc/hostname")
+    uploader, _progress = _uploader(FakeConnectFactory())
+
+    with pytest.raises(AcceleratedUploadUnavailable):
+        uploader.upload_directory(root, "/srv/project", min_segment_size=10)
+
+
+def test_interrupted_upload_resumes_from_journal(tmp_path):
+    local_path = tmp_path / "upload.bin"
+    local_path.write_bytes(b"0123456789")
+    journal_dir = tmp_path / "journals"
+    factory = FakeConnectFactory()
+    factory.sftp.corrupt_once.add(("/srv/upload.bin.part", 5))
+    uploader, _progress = _uploader(
+        factory, parallel_requests=1, chunk_retries=0, journal_dir=journal_dir
+    )
+
+    with pytest.raises(AcceleratedUploadError, match="Integrity check failed"):
+        uploader.upload(local_path, "/srv/upload.bin")
+
+    assert uploader.resumable_bytes == 5
+    assert "/srv/upload.bin.part" in factory.sftp.files
+    assert len(list(journal_dir.iterdir())) == 1
+
+    factory.sftp.writes.clear()
+    resumed, _progress = _uploader(factory, parallel_requests=1, journal_dir=journal_dir)
+    resumed.upload(local_path, "/srv/upload.bin")
+
+    assert bytes(factory.sftp.files["/srv/upload.bin"]) == b"0123456789"
+    assert [offset for _path, offset, _size in factory.sftp.writes] == [5]
+    assert list(journal_dir.iterdir()) == []
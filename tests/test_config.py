@@ -155,6 +155,34 @@ class TestDefaultSettings:
         assert defaults["file_transfer_parallel_requests"] == 6
         assert defaults["file_transfer_accelerated_min_size_mb"] == 64
 
+    def test_defaults_enable_accelerated_uploads(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["file_transfer_accelerated_uploads"] is True
+        assert defaults["file_transfer_accelerated_upload_min_size_mb"] == 64
+
+    def test_defaults_enable_transfer_auto_tuning(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["file_transfer_auto_tune"] is True
+
+    def test_defaults_enable_delta_save_uploads(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["file_transfer_delta_save_uploads"] is True
+
+    def test_defaults_have_transfer_scheduler_limits(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["file_transfer_max_active"] == 4
+        assert defaults["file_transfer_max_per_host"] == 2
+        assert defaults["file_transfer_bandwidth_limit_kib"] == 0
+
+    def test_defaults_keep_one_warm_shell_under_a_memory_cap(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["warm_shell_pool_size"] == 1
+        assert defaults["warm_shell_pool_max_mb"] == 64
+
+    def test_defaults_leave_known_hosts_out_of_the_import(self):
+        defaults = self.DS.get_defaults()
+        assert defaults["ssh_import_known_hosts"] is False
+
 
 # ── ColorSchemes ──
 
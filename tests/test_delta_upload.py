@@ -0,0 +1,163 @@
+"""Tests for block-level delta uploads."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ashyterm.filemanager.accelerated_upload import AcceleratedUploadConfig
+from ashyterm.filemanager.delta_upload import (
+    AsyncSSHDeltaUploader,
+    DeltaUploadUnavailable,
+    changed_ranges,
+    choose_block_size,
+    parse_remote_checksums,
+)
+
+BLOCK = 64 * 1024
+
+
+def _session():
+    return SimpleNamespace(
+        host="example.com",
+        user="alice",
+        port=22,
+        auth_value="/home/alice/.ssh/id_ed25519",
+        proxy_jump="",
+        is_ssh=lambda: True,
+        uses_key_auth=lambda: True,
+        uses_password_auth=lambda: False,
+    )
+
+
+class LocalFile:
+    """SFTP file handle backed by a real file."""
+
+    def __init__(self, path, sftp):
+        self._handle = open(path, "r+b")
+        self._sftp = sftp
+
+    async def write(self, data, offset):
+        self._sftp.writes.append((offset, len(data)))
+        os.pwrite(self._handle.fileno(), data, offset)
+
+    async def read(self, size, offset):
+        return os.pread(self._handle.fileno(), size, offset)
+
+    async def close(self):
+        self._handle.close()
+
+
+class LocalSFTP:
+    """Just enough of an SFTP client on top of the local filesystem."""
+
+    def __init__(self):
+        self.writes = []
+
+    async def open(self, path, mode):
+        return LocalFile(path, self)
+
+    async def truncate(self, path, size):
+        os.truncate(path, size)
+
+    async def stat(self, path):
+        return SimpleNamespace(size=os.path.getsize(path))
+
+    async def chmod(self, path, mode):
+        os.chmod(path, mode)
+
+    async def utime(self, path, times):
+        os.utime(path, times)
+
+
+class LocalConnection:
+    """Runs exec requests with the local shell, as sshd would remotely."""
+
+    def __init__(self, sftp):
+        self.sftp = sftp
+        self.commands = []
+
+    async def run(self, command, check=False):
+        self.commands.append(command)
+        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        return SimpleNamespace(exit_status=result.returncode, stdout=result.stdout)
+
+    async def start_sftp_client(self):
+        return self.sftp
+
+
+def _upload(local: Path, remote: Path):
+    sftp = LocalSFTP()
+    connection = LocalConnection(sftp)
+
+    async def connect(**_kwargs):
+        return connection
+
+    uploader = AsyncSSHDeltaUploader(
+        _session(),
+        AcceleratedUploadConfig(parallel_requests=2, chunk_size_bytes=BLOCK),
+        connect_factory=connect,
+    )
+    uploader.upload_delta(local, str(remote))
+    return uploader, sftp, connection
+
+
+def test_only_changed_blocks_are_written(tmp_path):
+    original = os.urandom(BLOCK * 8)
+    remote = tmp_path / "remote.log"
+    remote.write_bytes(original)
+    edited = bytearray(original)
+    edited[BLOCK * 3 + 10 : BLOCK * 3 + 20] = b"x" * 10
+    local = tmp_path / "local.log"
+    local.write_bytes(bytes(edited) + b"appended line\n")
+
+    uploader, sftp, connection = _upload(local, remote)
+
+    assert remote.read_bytes() == local.read_bytes()
+    # One exec to find the changed blocks, one to verify the result.
+    assert len(connection.commands) == 2
+    assert sftp.writes == [(BLOCK * 3, BLOCK), (BLOCK * 8, 14)]
+    assert uploader.bytes_sent == BLOCK + 14
+
+
+def test_shorter_local_file_truncates_remote(tmp_path):
+    original = os.urandom(BLOCK * 5)
+    remote = tmp_path / "remote.conf"
+    remote.write_bytes(original)
+    local = tmp_path / "local.conf"
+    local.write_bytes(original[: BLOCK * 4 + 100])
+
+    uploader, sftp, _connection = _upload(local, remote)
+
+    assert remote.read_bytes() == local.read_bytes()
+    assert sftp.writes == [(BLOCK * 4, 100)]
+    assert uploader.bytes_sent == 100
+
+
+def test_missing_remote_file_is_unavailable(tmp_path):
+    local = tmp_path / "local.conf"
+    local.write_bytes(b"a" * BLOCK * 5)
+
+    with pytest.raises(DeltaUploadUnavailable):
+        _upload(local, tmp_path / "missing.conf")
+
+
+def test_changed_ranges_coalesce_adjacent_blocks():
+    assert changed_ranges(250, ["a", "x", "y", "d"], ["a", "b", "c", "d"], 64) == [
+        (64, 128)
+    ]
+    assert changed_ranges(250, ["a", "b"], ["a"], 200) == [(200, 50)]
+
+
+def test_checksum_parser_rejects_truncated_output():
+    with pytest.raises(ValueError):
+        parse_remote_checksums("200000\nabc\n", BLOCK)
+
+
+def test_block_size_bounds_remote_block_count():
+    assert choose_block_size(1024) == BLOCK
+    assert choose_block_size(1024 * 1024 * 1024) == 4 * 1024 * 1024
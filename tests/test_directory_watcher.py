@@ -0,0 +1,110 @@
+"""Tests for live local directory updates in the file manager."""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from ashyterm.filemanager import directory_watcher as watcher_module
+from ashyterm.filemanager.directory_watcher import (
+    DirectoryWatcher,
+    apply_entry_changes,
+    stat_entries,
+)
+from ashyterm.filemanager.models import FileItem
+
+
+class FakeStore:
+    def __init__(self, items):
+        self.items = list(items)
+        self.splices = []
+
+    def get_n_items(self):
+        return len(self.items)
+
+    def get_item(self, position):
+        return self.items[position]
+
+    def splice(self, position, n_removals, additions):
+        self.splices.append((position, n_removals, len(additions)))
+        self.items[position : position + n_removals] = additions
+
+    def remove(self, position):
+        del self.items[position]
+
+
+def _gio_file(path):
+    return SimpleNamespace(get_path=lambda: path)
+
+
+def test_local_items_match_ls_classification(tmp_path):
+    (tmp_path / "notes.txt").write_text("hello")
+    (tmp_path / "src").mkdir()
+    os.symlink("src", tmp_path / "link")
+
+    items = stat_entries(str(tmp_path), ["notes.txt", "src", "link", "gone"])
+
+    assert items["notes.txt"].size == 5
+    assert items["notes.txt"].permissions.startswith("-")
+    assert items["src"].is_directory
+    assert items["link"].is_link
+    assert items["link"].is_directory_like
+    assert items["link"]._link_target == f"{tmp_path}/src/"
+    assert items["gone"] is None
+
+
+def test_changes_are_applied_in_place(tmp_path):
+    (tmp_path / "a").write_text("new contents")
+    (tmp_path / "c").write_text("")
+    old = stat_entries(str(tmp_path), ["a", "c"])
+    (tmp_path / "b").write_text("")
+    store = FakeStore([old["a"], FileItem.from_local_path(str(tmp_path), "b")])
+    (tmp_path / "b").unlink()
+
+    apply_entry_changes(store, stat_entries(str(tmp_path), ["a", "b", "c"]))
+
+    assert [item.name for item in store.items] == ["a", "c"]
+    assert store.items[0] is not old["a"]
+    # One in-place replacement and one append; no full reload.
+    assert (0, 1, 1) in store.splices
+    assert (1, 0, 1) in store.splices
+
+
+def test_bursts_are_batched_into_one_callback(monkeypatch):
+    timeouts = []
+    monkeypatch.setattr(
+        watcher_module.GLib,
+        "timeout_add",
+        lambda delay, callback: timeouts.append(callback) or 7,
+    )
+    monitor = MagicMock()
+    monkeypatch.setattr(
+        watcher_module.Gio.File,
+        "new_for_path",
+        lambda path: SimpleNamespace(monitor_directory=lambda *args: monitor),
+    )
+    batches = []
+    watcher = DirectoryWatcher(lambda directory, names: batches.append(names))
+    watcher.watch("/work/build/")
+
+    created = watcher_module.Gio.FileMonitorEvent.CREATED
+    renamed = watcher_module.Gio.FileMonitorEvent.RENAMED
+    for index in range(100):
+        watcher._on_monitor_changed(
+            monitor, _gio_file(f"/work/build/obj{index}.o"), None, created
+        )
+    watcher._on_monitor_changed(
+        monitor, _gio_file("/work/build/a"), _gio_file("/work/build/b"), renamed
+    )
+    watcher._on_monitor_changed(
+        monitor, _gio_file("/work/build/sub/deep.o"), None, created
+    )
+
+    assert len(timeouts) == 1
+    timeouts[0]()
+    assert len(batches) == 1
+    assert len(batches[0]) == 102
+    assert {"a", "b"} <= batches[0]
+    assert "deep.o" not in batches[0]
+
+    watcher.stop()
+    monitor.cancel.assert_called_once()
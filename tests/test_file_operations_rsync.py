@@ -7,6 +7,7 @@ import pytest
 
 from ashyterm.filemanager import operations as operations_module
 from ashyterm.filemanager.accelerated_download import AcceleratedDownloadUnavailable
+from ashyterm.filemanager.accelerated_upload import AcceleratedUploadUnavailable
 from ashyterm.filemanager.operations import FileOperations, _format_exception_for_log
 from ashyterm.sessions.models import SessionItem
 
@@ -124,6 +125,28 @@ def test_accelerated_download_selection_requires_large_ssh_item():
     )
 
 
+def test_upload_and_delta_gating_is_independent_of_download_settings():
+    ops = FileOperations(_session())
+    settings = {
+        "file_transfer_accelerated_downloads": False,
+        "file_transfer_accelerated_min_size_mb": 4096,
+        "file_transfer_accelerated_upload_min_size_mb": 1,
+    }
+    ops._get_setting_value = lambda key, default: settings.get(key, default)
+    mb = 1024 * 1024
+
+    assert ops._should_use_accelerated_download(_session(), False, 2 * mb) is False
+    assert ops._should_use_accelerated_upload(_session(), False, 2 * mb) is True
+    assert ops._should_use_accelerated_upload(_session(), False, mb // 2) is False
+    assert ops._should_use_delta_upload(_session(), False, 2 * mb) is True
+
+    settings["file_transfer_accelerated_uploads"] = False
+    assert ops._should_use_accelerated_upload(_session(), False, 2 * mb) is False
+    assert ops._should_use_delta_upload(_session(), False, 2 * mb) is True
+    settings["file_transfer_delta_save_uploads"] = False
+    assert ops._should_use_delta_upload(_session(), False, 2 * mb) is False
+
+
 def test_start_download_uses_accelerated_path_when_eligible(tmp_path):
     ops = FileOperations(_session())
     ops._should_use_accelerated_download = MagicMock(return_value=True)
@@ -236,6 +259,83 @@ def test_accelerated_download_unavailable_falls_back_to_existing_transfer(
     ops._transfer_with_progress.assert_called_once()
 
 
+def test_start_upload_uses_accelerated_path_for_large_files(tmp_path):
+    local_path = tmp_path / "movie.mkv"
+    local_path.write_bytes(b"x" * 2048)
+    ops = FileOperations(_session())
+    ops._get_accelerated_download_settings = MagicMock(
+        return_value=(True, 6, 1024, 30, "accept-new")
+    )
+    ops._get_accelerated_upload_min_size_bytes = MagicMock(return_value=1024)
+    ops._start_accelerated_upload_with_fallback = MagicMock()
+    ops._transfer_with_progress = MagicMock()
+
+    ops.start_upload_with_progress(
+        "transfer-1", _session(), local_path, "/srv/movie.mkv", False
+    )
+
+    ops._start_accelerated_upload_with_fallback.assert_called_once()
+    ops._transfer_with_progress.assert_not_called()
+
+
+def test_start_upload_keeps_rsync_for_small_files(tmp_path):
+    local_path = tmp_path / "notes.txt"
+    local_path.write_bytes(b"notes")
+    ops = FileOperations(_session())
+    ops._get_accelerated_download_settings = MagicMock(
+        return_value=(True, 6, 1024, 30, "accept-new")
+    )
+    ops._get_accelerated_upload_min_size_bytes = MagicMock(return_value=1024)
+    ops._start_accelerated_upload_with_fallback = MagicMock()
+    ops._transfer_with_progress = MagicMock()
+
+    ops.start_upload_with_progress(
+        "transfer-1", _session(), local_path, "/srv/notes.txt", False
+    )
+
+    ops._start_accelerated_upload_with_fallback.assert_not_called()
+    ops._transfer_with_progress.assert_called_once()
+
+
+def test_accelerated_upload_unavailable_falls_back_to_rsync(monkeypatch, tmp_path):
+    class ImmediateThread:
+        def __init__(self, target, daemon):
+            self._target = target
+            self.daemon = daemon
+
+        def start(self):
+            self._target()
+
+    class UnavailableUploader:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def upload(self, *_args, **_kwargs):
+            raise AcceleratedUploadUnavailable("not available")
+
+    ops = FileOperations(_session())
+    ops._get_accelerated_download_settings = MagicMock(
+        return_value=(True, 6, 1024, 30, "accept-new")
+    )
+    ops._transfer_with_progress = MagicMock()
+    monkeypatch.setattr(operations_module.threading, "Thread", ImmediateThread)
+    monkeypatch.setattr(
+        operations_module, "AsyncSSHSegmentedUploader", UnavailableUploader
+    )
+
+    ops._start_accelerated_upload_with_fallback(
+        "transfer-1",
+        _session(),
+        tmp_path / "movie.mkv",
+        "/srv/movie.mkv",
+        False,
+        cancellation_event=threading.Event(),
+    )
+
+    ops._transfer_with_progress.assert_called_once()
+    assert ops._transfer_with_progress.call_args.kwargs["direction"] == "upload"
+
+
 def test_sftp_fallback_command_uses_session_ssh_options():
     session = _session()
     spawner = MagicMock()
@@ -344,3 +444,52 @@ def test_sftp_batch_rejects_command_separators(unsafe_character):
             is_directory=False,
             is_download=False,
         )
+
+
+def test_rsync_output_reader_streams_totals_and_returns_only_errors(monkeypatch):
+    idle_add = MagicMock()
+    monkeypatch.setattr(operations_module.GLib, "idle_add", idle_add)
+    progress_callback = MagicMock()
+    lines = iter(
+        [
+            "big.iso\n",
+            "  1,048,576  50%    5.00MB/s    0:00:01 (xfr#1, to-chk=1/2)\n",
+            "rsync: [sender] read errors mapping \"/remote/big.iso\": Input/output error (5)\n",
+            "",
+        ]
+    )
+    process = MagicMock()
+    process.stdout.readline = lambda: next(lines)
+
+    output = FileOperations._read_rsync_output(
+        process, "transfer-1", "Download", progress_callback, None
+    )
+
+    idle_add.assert_called_once_with(progress_callback, "transfer-1", 50.0)
+    assert "50%" not in output
+    assert output.startswith("big.iso\n")
+    assert "Input/output error" in output
+
+
+def test_save_upload_prefers_delta_below_acceleration_threshold(tmp_path):
+    local_path = tmp_path / "app.log"
+    local_path.write_bytes(b"x" * (512 * 1024))
+    ops = FileOperations(_session())
+    ops._get_accelerated_download_settings = MagicMock(
+        return_value=(True, 6, 64 * 1024 * 1024, 30, "accept-new")
+    )
+    ops._start_delta_upload_with_fallback = MagicMock()
+    ops._transfer_with_progress = MagicMock()
+
+    ops.start_upload_with_progress(
+        "transfer-1", _session(), local_path, "/srv/app.log", False, prefer_delta=True
+    )
+    ops.start_upload_with_progress(
+        "transfer-2", _session(), local_path, "/srv/app.log", False
+    )
+
+    ops._start_delta_upload_with_fallback.assert_called_once()
+    assert ops._start_delta_upload_with_fallback.call_args.kwargs["file_size"] == (
+        512 * 1024
+    )
+    ops._transfer_with_progress.assert_called_once()
@@ -1,15 +1,25 @@
 """Tests for upload-on-save transfer flow."""
 
+from functools import partial
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+from ashyterm.core import tasks
 from ashyterm.filemanager.transfers import FileTransferMixin
 from ashyterm.filemanager.transfer_manager import TransferType
+from ashyterm.filemanager.transfer_scheduler import TransferPriority
 from ashyterm.sessions.models import SessionItem
 
 
-def test_upload_on_save_marks_transfer_started_before_upload(tmp_path):
+def test_upload_on_save_marks_transfer_started_before_upload(tmp_path, monkeypatch):
     order = []
+    monkeypatch.setattr(
+        tasks.AsyncTaskManager,
+        "get",
+        classmethod(
+            lambda cls: SimpleNamespace(submit_io=lambda fn, *args: fn(*args))
+        ),
+    )
     local_file = tmp_path / "note.txt"
     local_file.write_text("hello", encoding="utf-8")
     session = SessionItem(
@@ -25,6 +35,16 @@ def test_upload_on_save_marks_transfer_started_before_upload(tmp_path):
         ("start", transfer_id)
     )
     transfer_manager.get_cancellation_event.return_value = None
+    transfer = SimpleNamespace(
+        local_path=str(local_file),
+        remote_path="/remote/note.txt",
+        is_directory=False,
+        file_size=5,
+        session_key="",
+        priority=TransferPriority.BULK,
+    )
+    transfer_manager.get_transfer.return_value = transfer
+    transfer_manager.queue_transfer.side_effect = lambda transfer_id, start: start()
 
     operations = MagicMock()
     operations.start_upload_with_progress.side_effect = lambda *args, **kwargs: order.append(
@@ -38,6 +58,13 @@ def test_upload_on_save_marks_transfer_started_before_upload(tmp_path):
         logger=MagicMock(),
         _on_save_upload_complete=MagicMock(),
     )
+    fm._get_transfer_session_key = lambda: "alice@example.com:22"
+    fm._background_save_upload_worker = partial(
+        FileTransferMixin._background_save_upload_worker, fm
+    )
+    fm._start_cancellable_transfer = partial(
+        FileTransferMixin._start_cancellable_transfer, fm
+    )
 
     FileTransferMixin._upload_on_save_thread(fm, local_file, "/remote/note.txt")
 
@@ -51,6 +78,8 @@ def test_upload_on_save_marks_transfer_started_before_upload(tmp_path):
         is_directory=False,
     )
     assert order == [("start", "transfer-1"), ("upload", "transfer-1")]
+    assert transfer.priority is TransferPriority.INTERACTIVE
+    assert transfer.session_key == "alice@example.com:22"
 
 
 def test_rename_sanitizes_path_separators():
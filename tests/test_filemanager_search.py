@@ -4,6 +4,7 @@ from pathlib import PurePosixPath
 
 from ashyterm.filemanager import search as search_module
 from ashyterm.filemanager.search import FileSearchMixin
+from ashyterm.utils.logger import get_logger
 
 
 class _FakeSearch(FileSearchMixin):
@@ -79,3 +80,137 @@ def test_fd_search_uses_xargs_no_run_if_empty():
 
     assert command[:2] == ["sh", "-c"]
     assert "xargs -r -0 ls" in command[2]
+
+
+def _ls_line(path):
+    return f"-rw-r--r-- 1 alice users 12 2024-01-02 10:11:12.000000000 +0000 {path}\n"
+
+
+class _FakeStreamProcess(_FakeProcess):
+    def __init__(self, lines, on_line=None):
+        super().__init__()
+        self._lines = lines
+        self._on_line = on_line
+        self.stdout = self._iter_lines()
+        self.terminated = False
+
+    def _iter_lines(self):
+        for line in self._lines:
+            yield line
+            if self._on_line:
+                self._on_line()
+
+    def terminate(self):
+        self.terminated = True
+
+
+class _FakeStreamingOperations:
+    def __init__(self, process):
+        self.process = process
+        self.commands = []
+
+    def stream_command_on_session(self, command):
+        self.commands.append(command)
+        return self.process
+
+    def execute_command_on_session(self, _command):
+        raise AssertionError("remote search must not buffer the whole output")
+
+
+def test_remote_search_streams_results_in_batches(monkeypatch):
+    batches = []
+    monkeypatch.setattr(
+        search_module.GLib,
+        "idle_add",
+        lambda callback, *args: batches.append((callback.__name__, args)) or 1,
+    )
+    monkeypatch.setattr(search_module, "SEARCH_RESULT_BATCH_SIZE", 2)
+    monkeypatch.setattr(search_module, "SEARCH_RESULT_BATCH_INTERVAL", 60)
+    process = _FakeStreamProcess([_ls_line(f"/srv/data/f{i}.txt") for i in range(6)])
+    operations = _FakeStreamingOperations(process)
+
+    results, error_message, truncated = _FakeSearch()._search_remote(
+        1, ["find"], PurePosixPath("/srv/data"), False, operations
+    )
+
+    assert [name for name, _args in batches] == ["_append_recursive_search_results"] * 3
+    assert [[item.name for item in args[1]] for _name, args in batches] == [
+        ["f0.txt"],
+        ["f1.txt", "f2.txt"],
+        ["f3.txt", "f4.txt"],
+    ]
+    assert [item.name for item in results] == ["f5.txt"]
+    assert error_message == ""
+    assert truncated is False
+
+
+def test_remote_search_stops_reading_when_superseded(monkeypatch):
+    monkeypatch.setattr(search_module.GLib, "idle_add", lambda *_args: 1)
+    fm = _FakeSearch()
+
+    def supersede():
+        fm._recursive_search_generation = 2
+
+    process = _FakeStreamProcess(
+        [_ls_line("/srv/data/a.txt"), _ls_line("/srv/data/b.txt")], on_line=supersede
+    )
+
+    results, error_message, truncated = fm._search_remote(
+        1, ["find"], PurePosixPath("/srv/data"), False, _FakeStreamingOperations(process)
+    )
+
+    assert process.terminated is True
+    assert (results, error_message, truncated) == ([], "", False)
+
+
+def test_recursive_search_is_answered_from_a_ready_filename_index(tmp_path):
+    from ashyterm.filemanager.filename_index import FilenameIndex, refresh_local_index
+
+    (tmp_path / "notes.txt").write_text("")
+    index = FilenameIndex(str(tmp_path))
+    refresh_local_index(index)
+    fm = _FakeSearch()
+    fm._filename_index = index
+    fm._filename_index_session = "local"
+    fm._get_current_session_key = lambda: "local"
+
+    results, error_message, truncated = fm._search_filename_index(
+        str(tmp_path), "note", show_hidden=False
+    )
+
+    assert [item.name for item in results] == ["notes.txt"]
+    assert (error_message, truncated) == ("", False)
+    assert fm._search_filename_index("/elsewhere", "note", show_hidden=False) is None
+
+
+def test_filename_index_refresh_runs_as_its_own_task_once_per_index(
+    monkeypatch, tmp_path
+):
+    from ashyterm.core import tasks as tasks_module
+
+    (tmp_path / "notes.txt").write_text("")
+    submitted = []
+
+    class _FakeTasks:
+        def submit_io(self, fn, *args):
+            submitted.append((fn, args))
+            return object()
+
+    monkeypatch.setattr(tasks_module.AsyncTaskManager, "get", lambda: _FakeTasks())
+    fm = _FakeSearch()
+    fm._is_destroyed = False
+    fm._filename_index = None
+    fm.logger = get_logger("test")
+    fm._get_current_session_key = lambda: "local"
+    fm._is_remote_session = lambda: False
+
+    fm._schedule_filename_index_refresh(str(tmp_path), operations=None)
+    fm._schedule_filename_index_refresh(str(tmp_path), operations=None)
+    assert len(submitted) == 1
+    assert not fm._filename_index.ready
+
+    fn, args = submitted.pop()
+    fn(*args)
+    assert fm._filename_index.ready
+    fm._schedule_filename_index_refresh(str(tmp_path), operations=None)
+    assert len(submitted) == 1
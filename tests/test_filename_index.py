@@ -0,0 +1,184 @@
+"""Tests for the per-session filename index."""
+
+import os
+
+from ashyterm.filemanager import filename_index as filename_index_module
+from ashyterm.filemanager.filename_index import (
+    FilenameIndex,
+    FilenameIndexTooLarge,
+    refresh_local_index,
+    refresh_remote_index,
+)
+
+
+def _names(matches):
+    return [relative_path for relative_path, _entry in matches]
+
+
+def _tree(tmp_path):
+    root = tmp_path / "project"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / ".git").mkdir()
+    (root / "README.md").write_text("readme")
+    (root / "src" / "main.py").write_text("main")
+    (root / "src" / "pkg" / "Main_helper.py").write_text("helper")
+    (root / ".git" / "main.lock").write_text("")
+    return root
+
+
+def test_local_index_answers_substring_and_glob_queries(tmp_path):
+    root = _tree(tmp_path)
+    index = FilenameIndex(str(root))
+
+    refresh_local_index(index)
+
+    assert index.ready
+    matches, truncated = index.search(str(root), "MAIN", False, 100)
+    assert _names(matches) == ["src/main.py", "src/pkg/Main_helper.py"]
+    assert truncated is False
+    assert _names(index.search(str(root), "*.md", False, 100)[0]) == ["README.md"]
+    assert _names(index.search(str(root / "src"), "main", False, 100)[0]) == [
+        "main.py",
+        "pkg/Main_helper.py",
+    ]
+
+
+def test_local_index_hides_dot_entries_unless_requested(tmp_path):
+    root = _tree(tmp_path)
+    index = FilenameIndex(str(root))
+    refresh_local_index(index)
+
+    hidden_off = _names(index.search(str(root), "main", False, 100)[0])
+    assert not any(name.startswith(".git") for name in hidden_off)
+    assert ".git/main.lock" in _names(index.search(str(root), "main", True, 100)[0])
+
+
+def test_local_index_reports_truncation(tmp_path):
+    root = _tree(tmp_path)
+    index = FilenameIndex(str(root))
+    refresh_local_index(index)
+
+    matches, truncated = index.search(str(root), "", False, 2)
+
+    assert len(matches) == 2
+    assert truncated is True
+
+
+def test_local_refresh_only_rescans_changed_directories(tmp_path):
+    root = _tree(tmp_path)
+    index = FilenameIndex(str(root))
+    refresh_local_index(index)
+
+    assert refresh_local_index(index) == 0
+
+    (root / "src" / "pkg" / "new_main.py").write_text("")
+    os.utime(root / "src" / "pkg", (1, 1))
+    assert refresh_local_index(index) == 1
+    assert "src/pkg/new_main.py" in _names(index.search(str(root), "main", False, 100)[0])
+
+
+def test_local_refresh_drops_deleted_directories(tmp_path):
+    root = _tree(tmp_path)
+    index = FilenameIndex(str(root))
+    refresh_local_index(index)
+    for child in (root / "src" / "pkg").iterdir():
+        child.unlink()
+    (root / "src" / "pkg").rmdir()
+    os.utime(root / "src", (1, 1))
+
+    refresh_local_index(index)
+
+    assert _names(index.search(str(root), "helper", False, 100)[0]) == []
+
+
+def test_index_refuses_trees_above_the_entry_limit(monkeypatch, tmp_path):
+    root = _tree(tmp_path)
+    monkeypatch.setattr(filename_index_module, "MAX_INDEXED_ENTRIES", 2)
+    index = FilenameIndex(str(root))
+
+    try:
+        refresh_local_index(index)
+    except FilenameIndexTooLarge:
+        pass
+    else:
+        raise AssertionError("expected FilenameIndexTooLarge")
+
+
+class _FakeProcess:
+    def __init__(self, lines):
+        self.stdout = iter(lines)
+        self.killed = False
+
+    def poll(self):
+        return 0 if self.killed else None
+
+    def kill(self):
+        self.killed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+class _FakeRemoteOperations:
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.commands = []
+
+    def stream_command_on_session(self, command):
+        self.commands.append(command)
+        self.process = _FakeProcess(self.outputs.pop(0))
+        return self.process
+
+
+def _entry(perms, mtime, parent, name):
+    return f"{perms}\t10\t{mtime}\talice\tusers\t{parent}\t{name}\t\n"
+
+
+def test_remote_index_builds_from_one_find_and_refreshes_changed_directories():
+    operations = _FakeRemoteOperations(
+        [
+            [
+                _entry("drwxr-xr-x", "100.0", "/srv", "app"),
+                _entry("-rw-r--r--", "50.0", "/srv/app", "config.yml"),
+                _entry("drwxr-xr-x", "200.0", "/srv/app", "logs"),
+                _entry("-rw-r--r--", "60.0", "/srv/app/logs", "app.log"),
+            ],
+            ["100.0\t/srv/app\n", "300.0\t/srv/app/logs\n"],
+            [_entry("-rw-r--r--", "61.0", "/srv/app/logs", "app.log.1")],
+        ]
+    )
+    index = FilenameIndex("/srv/app")
+
+    assert refresh_remote_index(index, operations) == 2
+    assert len(operations.commands) == 1
+    assert index.directory_mtime("/srv/app") == 100.0
+    assert operations.commands[0][:2] == ["find", "/srv/app"]
+    assert _names(index.search("/srv/app", "log", False, 100)[0]) == [
+        "logs",
+        "logs/app.log",
+    ]
+
+    assert refresh_remote_index(index, operations) == 1
+    assert operations.commands[2][:2] == ["find", "/srv/app/logs"]
+    assert "-maxdepth" in operations.commands[2]
+    assert _names(index.search("/srv/app", "app.log", False, 100)[0]) == [
+        "logs/app.log.1"
+    ]
+
+
+def test_remote_index_stops_find_once_the_entry_limit_is_passed(monkeypatch):
+    monkeypatch.setattr(filename_index_module, "MAX_INDEXED_ENTRIES", 2)
+    lines = (_entry("-rw-r--r--", "1.0", "/", f"f{i}") for i in range(1000))
+    operations = _FakeRemoteOperations([lines])
+
+    try:
+        refresh_remote_index(FilenameIndex("/"), operations)
+    except FilenameIndexTooLarge:
+        pass
+    else:
+        raise AssertionError("expected FilenameIndexTooLarge")
+    assert operations.process.killed
+    assert len(list(lines)) == 997
@@ -1,8 +1,30 @@
 """Tests for live manual SSH target tracking."""
 
+import os
+import signal
+import sys
+import time
 from unittest.mock import MagicMock
 
+from ashyterm.terminal.pty_spawn import spawn_on_pty
 from ashyterm.terminal.registry import ManualSSHTracker
+from ashyterm.terminal.ssh_process_detection import read_cmdline
+
+FAKE_SSH = (
+    f"exec -a ssh {sys.executable} -c 'import time; time.sleep(30)' root@box"
+)
+
+
+def _spawn_on_pty(script):
+    master_fd, slave_fd = os.openpty()
+    pid = spawn_on_pty(
+        ["/bin/bash", "-c", script], slave_fd, master_fd, "/", dict(os.environ)
+    )
+    os.close(slave_fd)
+    deadline = time.monotonic() + 5
+    while read_cmdline(pid)[:1] != ["ssh"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return master_fd, pid
 
 
 def test_same_child_count_still_updates_changed_ssh_target() -> None:
@@ -45,3 +67,28 @@ def test_same_nonzero_child_count_detects_new_ssh_session() -> None:
     tracker._check_ssh_state(4, state, 123, psutil_module)
 
     tracker._update_ssh_state.assert_called_once_with(4, state, "root@node", True)
+
+
+def test_foreground_ssh_is_read_from_the_pty_master() -> None:
+    master_fd, pid = _spawn_on_pty(FAKE_SSH)
+    try:
+        terminal = MagicMock()
+        terminal.get_pty.return_value.get_fd.return_value = master_fd
+        registry = MagicMock()
+        registry.get_terminal_info.return_value = {"type": "local", "process_id": pid}
+        tracker = ManualSSHTracker(registry, MagicMock())
+        tracker._notify_state_changed = MagicMock()
+        tracker.track(7, terminal)
+
+        tracker.check_foreground(7)
+        assert tracker.get_ssh_target(7) == "root@box"
+
+        # Output that does not change the foreground group costs one ioctl.
+        tracker._tracked_terminals[7]["in_ssh"] = False
+        tracker.check_foreground(7)
+        assert tracker.get_ssh_target(7) is None
+        assert tracker._notify_state_changed.call_count == 1
+    finally:
+        tracker.untrack(7)
+        os.kill(pid, signal.SIGKILL)
+        os.close(master_fd)
@@ -0,0 +1,111 @@
+"""Tests for the shared /proc sampler."""
+
+import os
+import signal
+import time
+
+from ashyterm.terminal import proc_sampler as proc_sampler_module
+from ashyterm.terminal.proc_sampler import (
+    ProcSample,
+    ProcSampler,
+    SampleTarget,
+    sample_process,
+)
+from ashyterm.terminal.pty_spawn import spawn_on_pty
+
+
+def test_one_read_covers_cwd_state_and_foreground(tmp_path):
+    master_fd, slave_fd = os.openpty()
+    pid = spawn_on_pty(
+        ["/bin/sleep", "30"], slave_fd, master_fd, str(tmp_path), dict(os.environ)
+    )
+    os.close(slave_fd)
+    try:
+        deadline = time.monotonic() + 5
+        sample = sample_process(SampleTarget("tab", pid, master_fd))
+        while sample.fg_pgrp is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+            sample = sample_process(SampleTarget("tab", pid, master_fd))
+    finally:
+        os.kill(pid, signal.SIGKILL)
+        os.close(master_fd)
+
+    assert sample.cwd == str(tmp_path)
+    assert sample.alive
+    assert sample.fg_pgrp == pid
+    assert not sample.running_job
+    assert not sample_process(SampleTarget("gone", -1)).alive
+
+
+class SamplerHarness:
+    def __init__(self, monkeypatch, keys):
+        self.timeouts = []
+        monkeypatch.setattr(
+            proc_sampler_module.GLib,
+            "timeout_add",
+            lambda delay, callback: self.timeouts.append(callback) or 5,
+        )
+        monkeypatch.setattr(proc_sampler_module.GLib, "source_remove", lambda _id: None)
+        self.sampled = []
+        self.cwds = {key: "/home" for key in keys}
+        monkeypatch.setattr(
+            proc_sampler_module, "sample_process", self._fake_sample
+        )
+        self.keys = list(keys)
+        self.sampler = ProcSampler(
+            lambda: [SampleTarget(key, 100 + i) for i, key in enumerate(self.keys)],
+            background_every=3,
+        )
+        self.changes = []
+        self.sampler.subscribe(self.changes.append)
+
+    def _fake_sample(self, target, previous=None):
+        self.sampled.append(target.key)
+        return ProcSample(target.pid, cwd=self.cwds[target.key], state="S")
+
+    def tick(self):
+        return self.timeouts[0]()
+
+
+def test_focused_terminal_every_tick_others_every_nth(monkeypatch):
+    harness = SamplerHarness(monkeypatch, ["a", "b", "c"])
+    harness.sampler.start()
+    harness.sampler.set_focus("b")
+    # Focusing a terminal that was never sampled samples everything once.
+    assert harness.sampled == ["a", "b", "c"]
+    harness.sampled.clear()
+
+    harness.tick()
+    harness.tick()
+    assert harness.sampled == ["b", "b"]
+    harness.tick()
+    assert harness.sampled[2:] == ["a", "b", "c"]
+
+
+def test_subscribers_only_hear_about_changes(monkeypatch):
+    harness = SamplerHarness(monkeypatch, ["a", "b"])
+    harness.sampler.sample_now()
+    assert set(harness.changes[0]) == {"a", "b"}
+
+    harness.cwds["b"] = "/tmp"
+    harness.sampler.sample_now()
+    harness.sampler.sample_now()
+
+    assert len(harness.changes) == 2
+    old, new = harness.changes[1]["b"]
+    assert (old.cwd, new.cwd) == ("/home", "/tmp")
+    assert harness.sampler.latest("b").cwd == "/tmp"
+
+
+def test_suspended_window_and_empty_registry_stop_the_timer(monkeypatch):
+    harness = SamplerHarness(monkeypatch, ["a"])
+    harness.sampler.start()
+    harness.sampler.set_suspended(True)
+    assert harness.sampler._timer_id is None
+
+    harness.sampler.set_suspended(False)
+    assert harness.sampler._timer_id is not None
+    harness.keys.clear()
+    assert harness.tick() == proc_sampler_module.GLib.SOURCE_REMOVE
+    assert harness.sampler._timer_id is None
+    assert harness.sampler.latest("a") is None
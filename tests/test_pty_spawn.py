@@ -0,0 +1,68 @@
+"""Tests for spawning terminal children on a PTY."""
+
+import os
+import select
+import time
+
+import pytest
+
+from ashyterm.terminal import pty_spawn
+from ashyterm.terminal.pty_spawn import find_ctty_helper, spawn_on_pty
+
+# Opening /dev/tty only succeeds when the PTY is the controlling terminal.
+PROBE = (
+    'exec 3</dev/tty && echo "ctty=ok pid=$$ sid=$(ps -o sid= -p $$ | tr -d " ")"'
+)
+
+
+def _read_until_exit(master_fd, pid, timeout=5.0):
+    output = b""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready, _, _ = select.select([master_fd], [], [], 0.1)
+        if ready:
+            try:
+                chunk = os.read(master_fd, 4096)
+            except OSError:
+                break
+            if not chunk:
+                break
+            output += chunk
+        elif os.waitpid(pid, os.WNOHANG) != (0, 0):
+            break
+    return output.decode(errors="replace")
+
+
+@pytest.mark.parametrize("use_helper", [True, False])
+def test_child_is_session_leader_with_the_pty_as_ctty(tmp_path, use_helper):
+    if use_helper and not find_ctty_helper():
+        pytest.skip("setsid -c is not installed")
+    master_fd, slave_fd = os.openpty()
+    try:
+        pid = spawn_on_pty(
+            ["/bin/sh", "-c", PROBE],
+            slave_fd,
+            master_fd,
+            str(tmp_path),
+            {"PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+            use_helper=use_helper,
+        )
+        os.close(slave_fd)
+        slave_fd = None
+        output = _read_until_exit(master_fd, pid)
+    finally:
+        if slave_fd is not None:
+            os.close(slave_fd)
+        os.close(master_fd)
+
+    assert "ctty=ok" in output
+    # The helper execs in place: the returned PID runs the command and
+    # leads its own session.
+    assert f"pid={pid} sid={pid}" in output
+
+
+def test_missing_helper_falls_back_to_preexec(monkeypatch):
+    monkeypatch.setattr(pty_spawn, "_ctty_helper", pty_spawn._UNRESOLVED)
+    monkeypatch.setattr(pty_spawn.shutil, "which", lambda name: None)
+
+    assert find_ctty_helper() is None
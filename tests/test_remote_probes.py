@@ -0,0 +1,131 @@
+"""Tests for batched remote metadata probes."""
+
+import os
+import subprocess
+
+from ashyterm.filemanager.operations import FileOperations
+from ashyterm.filemanager.remote_probes import (
+    PROBE_COMMAND,
+    PROBE_FREE_SPACE,
+    PROBE_MTIME,
+    ProbeResult,
+    RemoteProbe,
+    build_probe_command,
+    parse_probe_output,
+)
+from ashyterm.sessions.models import SessionItem
+
+
+class LocalSpawner:
+    """Runs "remote" commands with the local shell and counts them."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_remote_command_sync(self, session, command, timeout=10):
+        self.commands.append(command)
+        result = subprocess.run(command, capture_output=True, text=True)
+        return result.returncode == 0, result.stdout
+
+
+def _operations():
+    session = SessionItem(
+        name="prod", session_type="ssh", host="example.com", user="alice"
+    )
+    spawner = LocalSpawner()
+    return FileOperations(session, spawner=spawner), spawner
+
+
+def _run(probes):
+    result = subprocess.run(
+        build_probe_command(probes), capture_output=True, text=True, check=True
+    )
+    return parse_probe_output(probes, result.stdout)
+
+
+def test_script_answers_every_probe_in_order(tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("hello")
+    os.utime(target, (1_700_000_000, 1_700_000_000))
+    probes = [
+        RemoteProbe(PROBE_MTIME, str(target)),
+        RemoteProbe(PROBE_COMMAND, "sh"),
+        RemoteProbe(PROBE_FREE_SPACE, str(tmp_path)),
+    ]
+
+    results = _run(probes)
+
+    assert results[probes[0]] == ProbeResult(True, 1_700_000_000)
+    assert results[probes[1]].ok
+    assert results[probes[1]].value.endswith("sh")
+    assert results[probes[2]].ok
+    assert results[probes[2]].value > 0
+
+
+def test_failed_probes_do_not_shift_later_results(tmp_path):
+    missing = RemoteProbe(PROBE_MTIME, str(tmp_path / "missing"))
+    absent = RemoteProbe(PROBE_COMMAND, "definitely-not-a-command-ashyterm")
+    present = RemoteProbe(PROBE_MTIME, str(tmp_path))
+    odd_name = tmp_path / "tab\there"
+    odd_name.write_text("")
+    odd = RemoteProbe(PROBE_MTIME, str(odd_name))
+
+    results = _run([missing, absent, present, odd])
+
+    assert results[missing] == ProbeResult(False)
+    assert results[absent] == ProbeResult(False)
+    assert results[present].ok
+    assert results[odd].ok
+
+
+def test_truncated_output_marks_remaining_probes_failed():
+    probes = [RemoteProbe(PROBE_MTIME, "/a"), RemoteProbe(PROBE_MTIME, "/b")]
+
+    results = parse_probe_output(probes, "0\t17\n")
+
+    assert results[probes[0]] == ProbeResult(True, 17)
+    assert results[probes[1]] == ProbeResult(False)
+
+
+def test_probes_share_one_exec_and_cache_by_kind(tmp_path):
+    ops, spawner = _operations()
+    target = tmp_path / "report.csv"
+    target.write_text("1,2\n")
+
+    timestamp = ops.get_remote_file_timestamp(str(target))
+    free_space = ops.get_free_space(str(tmp_path), is_remote=True)
+
+    assert timestamp == int(target.stat().st_mtime)
+    assert free_space > 0
+    # The second call reused the rsync probe answered by the first.
+    assert len(spawner.commands) == 2
+    assert spawner.commands[1].count(PROBE_COMMAND) == 0
+
+    ops.check_command_available("rsync")
+    ops.get_free_space(str(tmp_path), is_remote=True)
+    assert len(spawner.commands) == 2
+
+    # Modification times back conflict checks and are never cached.
+    ops.get_remote_file_timestamp(str(target))
+    assert len(spawner.commands) == 3
+
+
+def test_failed_exec_reports_failure_and_caches_nothing():
+    ops, _spawner = _operations()
+    ops.execute_command_on_session = lambda command, session_override=None: (
+        False,
+        "Connection refused",
+    )
+    probe = RemoteProbe(PROBE_COMMAND, "rsync")
+
+    assert ops.run_probes([probe]) == {probe: ProbeResult(False)}
+    assert ops._probe_cache == {}
+
+
+def test_local_stream_stops_the_process_when_the_reader_leaves():
+    ops = FileOperations(SessionItem(name="local", session_type="local"))
+
+    with ops.stream_command_on_session(["sh", "-c", "echo ready; sleep 30"]) as proc:
+        assert proc.stdout.readline() == "ready\n"
+
+    assert proc.returncode is not None
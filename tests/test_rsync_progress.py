@@ -0,0 +1,50 @@
+"""Tests for the streaming rsync progress parser."""
+
+from ashyterm.filemanager.rsync_progress import RsyncProgressParser
+
+
+def _parser(now, emitted, **kwargs):
+    return RsyncProgressParser(emitted.append, clock=lambda: now[0], **kwargs)
+
+
+def test_progress2_lines_are_parsed_and_coalesced():
+    now = [0.0]
+    emitted = []
+    parser = _parser(now, emitted, interval=0.1)
+
+    parser.feed("     32,768   1%    1.00MB/s    0:00:10 (xfr#1, to-chk=9/10)\n")
+    parser.feed("  1,048,576  30%    5.00MB/s    0:00:05 (xfr#2, to-chk=8/10)\n")
+    parser.feed("  2,097,152  60%    5.00MB/s    0:00:03 (xfr#3, to-chk=7/10)\n")
+    now[0] = 0.2
+    parser.feed("  3,145,728  90%    5.00MB/s    0:00:01 (xfr#4, to-chk=6/10)\n")
+    parser.feed("  3,495,253 100%    5.00MB/s    0:00:00 (xfr#5, to-chk=0/10)\n")
+    parser.flush()
+
+    assert emitted == [1.0, 90.0, 100.0]
+
+
+def test_repeated_percentages_are_not_emitted_again():
+    now = [0.0]
+    emitted = []
+    parser = _parser(now, emitted, interval=0.0)
+
+    for _ in range(3):
+        parser.feed("  1,048,576  30%    5.00MB/s    0:00:05\n")
+    parser.flush()
+
+    assert emitted == [30.0]
+
+
+def test_only_the_output_tail_is_kept_and_progress_lines_are_excluded():
+    emitted = []
+    parser = _parser([0.0], emitted, tail_lines=3)
+
+    for index in range(10):
+        parser.feed(f"file-{index} 50% done.txt\n")
+        parser.feed(f"  {index},000  {index}%    1.00MB/s    0:00:01\n")
+    parser.feed("rsync error: some files/attrs were not transferred\n")
+
+    assert parser.output_tail() == (
+        "file-8 50% done.txt\nfile-9 50% done.txt\n"
+        "rsync error: some files/attrs were not transferred\n"
+    )
@@ -0,0 +1,80 @@
+"""Tests for loading sessions with their detail fields deferred."""
+
+from ashyterm.sessions.models import SessionItem
+from ashyterm.sessions.storage import load_sessions_to_store
+
+
+class FakeStore(list):
+    def get_n_items(self):
+        return len(self)
+
+    def splice(self, position, n_removals, additions):
+        self[position : position + n_removals] = additions
+
+
+def _record(name="web", **extra):
+    data = {
+        "name": name,
+        "session_type": "ssh",
+        "host": "web.example",
+        "user": "deploy",
+        "folder_path": "/prod",
+        "port": 2222,
+        "sftp_session_enabled": True,
+        "sftp_local_directory": "/nonexistent/downloads",
+        "post_login_command": "uptime",
+        "post_login_command_enabled": True,
+        "port_forwardings": [
+            {"name": "db", "local_port": 15432, "remote_port": 5432}
+        ],
+    }
+    data.update(extra)
+    return data
+
+
+def test_record_defers_details_until_first_use():
+    saved = SessionItem.from_dict(_record()).to_dict()
+    session = SessionItem.from_record(saved)
+
+    assert (session.name, session.host, session.folder_path) == (
+        "web",
+        "web.example",
+        "/prod",
+    )
+    assert session.get_connection_string() == "deploy@web.example"
+    assert not session.is_materialized
+    # Saving an untouched session writes back what was loaded.
+    assert session.to_dict() == saved
+    assert not session.is_materialized
+
+    assert session.port_forwardings[0]["local_host"] == "localhost"
+    assert session.is_materialized
+
+
+def test_writes_before_materializing_are_kept():
+    session = SessionItem.from_record(_record())
+    session.post_login_command = "  hostname "
+
+    assert session.post_login_command == "hostname"
+    assert session.to_dict()["sftp_remote_directory"] == ""
+    assert session.to_dict()["post_login_command"] == "hostname"
+
+
+def test_store_loads_lazily_and_checks_records_without_the_filesystem():
+    store = FakeStore()
+    bad_tunnel = [{"name": "x", "local_port": 80, "remote_port": 80}]
+    load_sessions_to_store(
+        store,
+        [
+            _record("web"),
+            _record("no-host", host=""),
+            _record("bad-tunnel", port_forwardings=bad_tunnel),
+            _record("empty-login", post_login_command=" "),
+        ],
+    )
+
+    # The missing SFTP directory only matters once the session is edited.
+    assert [s.name for s in store] == ["web"]
+    assert not store[0].is_materialized
+    assert store[0].get_validation_errors()
+    assert store[0].is_materialized
@@ -0,0 +1,185 @@
+"""Tests for debounced session persistence and checksummed saves."""
+
+import json
+from concurrent.futures import Future
+
+import pytest
+
+from ashyterm.sessions import persistence as persistence_module
+from ashyterm.sessions.persistence import SessionPersistence
+from ashyterm.sessions.storage import SessionStorageManager
+from ashyterm.utils.exceptions import StorageWriteError
+
+
+class FakeStorage:
+    def __init__(self):
+        self.version = 0
+        self.writes = []
+        self.fail = False
+
+    def snapshot(self, session_store, folder_store):
+        return {"version": self.version}
+
+    def write_snapshot(self, data):
+        self.writes.append(data)
+        if self.fail:
+            raise OSError("disk full")
+        return True
+
+
+class Harness:
+    def __init__(self, monkeypatch, submit=None, on_save_failed=None):
+        self.timeouts = {}
+        self.idle = []
+        self._next_id = 0
+        monkeypatch.setattr(persistence_module.GLib, "timeout_add", self._timeout_add)
+        monkeypatch.setattr(
+            persistence_module.GLib, "source_remove", self.timeouts.pop
+        )
+        monkeypatch.setattr(
+            persistence_module.GLib,
+            "idle_add",
+            lambda callback, *args: self.idle.append((callback, args)),
+        )
+        self.storage = FakeStorage()
+        self.persistence = SessionPersistence(
+            self.storage,
+            object(),
+            object(),
+            submit=submit,
+            on_save_failed=on_save_failed,
+        )
+
+    def _timeout_add(self, delay, callback):
+        self._next_id += 1
+        self.timeouts[self._next_id] = (delay, callback)
+        return self._next_id
+
+    def fire(self):
+        (source_id,) = self.timeouts
+        _delay, callback = self.timeouts.pop(source_id)
+        callback()
+
+    def run_idle(self):
+        while self.idle:
+            callback, args = self.idle.pop(0)
+            callback(*args)
+
+
+def test_mutations_coalesce_into_one_deferred_write(monkeypatch):
+    harness = Harness(monkeypatch)
+    for version in range(5):
+        harness.storage.version = version
+        harness.persistence.mark_dirty()
+
+    assert harness.storage.writes == []
+    assert len(harness.timeouts) == 1
+    harness.fire()
+    assert harness.storage.writes == [{"version": 4}]
+    assert not harness.persistence.dirty
+
+
+def test_batch_holds_the_write_until_the_outermost_block_ends(monkeypatch):
+    harness = Harness(monkeypatch)
+    with harness.persistence.batch():
+        harness.persistence.mark_dirty()
+        with harness.persistence.batch():
+            harness.persistence.mark_dirty()
+        assert harness.timeouts == {}
+    assert len(harness.timeouts) == 1
+
+    harness.fire()
+    assert len(harness.storage.writes) == 1
+
+
+def test_changes_during_a_background_write_are_saved_after_it(monkeypatch):
+    futures = []
+
+    def submit(fn, *args):
+        future = Future()
+        futures.append((future, fn, args))
+        return future
+
+    harness = Harness(monkeypatch, submit=submit)
+    harness.persistence.mark_dirty()
+    harness.fire()
+    harness.storage.version = 1
+    harness.persistence.mark_dirty()
+    # The second write waits for the first one to land.
+    harness.fire()
+    assert len(futures) == 1
+
+    future, fn, args = futures.pop()
+    future.set_result(fn(*args))
+    harness.run_idle()
+    harness.fire()
+    future, fn, args = futures.pop()
+    future.set_result(fn(*args))
+    harness.run_idle()
+
+    assert harness.storage.writes == [{"version": 0}, {"version": 1}]
+    assert harness.timeouts == {}
+
+
+def test_failed_write_is_retried_and_flush_writes_inline(monkeypatch):
+    harness = Harness(monkeypatch)
+    harness.storage.fail = True
+    harness.persistence.mark_dirty()
+    harness.fire()
+    assert harness.persistence.dirty
+    ((delay, _callback),) = harness.timeouts.values()
+    assert delay == persistence_module.RETRY_DELAY_MS
+
+    harness.storage.fail = False
+    assert harness.persistence.flush()
+    assert harness.timeouts == {}
+    assert len(harness.storage.writes) == 2
+    assert not harness.persistence.dirty
+
+
+def test_persistent_write_failures_are_reported_once_per_run(monkeypatch):
+    failures = []
+    harness = Harness(monkeypatch, on_save_failed=lambda: failures.append(1))
+    harness.storage.fail = True
+    harness.persistence.mark_dirty()
+    harness.fire()
+    harness.fire()
+    assert len(harness.storage.writes) == 2
+    assert failures == [1]
+
+    harness.storage.fail = False
+    harness.fire()
+    assert not harness.persistence.dirty
+    harness.storage.fail = True
+    harness.persistence.mark_dirty()
+    harness.fire()
+    assert failures == [1, 1]
+
+
+def test_storage_verifies_by_checksum_and_skips_unchanged_data(tmp_path):
+    storage = SessionStorageManager()
+    storage.sessions_file = tmp_path / "sessions.json"
+    payloads = []
+    write_temp_file = storage._write_temp_file
+
+    def counting_write(temp_file, payload):
+        payloads.append(payload)
+        write_temp_file(temp_file, payload)
+
+    storage._write_temp_file = counting_write
+    data = {"sessions": [{"name": "web"}], "folders": [], "version": 1}
+
+    assert storage.write_snapshot(data)
+    assert storage.write_snapshot(data)
+    assert len(payloads) == 1
+    assert json.loads(storage.sessions_file.read_text()) == data
+
+    # Edited behind our back: written again even though the data matches.
+    storage.sessions_file.write_text("{}")
+    assert storage.write_snapshot(data)
+    assert len(payloads) == 2
+
+    storage._verify_saved_file = lambda digest: False
+    data["sessions"].append({"name": "db"})
+    with pytest.raises(StorageWriteError):
+        storage.write_snapshot(data)
@@ -0,0 +1,73 @@
+"""Tests for the fuzzy session search index."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from ashyterm.sessions.models import SessionFolder, SessionItem
+from ashyterm.sessions.search_index import SessionSearchIndex, fuzzy_score
+from ashyterm.sessions.tree_search import SessionTreeSearch
+
+
+def _names(matches):
+    return [match.item.name for match in matches]
+
+
+def _sessions():
+    return [
+        SessionItem("prod-web-01", host="10.0.0.5", user="deploy", folder_path="/prod"),
+        SessionItem("pgweb", host="pg.internal", user="postgres"),
+        SessionItem("staging-db", host="db.staging", user="admin", folder_path="/stg"),
+        SessionItem("laptop", session_type="local"),
+    ]
+
+
+def test_fuzzy_score_prefers_boundaries_and_runs():
+    assert fuzzy_score("pw", "prod-web-01") > fuzzy_score("pw", "xpxxxxwx")
+    assert fuzzy_score("web", "prod-web-01") > fuzzy_score("web", "wxexb")
+    assert fuzzy_score("zz", "prod-web-01") == 0
+
+
+def test_search_ranks_across_name_host_user_and_folder():
+    index = SessionSearchIndex()
+    index.rebuild(_sessions())
+
+    # Both "p" and "w" start a word in prod-web-01.
+    assert _names(index.search("pweb"))[:2] == ["prod-web-01", "pgweb"]
+    assert _names(index.search("postgres")) == ["pgweb"]
+    assert _names(index.search("stg db")) == ["staging-db"]
+    assert _names(index.search("'staging")) == ["staging-db"]
+    assert index.search("'stgdb") == []
+    assert index.search("   ") == []
+
+
+def test_growing_query_narrows_and_edits_reindex():
+    sessions = _sessions()
+    index = SessionSearchIndex()
+    index.rebuild(sessions)
+    assert "laptop" in _names(index.search("l"))
+
+    index.search("la")
+    sessions[0].name = "lab-web"
+    assert index.sync(sessions) == 1
+    # The index changed, so the narrowed "la" candidates are not reused.
+    assert _names(index.search("lab")) == ["lab-web"]
+    assert index.sync(sessions) == 0
+
+
+def test_tree_search_filters_from_the_index_without_populating():
+    sessions = _sessions()
+    prod = SessionFolder("prod", path="/prod")
+    index = SessionSearchIndex()
+    index.rebuild(sessions + [prod])
+    view = MagicMock(search_index=index, _populated_folders=set())
+    search = SessionTreeSearch(view)
+    search.save_expansion_state = MagicMock()
+    search._expand_folders_with_matches = MagicMock()
+
+    search.set_filter_text("deploy")
+
+    assert search.folder_contains_matching(prod)
+    assert search.filter_func(SimpleNamespace(get_item=lambda: sessions[0]))
+    assert not search.filter_func(SimpleNamespace(get_item=lambda: sessions[1]))
+    view._populate_folder_children.assert_not_called()
+    view.filter.changed.assert_called_once()
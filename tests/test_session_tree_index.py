@@ -0,0 +1,81 @@
+"""Tests for the parent-path index behind the sessions tree."""
+
+from ashyterm.sessions.models import LayoutItem, SessionFolder, SessionItem
+from ashyterm.sessions.tree_index import SessionTreeIndex
+
+
+def _names(items):
+    return [item.name for item in items]
+
+
+def _apply(mirror, changes):
+    """Replay splices onto plain lists, the way the tree view does."""
+    for change in changes:
+        bucket = mirror.setdefault(change.parent_path, [])
+        if change.added:
+            bucket.insert(change.position, change.item)
+        else:
+            assert bucket.pop(change.position) is change.item
+
+
+def _sample_items():
+    prod = SessionFolder("prod", path="/prod")
+    web = SessionFolder("web", path="/prod/web", parent_path="/prod")
+    return [
+        SessionItem("zeta", folder_path="/prod"),
+        SessionItem("alpha", folder_path="/prod"),
+        SessionItem("home", session_type="local"),
+        web,
+        prod,
+        LayoutItem("grid", folder_path="/prod"),
+        SessionItem("api", folder_path="/prod/web"),
+    ]
+
+
+def test_children_are_bucketed_by_parent_in_display_order():
+    index = SessionTreeIndex()
+    index.rebuild(_sample_items())
+
+    assert _names(index.children("")) == ["prod", "home"]
+    assert _names(index.children("/prod")) == ["web", "grid", "alpha", "zeta"]
+    assert _names(index.children("/prod/web")) == ["api"]
+    assert index.has_children("/prod/web")
+    assert not index.has_children("/empty")
+
+
+def test_sync_reports_only_the_items_that_changed():
+    items = _sample_items()
+    index = SessionTreeIndex()
+    index.rebuild(items)
+    mirror = {path: index.children(path) for path in ("", "/prod", "/prod/web")}
+    assert index.sync(items) == []
+
+    zeta, alpha = items[0], items[1]
+    alpha.name = "omega"
+    zeta.folder_path = ""
+    items.append(SessionItem("beta", folder_path="/prod"))
+    items.remove(items[6])  # "api"
+    changes = index.sync(items)
+
+    assert len(changes) == 6
+    _apply(mirror, changes)
+    for path, bucket in mirror.items():
+        assert bucket == index.children(path)
+    assert _names(mirror["/prod"]) == ["web", "grid", "beta", "omega"]
+    assert _names(mirror[""]) == ["prod", "home", "zeta"]
+
+
+def test_renamed_folder_reports_its_old_path():
+    items = _sample_items()
+    index = SessionTreeIndex()
+    index.rebuild(items)
+    web = items[3]
+
+    web.name, web.path = "www", "/prod/www"
+    items[6].folder_path = "/prod/www"
+    changes = index.sync(items)
+
+    removal = next(c for c in changes if c.item is web and not c.added)
+    assert removal.path == "/prod/web"
+    assert _names(index.children("/prod/www")) == ["api"]
+    assert not index.has_children("/prod/web")
@@ -0,0 +1,124 @@
+"""Tests for the bulk SSH config / known_hosts import."""
+
+from types import GeneratorType
+from unittest.mock import MagicMock
+
+from ashyterm.sessions import operations as operations_module
+from ashyterm.sessions.models import SessionItem
+from ashyterm.sessions.operations import SessionOperations
+from ashyterm.utils.ssh_config_parser import SSHConfigParser, parse_known_hosts
+
+
+class FakeStore(list):
+    """The slice of Gio.ListStore that SessionOperations uses."""
+
+    def get_n_items(self):
+        return len(self)
+
+    def get_item(self, position):
+        return self[position]
+
+    def splice(self, position, n_removals, additions):
+        self[position : position + n_removals] = additions
+
+
+class FakeSettings:
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+def test_known_hosts_yields_each_plain_host_once(tmp_path):
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(
+        "web.example,10.0.0.5 ssh-ed25519 AAAA\n"
+        "[git.example]:2222 ssh-rsa AAAA\n"
+        "web.example ecdsa-sha2-nistp256 AAAA\n"
+        "|1|c2FsdA==|aGFzaA== ssh-ed25519 AAAA\n"
+        "@cert-authority *.example ssh-rsa AAAA\n"
+        "*.internal ssh-rsa AAAA\n"
+        "# comment\n"
+    )
+
+    hosts = [(h.hostname, h.port) for h in parse_known_hosts(known_hosts)]
+
+    assert hosts == [("web.example", None), ("10.0.0.5", None), ("git.example", 2222)]
+    assert list(parse_known_hosts(tmp_path / "missing")) == []
+
+
+def test_iter_hosts_streams_the_same_entries_parse_returns(tmp_path):
+    config = tmp_path / "config"
+    (tmp_path / "extra").write_text("Host inc\n  HostName inc.example\n")
+    config.write_text(
+        "Host a\n  HostName a.example\nInclude extra\nHost b\n  User bob\n"
+    )
+
+    hosts = SSHConfigParser().iter_hosts(config)
+
+    assert isinstance(hosts, GeneratorType)
+    assert [h.alias for h in hosts] == ["a", "inc", "b"]
+    assert [h.alias for h in SSHConfigParser().parse(config)] == ["a", "inc", "b"]
+
+
+def _operations(monkeypatch, sessions=(), **settings):
+    signals = MagicMock()
+    monkeypatch.setattr(operations_module.AppSignals, "get", lambda: signals)
+    ops = SessionOperations(FakeStore(sessions), FakeStore(), FakeSettings(**settings))
+    ops._save_changes = MagicMock(return_value=True)
+    return ops, signals
+
+
+def test_import_diffs_and_applies_everything_in_one_batch(monkeypatch, tmp_path):
+    config = tmp_path / "config"
+    config.write_text(
+        "Host web\n  HostName 10.0.0.5\n  User deploy\n"
+        "Host db\n  HostName db.example\n"
+        "Host db-again\n  HostName db.example\n"
+        "Host old\n  HostName old.example\n  User root\n"
+    )
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(
+        "10.0.0.5 ssh-ed25519 AAAA\nold.example ssh-ed25519 AAAA\n"
+        "new.example ssh-ed25519 AAAA\n"
+    )
+    existing = SessionItem("old", host="old.example", user="root")
+    ops, signals = _operations(monkeypatch, [existing])
+
+    result = ops.import_sessions_from_ssh_config(config, known_hosts)
+
+    assert result.success
+    names = [session.name for session in ops.session_store]
+    assert names == ["old", "web", "db", "new.example"]
+    ops._save_changes.assert_called_once()
+    signals.emit.assert_called_once_with("request-tree-refresh")
+
+
+def test_failed_save_rolls_the_whole_batch_back(monkeypatch, tmp_path):
+    config = tmp_path / "config"
+    config.write_text("Host a\n  HostName a.example\nHost b\n  HostName b.example\n")
+    ops, signals = _operations(monkeypatch)
+    ops._save_changes.return_value = False
+
+    result = ops.import_sessions_from_ssh_config(config)
+
+    assert not result.success
+    assert len(ops.session_store) == 0
+    signals.emit.assert_not_called()
+
+
+def test_known_hosts_follow_the_setting(monkeypatch, tmp_path):
+    monkeypatch.setattr(operations_module.Path, "home", lambda: tmp_path)
+    (tmp_path / ".ssh").mkdir()
+    (tmp_path / ".ssh" / "known_hosts").write_text("kh.example ssh-rsa AAAA\n")
+
+    ops, _signals = _operations(monkeypatch)
+    assert not ops.import_sessions_from_ssh_config().success
+
+    ops, _signals = _operations(monkeypatch, ssh_import_known_hosts=True)
+    assert ops.import_sessions_from_ssh_config().success
+    assert [s.host for s in ops.session_store] == ["kh.example"]
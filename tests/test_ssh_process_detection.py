@@ -1,10 +1,17 @@
 """Tests for manual OpenSSH and Tailscale SSH process detection."""
 
+import os
+import signal
+import subprocess
+import sys
+import time
 from unittest.mock import MagicMock
 
 from ashyterm.terminal.ssh_process_detection import (
     extract_ssh_target,
+    find_foreground_ssh_target,
     find_ssh_process,
+    read_cmdline,
 )
 
 
@@ -39,3 +46,32 @@ def test_find_skips_exited_process_and_returns_tailscale() -> None:
 
     assert process is tailscale
     assert target == "root@node"
+
+
+def test_foreground_target_is_found_under_a_wrapper_process() -> None:
+    wrapper = subprocess.Popen(
+        [
+            "/bin/bash",
+            "-c",
+            f"(exec -a ssh {sys.executable} -c 'import time; time.sleep(30)'"
+            " -p 2222 admin@build); :",
+        ],
+        start_new_session=True,
+    )
+    try:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            target = find_foreground_ssh_target(wrapper.pid)
+            if target:
+                break
+            time.sleep(0.01)
+        assert target == "admin@build"
+        assert read_cmdline(wrapper.pid)[0] == "/bin/bash"
+    finally:
+        os.killpg(wrapper.pid, signal.SIGKILL)
+        wrapper.wait()
+
+
+def test_missing_process_has_no_cmdline() -> None:
+    assert read_cmdline(-1) == []
+    assert find_foreground_ssh_target(-1) is None
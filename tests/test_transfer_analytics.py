@@ -0,0 +1,140 @@
+"""Tests for transfer history analytics."""
+
+import csv
+from unittest.mock import MagicMock
+
+from ashyterm.filemanager.operations import FileOperations
+from ashyterm.filemanager.transfer_analytics import (
+    ENGINE_ACCELERATED,
+    ENGINE_DELTA,
+    ENGINE_RSYNC,
+    export_summary_csv,
+    preferred_engine,
+    summarize_transfers,
+)
+from ashyterm.filemanager.transfer_manager import (
+    TransferItem,
+    TransferStatus,
+    TransferType,
+)
+from ashyterm.sessions.models import SessionItem
+
+MB = 1024 * 1024
+
+
+def _item(engine, seconds, size=100 * MB, host="example.com:22", **overrides):
+    data = dict(
+        id=f"{engine}-{seconds}-{size}",
+        filename="data.bin",
+        local_path="/tmp/data.bin",
+        remote_path="/srv/data.bin",
+        file_size=size,
+        transfer_type=TransferType.DOWNLOAD,
+        status=TransferStatus.COMPLETED,
+        start_time=1000.0,
+        end_time=1000.0 + seconds,
+        host=host,
+        engine=engine,
+    )
+    data.update(overrides)
+    return TransferItem(**data)
+
+
+def test_summary_groups_by_host_and_engine_fastest_first():
+    history = [
+        _item(ENGINE_RSYNC, 10, rtt_ms=40.0),
+        _item(ENGINE_ACCELERATED, 2, rtt_ms=30.0, chunk_retries=1),
+        _item(ENGINE_ACCELERATED, 4, rtt_ms=50.0),
+        _item(ENGINE_ACCELERATED, 1, status=TransferStatus.FAILED),
+        _item(ENGINE_RSYNC, 1, host="other:22"),
+        _item("", 1),
+    ]
+
+    stats = summarize_transfers(history)
+
+    assert [(s.host, s.engine) for s in stats] == [
+        ("example.com:22", ENGINE_ACCELERATED),
+        ("example.com:22", ENGINE_RSYNC),
+        ("other:22", ENGINE_RSYNC),
+    ]
+    accelerated = stats[0]
+    assert accelerated.transfers == 3
+    assert accelerated.completed == 2
+    assert accelerated.failures == 1
+    assert accelerated.median_throughput == (50 * MB + 25 * MB) / 2
+    assert accelerated.chunk_retries == 1
+    assert accelerated.mean_rtt_ms == 40.0
+
+
+def test_preferred_engine_needs_samples_and_a_clear_margin():
+    accelerated = [_item(ENGINE_ACCELERATED, 10 + i) for i in range(3)]
+    faster_rsync = [_item(ENGINE_RSYNC, 5 + i) for i in range(3)]
+    slightly_faster_rsync = [_item(ENGINE_RSYNC, 9 + i) for i in range(3)]
+
+    host = "example.com:22"
+    assert preferred_engine(faster_rsync, host, ENGINE_ACCELERATED) is None
+    assert (
+        preferred_engine(accelerated + faster_rsync, host, ENGINE_ACCELERATED)
+        == ENGINE_RSYNC
+    )
+    assert (
+        preferred_engine(accelerated + slightly_faster_rsync, host, ENGINE_ACCELERATED)
+        == ENGINE_ACCELERATED
+    )
+    assert preferred_engine(accelerated + faster_rsync, "other:22", "x") is None
+
+
+def test_small_and_delta_transfers_are_not_compared():
+    history = [_item(ENGINE_ACCELERATED, 10 + i) for i in range(3)]
+    history += [_item(ENGINE_RSYNC, 0.01, size=MB) for _ in range(3)]
+    history += [_item(ENGINE_DELTA, 0.1) for _ in range(3)]
+
+    assert (
+        preferred_engine(history, "example.com:22", ENGINE_ACCELERATED)
+        == ENGINE_ACCELERATED
+    )
+
+
+def test_export_writes_one_row_per_host_engine(tmp_path):
+    path = tmp_path / "stats.csv"
+
+    export_summary_csv([_item(ENGINE_RSYNC, 4, rtt_ms=20.0)], path)
+
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert rows == [
+        {
+            "host": "example.com:22",
+            "engine": "rsync",
+            "transfers": "1",
+            "completed": "1",
+            "failures": "0",
+            "bytes": str(100 * MB),
+            "median_throughput_bps": str(25 * MB),
+            "chunk_retries": "0",
+            "mean_rtt_ms": "20.0",
+        }
+    ]
+
+
+def test_history_advice_can_keep_large_transfers_off_the_accelerated_engine():
+    session = SessionItem(
+        "prod",
+        session_type="ssh",
+        host="example.com",
+        user="alice",
+        auth_type="key",
+        auth_value="/home/alice/.ssh/id_ed25519",
+    )
+    ops = FileOperations(session)
+    ops._get_setting_value = lambda key, default: default
+    ops.engine_advisor = MagicMock(return_value=ENGINE_RSYNC)
+
+    assert not ops._should_use_accelerated_download(session, False, 512 * MB)
+    ops.engine_advisor.assert_called_once_with(
+        "example.com:22", "download", ENGINE_ACCELERATED
+    )
+
+    ops.engine_advisor.return_value = None
+    assert ops._should_use_accelerated_upload(session, False, 512 * MB)
+    assert ops.engine_advisor.call_args.args[1] == "upload"
@@ -0,0 +1,142 @@
+"""Tests for the append-only transfer history store."""
+
+import json
+
+from ashyterm.filemanager import transfer_history as transfer_history_module
+from ashyterm.filemanager import transfer_manager as transfer_manager_module
+from ashyterm.filemanager.transfer_history import TransferHistoryStore
+from ashyterm.filemanager.transfer_manager import (
+    HISTORY_PAGE_SIZE,
+    TransferManager,
+    TransferStatus,
+    TransferType,
+)
+
+
+def _record(index):
+    return {"id": f"t{index}", "filename": f"file-{index}.txt"}
+
+
+def _ids(records):
+    return [record["id"] for record in records]
+
+
+def test_recent_records_come_newest_first_across_read_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer_history_module, "_READ_BLOCK_SIZE", 16)
+    store = TransferHistoryStore(tmp_path / "history.jsonl")
+    for index in range(10):
+        store.append(_record(index))
+
+    assert _ids(store.read_recent(3)) == ["t9", "t8", "t7"]
+    assert _ids(store.read_recent(3, exclude_ids={"t9", "t8", "t7"})) == [
+        "t6",
+        "t5",
+        "t4",
+    ]
+    assert len(store.read_recent(100)) == 10
+
+
+def test_removed_entries_and_torn_lines_are_skipped(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = TransferHistoryStore(path)
+    for index in range(3):
+        store.append(_record(index))
+    store.remove("t1")
+    with open(path, "a", encoding="utf-8") as history_file:
+        history_file.write('{"id": "t3", "filena')
+
+    assert _ids(store.read_recent(10)) == ["t2", "t0"]
+
+
+def test_compaction_keeps_newest_live_entries(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = TransferHistoryStore(path, max_entries=3, compact_every=5)
+    for index in range(4):
+        store.append(_record(index))
+    store.remove("t3")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["t0", "t1", "t2"]
+
+    store.clear()
+    assert store.read_recent(10) == []
+
+
+def _manager_with_history(tmp_path, monkeypatch, count):
+    monkeypatch.setattr(
+        transfer_manager_module.GLib, "idle_add", lambda callback, *args: 1
+    )
+    manager = TransferManager(str(tmp_path))
+    for index in range(count):
+        transfer_id = manager.add_transfer(
+            filename=f"file-{index}.txt",
+            local_path=f"/tmp/file-{index}.txt",
+            remote_path=f"/remote/file-{index}.txt",
+            file_size=index,
+            transfer_type=TransferType.UPLOAD,
+        )
+        manager.complete_transfer(transfer_id)
+    return manager
+
+
+def test_startup_loads_one_page_and_older_entries_on_demand(tmp_path, monkeypatch):
+    _manager_with_history(tmp_path, monkeypatch, HISTORY_PAGE_SIZE + 5)
+
+    manager = TransferManager(str(tmp_path))
+    assert len(manager.history) == HISTORY_PAGE_SIZE
+    assert manager.history[0].filename == f"file-{HISTORY_PAGE_SIZE + 4}.txt"
+
+    older = manager.load_older_history()
+    assert [t.filename for t in older] == [f"file-{i}.txt" for i in range(4, -1, -1)]
+    assert older[0].status is TransferStatus.COMPLETED
+    assert len(manager.history) == HISTORY_PAGE_SIZE + 5
+
+    manager.remove_from_history(older[0].id)
+    assert len(TransferManager(str(tmp_path)).load_older_history()) == 4
+
+
+def test_statistics_cover_the_journal_beyond_the_loaded_page(tmp_path, monkeypatch):
+    _manager_with_history(tmp_path, monkeypatch, HISTORY_PAGE_SIZE + 5)
+    manager = TransferManager(str(tmp_path))
+    assert len(manager.history) == HISTORY_PAGE_SIZE
+    assert len(manager.recent_history()) == HISTORY_PAGE_SIZE + 5
+
+    transfer_id = manager.add_transfer(
+        filename="new.txt",
+        local_path="/tmp/new.txt",
+        remote_path="/remote/new.txt",
+        file_size=1,
+        transfer_type=TransferType.DOWNLOAD,
+    )
+    manager.fail_transfer(transfer_id, "boom")
+    assert manager.recent_history()[0].id == transfer_id
+    assert len(manager.recent_history()) == HISTORY_PAGE_SIZE + 6
+
+    # Paging in the dialog keeps going back past what is already shown.
+    older = manager.load_older_history()
+    assert [t.filename for t in older] == [f"file-{i}.txt" for i in range(4, -1, -1)]
+
+    manager.remove_from_history(transfer_id)
+    assert transfer_id not in {t.id for t in manager.recent_history()}
+
+def test_legacy_json_history_is_migrated(tmp_path):
+    legacy = [
+        {
+            "id": "old",
+            "filename": "a.txt",
+            "local_path": "/tmp/a.txt",
+            "remote_path": "/remote/a.txt",
+            "file_size": 1,
+            "transfer_type": "download",
+            "status": "failed",
+            "error_message": "boom",
+        }
+    ]
+    (tmp_path / "transfer_history.json").write_text(json.dumps(legacy))
+
+    manager = TransferManager(str(tmp_path))
+
+    assert [t.id for t in manager.history] == ["old"]
+    assert manager.history[0].status is TransferStatus.FAILED
+    assert not (tmp_path / "transfer_history.json").exists()
+    assert [t.id for t in TransferManager(str(tmp_path)).history] == ["old"]
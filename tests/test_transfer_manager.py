@@ -1,11 +1,17 @@
 """Tests for TransferManager state and signal dispatch."""
 
+from functools import partial
+from types import SimpleNamespace
+
 from ashyterm.filemanager import transfer_manager as transfer_manager_module
+from ashyterm.filemanager.operations import FileOperations
 from ashyterm.filemanager.transfer_manager import (
     TransferManager,
     TransferStatus,
     TransferType,
 )
+from ashyterm.filemanager.transfer_scheduler import TransferScheduler
+from ashyterm.sessions.models import SessionItem
 
 
 def test_start_transfer_dispatches_signal_through_idle(monkeypatch, tmp_path):
@@ -60,3 +66,149 @@ def test_update_progress_ignores_unknown_id(monkeypatch, tmp_path):
     manager.update_progress("missing", 50.0)
 
     assert idle_add == []
+
+
+def test_retry_transfer_requeues_failed_transfer_for_same_session(
+    monkeypatch, tmp_path
+):
+    idle_calls = []
+    monkeypatch.setattr(
+        transfer_manager_module.GLib,
+        "idle_add",
+        lambda callback, *args: idle_calls.append((callback, args)) or 1,
+    )
+    manager = TransferManager(str(tmp_path))
+    transfer_id = manager.add_transfer(
+        filename="a.bin",
+        local_path="/tmp/a.bin",
+        remote_path="/remote/a.bin",
+        file_size=10,
+        transfer_type=TransferType.UPLOAD,
+    )
+    manager.get_transfer(transfer_id).session_key = "alice@example.com:22"
+    manager.fail_transfer(transfer_id, "connection lost")
+    failed = next(t for t in manager.history if t.id == transfer_id)
+
+    new_id = manager.retry_transfer(transfer_id)
+
+    assert manager.can_retry(failed)
+    assert new_id is not None and new_id != transfer_id
+    retried = manager.get_transfer(new_id)
+    assert retried.status is TransferStatus.PENDING
+    assert retried.remote_path == "/remote/a.bin"
+    assert retried.session_key == "alice@example.com:22"
+    assert idle_calls[-1][1] == ("transfer-retry-requested", new_id)
+
+
+def test_retry_transfer_ignores_transfers_without_session(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        transfer_manager_module.GLib, "idle_add", lambda callback, *args: 1
+    )
+    manager = TransferManager(str(tmp_path))
+    transfer_id = manager.add_transfer(
+        filename="a.bin",
+        local_path="/tmp/a.bin",
+        remote_path="/remote/a.bin",
+        file_size=10,
+        transfer_type=TransferType.DOWNLOAD,
+    )
+    manager.fail_transfer(transfer_id, "connection lost")
+
+    assert manager.retry_transfer(transfer_id) is None
+
+
+def test_queued_transfers_start_in_order_and_cancel_without_running(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(
+        transfer_manager_module.GLib, "idle_add", lambda callback, *args: 1
+    )
+    manager = TransferManager(str(tmp_path))
+    manager.scheduler = TransferScheduler(max_active=1, max_per_host=1)
+    monkeypatch.setattr(manager, "_apply_scheduler_settings", lambda: None)
+    started = []
+    ids = []
+    for name in ("a.bin", "b.bin", "c.bin"):
+        transfer_id = manager.add_transfer(
+            filename=name,
+            local_path=f"/tmp/{name}",
+            remote_path=f"/remote/{name}",
+            file_size=10,
+            transfer_type=TransferType.DOWNLOAD,
+            is_cancellable=True,
+        )
+        manager.get_transfer(transfer_id).session_key = "alice@example.com:22"
+        manager.queue_transfer(transfer_id, partial(started.append, transfer_id))
+        ids.append(transfer_id)
+
+    assert started == ids[:1]
+    manager.cancel_transfer(ids[1])
+    manager.complete_transfer(ids[0])
+
+    assert started == [ids[0], ids[2]]
+    cancelled = next(t for t in manager.history if t.id == ids[1])
+    assert cancelled.status is TransferStatus.CANCELLED
+
+
+def test_transfer_whose_start_fails_is_failed_and_frees_its_slot(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(
+        transfer_manager_module.GLib, "idle_add", lambda callback, *args: 1
+    )
+    manager = TransferManager(str(tmp_path))
+    manager.scheduler = TransferScheduler(max_active=1, max_per_host=1)
+    monkeypatch.setattr(manager, "_apply_scheduler_settings", lambda: None)
+
+    def refuse_to_start():
+        raise RuntimeError("The transfer could not be started.")
+
+    started = []
+    starts = {"a.bin": refuse_to_start, "b.bin": partial(started.append, "b.bin")}
+    ids = []
+    for name, start in starts.items():
+        transfer_id = manager.add_transfer(
+            filename=name,
+            local_path=f"/tmp/{name}",
+            remote_path=f"/remote/{name}",
+            file_size=10,
+            transfer_type=TransferType.DOWNLOAD,
+            is_cancellable=True,
+        )
+        ids.append(transfer_id)
+        manager.queue_transfer(transfer_id, start)
+
+    failed = next(t for t in manager.history if t.id == ids[0])
+    assert failed.status is TransferStatus.FAILED
+    assert failed.error_message == "The transfer could not be started."
+    assert started == ["b.bin"]
+    assert manager.scheduler.active_count == 1
+
+
+def test_engine_telemetry_is_kept_in_history(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        transfer_manager_module.GLib, "idle_add", lambda callback, *args: 1
+    )
+    operations = FileOperations(SessionItem("prod", session_type="ssh", host="h"))
+    manager = TransferManager(str(tmp_path), operations)
+    transfer_id = manager.add_transfer(
+        filename="a.iso",
+        local_path="/tmp/a.iso",
+        remote_path="/remote/a.iso",
+        file_size=100,
+        transfer_type=TransferType.DOWNLOAD,
+    )
+    manager.get_transfer(transfer_id).session_key = "alice@example.com:2222"
+    manager.start_transfer(transfer_id)
+    operations._record_transfer_telemetry(
+        transfer_id, "accelerated", SimpleNamespace(chunk_retries=2, rtt_ms=12.5)
+    )
+
+    manager.complete_transfer(transfer_id)
+
+    reloaded = TransferManager(str(tmp_path)).history[0]
+    assert reloaded.host == "example.com:2222"
+    assert reloaded.engine == "accelerated"
+    assert reloaded.chunk_retries == 2
+    assert reloaded.rtt_ms == 12.5
+    assert operations.pop_transfer_telemetry(transfer_id) is None
@@ -0,0 +1,100 @@
+"""Tests for transfer admission control and the shared bandwidth bucket."""
+
+from ashyterm.filemanager.transfer_scheduler import (
+    TokenBucket,
+    TransferPriority,
+    TransferScheduler,
+)
+
+
+def _enqueue(scheduler, started, transfer_id, session_key, priority=None):
+    scheduler.enqueue(
+        transfer_id,
+        session_key,
+        priority or TransferPriority.BULK,
+        lambda: started.append(transfer_id),
+    )
+
+
+def test_global_limit_queues_transfers_until_a_slot_is_released():
+    scheduler = TransferScheduler(max_active=2, max_per_host=5)
+    started = []
+
+    for index in range(3):
+        _enqueue(scheduler, started, f"t{index}", f"u@host{index}:22")
+
+    assert started == ["t0", "t1"]
+    assert scheduler.is_queued("t2")
+
+    scheduler.release("t0")
+
+    assert started == ["t0", "t1", "t2"]
+
+
+def test_per_host_limit_ignores_user_and_lets_other_hosts_through():
+    scheduler = TransferScheduler(max_active=4, max_per_host=1)
+    started = []
+
+    _enqueue(scheduler, started, "a1", "alice@box:22")
+    _enqueue(scheduler, started, "a2", "bob@box:22")
+    _enqueue(scheduler, started, "b1", "alice@other:22")
+
+    assert started == ["a1", "b1"]
+
+
+def test_sessions_are_served_round_robin():
+    scheduler = TransferScheduler(max_active=1, max_per_host=4)
+    started = []
+    _enqueue(scheduler, started, "first", "u@a:22")
+    for transfer_id in ("a1", "a2", "a3"):
+        _enqueue(scheduler, started, transfer_id, "u@a:22")
+    _enqueue(scheduler, started, "b1", "u@b:22")
+
+    for transfer_id in ("first", "a1", "b1"):
+        scheduler.release(transfer_id)
+
+    assert started == ["first", "a1", "b1", "a2"]
+
+
+def test_interactive_transfers_jump_the_queue_and_get_an_extra_slot():
+    scheduler = TransferScheduler(max_active=1, max_per_host=1)
+    started = []
+    _enqueue(scheduler, started, "bulk1", "u@a:22")
+    _enqueue(scheduler, started, "bulk2", "u@a:22")
+
+    _enqueue(scheduler, started, "open", "u@a:22", TransferPriority.INTERACTIVE)
+
+    assert started == ["bulk1", "open"]
+    scheduler.release("open")
+    assert started == ["bulk1", "open"]
+    scheduler.release("bulk1")
+    assert started == ["bulk1", "open", "bulk2"]
+
+
+def test_removed_transfers_never_start():
+    scheduler = TransferScheduler(max_active=1, max_per_host=1)
+    started = []
+    _enqueue(scheduler, started, "running", "u@a:22")
+    _enqueue(scheduler, started, "queued", "u@a:22")
+
+    assert scheduler.remove("queued") is True
+    scheduler.release("running")
+
+    assert started == ["running"]
+    assert scheduler.remove("running") is False
+
+
+def test_token_bucket_allows_burst_then_spaces_out_reservations():
+    now = [0.0]
+    bucket = TokenBucket(1000, clock=lambda: now[0])
+
+    assert bucket.reserve(500) == 0.0
+    assert bucket.reserve(1000) == 1.0
+    now[0] = 1.0
+    assert bucket.reserve(100) == 0.1
+
+
+def test_token_bucket_without_rate_never_waits():
+    bucket = TokenBucket(0)
+
+    assert bucket.reserve(10**9) == 0.0
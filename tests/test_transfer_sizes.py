@@ -6,8 +6,11 @@ from unittest.mock import MagicMock
 
 from ashyterm.filemanager.models import FileItem
 from ashyterm.filemanager.transfer_sizes import (
+    DirectorySizeCache,
     calculate_local_paths_size,
     calculate_remote_item_sizes,
+    parse_du_output,
+    walk_local_size,
 )
 
 
@@ -39,11 +42,11 @@ class TestRemoteItemSizes:
         )
 
         assert out == {"a.txt": 100, "b.bin": 2048}
-        ops.get_directory_size.assert_not_called()
+        ops.get_directory_sizes.assert_not_called()
 
     def test_directories_are_measured_recursively(self):
         ops = MagicMock()
-        ops.get_directory_size.return_value = 999_999
+        ops.get_directory_sizes.return_value = {"/remote/src": 999_999}
         items = [_ls_dir("src")]
 
         out = calculate_remote_item_sizes(
@@ -54,13 +57,16 @@ class TestRemoteItemSizes:
         )
 
         assert out == {"src": 999_999}
-        ops.get_directory_size.assert_called_once_with(
-            "/remote/src", is_remote=True, session_override="session"
+        ops.get_directory_sizes.assert_called_once_with(
+            ["/remote/src"],
+            is_remote=True,
+            session_override="session",
+            mtimes={"/remote/src": items[0].date.timestamp()},
         )
 
     def test_directories_fall_back_to_listed_size_when_measurement_fails(self):
         ops = MagicMock()
-        ops.get_directory_size.return_value = 0
+        ops.get_directory_sizes.return_value = {"/remote/src": 0}
         item = _ls_dir("src", 4096)
 
         out = calculate_remote_item_sizes(
@@ -74,9 +80,9 @@ class TestRemoteItemSizes:
 
     def test_zero_size_files_are_remeasured(self):
         """Listing sometimes reports size 0 for non-dir entries (e.g.
-        special files); we defer to operations.get_directory_size."""
+        special files); we defer to operations.get_directory_sizes."""
         ops = MagicMock()
-        ops.get_directory_size.return_value = 42
+        ops.get_directory_sizes.return_value = {"/remote/sock": 42}
         items = [_ls_file("sock", 0)]
 
         out = calculate_remote_item_sizes(
@@ -87,7 +93,7 @@ class TestRemoteItemSizes:
 
     def test_zero_size_when_operations_returns_zero_falls_back_to_listed(self):
         ops = MagicMock()
-        ops.get_directory_size.return_value = 0
+        ops.get_directory_sizes.return_value = {"/remote/empty": 0}
         items = [_ls_file("empty", 0)]
 
         out = calculate_remote_item_sizes(
@@ -100,7 +106,7 @@ class TestRemoteItemSizes:
 
     def test_zero_size_item_trailing_slash_is_handled(self):
         ops = MagicMock()
-        ops.get_directory_size.return_value = 1
+        ops.get_directory_sizes.return_value = {"/remote/sub": 1}
         items = [_ls_file("sub", 0)]
 
         out = calculate_remote_item_sizes(
@@ -111,10 +117,10 @@ class TestRemoteItemSizes:
         )
 
         assert out == {"sub": 1}
-        ops.get_directory_size.assert_called_once()
-        # The first arg must be "/remote/sub", not "/remote//sub".
-        remote_path = ops.get_directory_size.call_args[0][0]
-        assert remote_path == "/remote/sub"
+        ops.get_directory_sizes.assert_called_once()
+        # The path must be "/remote/sub", not "/remote//sub".
+        remote_paths = ops.get_directory_sizes.call_args[0][0]
+        assert remote_paths == ["/remote/sub"]
 
     def test_empty_list_returns_empty_dict(self):
         out = calculate_remote_item_sizes(
@@ -136,21 +142,21 @@ class TestLocalPathsSize:
 
         assert sizes[str(target)] == 1234
         assert total == 1234
-        # Pure files never hit operations.get_directory_size.
-        ops.get_directory_size.assert_not_called()
+        # Pure files never hit operations.get_directory_sizes.
+        ops.get_directory_sizes.assert_not_called()
 
     def test_directory_size_via_operations(self, tmp_path: Path):
         folder = tmp_path / "sub"
         folder.mkdir()
         ops = MagicMock()
-        ops.get_directory_size.return_value = 4096
+        ops.get_directory_sizes.return_value = {str(folder): 4096}
 
         total, sizes = calculate_local_paths_size([folder], operations=ops)
 
         assert sizes[str(folder)] == 4096
         assert total == 4096
-        ops.get_directory_size.assert_called_once_with(
-            str(folder), is_remote=False
+        ops.get_directory_sizes.assert_called_once_with(
+            [str(folder)], is_remote=False
         )
 
     def test_missing_files_contribute_zero(self, tmp_path: Path):
@@ -173,7 +179,7 @@ class TestLocalPathsSize:
         folder = tmp_path / "sub"
         folder.mkdir()
         ops = MagicMock()
-        ops.get_directory_size.return_value = 1000
+        ops.get_directory_sizes.return_value = {str(folder): 1000}
 
         total, sizes = calculate_local_paths_size([f1, folder], operations=ops)
 
@@ -187,6 +193,69 @@ class TestLocalPathsSize:
         assert sizes == {}
 
 
+    def test_directories_are_measured_in_one_batch(self, tmp_path: Path):
+        first = tmp_path / "a"
+        second = tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        ops = MagicMock()
+        ops.get_directory_sizes.return_value = {str(first): 10, str(second): 20}
+
+        total, _sizes = calculate_local_paths_size([first, second], operations=ops)
+
+        assert total == 30
+        ops.get_directory_sizes.assert_called_once_with(
+            [str(first), str(second)], is_remote=False
+        )
+
+
+# ── batch sizing engine ─────────────────────────────────────
+
+
+class TestSizingEngine:
+    def test_remote_items_share_one_measurement_call(self):
+        ops = MagicMock()
+        ops.get_directory_sizes.return_value = {"/r/a": 1, "/r/b": 2}
+
+        out = calculate_remote_item_sizes(
+            [_ls_dir("a"), _ls_dir("b"), _ls_file("c", 3)],
+            current_path="/r",
+            operations=ops,
+            session_override=None,
+        )
+
+        assert out == {"a": 1, "b": 2, "c": 3}
+        assert ops.get_directory_sizes.call_count == 1
+
+    def test_parse_du_output_maps_paths(self):
+        output = "4096\t/srv/a\n123\t/srv/with space\nbogus line\n"
+
+        assert parse_du_output(output) == {"/srv/a": 4096, "/srv/with space": 123}
+
+    def test_walk_local_size_counts_hard_links_once(self, tmp_path: Path):
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        (root / "sub" / "data.bin").write_bytes(b"x" * 1000)
+        (root / "link.bin").hardlink_to(root / "sub" / "data.bin")
+        (root / "sym").symlink_to("/nonexistent")
+
+        size = walk_local_size(str(root))
+
+        dirs = root.lstat().st_size + (root / "sub").lstat().st_size
+        assert size == dirs + 1000 + (root / "sym").lstat().st_size
+
+    def test_cache_requires_matching_mtime_and_fresh_entry(self):
+        now = [0.0]
+        cache = DirectorySizeCache(ttl=10, clock=lambda: now[0])
+        cache.put(("local", "/a"), 5.0, 100)
+
+        assert cache.get(("local", "/a"), 5.0) == 100
+        assert cache.get(("local", "/a"), 6.0) is None
+        assert cache.get(("local", "/a"), None) is None
+        now[0] = 11.0
+        assert cache.get(("local", "/a"), 5.0) is None
+
+
 # ── mixin delegation ────────────────────────────────────────
 
 
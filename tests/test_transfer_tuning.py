@@ -0,0 +1,103 @@
+"""Tests for adaptive transfer tuning."""
+
+from ashyterm.filemanager.transfer_tuning import (
+    MAX_CHUNK_SIZE_BYTES,
+    MIN_CHUNK_SIZE_BYTES,
+    TUNING_WINDOW_SECONDS,
+    TransferAutoTuner,
+    TransferTuning,
+    TransferTuningStore,
+)
+
+MIB = 1024 * 1024
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _tuner(parallel_requests=4, chunk_size=4 * MIB, max_requests=8):
+    clock = FakeClock()
+    tuner = TransferAutoTuner(
+        TransferTuning(parallel_requests, chunk_size),
+        min_requests=1,
+        max_requests=max_requests,
+        clock=clock,
+    )
+    return tuner, clock
+
+
+def _window(tuner, clock, byte_count, latency):
+    clock.now += TUNING_WINDOW_SECONDS
+    tuner.record_chunk(byte_count, latency)
+
+
+def test_tuner_adds_requests_while_throughput_grows():
+    tuner, clock = _tuner(max_requests=6)
+
+    for step in range(1, 5):
+        _window(tuner, clock, step * 10 * MIB, 0.5)
+
+    assert tuner.parallel_requests == 6
+    assert tuner.adjustments == 4
+
+
+def test_tuner_halves_requests_when_throughput_drops():
+    tuner, clock = _tuner(parallel_requests=8)
+    _window(tuner, clock, 40 * MIB, 0.5)
+
+    _window(tuner, clock, 20 * MIB, 0.5)
+
+    assert tuner.parallel_requests == 4
+
+
+def test_tuner_backs_off_on_latency_inflation():
+    tuner, clock = _tuner(parallel_requests=8)
+    _window(tuner, clock, 40 * MIB, 0.5)
+
+    _window(tuner, clock, 60 * MIB, 1.5)
+
+    assert tuner.parallel_requests == 4
+
+
+def test_tuner_scales_chunk_size_with_latency_within_bounds():
+    tuner, clock = _tuner(chunk_size=8 * MIB)
+    for _ in range(3):
+        _window(tuner, clock, 10 * MIB, 0.1)
+    assert tuner.chunk_size_bytes == MAX_CHUNK_SIZE_BYTES
+
+    slow, slow_clock = _tuner(chunk_size=MIN_CHUNK_SIZE_BYTES * 2)
+    for _ in range(3):
+        _window(slow, slow_clock, MIB, 3.0)
+    assert slow.chunk_size_bytes == MIN_CHUNK_SIZE_BYTES
+
+
+def test_tuner_waits_for_a_full_window():
+    tuner, clock = _tuner()
+    clock.now += TUNING_WINDOW_SECONDS / 2
+
+    tuner.record_chunk(MIB, 0.1)
+
+    assert tuner.adjustments == 0
+    assert tuner.tuning == TransferTuning(4, 4 * MIB)
+
+
+def test_store_remembers_tuning_per_host(tmp_path):
+    store = TransferTuningStore(tmp_path / "tuning.json")
+
+    store.save("alice@example.com:22", TransferTuning(9, 8 * MIB))
+
+    reloaded = TransferTuningStore(tmp_path / "tuning.json")
+    assert reloaded.get("alice@example.com:22") == TransferTuning(9, 8 * MIB)
+    assert reloaded.get("bob@example.com:22") is None
+
+
+def test_store_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "tuning.json"
+    path.write_text("{not json")
+
+    assert TransferTuningStore(path).get("alice@example.com:22") is None
@@ -0,0 +1,118 @@
+"""Tests for the pool of pre-started local shells."""
+
+import os
+
+from ashyterm.terminal import warm_pool as warm_pool_module
+from ashyterm.terminal.warm_pool import WarmShell, WarmShellPool, process_rss_bytes
+
+
+class FakeSettings:
+    def __init__(self, **values):
+        self.values = values
+        self.listeners = []
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        old = self.values.get(key)
+        self.values[key] = value
+        for listener in self.listeners:
+            listener(key, old, value)
+
+    def add_change_listener(self, listener):
+        self.listeners.append(listener)
+
+
+class PoolHarness:
+    def __init__(self, monkeypatch, **settings):
+        self.timeouts = []
+        monkeypatch.setattr(
+            warm_pool_module.GLib,
+            "timeout_add",
+            lambda delay, callback: self.timeouts.append(callback) or 1,
+        )
+        monkeypatch.setattr(warm_pool_module.GLib, "source_remove", lambda _id: None)
+        self.settings = FakeSettings(warm_shell_pool_size=2, **settings)
+        self.signature = ("bash", False, True)
+        self.next_pid = 1000
+        self.discarded = []
+        self.pool = WarmShellPool(
+            self.spawn, self.discarded.append, lambda: self.signature, self.settings
+        )
+
+    def spawn(self, signature):
+        self.next_pid += 1
+        return WarmShell(terminal=object(), signature=signature, pid=self.next_pid)
+
+    def run_timers(self):
+        while self.timeouts:
+            self.timeouts.pop(0)()
+
+
+def test_pool_fills_one_shell_per_tick_and_hands_them_out(monkeypatch):
+    harness = PoolHarness(monkeypatch)
+    harness.pool.schedule_refill()
+
+    harness.timeouts.pop(0)()
+    assert len(harness.pool) == 1
+    harness.run_timers()
+    assert len(harness.pool) == 2
+
+    shell = harness.pool.acquire(harness.signature)
+    assert shell.pid == 1001
+    assert len(harness.pool) == 1
+    assert harness.pool.acquire(("zsh", False, True)) is None
+
+    harness.run_timers()
+    assert len(harness.pool) == 2
+
+
+def test_changed_launch_settings_discard_the_pool(monkeypatch):
+    harness = PoolHarness(monkeypatch)
+    harness.pool.schedule_refill()
+    harness.run_timers()
+
+    harness.settings.set("use_login_shell", True)
+    assert len(harness.pool) == 0
+    assert len(harness.discarded) == 2
+
+    harness.run_timers()
+    harness.signature = ("bash", True, True)
+    assert harness.pool.acquire(harness.signature) is None
+    assert len(harness.discarded) == 4
+    harness.run_timers()
+    assert harness.pool.acquire(harness.signature).signature == harness.signature
+
+
+def test_memory_cap_and_size_limit_refills(monkeypatch):
+    harness = PoolHarness(monkeypatch, warm_shell_pool_max_mb=1)
+    monkeypatch.setattr(
+        warm_pool_module, "process_rss_bytes", lambda pid: 2 * 1024 * 1024
+    )
+    harness.pool.schedule_refill()
+    harness.run_timers()
+    assert len(harness.pool) == 1
+
+    harness.settings.set("warm_shell_pool_size", 0)
+    assert len(harness.pool) == 0
+    assert harness.pool.acquire(harness.signature) is None
+
+
+def test_exited_shells_leave_the_pool(monkeypatch):
+    harness = PoolHarness(monkeypatch)
+    harness.pool.schedule_refill()
+    harness.run_timers()
+    shell = harness.pool._entries[0]
+
+    harness.pool.entry_exited(shell)
+
+    assert shell.discarded
+    assert shell not in harness.pool._entries
+    harness.pool.close()
+    assert len(harness.pool) == 0
+
+
+def test_rss_of_running_and_missing_processes():
+    assert process_rss_bytes(os.getpid()) > 0
+    assert process_rss_bytes(-1) == 0
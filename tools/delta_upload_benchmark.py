@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Delta upload benchmark for Ashy Terminal
+
+Compares the ways a file edited from the server can be saved back:
+a full segmented SFTP upload, the block-level delta upload and rsync.
+Usage:
+
+    python tools/delta_upload_benchmark.py HOST REMOTE_PATH LOCAL_FILE \\
+        [--user USER] [--port PORT] [--key KEY] [--edit inplace|append|insert]
+
+LOCAL_FILE is never modified; the benchmark edits a temporary copy.
+REMOTE_PATH is overwritten.
+"""
+
+import argparse
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ashyterm.filemanager.accelerated_upload import (
+    AcceleratedUploadConfig,
+    AsyncSSHSegmentedUploader,
+)
+from ashyterm.filemanager.delta_upload import AsyncSSHDeltaUploader
+from ashyterm.sessions.models import SessionItem
+
+EDIT_BYTES = b"# edited by delta_upload_benchmark\n"
+
+
+def _edit_copy(source: Path, target: Path, kind: str) -> None:
+    data = bytearray(source.read_bytes())
+    middle = len(data) // 2
+    if kind == "append":
+        data += EDIT_BYTES
+    elif kind == "insert":
+        data[middle:middle] = EDIT_BYTES
+    else:
+        data[middle : middle + len(EDIT_BYTES)] = EDIT_BYTES
+    target.write_bytes(data)
+
+
+def _full_upload(session: SessionItem, config, local: Path, remote: str) -> int:
+    AsyncSSHSegmentedUploader(session, config).upload(local, remote)
+    return local.stat().st_size
+
+
+def _delta_upload(session: SessionItem, config, local: Path, remote: str) -> int:
+    uploader = AsyncSSHDeltaUploader(session, config)
+    uploader.upload_delta(local, remote)
+    return uploader.bytes_sent
+
+
+def _rsync_upload(session: SessionItem, _config, local: Path, remote: str) -> int:
+    ssh = ["ssh", "-p", str(session.port or 22)]
+    if session.auth_value:
+        ssh += ["-i", session.auth_value]
+    target = f"{session.user}@{session.host}" if session.user else session.host
+    result = subprocess.run(
+        ["rsync", "--stats", "-e", shlex.join(ssh), str(local), f"{target}:{remote}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("Total bytes sent:"):
+            return int(line.split(":", 1)[1].strip().replace(",", ""))
+    return -1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("host")
+    parser.add_argument("remote_path")
+    parser.add_argument("local_file", type=Path)
+    parser.add_argument("--user", default="")
+    parser.add_argument("--port", type=int, default=22)
+    parser.add_argument("--key", default="")
+    parser.add_argument(
+        "--edit", choices=("inplace", "append", "insert"), default="inplace"
+    )
+    args = parser.parse_args()
+
+    session = SessionItem(
+        name="benchmark",
+        session_type="ssh",
+        host=args.host,
+        user=args.user,
+        port=args.port,
+        auth_type="key",
+        auth_value=args.key,
+    )
+    config = AcceleratedUploadConfig()
+    methods = (
+        ("full upload", _full_upload),
+        ("delta upload", _delta_upload),
+    )
+    if shutil.which("rsync"):
+        methods += (("rsync", _rsync_upload),)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        edited = Path(workdir) / args.local_file.name
+        _edit_copy(args.local_file, edited, args.edit)
+        size = edited.stat().st_size
+        print(f"File: {size} bytes, edit: {args.edit}")
+        for label, upload in methods:
+            # Every method starts from the unedited file on the server.
+            _full_upload(session, config, args.local_file, args.remote_path)
+            started = time.perf_counter()
+            sent = upload(session, config, edited, args.remote_path)
+            elapsed = time.perf_counter() - started
+            print(f"  {label:<13} {elapsed * 1000:9.1f} ms  {sent:>12} bytes sent")
+
+
+if __name__ == "__main__":
+    main()
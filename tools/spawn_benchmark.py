@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Terminal spawn benchmark for Ashy Terminal
+
+Measures how long starting a shell on a new PTY blocks the caller, with
+the process grown to a given resident size to mimic a long-running
+window. Compares the ``setsid -c`` helper with the old ``preexec_fn``
+path. Usage:
+
+    python tools/spawn_benchmark.py [--rss-mb 200 1024] [--runs 50]
+"""
+
+import argparse
+import contextlib
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ashyterm.terminal.pty_spawn import find_ctty_helper, spawn_on_pty
+
+PAGE = 4096
+
+
+def _grow_rss(megabytes: int) -> bytearray:
+    ballast = bytearray(megabytes * 1024 * 1024)
+    # Touch every page so it is resident, not just reserved.
+    for offset in range(0, len(ballast), PAGE):
+        ballast[offset] = 1
+    return ballast
+
+
+def _spawn_once(use_helper: bool) -> float:
+    master_fd, slave_fd = os.openpty()
+    try:
+        start = time.perf_counter()
+        pid = spawn_on_pty(
+            ["/bin/true"], slave_fd, master_fd, "/", dict(os.environ), use_helper
+        )
+        elapsed = time.perf_counter() - start
+        # subprocess may already have reaped it while starting the next one.
+        with contextlib.suppress(ChildProcessError):
+            os.waitpid(pid, 0)
+    finally:
+        os.close(slave_fd)
+        os.close(master_fd)
+    return elapsed * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rss-mb", type=int, nargs="+", default=[200, 1024])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    backends = [("preexec_fn", False)]
+    if find_ctty_helper():
+        backends.insert(0, ("setsid -c", True))
+    else:
+        print("setsid -c not found; only the preexec_fn path is measured")
+
+    ballast = bytearray()
+    for megabytes in sorted(args.rss_mb):
+        ballast += _grow_rss(megabytes - len(ballast) // (1024 * 1024))
+        print(f"\nRSS ballast: {megabytes} MiB")
+        for name, use_helper in backends:
+            timings = [_spawn_once(use_helper) for _ in range(args.runs)]
+            print(
+                f"  {name:<12} median {statistics.median(timings):7.2f} ms"
+                f"  max {max(timings):7.2f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
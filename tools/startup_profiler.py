@@ -1,13 +1,60 @@
 #!/usr/bin/env python3
-"""Startup profiler for Ashy Terminal - measures real startup time."""
+"""Startup profiler for Ashy Terminal - measures real startup time.
 
+Usage: startup_profiler.py [--sessions N]
+
+With ``--sessions N`` the app starts against a throwaway config directory
+holding N synthetic SSH sessions, and the time spent loading them into
+the sidebar is reported separately.
+"""
+
+import argparse
+import json
 import os
 import sys
+import tempfile
 import time
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+
+def _seed_sessions(count: int) -> str:
+    """Write ``count`` sessions to a fresh XDG config dir; return its path."""
+    config_home = tempfile.mkdtemp(prefix="ashyterm-profile-")
+    config_dir = os.path.join(config_home, "ashyterm")
+    os.makedirs(config_dir)
+    sessions = [
+        {
+            "name": f"host-{i:05d}",
+            "session_type": "ssh",
+            "host": f"10.{i // 65536}.{i // 256 % 256}.{i % 256}",
+            "user": "deploy",
+            "folder_path": f"/dc{i % 10}",
+            "sftp_session_enabled": i % 3 == 0,
+            "sftp_local_directory": "~/Downloads",
+            "port_forwardings": [
+                {"name": "web", "local_port": 8080, "remote_port": 80}
+            ]
+            if i % 5 == 0
+            else [],
+        }
+        for i in range(count)
+    ]
+    folders = [{"name": f"dc{i}", "path": f"/dc{i}"} for i in range(10)]
+    with open(os.path.join(config_dir, "sessions.json"), "w") as f:
+        json.dump({"sessions": sessions, "folders": folders}, f)
+    return config_home
+
+
+_parser = argparse.ArgumentParser(description="Measure Ashy Terminal startup.")
+_parser.add_argument(
+    "--sessions", type=int, default=0, help="seed this many synthetic sessions"
+)
+_ARGS = _parser.parse_args()
+if _ARGS.sessions:
+    os.environ["XDG_CONFIG_HOME"] = _seed_sessions(_ARGS.sessions)
+
 _T0 = time.perf_counter()
 
 import gi
@@ -24,9 +71,32 @@ import ashyterm
 _T_PKG = time.perf_counter()
 
 from ashyterm.app import CommTerminalApp
+from ashyterm.sessions import storage as session_storage
 
 _T_APP_IMPORT = time.perf_counter()
 
+_LOAD_TIMINGS = {}
+
+
+def _timed(name, fn):
+    def wrapper(*args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _LOAD_TIMINGS[name] = (time.perf_counter() - t) * 1000
+
+    return wrapper
+
+
+# The window imports these at call time, so patching the module is enough.
+session_storage.load_sessions_and_folders = _timed(
+    "read + validate", session_storage.load_sessions_and_folders
+)
+session_storage.load_sessions_to_store = _timed(
+    "fill store", session_storage.load_sessions_to_store
+)
+
 
 class ProfiledApp(CommTerminalApp):
     def _on_startup(self, app):
@@ -84,6 +154,13 @@ class ProfiledApp(CommTerminalApp):
         GLib.timeout_add(200, self.quit)
         return ret
 
+    def quit(self):
+        if _LOAD_TIMINGS:
+            print(f"\n=== Session loading ({_ARGS.sessions} seeded) ===")
+            for name, ms in _LOAD_TIMINGS.items():
+                print(f"  {name + ':':21} {ms:7.1f} ms")
+        super().quit()
+
 
 if __name__ == "__main__":
     app = ProfiledApp()